@@ -47,7 +47,7 @@ AUTO_RESPOND_PY="${PROJECT_ROOT}/scripts/respond-to-llm-requests.py"
 
 # Blog 2: Sprint Planning
 echo "=== Generating Blog 2: Sprint Planning ==="
-rm -f "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
+rm -rf "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
 
 bloginator outline --index "$INDEX_DIR" \
   --keywords "sprint,planning,agile,scrum,estimation,story,points,capacity,commitment" \
@@ -61,7 +61,7 @@ python3 "$AUTO_RESPOND_PY"
 wait $OUTLINE_PID
 
 echo "Blog 2 outline complete, starting draft..."
-rm -f "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
+rm -rf "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
 
 bloginator draft --index "$INDEX_DIR" \
   --outline "$GENERATED_DIR/blog2-planning-outline.json" \
@@ -82,7 +82,7 @@ wc -w "$GENERATED_DIR/blog2-sprint-planning.md"
 
 # Blog 3: Sprint Grooming
 echo "=== Generating Blog 3: Sprint Grooming ==="
-rm -f "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
+rm -rf "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
 
 bloginator outline --index "$INDEX_DIR" \
   --keywords "backlog,refinement,grooming,scrum,agile,stories,acceptance,criteria,estimation" \
@@ -96,7 +96,7 @@ python3 "$AUTO_RESPOND_PY"
 wait $OUTLINE_PID
 
 echo "Blog 3 outline complete, starting draft..."
-rm -f "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
+rm -rf "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
 
 bloginator draft --index "$INDEX_DIR" \
   --outline "$GENERATED_DIR/blog3-grooming-outline.json" \
@@ -117,7 +117,7 @@ wc -w "$GENERATED_DIR/blog3-sprint-grooming.md"
 
 # Blog 4: Retrospectives
 echo "=== Generating Blog 4: Retrospectives ==="
-rm -f "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
+rm -rf "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
 
 bloginator outline --index "$INDEX_DIR" \
   --keywords "retrospective,agile,scrum,improvement,feedback,team,process,kaizen" \
@@ -131,7 +131,7 @@ python3 "$AUTO_RESPOND_PY"
 wait $OUTLINE_PID
 
 echo "Blog 4 outline complete, starting draft..."
-rm -f "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
+rm -rf "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
 
 bloginator draft --index "$INDEX_DIR" \
   --outline "$GENERATED_DIR/blog4-retro-outline.json" \
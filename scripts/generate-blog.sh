@@ -65,7 +65,7 @@ fi
 AUTO_RESPOND_PY="${PROJECT_ROOT}/scripts/respond-to-llm-requests.py"
 
 # Clean request/response directories
-rm -f "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/* 2>/dev/null || true
+rm -rf "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/* 2>/dev/null || true
 
 # Start continuous auto-responder in background
 echo "Starting continuous auto-responder..."
@@ -94,7 +94,7 @@ echo "Outline complete: $OUTLINE_FILE"
 sleep 2
 
 # Clean request/response directories for draft
-rm -f "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
+rm -rf "$LLM_REQUESTS_DIR"/* "$LLM_RESPONSES_DIR"/*
 
 # Generate draft
 echo "Generating draft..."
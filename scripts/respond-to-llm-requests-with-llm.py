@@ -174,15 +174,18 @@ def main():
             time.sleep(1)
             continue
 
-        for request_file in sorted(requests_dir.glob("request_*.json")):
-            if request_file.name in processed:
+        # Requests are grouped into one subdirectory per run; mirror it for responses
+        for request_file in sorted(requests_dir.rglob("request_*.json")):
+            if request_file in processed:
                 continue
 
             request_id = request_file.stem.replace("request_", "")
-            response_file = responses_dir / f"response_{request_id}.json"
+            response_dir = responses_dir / request_file.parent.relative_to(requests_dir)
+            response_dir.mkdir(parents=True, exist_ok=True)
+            response_file = response_dir / f"response_{request_id}.json"
 
             if response_file.exists():
-                processed.add(request_file.name)
+                processed.add(request_file)
                 continue
 
             # Read request
@@ -224,7 +227,7 @@ def main():
                 json.dump(response, f, indent=2)
 
             print(f"✅ Generated {response_file.name}")
-            processed.add(request_file.name)
+            processed.add(request_file)
 
         time.sleep(0.5)
 
@@ -336,9 +336,12 @@ def auto_respond_to_requests(requests_dir, responses_dir):
     responses_path = Path(responses_dir)
     responses_path.mkdir(parents=True, exist_ok=True)
 
-    for request_file in sorted(requests_path.glob("request_*.json")):
+    # Requests are grouped into one subdirectory per run; mirror it for responses
+    for request_file in sorted(requests_path.rglob("request_*.json")):
         request_id = request_file.stem.replace("request_", "")
-        response_file = responses_path / f"response_{request_id}.json"
+        response_dir = responses_path / request_file.parent.relative_to(requests_path)
+        response_dir.mkdir(parents=True, exist_ok=True)
+        response_file = response_dir / f"response_{request_id}.json"
 
         # Skip if response already exists
         if response_file.exists():
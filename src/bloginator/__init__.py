@@ -9,7 +9,38 @@ __version__ = "1.0.0"
 __author__ = "Matt Bordenet"
 __email__ = "matt@bordenet.com"
 
-from bloginator import cli, config, extraction, generation, indexing, models, safety, search, voice
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from bloginator import (
+        cli,
+        config,
+        extraction,
+        generation,
+        indexing,
+        models,
+        safety,
+        search,
+        voice,
+    )
+
+_SUBPACKAGES = frozenset(
+    {"cli", "config", "extraction", "generation", "indexing", "models", "safety", "search", "voice"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import subpackages on first access.
+
+    Importing everything eagerly (the CLI pulls in every command and its
+    dependencies) costs seconds, which every spawned extraction worker would
+    otherwise pay just to load one extractor module.
+    """
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f"bloginator.{name}")
+    raise AttributeError(f"module 'bloginator' has no attribute '{name}'")
 
 
 __all__ = [
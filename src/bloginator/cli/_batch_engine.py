@@ -0,0 +1,392 @@
+"""Batch generation engine: many blogs in one process.
+
+Every blog in a batch shares one corpus searcher (the embedding model and
+Chroma collection are loaded once, and identical searches are answered
+from memory), one LLM client and one prompt loader. Blogs run on a thread
+pool whose size is the batch's global concurrency limit; each blog's
+sections are generated one at a time, so at most that many LLM requests
+are in flight at once.
+"""
+
+import json
+import re
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from bloginator.cli._draft_output import update_draft_from_markdown
+from bloginator.generation import DraftGenerator, GenerationContext, OutlineGenerator
+from bloginator.generation._generation_context import MemoizingSearcher
+from bloginator.generation.llm_base import LLMClient
+from bloginator.generation.quality_reviewer import QualityReviewer
+from bloginator.models.outline import Outline
+from bloginator.prompts.loader import PromptLoader
+from bloginator.search import CorpusSearcher
+
+
+# Stages timed for every blog, in the order they run
+STAGES = ("outline", "draft", "review", "save")
+
+
+@dataclass
+class BatchItem:
+    """One blog to generate.
+
+    Attributes:
+        title: Document title
+        keywords: Keywords/themes for the document
+        thesis: Optional thesis statement
+        classification: Content classification
+        audience: Target audience
+        num_sections: Target number of top-level sections
+        outline_file: Existing outline JSON; the outline stage is skipped
+        slug: Base name of the blog's output files
+    """
+
+    title: str
+    keywords: list[str] = field(default_factory=list)
+    thesis: str = ""
+    classification: str = "guidance"
+    audience: str = "all-disciplines"
+    num_sections: int = 5
+    outline_file: Path | None = None
+    slug: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.slug:
+            self.slug = slugify(self.title)
+
+
+@dataclass
+class BlogResult:
+    """Outcome of one blog in a batch.
+
+    Attributes:
+        slug: Base name of the blog's output files
+        title: Document title
+        status: "ok" or "failed"
+        timings: Seconds spent in each stage that ran
+        outputs: Written files by kind (outline, outline_markdown, draft, draft_json)
+        total_words: Words in the final draft
+        error: Failure message, if the blog failed
+    """
+
+    slug: str
+    title: str
+    status: str = "ok"
+    timings: dict[str, float] = field(default_factory=dict)
+    outputs: dict[str, str] = field(default_factory=dict)
+    total_words: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result for the summary report."""
+        return {
+            "slug": self.slug,
+            "title": self.title,
+            "status": self.status,
+            "seconds": round(sum(self.timings.values()), 3),
+            "timings": {stage: round(secs, 3) for stage, secs in self.timings.items()},
+            "outputs": self.outputs,
+            "total_words": self.total_words,
+            "error": self.error,
+        }
+
+
+def slugify(title: str, max_length: int = 60) -> str:
+    """Turn a title into a file-name-safe slug.
+
+    Args:
+        title: Document title
+        max_length: Longest slug returned
+
+    Returns:
+        Lowercase, hyphen-separated slug ("blog" if nothing is left)
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+    return slug[:max_length].rstrip("-") or "blog"
+
+
+def _keywords(value: Any) -> list[str]:
+    if isinstance(value, str):
+        value = value.split(",")
+    return [str(k).strip() for k in value or [] if str(k).strip()]
+
+
+def load_manifest(manifest_file: Path) -> list[BatchItem]:
+    """Load the blogs to generate from a YAML or JSON manifest.
+
+    The manifest is a list of entries, or a mapping with the list under
+    ``topics`` (the corpus/blog-topics.yaml layout). Each entry needs a
+    ``title`` and either ``keywords`` (list or comma-separated string) or an
+    ``outline`` JSON file, relative to the manifest. ``sections`` may be a
+    count or a list of section titles (its length is used); ``summary`` is
+    used as the thesis when no ``thesis`` is given. Duplicate slugs get a
+    numeric suffix.
+
+    Args:
+        manifest_file: Path to the manifest
+
+    Returns:
+        Batch items in manifest order
+
+    Raises:
+        ValueError: If the manifest or one of its entries is invalid
+    """
+    data = yaml.safe_load(manifest_file.read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        data = data.get("topics")
+    if not isinstance(data, list):
+        raise ValueError(f"{manifest_file}: expected a list of blogs or a 'topics' list")
+
+    items: list[BatchItem] = []
+    seen: dict[str, int] = {}
+    for number, entry in enumerate(data, start=1):
+        if not isinstance(entry, dict) or not entry.get("title"):
+            raise ValueError(f"{manifest_file}: entry {number} has no title")
+
+        outline_file = None
+        if entry.get("outline"):
+            outline_file = manifest_file.parent / str(entry["outline"])
+            if not outline_file.is_file():
+                raise ValueError(f"{manifest_file}: entry {number}: {outline_file} not found")
+
+        keywords = _keywords(entry.get("keywords"))
+        if not keywords and outline_file is None:
+            raise ValueError(f"{manifest_file}: entry {number} needs keywords or an outline")
+
+        sections = entry.get("sections", 5)
+        item = BatchItem(
+            title=str(entry["title"]),
+            keywords=keywords,
+            thesis=str(entry.get("thesis") or entry.get("summary") or "").strip(),
+            classification=str(entry.get("classification", "guidance")),
+            audience=str(entry.get("audience", "all-disciplines")),
+            num_sections=len(sections) if isinstance(sections, list) else int(sections),
+            outline_file=outline_file,
+            slug=slugify(str(entry.get("slug") or entry["title"])),
+        )
+        count = seen.get(item.slug, 0)
+        seen[item.slug] = count + 1
+        if count:
+            item.slug = f"{item.slug}-{count + 1}"
+        items.append(item)
+    return items
+
+
+class BatchRunner:
+    """Generate a batch of blogs with shared components.
+
+    Attributes:
+        llm_client: LLM client shared by every blog
+        searcher: Memoizing wrapper around the shared corpus searcher
+        output_dir: Directory for per-blog output files
+        concurrency: Blogs generated at once (the global LLM request limit)
+        prompt_loader: Prompt loader shared by every blog
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        searcher: CorpusSearcher,
+        output_dir: Path,
+        concurrency: int = 1,
+        temperature: float = 0.7,
+        sources_per_section: int = 5,
+        max_section_words: int = 70,
+        quality_review: bool = True,
+        prompt_loader: PromptLoader | None = None,
+    ):
+        """Initialize batch runner.
+
+        Args:
+            llm_client: LLM client shared by every blog; must be thread-safe
+                when concurrency is above 1
+            searcher: Corpus searcher shared by every blog
+            output_dir: Directory for per-blog output files
+            concurrency: Blogs generated at once
+            temperature: LLM sampling temperature
+            sources_per_section: Sources to retrieve per section
+            max_section_words: Target words per section
+            quality_review: Run the final quality review on each draft
+            prompt_loader: Prompt loader (creates default if None)
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.llm_client = llm_client
+        self.searcher = (
+            searcher if isinstance(searcher, MemoizingSearcher) else MemoizingSearcher(searcher)
+        )
+        self.output_dir = Path(output_dir)
+        self.concurrency = concurrency
+        self.temperature = temperature
+        self.sources_per_section = sources_per_section
+        self.max_section_words = max_section_words
+        self.quality_review = quality_review
+        self.prompt_loader = prompt_loader or PromptLoader()
+
+    def run(
+        self,
+        items: list[BatchItem],
+        on_done: Callable[[BlogResult], None] | None = None,
+    ) -> list[BlogResult]:
+        """Generate every blog; a failing blog does not stop the others.
+
+        Args:
+            items: Blogs to generate
+            on_done: Optional callback, called from the calling thread as
+                each blog finishes (in manifest order)
+
+        Returns:
+            One result per item, in manifest order
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        results: list[BlogResult] = []
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="bloginator-batch"
+        ) as pool:
+            for result in pool.map(self.run_item, items):
+                results.append(result)
+                if on_done:
+                    on_done(result)
+        return results
+
+    def run_item(self, item: BatchItem) -> BlogResult:
+        """Generate and save one blog.
+
+        Args:
+            item: Blog to generate
+
+        Returns:
+            The blog's result; failures are recorded, not raised
+        """
+        result = BlogResult(slug=item.slug, title=item.title)
+        context = GenerationContext(self.searcher)
+        try:
+            with _timed(result, "outline"):
+                outline_obj = self._outline(item, context)
+            with _timed(result, "draft"):
+                draft_obj = DraftGenerator(
+                    llm_client=self.llm_client,
+                    searcher=context.searcher,
+                    sources_per_section=self.sources_per_section,
+                    prompt_loader=self.prompt_loader,
+                    context=context,
+                ).generate(
+                    outline=outline_obj,
+                    temperature=self.temperature,
+                    max_section_words=self.max_section_words,
+                )
+            if self.quality_review:
+                with _timed(result, "review"):
+                    reviewer = QualityReviewer(self.llm_client, prompt_loader=self.prompt_loader)
+                    revised = reviewer.review_and_revise(draft_obj, temperature=0.3)
+                    update_draft_from_markdown(draft_obj, revised)
+            with _timed(result, "save"):
+                base = self.output_dir / item.slug
+                if item.outline_file is None:
+                    result.outputs["outline"] = _write(
+                        base.with_suffix(".outline.json"), outline_obj.model_dump_json(indent=2)
+                    )
+                    result.outputs["outline_markdown"] = _write(
+                        base.with_suffix(".outline.md"), outline_obj.to_markdown()
+                    )
+                result.outputs["draft"] = _write(base.with_suffix(".md"), draft_obj.to_markdown())
+                result.outputs["draft_json"] = _write(
+                    base.with_suffix(".json"), draft_obj.model_dump_json(indent=2)
+                )
+            result.total_words = draft_obj.total_words
+        except Exception as e:
+            result.status = "failed"
+            result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    def _outline(self, item: BatchItem, context: GenerationContext) -> Outline:
+        if item.outline_file is not None:
+            return Outline.model_validate_json(item.outline_file.read_text(encoding="utf-8"))
+        return OutlineGenerator(
+            llm_client=self.llm_client,
+            searcher=context.searcher,
+            prompt_loader=self.prompt_loader,
+            context=context,
+        ).generate(
+            title=item.title,
+            keywords=item.keywords,
+            thesis=item.thesis,
+            classification=item.classification,
+            audience=item.audience,
+            num_sections=item.num_sections,
+            temperature=self.temperature,
+        )
+
+
+@contextmanager
+def _timed(result: BlogResult, stage: str) -> Iterator[None]:
+    """Add the time spent in the block to a stage of a result."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        result.timings[stage] = time.perf_counter() - started
+
+
+def _write(path: Path, content: str) -> str:
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def build_report(
+    results: list[BlogResult],
+    setup_timings: dict[str, float],
+    wall_seconds: float,
+    searcher: MemoizingSearcher | None = None,
+) -> dict[str, Any]:
+    """Build the batch summary report.
+
+    Args:
+        results: Results of every blog, in manifest order
+        setup_timings: Seconds spent on one-off setup (index load, LLM connect)
+        wall_seconds: Elapsed time of the whole batch
+        searcher: Shared searcher, to report how many searches were reused
+
+    Returns:
+        JSON-serializable report with per-blog and per-stage timings
+    """
+    stage_totals = {
+        stage: round(sum(r.timings.get(stage, 0.0) for r in results), 3)
+        for stage in STAGES
+        if any(stage in r.timings for r in results)
+    }
+    report: dict[str, Any] = {
+        "blogs": len(results),
+        "succeeded": sum(r.status == "ok" for r in results),
+        "failed": sum(r.status != "ok" for r in results),
+        "wall_seconds": round(wall_seconds, 3),
+        "setup_timings": {name: round(secs, 3) for name, secs in setup_timings.items()},
+        "stage_totals": stage_totals,
+        "results": [r.to_dict() for r in results],
+    }
+    if searcher is not None:
+        report["searches"] = {"performed": searcher.misses, "reused": searcher.hits}
+    return report
+
+
+def write_report(report: dict[str, Any], report_file: Path) -> None:
+    """Write the summary report as JSON.
+
+    Args:
+        report: Report from build_report()
+        report_file: Destination path
+    """
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    report_file.write_text(json.dumps(report, indent=2), encoding="utf-8")
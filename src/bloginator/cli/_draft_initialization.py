@@ -8,6 +8,8 @@ from pathlib import Path
 from rich.console import Console
 from rich.progress import Progress
 
+from bloginator.config import config
+from bloginator.generation._ollama_session import start_ollama_session
 from bloginator.generation.llm_base import LLMClient
 from bloginator.generation.llm_factory import create_llm_from_config
 from bloginator.models.outline import Outline
@@ -102,9 +104,16 @@ def initialize_llm(
     try:
         logger.info("Connecting to LLM from config")
         llm_client = create_llm_from_config(
-            verbose=verbose, batch_mode=batch_mode, batch_timeout=batch_timeout
+            verbose=verbose,
+            batch_mode=batch_mode,
+            batch_timeout=batch_timeout,
+            use_cache=config.LLM_CACHE,
+            coalesce=config.LLM_COALESCE,
         )
         logger.info("LLM client connected")
+        if config.OLLAMA_PRELOAD and not batch_mode:
+            progress.update(task, description="Loading model...")
+            start_ollama_session(llm_client)
         progress.update(task, completed=True)
         return llm_client
     except Exception as e:
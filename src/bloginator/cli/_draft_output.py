@@ -5,15 +5,20 @@ import sys
 from pathlib import Path
 
 from rich.console import Console
+from rich.markup import escape
 from rich.progress import Progress
 
 from bloginator.generation import DraftGenerator
-from bloginator.models.draft import Draft
+from bloginator.models.draft import Draft, DraftSection
 from bloginator.models.history import GenerationHistoryEntry, GenerationType
 from bloginator.models.outline import Outline
 from bloginator.services.history_manager import HistoryManager
 
 
+# Characters of streamed section text shown in the progress line
+STREAM_PREVIEW_CHARS = 60
+
+
 def generate_draft_with_progress(
     generator: DraftGenerator,
     outline: Outline,
@@ -22,6 +27,7 @@ def generate_draft_with_progress(
     progress: Progress,
     logger: logging.Logger,
     console: Console,
+    stream: bool = False,
 ) -> Draft:
     """Generate draft with progress tracking.
 
@@ -33,6 +39,7 @@ def generate_draft_with_progress(
         progress: Rich progress bar
         logger: Logger instance
         console: Rich console for output
+        stream: Stream section text and show its latest words in the progress line
 
     Returns:
         Generated draft object
@@ -54,6 +61,14 @@ def generate_draft_with_progress(
             completed=current + 1,
         )
 
+    written: dict[str, str] = {}
+
+    def show_tokens(title: str, delta: str) -> None:
+        """Show the tail of the section being written."""
+        written[title] = (written.get(title, "") + delta)[-STREAM_PREVIEW_CHARS:]
+        preview = " ".join(written[title].split())
+        progress.update(task, description=f"{escape(title)}: [dim]…{escape(preview)}[/dim]")
+
     try:
         logger.info(
             f"Generating draft with {len(outline.sections)} top-level sections, "
@@ -64,6 +79,7 @@ def generate_draft_with_progress(
             temperature=temperature,
             max_section_words=max_section_words,
             progress_callback=update_progress,
+            token_callback=show_tokens if stream else None,
         )
         logger.info(
             f"Draft generated: {draft_obj.total_words} words, {draft_obj.total_citations} citations"
@@ -76,6 +92,62 @@ def generate_draft_with_progress(
         sys.exit(1)
 
 
+def update_draft_from_markdown(draft: Draft, markdown_content: str) -> None:
+    """Update draft object with revised markdown content.
+
+    Parses markdown to extract sections and updates draft in-place.
+    Preserves draft metadata (title, keywords, etc.) while replacing content.
+
+    Args:
+        draft: Draft object to update
+        markdown_content: Revised markdown content from quality review
+    """
+    lines = markdown_content.strip().split("\n")
+
+    # Extract title (first # heading)
+    if lines and lines[0].startswith("# "):
+        draft.title = lines[0][2:].strip()
+        lines = lines[1:]
+
+    # Parse sections (## headings)
+    sections = []
+    current_section_title = None
+    current_section_content: list[str] = []
+
+    for line in lines:
+        if line.startswith("## "):
+            # Save previous section if exists
+            if current_section_title:
+                sections.append(
+                    DraftSection(
+                        title=current_section_title,
+                        content="\n".join(current_section_content).strip(),
+                        citations=[],  # Citations preserved from original
+                        subsections=[],
+                    )
+                )
+            # Start new section
+            current_section_title = line[3:].strip()
+            current_section_content = []
+        else:
+            current_section_content.append(line)
+
+    # Save last section
+    if current_section_title:
+        sections.append(
+            DraftSection(
+                title=current_section_title,
+                content="\n".join(current_section_content).strip(),
+                citations=[],
+                subsections=[],
+            )
+        )
+
+    # Update draft sections
+    draft.sections = sections
+    draft.calculate_stats()
+
+
 def save_draft_output(
     draft: Draft,
     output_file: Path,
@@ -12,6 +12,7 @@ from bloginator.cli._smb_resolver import SHADOW_COPY_ROOT, resolve_smb_path
 from bloginator.cli.error_reporting import ErrorTracker, SkipCategory, create_error_panel
 from bloginator.cli.extract_utils import is_temp_file
 from bloginator.corpus_config import CorpusConfig, CorpusSource
+from bloginator.extraction import ExtractionSupervisor
 
 
 def _get_shadow_path_for_local(original_path: Path) -> Path | None:
@@ -103,6 +104,7 @@ def process_all_sources(
     error_tracker: ErrorTracker,
     console: Console,
     verbose: bool = False,
+    supervisor: ExtractionSupervisor | None = None,
 ) -> tuple[int, int, int]:
     """Process all enabled sources.
 
@@ -116,6 +118,7 @@ def process_all_sources(
         error_tracker: Error tracker instance
         console: Rich console
         verbose: If True, show detailed progress information
+        supervisor: Optional supervisor for isolated, concurrent extraction
 
     Returns:
         Tuple of (total_extracted, total_skipped, total_failed)
@@ -141,6 +144,7 @@ def process_all_sources(
             error_tracker=error_tracker,
             console=console,
             verbose=verbose,
+            supervisor=supervisor,
         )
 
         total_extracted += extracted
@@ -215,6 +219,7 @@ def process_source(
     error_tracker: ErrorTracker,
     console: Console,
     verbose: bool = False,
+    supervisor: ExtractionSupervisor | None = None,
 ) -> tuple[int, int, int]:
     """Process a single source.
 
@@ -228,6 +233,7 @@ def process_source(
         error_tracker: Error tracker instance
         console: Rich console
         verbose: If True, show detailed progress information
+        supervisor: Optional supervisor for isolated, concurrent extraction
 
     Returns:
         Tuple of (extracted_count, skipped_count, failed_count)
@@ -253,6 +259,7 @@ def process_source(
         error_tracker=error_tracker,
         console=console,
         verbose=verbose,
+        supervisor=supervisor,
     )
 
     # Print source summary
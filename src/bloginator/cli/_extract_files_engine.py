@@ -1,6 +1,10 @@
 """File extraction engine for corpus source processing."""
 
+import hashlib
 import uuid
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -11,12 +15,16 @@ from bloginator.cli.error_reporting import ErrorTracker, SkipCategory
 from bloginator.cli.extract_utils import should_skip_file, wait_for_file_availability
 from bloginator.corpus_config import CorpusSource
 from bloginator.extraction import (
+    PAGE_SEPARATOR,
+    ExtractionSupervisor,
+    LegacyOfficeBatch,
     count_words,
     extract_file_metadata,
     extract_text_from_file,
     extract_yaml_frontmatter,
+    iter_chunks_by_paragraphs,
 )
-from bloginator.models import Document
+from bloginator.models import Chunk, Document
 from bloginator.utils.checksum import calculate_content_checksum
 from bloginator.utils.shadow_copy import (
     build_shadow_path_for_local,
@@ -26,6 +34,242 @@ from bloginator.utils.shadow_copy import (
 )
 
 
+@dataclass
+class FileExtractionResult:
+    """Outcome of extracting a single corpus file.
+
+    Attributes:
+        document: Extracted document metadata (None if skipped)
+        text: Extracted text content (empty if skipped)
+        skip_category: Skip category if the file was skipped
+        skip_context: Context recorded with the skip in ErrorTracker
+        skip_event: Parseable reason printed as "[SKIP] <path> (<reason>)"
+        hydration_method: How a cloud placeholder was hydrated, if it was
+        chunks: Chunks of the text, if it was chunked while being extracted
+            (text is then left empty)
+    """
+
+    document: Document | None = None
+    text: str = ""
+    skip_category: SkipCategory | None = None
+    skip_context: str = ""
+    skip_event: str = ""
+    hydration_method: str | None = None
+    chunks: list[Chunk] | None = None
+
+
+def _chunk_streamed_text(
+    pieces: Iterable[str], document_id: str, chunk_size: int
+) -> tuple[list[Chunk], int, str]:
+    """Chunk text pieces as they arrive instead of joining them first.
+
+    Chunking overlaps extraction and the joined text is never built, but the
+    chunks are returned together: every chunk is indexed with the document's
+    content checksum, which is only known once the last piece has been read.
+
+    Args:
+        pieces: Text pieces joined by PAGE_SEPARATOR (e.g. a PDF's pages)
+        document_id: ID of the parent document
+        chunk_size: Maximum chunk size in characters
+
+    Returns:
+        Tuple of (chunks, word count, content checksum) for the joined text
+    """
+    digest = hashlib.sha256()
+    word_count = 0
+
+    def observed() -> Iterable[str]:
+        nonlocal word_count
+        for index, piece in enumerate(pieces):
+            if index:
+                digest.update(PAGE_SEPARATOR.encode("utf-8"))
+            digest.update(piece.encode("utf-8"))
+            word_count += count_words(piece)
+            yield piece
+
+    chunks = list(iter_chunks_by_paragraphs(observed(), document_id, chunk_size))
+    return chunks, word_count, digest.hexdigest()
+
+
+def extract_file(
+    file_path: Path,
+    source_cfg: CorpusSource,
+    existing_docs: dict[str, tuple[str, datetime]],
+    force: bool,
+    document_id: str | None = None,
+    extract_text: Callable[[Path], str] = extract_text_from_file,
+    iter_text: Callable[[Path], Iterable[str]] | None = None,
+    chunk_size: int = 1000,
+) -> FileExtractionResult:
+    """Extract one file from a corpus source, applying the standard skip logic.
+
+    Skips files that are already extracted and unchanged, cloud placeholders
+    that cannot be hydrated, empty files, and files with no extractable text.
+
+    With iter_text, the text is chunked piece by piece as it is extracted
+    (e.g. a PDF page at a time) and returned as chunks rather than a string.
+
+    Args:
+        file_path: Path to the file to extract
+        source_cfg: Source configuration (quality, tags, voice notes)
+        existing_docs: Dictionary of existing extractions
+        force: Force re-extraction flag
+        document_id: Document ID to reuse (default: new UUID)
+        extract_text: Text extractor (e.g. ExtractionSupervisor.extract for
+            isolated extraction with timeouts; default: in-process)
+        iter_text: Piecewise text extractor to chunk from instead (e.g.
+            iter_text_from_file or ExtractionSupervisor.iter_extract)
+        chunk_size: Maximum chunk size in characters, with iter_text
+
+    Returns:
+        FileExtractionResult with either a document and text (or chunks),
+        or skip details
+
+    Raises:
+        Exception: Any extraction error, for the caller to categorize
+    """
+    # Check if we should skip this file
+    skip, _doc_id = should_skip_file(file_path, existing_docs, force)
+
+    if skip:
+        return FileExtractionResult(
+            skip_category=SkipCategory.ALREADY_EXTRACTED,
+            skip_context=str(file_path),
+            skip_event="already_extracted",
+        )
+
+    # Check file availability (critical for OneDrive/iCloud files)
+    # Cloud files may appear in directory but are placeholders (st_blocks=0)
+    # We use copy-based hydration: copying forces OneDrive to download the file.
+    is_available, availability_reason, alt_path = wait_for_file_availability(
+        file_path,
+        timeout_seconds=120.0,
+        attempt_hydration_flag=False,
+        use_copy_hydration=True,
+    )
+    if not is_available:
+        # File not available - determine skip category
+        if availability_reason == "cloud_only":
+            return FileExtractionResult(
+                skip_category=SkipCategory.CLOUD_ONLY,
+                skip_context=f"{file_path} (cloud placeholder - copy failed)",
+                skip_event="cloud_only",
+            )
+        return FileExtractionResult(
+            skip_category=SkipCategory.PATH_NOT_FOUND,
+            skip_context=f"{file_path} (not available - {availability_reason})",
+            skip_event=f"path_not_found: {availability_reason}",
+        )
+
+    # Determine which path to extract from (original or temp copy)
+    extract_from = alt_path if alt_path else file_path
+
+    hydration_method = None
+    if availability_reason in ("hydrated", "copy_hydrated"):
+        hydration_method = "copied to temp" if alt_path else "downloaded"
+
+    # Check file size before extraction
+    file_size = extract_from.stat().st_size
+    if file_size == 0:
+        return FileExtractionResult(
+            skip_category=SkipCategory.EMPTY_CONTENT,
+            skip_context=f"{file_path} (0 bytes - likely OneDrive placeholder not downloaded)",
+            skip_event="empty_content: 0 bytes",
+            hydration_method=hydration_method,
+        )
+
+    document_id = document_id or str(uuid.uuid4())
+
+    # Extract text from the available path (original or temp copy)
+    chunks = None
+    if iter_text is not None:
+        text = ""
+        chunks, word_count, content_checksum = _chunk_streamed_text(
+            iter_text(extract_from), document_id, chunk_size
+        )
+        empty = not chunks
+    else:
+        text = extract_text(extract_from)
+        empty = not text or not text.strip()
+
+    # Check for empty content after extraction
+    if empty:
+        return FileExtractionResult(
+            skip_category=SkipCategory.EMPTY_CONTENT,
+            skip_context=f"{file_path} ({file_size} bytes but no extractable text)",
+            skip_event="empty_content: no text extracted",
+            hydration_method=hydration_method,
+        )
+
+    # Get file metadata from original path (for correct dates/paths)
+    file_meta = extract_file_metadata(file_path)
+
+    # Try to extract frontmatter if Markdown
+    frontmatter = {}
+    if file_path.suffix.lower() in [".md", ".markdown"]:
+        content = extract_from.read_text(encoding="utf-8")
+        frontmatter = extract_yaml_frontmatter(content)
+
+    # Merge tags from source config and frontmatter
+    doc_tags = list(source_cfg.tags)
+    if frontmatter and "tags" in frontmatter:
+        doc_tags.extend(frontmatter["tags"])
+
+    if chunks is None:
+        word_count = count_words(text)
+        # Calculate content checksum for incremental indexing
+        content_checksum = calculate_content_checksum(text)
+
+    # Create document with source metadata
+    doc = Document(
+        id=document_id,
+        filename=file_path.name,
+        source_path=file_path.absolute(),
+        format=file_path.suffix.lstrip(".").lower(),
+        created_date=file_meta.get("created_date"),
+        modified_date=file_meta.get("modified_date"),
+        quality_rating=source_cfg.quality,
+        tags=doc_tags,
+        word_count=word_count,
+        source_name=source_cfg.name,
+        voice_notes=source_cfg.voice_notes,
+        content_checksum=content_checksum,
+    )
+
+    return FileExtractionResult(
+        document=doc, text=text, hydration_method=hydration_method, chunks=chunks
+    )
+
+
+def save_extracted_document(document: Document, text: str, output: Path) -> None:
+    """Write extracted text and metadata in the layout 'bloginator index' reads.
+
+    Args:
+        document: Document metadata
+        text: Extracted text content
+        output: Output directory
+    """
+    # Save extracted text
+    text_file = output / f"{document.id}.txt"
+    text_file.write_text(text, encoding="utf-8")
+
+    # Save metadata
+    meta_file = output / f"{document.id}.json"
+    meta_file.write_text(document.model_dump_json(indent=2), encoding="utf-8")
+
+
+def update_shadow_copy(file_path: Path) -> None:
+    """Create or refresh the offline shadow copy of a file if enabled.
+
+    Args:
+        file_path: Original source file path
+    """
+    if is_shadow_copy_enabled():
+        shadow_path = build_shadow_path_for_local(file_path)
+        if should_update_shadow_copy(file_path, shadow_path):
+            create_shadow_copy(file_path, shadow_path)
+
+
 def extract_source_files(
     files: list[Path],
     source_cfg: CorpusSource,
@@ -35,12 +279,18 @@ def extract_source_files(
     error_tracker: ErrorTracker,
     console: Console,
     verbose: bool = False,
+    supervisor: ExtractionSupervisor | None = None,
 ) -> tuple[int, int, int]:
     """Extract files from a source with ticker-style progress.
 
     Uses a single-line ticker that shows current file being processed,
     then disappears when complete.
 
+    With a supervisor, files are extracted concurrently (one thread per
+    supervisor worker) in isolated processes, so a file that hangs or
+    crashes its extractor is killed and reported without stalling the rest.
+    Results are recorded in completion order.
+
     Args:
         files: List of file paths to extract
         source_cfg: Source configuration
@@ -50,6 +300,7 @@ def extract_source_files(
         error_tracker: Error tracker instance
         console: Rich console
         verbose: If True, show detailed progress information
+        supervisor: Optional extraction supervisor (default: in-process, sequential)
 
     Returns:
         Tuple of (extracted_count, skipped_count, failed_count)
@@ -58,6 +309,15 @@ def extract_source_files(
     skipped_count = 0
     failed_count = 0
 
+    # Legacy .doc/.ppt files are converted a few at a time in the supervisor's
+    # workers, paying LibreOffice's start-up once per window instead of per file
+    extract_text = LegacyOfficeBatch(
+        supervisor.extract if supervisor else extract_text_from_file,
+        supervisor.convert_legacy_office if supervisor else None,
+    )
+    extract_text.prepare(p for p in files if not should_skip_file(p, existing_docs, force)[0])
+    thread_count = supervisor.max_workers if supervisor else 1
+
     # Create progress with spinner and ticker-style current file display
     progress = Progress(
         SpinnerColumn(),
@@ -69,179 +329,80 @@ def extract_source_files(
         transient=not verbose,  # Keep progress visible if verbose mode
     )
 
-    with progress:
+    with progress, ThreadPoolExecutor(max_workers=thread_count) as executor:
         task = progress.add_task(
             f"[green]{source_cfg.name}",
             total=len(files),
             current_file="starting...",
         )
 
-        for file_path in files:
-            # Output current file path for Streamlit UI to parse (always in verbose)
+        def extract_one(file_path: Path) -> FileExtractionResult:
+            # Output current file path for Streamlit UI to parse (always in verbose);
+            # printed as the file starts, so it names the file in progress
             if verbose:
                 progress.console.print(f"Extracting: {file_path}", highlight=False)
 
             # Update ticker with current file (show full path)
-            display_path = str(file_path)
-            progress.update(task, current_file=display_path)
+            progress.update(task, current_file=str(file_path))
+            return extract_file(
+                file_path, source_cfg, existing_docs, force, extract_text=extract_text
+            )
+
+        futures = {executor.submit(extract_one, file_path): file_path for file_path in files}
 
-            try:
-                # Record file for statistics (not extracted yet)
-                error_tracker.record_file(file_path, extracted=False)
+        try:
+            for future in as_completed(futures):
+                file_path = futures[future]
 
-                # Check if we should skip this file
-                skip, doc_id = should_skip_file(file_path, existing_docs, force)
+                try:
+                    # Record file for statistics (not extracted yet)
+                    error_tracker.record_file(file_path, extracted=False)
 
-                if skip:
-                    error_tracker.record_skip(SkipCategory.ALREADY_EXTRACTED, str(file_path))
-                    # Output parseable skip event for Streamlit (verbose only)
-                    if verbose:
+                    result = future.result()
+
+                    # Log successful hydration if verbose
+                    if verbose and result.hydration_method:
                         progress.console.print(
-                            f"[SKIP] {file_path} (already_extracted)", highlight=False
-                        )
-                    skipped_count += 1
-                    progress.update(task, advance=1)
-                    continue
-
-                # Check file availability (critical for OneDrive/iCloud files)
-                # Cloud files may appear in directory but are placeholders (st_blocks=0)
-                # We use copy-based hydration: copying forces OneDrive to download the file.
-                is_available, availability_reason, alt_path = wait_for_file_availability(
-                    file_path,
-                    timeout_seconds=120.0,
-                    attempt_hydration_flag=False,
-                    use_copy_hydration=True,
-                )
-                if not is_available:
-                    # File not available - determine skip category
-                    if availability_reason == "cloud_only":
-                        error_tracker.record_skip(
-                            SkipCategory.CLOUD_ONLY,
-                            f"{file_path} (cloud placeholder - copy failed)",
-                        )
-                        if verbose:
-                            progress.console.print(
-                                f"[SKIP] {file_path} (cloud_only)",
-                                highlight=False,
-                            )
-                    else:
-                        error_tracker.record_skip(
-                            SkipCategory.PATH_NOT_FOUND,
-                            f"{file_path} (not available - {availability_reason})",
+                            f"[HYDRATED] {file_path} ({result.hydration_method})",
+                            highlight=False,
                         )
+
+                    if result.skip_category is not None:
+                        error_tracker.record_skip(result.skip_category, result.skip_context)
+                        # Output parseable skip event for Streamlit (verbose only)
                         if verbose:
                             progress.console.print(
-                                f"[SKIP] {file_path} (path_not_found: {availability_reason})",
-                                highlight=False,
+                                f"[SKIP] {file_path} ({result.skip_event})", highlight=False
                             )
-                    skipped_count += 1
-                    progress.update(task, advance=1)
-                    continue
-
-                # Determine which path to extract from (original or temp copy)
-                extract_from = alt_path if alt_path else file_path
-
-                # Log successful hydration if verbose
-                if verbose and availability_reason in ("hydrated", "copy_hydrated"):
-                    method = "copied to temp" if alt_path else "downloaded"
-                    progress.console.print(
-                        f"[HYDRATED] {file_path} ({method})",
-                        highlight=False,
-                    )
-
-                # Check file size before extraction
-                file_size = extract_from.stat().st_size
-                if file_size == 0:
-                    error_tracker.record_skip(
-                        SkipCategory.EMPTY_CONTENT,
-                        f"{file_path} (0 bytes - likely OneDrive placeholder not downloaded)",
-                    )
-                    if verbose:
-                        progress.console.print(
-                            f"[SKIP] {file_path} (empty_content: 0 bytes)", highlight=False
-                        )
-                    skipped_count += 1
-                    progress.update(task, advance=1)
-                    continue
-
-                # Extract text from the available path (original or temp copy)
-                text = extract_text_from_file(extract_from)
-
-                # Check for empty content after extraction
-                if not text or not text.strip():
-                    error_tracker.record_skip(
-                        SkipCategory.EMPTY_CONTENT,
-                        f"{file_path} ({file_size} bytes but no extractable text)",
-                    )
-                    if verbose:
-                        progress.console.print(
-                            f"[SKIP] {file_path} (empty_content: no text extracted)",
-                            highlight=False,
-                        )
-                    skipped_count += 1
-                    progress.update(task, advance=1)
-                    continue
-
-                # Get file metadata from original path (for correct dates/paths)
-                file_meta = extract_file_metadata(file_path)
-
-                # Try to extract frontmatter if Markdown
-                frontmatter = {}
-                if file_path.suffix.lower() in [".md", ".markdown"]:
-                    content = extract_from.read_text(encoding="utf-8")
-                    frontmatter = extract_yaml_frontmatter(content)
-
-                # Merge tags from source config and frontmatter
-                doc_tags = list(source_cfg.tags)
-                if frontmatter and "tags" in frontmatter:
-                    doc_tags.extend(frontmatter["tags"])
-
-                # Calculate content checksum for incremental indexing
-                content_checksum = calculate_content_checksum(text)
-
-                # Create document with source metadata
-                doc = Document(
-                    id=str(uuid.uuid4()),
-                    filename=file_path.name,
-                    source_path=file_path.absolute(),
-                    format=file_path.suffix.lstrip(".").lower(),
-                    created_date=file_meta.get("created_date"),
-                    modified_date=file_meta.get("modified_date"),
-                    quality_rating=source_cfg.quality,
-                    tags=doc_tags,
-                    word_count=count_words(text),
-                    source_name=source_cfg.name,
-                    voice_notes=source_cfg.voice_notes,
-                    content_checksum=content_checksum,
-                )
-
-                # Save extracted text
-                text_file = output / f"{doc.id}.txt"
-                text_file.write_text(text, encoding="utf-8")
-
-                # Save metadata
-                meta_file = output / f"{doc.id}.json"
-                meta_file.write_text(doc.model_dump_json(indent=2), encoding="utf-8")
-
-                # Create shadow copy for offline access if enabled
-                if is_shadow_copy_enabled():
-                    shadow_path = build_shadow_path_for_local(file_path)
-                    if should_update_shadow_copy(file_path, shadow_path):
-                        create_shadow_copy(file_path, shadow_path)
-
-                extracted_count += 1
-                # Update file stats to mark as extracted
-                error_tracker.extracted_by_type[file_path.suffix.lower() or "(no extension)"] += 1
-                error_tracker.total_extracted += 1
-
-            except Exception as e:
-                # Categorize and track error
-                category = error_tracker.categorize_exception(e, file_path)
-                error_tracker.record_error(category, f"{source_cfg.name}/{file_path.name}", e)
-                # Print error on separate line (progress is transient so this works)
-                progress.console.print(f"  [red]✗ {file_path.name}: {type(e).__name__}[/red]")
-                failed_count += 1
-
-            progress.update(task, advance=1)
+                        skipped_count += 1
+                        progress.update(task, advance=1)
+                        continue
+
+                    assert result.document is not None
+                    save_extracted_document(result.document, result.text, output)
+
+                    # Create shadow copy for offline access if enabled
+                    update_shadow_copy(file_path)
+
+                    extracted_count += 1
+                    # Update file stats to mark as extracted
+                    suffix = file_path.suffix.lower() or "(no extension)"
+                    error_tracker.extracted_by_type[suffix] += 1
+                    error_tracker.total_extracted += 1
+
+                except Exception as e:
+                    # Categorize and track error
+                    category = error_tracker.categorize_exception(e, file_path)
+                    error_tracker.record_error(category, f"{source_cfg.name}/{file_path.name}", e)
+                    # Print error on separate line (progress is transient so this works)
+                    progress.console.print(f"  [red]✗ {file_path.name}: {type(e).__name__}[/red]")
+                    failed_count += 1
+
+                progress.update(task, advance=1)
+        except BaseException:
+            # Interrupted (Ctrl-C) or failed outside a file: drop the queued
+            # files instead of extracting them all before exiting
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     return extracted_count, skipped_count, failed_count
@@ -0,0 +1,351 @@
+"""Streaming ingestion engine: extract → chunk → embed → index in one pass.
+
+Extraction runs in a background thread and hands documents to the main
+thread through a bounded queue, so file I/O and parsing overlap with
+embedding. Chunks are buffered and flushed to the vector store in batches,
+keeping memory bounded by the queue size plus one embedding batch. PDFs are
+chunked page by page as they are extracted rather than joined into one
+string first; a document's chunks are still queued and indexed together,
+since each carries the document's content checksum.
+"""
+
+import queue
+import threading
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from pathlib import Path
+
+from rich.console import Console
+from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
+from bloginator.cli._extract_files_engine import (
+    FileExtractionResult,
+    extract_file,
+    save_extracted_document,
+    update_shadow_copy,
+)
+from bloginator.cli._skip_tracking import SkipCategory
+from bloginator.cli.error_reporting import ErrorTracker
+from bloginator.cli.extract_utils import should_skip_file
+from bloginator.corpus_config import CorpusSource
+from bloginator.extraction import (
+    LegacyOfficeBatch,
+    chunk_text_by_paragraphs,
+    extract_text_from_file,
+    iter_text_from_file,
+)
+from bloginator.indexing import CorpusIndexer
+from bloginator.models import Chunk, Document
+
+
+# Formats chunked piece by piece while they are extracted
+STREAMED_SUFFIXES = frozenset({".pdf"})
+
+# (source config, file path, extraction result, extraction error)
+_ExtractionEvent = tuple[CorpusSource, Path, FileExtractionResult | None, Exception | None]
+
+
+class ChunkBatcher:
+    """Buffer document chunks and write them to the index in batches.
+
+    Attributes:
+        indexer: Corpus indexer receiving the batches
+        batch_size: Number of chunks that triggers a flush
+        pending: Buffered (document, chunks) pairs awaiting a flush
+        pending_chunks: Number of chunks currently buffered
+        total_chunks: Number of chunks written so far
+    """
+
+    def __init__(self, indexer: CorpusIndexer, batch_size: int = 256):
+        """Initialize chunk batcher.
+
+        Args:
+            indexer: Corpus indexer receiving the batches
+            batch_size: Number of chunks that triggers a flush
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        self.indexer = indexer
+        self.batch_size = batch_size
+        self.pending: list[tuple[Document, list[Chunk]]] = []
+        self.pending_chunks = 0
+        self.total_chunks = 0
+
+    def add(self, document: Document, chunks: list[Chunk]) -> None:
+        """Buffer a document's chunks until the next flush.
+
+        Args:
+            document: Document metadata
+            chunks: Chunks for the document
+        """
+        self.pending.append((document, chunks))
+        self.pending_chunks += len(chunks)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether enough chunks are buffered to warrant a flush."""
+        return self.pending_chunks >= self.batch_size
+
+    def flush(self) -> list[Document]:
+        """Embed and write all buffered chunks.
+
+        Chunks previously indexed for the documents are deleted after the
+        write succeeds. The buffer is cleared even if the write fails so that
+        one bad batch does not poison the next one.
+
+        Returns:
+            Documents written by this flush
+        """
+        if not self.pending:
+            return []
+
+        batch, chunk_count = self.pending, self.pending_chunks
+        self.pending = []
+        self.pending_chunks = 0
+
+        # Changed documents' old chunks are removed only once their
+        # replacements are written
+        self.indexer.index_documents(batch, replace=True)
+        self.total_chunks += chunk_count
+        return [document for document, _ in batch]
+
+
+def _produce_extractions(
+    work: Iterable[tuple[CorpusSource, Path]],
+    existing_docs: dict[str, tuple[str, datetime]],
+    force: bool,
+    events: "queue.Queue[_ExtractionEvent | None]",
+    stop: threading.Event,
+    extract_text: Callable[[Path], str],
+    iter_text: Callable[[Path], Iterable[str]] | None = None,
+    chunk_size: int = 1000,
+    convert_legacy: Callable[[list[Path]], dict[Path, str | Exception]] | None = None,
+) -> None:
+    """Extract files in order and push results onto the queue.
+
+    Args:
+        work: (source config, file path) pairs to extract
+        existing_docs: Indexed documents for skip logic and ID reuse
+        force: Force re-extraction flag
+        events: Bounded queue consumed by the main thread
+        stop: Set by the consumer to abandon remaining work
+        extract_text: Text extractor for a single file
+        iter_text: Piecewise extractor for STREAMED_SUFFIXES files, which are
+            chunked as they are extracted (None extracts them whole)
+        chunk_size: Maximum chunk size in characters
+        convert_legacy: Batch converter for legacy Office files (e.g.
+            ExtractionSupervisor.convert_legacy_office; default: in-process)
+    """
+    work = list(work)
+    # Legacy Office files are converted a few at a time as they come up
+    legacy = LegacyOfficeBatch(extract_text, convert_legacy)
+    try:
+        legacy.prepare(p for _, p in work if not should_skip_file(p, existing_docs, force)[0])
+        for source_cfg, file_path in work:
+            if stop.is_set():
+                break
+
+            existing = existing_docs.get(str(file_path.absolute()))
+            document_id = existing[0] if existing else None
+
+            try:
+                streamed = iter_text and file_path.suffix.lower() in STREAMED_SUFFIXES
+                result = extract_file(
+                    file_path,
+                    source_cfg,
+                    existing_docs,
+                    force,
+                    document_id,
+                    legacy,
+                    iter_text=iter_text if streamed else None,
+                    chunk_size=chunk_size,
+                )
+                events.put((source_cfg, file_path, result, None))
+            except Exception as e:
+                events.put((source_cfg, file_path, None, e))
+    finally:
+        events.put(None)
+
+
+def ingest_files(
+    work: list[tuple[CorpusSource, Path]],
+    indexer: CorpusIndexer,
+    existing_docs: dict[str, tuple[str, datetime]],
+    force: bool,
+    error_tracker: ErrorTracker,
+    console: Console,
+    chunk_size: int = 1000,
+    batch_size: int = 256,
+    queue_size: int = 8,
+    extracted_dir: Path | None = None,
+    verbose: bool = False,
+    extract_text: Callable[[Path], str] = extract_text_from_file,
+    iter_text: Callable[[Path], Iterable[str]] | None = iter_text_from_file,
+    convert_legacy: Callable[[list[Path]], dict[Path, str | Exception]] | None = None,
+) -> tuple[int, int, int]:
+    """Stream files through extraction, chunking, embedding and indexing.
+
+    Args:
+        work: (source config, file path) pairs in processing order
+        indexer: Corpus indexer to write into
+        existing_docs: Indexed documents (see CorpusIndexer.get_indexed_sources)
+        force: Force re-extraction flag
+        error_tracker: Error tracker instance
+        console: Rich console
+        chunk_size: Maximum chunk size in characters
+        batch_size: Chunks per embedding/write batch
+        queue_size: Maximum extracted documents held between stages
+        extracted_dir: If set, also persist extracted text and metadata here
+        verbose: If True, show detailed progress information
+        extract_text: Text extractor (e.g. ExtractionSupervisor.extract)
+        iter_text: Piecewise extractor used to chunk PDFs page by page (e.g.
+            ExtractionSupervisor.iter_extract); not used with extracted_dir,
+            which needs the whole text
+        convert_legacy: Batch converter for legacy Office files (e.g.
+            ExtractionSupervisor.convert_legacy_office; default: in-process)
+
+    Returns:
+        Tuple of (ingested_count, skipped_count, failed_count)
+    """
+    ingested_count = 0
+    skipped_count = 0
+    failed_count = 0
+
+    batcher = ChunkBatcher(indexer, batch_size=batch_size)
+    events: queue.Queue[_ExtractionEvent | None] = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_produce_extractions,
+        args=(
+            work,
+            existing_docs,
+            force,
+            events,
+            stop,
+            extract_text,
+            iter_text if extracted_dir is None else None,
+            chunk_size,
+            convert_legacy,
+        ),
+        name="bloginator-ingest-extract",
+        daemon=True,
+    )
+
+    def flush_batch() -> None:
+        nonlocal ingested_count, failed_count
+        pending = [document for document, _ in batcher.pending]
+        try:
+            written = batcher.flush()
+        except Exception as e:
+            # The whole batch failed to embed or write; attribute it to each document
+            category = error_tracker.categorize_exception(e)
+            for document in pending:
+                error_tracker.record_error(category, document.filename, e)
+            progress.console.print(f"  [red]✗ Batch of {len(pending)}: {type(e).__name__}[/red]")
+            failed_count += len(pending)
+            return
+
+        for document in written:
+            ext = Path(document.filename).suffix.lower() or "(no extension)"
+            error_tracker.extracted_by_type[ext] += 1
+            error_tracker.total_extracted += 1
+        ingested_count += len(written)
+
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TextColumn("• {task.fields[current_file]}"),
+        console=console,
+        transient=not verbose,
+    )
+
+    with progress:
+        task = progress.add_task("[green]Ingesting", total=len(work), current_file="starting...")
+        producer.start()
+
+        try:
+            while (event := events.get()) is not None:
+                source_cfg, file_path, result, error = event
+
+                progress.update(task, current_file=str(file_path))
+                if verbose:
+                    progress.console.print(f"Ingesting: {file_path}", highlight=False)
+
+                error_tracker.record_file(file_path, extracted=False)
+
+                try:
+                    if error is not None:
+                        raise error
+                    assert result is not None
+
+                    if verbose and result.hydration_method:
+                        progress.console.print(
+                            f"[HYDRATED] {file_path} ({result.hydration_method})",
+                            highlight=False,
+                        )
+
+                    if result.skip_category is not None:
+                        error_tracker.record_skip(result.skip_category, result.skip_context)
+                        if verbose:
+                            progress.console.print(
+                                f"[SKIP] {file_path} ({result.skip_event})", highlight=False
+                            )
+                        skipped_count += 1
+                        progress.update(task, advance=1)
+                        continue
+
+                    document = result.document
+                    assert document is not None
+
+                    # Modified on disk but identical content: nothing to re-embed
+                    if not indexer.document_needs_reindexing(document):
+                        error_tracker.record_skip(SkipCategory.ALREADY_EXTRACTED, str(file_path))
+                        if verbose:
+                            progress.console.print(
+                                f"[SKIP] {file_path} (already_indexed)", highlight=False
+                            )
+                        skipped_count += 1
+                        progress.update(task, advance=1)
+                        continue
+
+                    chunks = result.chunks
+                    if chunks is None:
+                        chunks = chunk_text_by_paragraphs(
+                            text=result.text,
+                            document_id=document.id,
+                            max_chunk_size=chunk_size,
+                        )
+
+                    if extracted_dir is not None:
+                        save_extracted_document(document, result.text, extracted_dir)
+
+                    update_shadow_copy(file_path)
+
+                    batcher.add(document, chunks)
+
+                except Exception as e:
+                    category = error_tracker.categorize_exception(e, file_path)
+                    error_tracker.record_error(category, f"{source_cfg.name}/{file_path.name}", e)
+                    progress.console.print(f"  [red]✗ {file_path.name}: {type(e).__name__}[/red]")
+                    failed_count += 1
+
+                if batcher.is_full:
+                    flush_batch()
+
+                progress.update(task, advance=1)
+
+            flush_batch()
+        finally:
+            stop.set()
+            # Drain so a producer blocked on a full queue can observe the stop flag
+            while producer.is_alive():
+                try:
+                    events.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            producer.join()
+
+    return ingested_count, skipped_count, failed_count
@@ -0,0 +1,256 @@
+"""CLI command for generating many blogs in one process."""
+
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import click
+from rich.console import Console
+from rich.markup import escape
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from rich.table import Table
+
+from bloginator.cli._batch_engine import (
+    BatchRunner,
+    BlogResult,
+    build_report,
+    load_manifest,
+    write_report,
+)
+from bloginator.config import config
+from bloginator.generation._llm_cache import cache_report
+from bloginator.generation._llm_coalesce import coalescing_report
+from bloginator.generation._ollama_session import ollama_report, start_ollama_session
+from bloginator.generation.llm_factory import create_llm_from_config
+from bloginator.search import CorpusSearcher
+
+
+@click.command()
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--index",
+    "index_dir",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Path to index directory",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False, path_type=Path),
+    required=True,
+    help="Directory for per-blog outlines, drafts and the summary report",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    envvar="BLOGINATOR_BATCH_CONCURRENCY",
+    help="Blogs generated at once, which is also the limit on LLM requests in flight "
+    "(default: 1)",
+)
+@click.option(
+    "--only",
+    "title_filter",
+    help="Only generate blogs whose title contains this text (case-insensitive)",
+)
+@click.option(
+    "--temperature",
+    type=float,
+    default=0.7,
+    help="LLM sampling temperature 0.0-1.0 (default: 0.7)",
+)
+@click.option(
+    "--sources-per-section",
+    type=int,
+    default=5,
+    help="Number of sources to retrieve per section (default: 5)",
+)
+@click.option(
+    "--max-section-words",
+    type=int,
+    default=70,
+    help="Target words per section (default: 70)",
+)
+@click.option(
+    "--skip-quality-review",
+    is_flag=True,
+    help="Skip the final quality review of each draft",
+)
+@click.option(
+    "--report",
+    "report_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Summary report path (default: <output-dir>/batch-report.json)",
+)
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Show LLM request/response interactions",
+)
+def batch(
+    manifest: Path,
+    index_dir: Path,
+    output_dir: Path,
+    concurrency: int,
+    title_filter: str | None,
+    temperature: float,
+    sources_per_section: int,
+    max_section_words: int,
+    skip_quality_review: bool,
+    report_file: Path | None,
+    verbose: bool,
+) -> None:
+    r"""Generate outlines and drafts for every blog in a manifest.
+
+    The manifest is YAML or JSON: a list of blogs, or a mapping with the list
+    under "topics" (as in corpus/blog-topics.yaml). Each blog needs a title
+    and keywords, or an "outline" JSON file to draft from; thesis,
+    classification, audience and sections are optional.
+
+    All blogs share one loaded index, LLM client and prompt set, so the
+    embedding model and Chroma collection load once per batch. Each blog
+    writes <slug>.outline.json, <slug>.outline.md, <slug>.md and
+    <slug>.json; a summary report with per-stage timings is written at the
+    end. Exits with status 1 if any blog failed.
+
+    Examples:
+      Generate every topic, two at a time:
+        bloginator batch corpus/blog-topics.yaml \\
+          --index output/index \\
+          -o output/batch \\
+          --concurrency 2
+
+      Only the hiring topics, without quality review:
+        bloginator batch corpus/blog-topics.yaml \\
+          --index output/index \\
+          -o output/batch \\
+          --only hiring --skip-quality-review
+    """
+    logging.basicConfig(level=logging.WARNING)
+    logger = logging.getLogger(__name__)
+    console = Console()
+
+    try:
+        items = load_manifest(manifest)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]✗[/red] Invalid manifest: {e}")
+        sys.exit(1)
+    if title_filter:
+        items = [item for item in items if title_filter.lower() in item.title.lower()]
+    if not items:
+        console.print("[yellow]No blogs to generate[/yellow]")
+        return
+
+    started = time.perf_counter()
+    setup_timings: dict[str, float] = {}
+
+    with console.status("Loading corpus index and embedding model..."):
+        stage_started = time.perf_counter()
+        try:
+            searcher = CorpusSearcher(index_dir=index_dir)
+        except Exception as e:
+            logger.error(f"Failed to load index: {e}")
+            console.print(f"[red]✗[/red] Failed to load index: {e}")
+            sys.exit(1)
+        setup_timings["index"] = time.perf_counter() - stage_started
+
+    with console.status("Connecting to LLM..."):
+        stage_started = time.perf_counter()
+        try:
+            llm_client = create_llm_from_config(
+                verbose=verbose, use_cache=config.LLM_CACHE, coalesce=config.LLM_COALESCE
+            )
+        except Exception as e:
+            logger.error(f"Failed to connect to LLM: {e}")
+            console.print(f"[red]✗[/red] Failed to connect to LLM: {e}")
+            console.print("[dim]Make sure Ollama is running and check .env configuration[/dim]")
+            sys.exit(1)
+        setup_timings["llm"] = time.perf_counter() - stage_started
+
+    if config.OLLAMA_PRELOAD:
+        with console.status("Loading model..."):
+            stage_started = time.perf_counter()
+            if start_ollama_session(llm_client) is not None:
+                setup_timings["model_load"] = time.perf_counter() - stage_started
+
+    runner = BatchRunner(
+        llm_client=llm_client,
+        searcher=searcher,
+        output_dir=output_dir,
+        concurrency=concurrency,
+        temperature=temperature,
+        sources_per_section=sources_per_section,
+        max_section_words=max_section_words,
+        quality_review=not skip_quality_review,
+    )
+
+    console.print(f"[bold cyan]Generating {len(items)} blogs ({concurrency} at a time)[/bold cyan]")
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Generating blogs...", total=len(items))
+
+        def blog_done(result: BlogResult) -> None:
+            """Report a finished blog and advance the bar."""
+            if result.status == "ok":
+                progress.console.print(f"[green]✓[/green] {escape(result.title)}")
+            else:
+                progress.console.print(
+                    f"[red]✗[/red] {escape(result.title)}: {escape(result.error or '')}"
+                )
+            progress.advance(task)
+
+        results = runner.run(items, on_done=blog_done)
+
+    report = build_report(
+        results, setup_timings, time.perf_counter() - started, searcher=runner.searcher
+    )
+    report_path = report_file or output_dir / "batch-report.json"
+    write_report(report, report_path)
+
+    _display_summary(console, report)
+    console.print(f"[green]✓[/green] Saved report to {report_path}")
+    for line in (
+        cache_report(llm_client),
+        coalescing_report(llm_client),
+        ollama_report(llm_client),
+    ):
+        if line:
+            console.print(f"[dim]{line}[/dim]")
+
+    if report["failed"]:
+        sys.exit(1)
+
+
+def _display_summary(console: Console, report: dict[str, Any]) -> None:
+    """Show per-blog stage timings and batch totals."""
+    table = Table(title="Batch Summary")
+    table.add_column("Blog")
+    table.add_column("Status")
+    for stage in report["stage_totals"]:
+        table.add_column(stage.title(), justify="right")
+    table.add_column("Words", justify="right")
+
+    for result in report["results"]:
+        status = "[green]ok[/green]" if result["status"] == "ok" else "[red]failed[/red]"
+        stages = [
+            f"{result['timings'][stage]:.1f}s" if stage in result["timings"] else "-"
+            for stage in report["stage_totals"]
+        ]
+        table.add_row(escape(result["title"]), status, *stages, str(result["total_words"]))
+
+    console.print()
+    console.print(table)
+    setup = ", ".join(f"{name} {secs:.1f}s" for name, secs in report["setup_timings"].items())
+    console.print(
+        f"{report['succeeded']}/{report['blogs']} blogs in {report['wall_seconds']:.1f}s "
+        f"(setup: {setup})"
+    )
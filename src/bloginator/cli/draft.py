@@ -14,6 +14,7 @@ from bloginator.cli._draft_output import (
     generate_draft_with_progress,
     save_draft_output,
     save_to_history,
+    update_draft_from_markdown,
 )
 from bloginator.cli._draft_validators import score_voice as score_draft_voice
 from bloginator.cli._draft_validators import (
@@ -21,70 +22,13 @@ from bloginator.cli._draft_validators import (
     validate_safety_pre_generation,
 )
 from bloginator.generation import DraftGenerator
+from bloginator.generation._llm_cache import cache_report
+from bloginator.generation._llm_coalesce import coalescing_report
+from bloginator.generation._ollama_session import ollama_report
 from bloginator.generation.llm_base import LLMResponse
 from bloginator.models.draft import Draft, DraftSection
 
 
-def _update_draft_from_markdown(draft: Draft, markdown_content: str) -> None:
-    """Update draft object with revised markdown content.
-
-    Parses markdown to extract sections and updates draft in-place.
-    Preserves draft metadata (title, keywords, etc.) while replacing content.
-
-    Args:
-        draft: Draft object to update
-        markdown_content: Revised markdown content from quality review
-    """
-    lines = markdown_content.strip().split("\n")
-
-    # Extract title (first # heading)
-    if lines and lines[0].startswith("# "):
-        draft.title = lines[0][2:].strip()
-        lines = lines[1:]
-
-    # Parse sections (## headings)
-    sections = []
-    current_section_title = None
-    current_section_content = []
-
-    for line in lines:
-        if line.startswith("## "):
-            # Save previous section if exists
-            if current_section_title:
-                from bloginator.models.draft import DraftSection
-
-                sections.append(
-                    DraftSection(
-                        title=current_section_title,
-                        content="\n".join(current_section_content).strip(),
-                        citations=[],  # Citations preserved from original
-                        subsections=[],
-                    )
-                )
-            # Start new section
-            current_section_title = line[3:].strip()
-            current_section_content = []
-        else:
-            current_section_content.append(line)
-
-    # Save last section
-    if current_section_title:
-        from bloginator.models.draft import DraftSection
-
-        sections.append(
-            DraftSection(
-                title=current_section_title,
-                content="\n".join(current_section_content).strip(),
-                citations=[],
-                subsections=[],
-            )
-        )
-
-    # Update draft sections
-    draft.sections = sections
-    draft.calculate_stats()
-
-
 def _replace_batch_placeholders(draft: Draft, responses: dict[int, LLMResponse]) -> None:
     """Replace placeholder content in draft sections with actual LLM responses.
 
@@ -218,6 +162,20 @@ def _replace_batch_placeholders(draft: Draft, responses: dict[int, LLMResponse])
     envvar="BLOGINATOR_BATCH_TIMEOUT",
     help="Batch mode timeout in seconds (default: 1800 = 30 minutes)",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    envvar="BLOGINATOR_DRAFT_CONCURRENCY",
+    help="Sections to generate in parallel (default: 1). Needs a provider that accepts "
+    "concurrent requests",
+)
+@click.option(
+    "--stream/--no-stream",
+    default=True,
+    envvar="BLOGINATOR_DRAFT_STREAM",
+    help="Stream section text from the LLM and show it as it is written (default: on)",
+)
 def draft(
     index_dir: Path,
     outline_file: Path,
@@ -237,6 +195,8 @@ def draft(
     similarity: float,
     batch: bool,
     batch_timeout: int,
+    concurrency: int,
+    stream: bool,
 ) -> None:
     r"""Generate document draft from outline.
 
@@ -266,6 +226,12 @@ def draft(
           --outline outline.json \\
           -o draft.json \\
           --format json
+
+      Generate up to 4 sections at a time:
+        bloginator draft --index output/index \\
+          --outline outline.json \\
+          -o draft.md \\
+          --concurrency 4
     """
     # Configure logging
     if log_file:
@@ -308,10 +274,12 @@ def draft(
             validate_safety_pre_generation(outline_obj, config_dir, progress, console)
 
         # Initialize generator
+        # Batch mode returns placeholders immediately, so there is nothing to overlap
         generator = DraftGenerator(
             llm_client=llm_client,
             searcher=searcher,
             sources_per_section=sources_per_section,
+            max_concurrency=1 if batch else concurrency,
         )
 
         # Generate draft with progress tracking
@@ -323,6 +291,8 @@ def draft(
             progress,
             logger,
             console,
+            # Batch mode answers with placeholders; there is nothing to stream
+            stream=stream and not batch,
         )
 
         # In batch mode, collect responses and replace placeholders
@@ -358,7 +328,7 @@ def draft(
             progress.update(task, completed=True)
 
             # Update draft object with revised content
-            _update_draft_from_markdown(draft_obj, revised_content)
+            update_draft_from_markdown(draft_obj, revised_content)
             logger.info("Quality review complete - draft revised for brevity and clarity")
 
             console.print("[bold green]✓ Quality review complete[/bold green]")
@@ -383,3 +353,11 @@ def draft(
 
     # Display results and recommendations
     display_results(draft_obj, searcher, score_voice, validate_safety, console)
+
+    for report in (
+        cache_report(llm_client),
+        coalescing_report(llm_client),
+        ollama_report(llm_client),
+    ):
+        if report:
+            console.print(f"[dim]{report}[/dim]")
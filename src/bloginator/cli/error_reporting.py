@@ -10,6 +10,7 @@ from rich.table import Table
 
 # Re-export SkipCategory for backwards compatibility
 from bloginator.cli._skip_tracking import SkipCategory
+from bloginator.extraction import ExtractionTimeoutError, ExtractionWorkerCrashError
 
 
 class ErrorCategory(str, Enum):
@@ -23,6 +24,7 @@ class ErrorCategory(str, Enum):
     NETWORK_ERROR = "network_error"
     CONFIG_ERROR = "config_error"
     DEPENDENCY_ERROR = "dependency_error"
+    TIMEOUT = "timeout"
     UNKNOWN = "unknown"
 
 
@@ -90,6 +92,14 @@ class ErrorTracker:
         """
         error_msg = str(exception).lower()
 
+        # Supervised extraction killed the worker for exceeding its time limit
+        if isinstance(exception, ExtractionTimeoutError):
+            return ErrorCategory.TIMEOUT
+
+        # Extractor crashed its worker process (e.g. segfault in native code)
+        if isinstance(exception, ExtractionWorkerCrashError):
+            return ErrorCategory.CORRUPTED_FILE
+
         # File not found errors
         if isinstance(exception, FileNotFoundError):
             return ErrorCategory.FILE_NOT_FOUND
@@ -153,6 +163,7 @@ class ErrorTracker:
             ErrorCategory.NETWORK_ERROR: "Check network connectivity and firewall settings. Verify the remote host is reachable.",
             ErrorCategory.CONFIG_ERROR: "Check YAML syntax in corpus.yaml. Verify all paths and settings are valid. Use a YAML validator or linter.",
             ErrorCategory.DEPENDENCY_ERROR: "Required Python package may be missing. Try: pip install -e '.[dev]' or check requirements.txt",
+            ErrorCategory.TIMEOUT: "Extraction exceeded its per-file time limit and the worker was killed. The file may be malformed or very large; open it in the native application to check, or raise the limit with BLOGINATOR_EXTRACTION_TIMEOUT (or the PDF/legacy Office/OCR variants).",
             ErrorCategory.UNKNOWN: "Review the error details below. Check file format, permissions, and content validity.",
         }
         return advice.get(category, "Review error details and check documentation.")
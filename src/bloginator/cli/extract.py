@@ -50,6 +50,12 @@ from bloginator.cli.extract_single import extract_single_source
     default=None,
     help="Number of parallel workers (default: auto-detect based on CPU count)",
 )
+@click.option(
+    "--isolation/--no-isolation",
+    default=True,
+    help="Extract each file in a supervised worker process with time and memory "
+    "limits (config mode, default: on)",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -64,6 +70,7 @@ def extract(
     tags: str | None,
     force: bool,
     workers: int | None,
+    isolation: bool,
     verbose: bool,
 ) -> None:
     """Extract documents from SOURCE to OUTPUT directory.
@@ -104,7 +111,7 @@ def extract(
     # Determine extraction mode
     if config:
         # MODE 2: Config-based multi-source extraction
-        extract_from_config(config, output, console, force, verbose)
+        extract_from_config(config, output, console, force, verbose, workers, isolation)
     elif source:
         # MODE 1: Legacy single-source extraction with parallel processing
         tag_list = [t.strip() for t in tags.split(",")] if tags else []
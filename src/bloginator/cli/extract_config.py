@@ -10,6 +10,7 @@ from bloginator.cli._extract_config_helpers import (
     process_all_sources,
 )
 from bloginator.cli.extract_utils import load_existing_extractions
+from bloginator.extraction import ExtractionSupervisor
 from bloginator.utils.cloud_files import cleanup_hydration_temp_dir
 
 
@@ -19,15 +20,23 @@ def extract_from_config(
     console: Console,
     force: bool = False,
     verbose: bool = False,
+    workers: int | None = None,
+    isolate: bool = True,
 ) -> None:
     """Extract from multiple sources using corpus.yaml config.
 
+    By default each file is extracted in a supervised worker process with
+    per-format time and memory limits, so a hanging or crashing extractor
+    is killed and reported as an error instead of stalling the run.
+
     Args:
         config_path: Path to corpus.yaml configuration file
         output: Output directory for extracted documents
         console: Rich console for output
         force: If True, re-extract all files
         verbose: If True, show detailed progress information
+        workers: Number of extraction worker processes (None = auto-detect)
+        isolate: If False, extract in-process and sequentially (no time limits)
     """
     from bloginator.cli.error_reporting import ErrorTracker
 
@@ -50,18 +59,30 @@ def extract_from_config(
     # Show sources table
     display_sources_table(enabled_sources, console)
 
-    # Process each source
-    total_extracted, total_skipped, total_failed = process_all_sources(
-        enabled_sources=enabled_sources,
-        config_dir=config_path.parent,
-        output=output,
-        corpus_config=corpus_config,
-        existing_docs=existing_docs,
-        force=force,
-        error_tracker=error_tracker,
-        console=console,
-        verbose=verbose,
-    )
+    # Process each source, reusing one pool of extraction workers across sources
+    supervisor = ExtractionSupervisor(max_workers=workers) if isolate else None
+    try:
+        total_extracted, total_skipped, total_failed = process_all_sources(
+            enabled_sources=enabled_sources,
+            config_dir=config_path.parent,
+            output=output,
+            corpus_config=corpus_config,
+            existing_docs=existing_docs,
+            force=force,
+            error_tracker=error_tracker,
+            console=console,
+            verbose=verbose,
+            supervisor=supervisor,
+        )
+    finally:
+        if supervisor is not None:
+            supervisor.close()
+
+    if supervisor is not None and (supervisor.timeouts or supervisor.crashes):
+        console.print(
+            f"[yellow]Extraction workers killed: {supervisor.timeouts} timeout(s), "
+            f"{supervisor.crashes} crash(es)[/yellow]"
+        )
 
     # Save report to file if there were skips or errors
     report_file: Path | None = None
@@ -15,8 +15,10 @@ from bloginator.cli.error_reporting import (
     create_error_panel,
 )
 from bloginator.extraction import chunk_text_by_paragraphs
+from bloginator.generation._voice_samples import precompute_voice_samples
 from bloginator.indexing import CorpusIndexer
 from bloginator.models import Document
+from bloginator.search import CorpusSearcher
 
 
 @click.command()
@@ -40,7 +42,29 @@ from bloginator.models import Document
     default=False,
     help="Force rebuild: purge existing index and rebuild from scratch",
 )
-def index(source: Path, output: Path, chunk_size: int, force: bool) -> None:
+@click.option(
+    "--voice-profile/--no-voice-profile",
+    default=False,
+    help=(
+        "Store an author voice profile with the index for fast voice scoring. "
+        "Drafts are then scored by similarity to the nearest author-style cluster, "
+        "which runs higher than the default sample-based score (default: off)"
+    ),
+)
+@click.option(
+    "--precompute-voice",
+    is_flag=True,
+    default=False,
+    help="Store voice-sample search results with the index for faster drafting",
+)
+def index(
+    source: Path,
+    output: Path,
+    chunk_size: int,
+    force: bool,
+    voice_profile: bool,
+    precompute_voice: bool,
+) -> None:
     """Build searchable index from extracted documents in SOURCE.
 
     SOURCE should be the output directory from the 'extract' command,
@@ -49,6 +73,8 @@ def index(source: Path, output: Path, chunk_size: int, force: bool) -> None:
     Examples:
         bloginator index output/extracted -o output/index
         bloginator index output/extracted -o output/index --chunk-size 500
+        bloginator index output/extracted -o output/index --precompute-voice
+        bloginator index output/extracted -o output/index --voice-profile
     """
     console = Console()
 
@@ -136,10 +162,6 @@ def index(source: Path, output: Path, chunk_size: int, force: bool) -> None:
                     progress.update(task, advance=1)
                     continue
 
-                # Delete old version if it exists (for reindexing)
-                if indexer.get_document_checksum(document.id) is not None:
-                    indexer.delete_document(document.id)
-
                 # Load extracted text (look in same directory as JSON file)
                 text_file = meta_file.parent / f"{document.id}.txt"
                 if not text_file.exists():
@@ -162,8 +184,9 @@ def index(source: Path, output: Path, chunk_size: int, force: bool) -> None:
                     max_chunk_size=chunk_size,
                 )
 
-                # Index document
-                indexer.index_document(document, chunks)
+                # Index document, replacing the old version's chunks once the
+                # new ones are written
+                indexer.index_documents([(document, chunks)], replace=True)
 
                 indexed_count += 1
 
@@ -198,6 +221,15 @@ def index(source: Path, output: Path, chunk_size: int, force: bool) -> None:
     console.print(f"  Collection: {info['collection_name']}")
     console.print(f"  Output directory: {info['output_dir']}")
 
+    if voice_profile:
+        profile_file = indexer.build_voice_profile()
+        if profile_file is not None:
+            console.print(f"  Voice profile: {profile_file}")
+
+    if precompute_voice and info["total_chunks"] > 0:
+        voice_file = precompute_voice_samples(CorpusSearcher(index_dir=output))
+        console.print(f"  Voice samples: {voice_file}")
+
     # Print skip summary if there were skips (with file path)
     if skipped_count > 0 and error_tracker.total_skipped > 0:
         error_tracker.print_skip_summary(console, show_file_path=report_file)
@@ -0,0 +1,218 @@
+"""CLI command for single-pass streaming ingestion (extract → chunk → embed → index)."""
+
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+from rich.console import Console
+
+from bloginator.cli._extract_config_helpers import (
+    collect_source_files,
+    display_sources_table,
+    load_config,
+    resolve_source_path,
+)
+from bloginator.cli._ingest_engine import ingest_files
+from bloginator.cli.error_reporting import ErrorTracker, create_error_panel
+from bloginator.extraction import (
+    ExtractionSupervisor,
+    extract_text_from_file,
+    iter_text_from_file,
+)
+from bloginator.indexing import CorpusIndexer
+from bloginator.utils.cloud_files import cleanup_hydration_temp_dir
+
+
+if TYPE_CHECKING:
+    from bloginator.corpus_config import CorpusSource
+
+
+@click.command()
+@click.option(
+    "-c",
+    "--config",
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+    help="Path to corpus.yaml configuration file",
+)
+@click.option(
+    "-o",
+    "--output",
+    required=True,
+    type=click.Path(path_type=Path),
+    help="Output directory for index",
+)
+@click.option(
+    "--extracted-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Also persist extracted text and metadata here (same layout as 'extract')",
+)
+@click.option(
+    "--chunk-size",
+    default=1000,
+    type=int,
+    help="Maximum chunk size in characters (default: 1000)",
+)
+@click.option(
+    "--batch-size",
+    default=256,
+    type=click.IntRange(min=1),
+    help="Chunks per embedding and index write batch (default: 256)",
+)
+@click.option(
+    "--queue-size",
+    default=8,
+    type=click.IntRange(min=1),
+    help="Maximum extracted documents buffered ahead of embedding (default: 8)",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Force rebuild: purge existing index and re-ingest every file",
+)
+@click.option(
+    "--isolation/--no-isolation",
+    default=True,
+    help="Extract each file in a supervised worker process with time and memory limits",
+)
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    help="Show verbose output with detailed progress information",
+)
+def ingest(
+    config: Path,
+    output: Path,
+    extracted_dir: Path | None,
+    chunk_size: int,
+    batch_size: int,
+    queue_size: int,
+    force: bool,
+    isolation: bool,
+    verbose: bool,
+) -> None:
+    """Extract, chunk, embed and index all corpus sources in a single pass.
+
+    Streams documents straight from the sources in corpus.yaml into the
+    vector index without the intermediate read-back that 'extract' followed
+    by 'index' requires. Files already in the index and unchanged since are
+    skipped, using the same rules as 'extract'.
+
+    Examples:
+        bloginator ingest -c corpus.yaml -o output/index
+        bloginator ingest -c corpus.yaml -o output/index --extracted-dir output/extracted
+        bloginator ingest -c corpus.yaml -o output/index --batch-size 512 --force
+    """
+    console = Console()
+    error_tracker = ErrorTracker()
+
+    corpus_config = load_config(config, error_tracker, console)
+
+    enabled_sources = corpus_config.get_enabled_sources()
+    if not enabled_sources:
+        console.print("[yellow]No enabled sources in config[/yellow]")
+        return
+
+    display_sources_table(enabled_sources, console)
+
+    # If force flag is set, purge existing index
+    if force and output.exists():
+        console.print(f"[yellow]🗑️  Purging existing index: {output}[/yellow]")
+        shutil.rmtree(output)
+        console.print("[green]✓ Index purged successfully[/green]\n")
+
+    if extracted_dir is not None:
+        extracted_dir.mkdir(parents=True, exist_ok=True)
+
+    # Collect the work list up front so progress has a known total
+    work: list[tuple[CorpusSource, Path]] = []
+    for source_cfg in enabled_sources:
+        resolved_path = resolve_source_path(source_cfg, config.parent, error_tracker, console)
+        if not resolved_path:
+            continue
+        files = collect_source_files(resolved_path, corpus_config, error_tracker)
+        console.print(f"[cyan]'{source_cfg.name}': {len(files)} file(s)[/cyan]")
+        work.extend((source_cfg, file_path) for file_path in files)
+
+    if not work:
+        console.print("[yellow]No files found in enabled sources[/yellow]")
+        return
+
+    try:
+        indexer = CorpusIndexer(output_dir=output)
+    except Exception as e:
+        category = error_tracker.categorize_exception(e)
+        advice = error_tracker.get_actionable_advice(category)
+        panel = create_error_panel(
+            "Indexer Initialization Failed",
+            f"Failed to initialize indexer: {e}",
+            advice,
+        )
+        console.print(panel)
+        raise
+
+    try:
+        existing_docs = indexer.get_indexed_sources(file_path for _, file_path in work)
+    except ValueError as e:
+        console.print(create_error_panel("Index Needs Rebuilding", str(e)))
+        raise click.Abort() from e
+
+    console.print(f"[cyan]Ingesting {len(work)} file(s)...[/cyan]")
+
+    # Extraction is a single ordered stream, so one isolated worker suffices
+    supervisor = ExtractionSupervisor(max_workers=1) if isolation else None
+    try:
+        ingested_count, skipped_count, failed_count = ingest_files(
+            work=work,
+            indexer=indexer,
+            existing_docs=existing_docs,
+            force=force,
+            error_tracker=error_tracker,
+            console=console,
+            chunk_size=chunk_size,
+            batch_size=batch_size,
+            queue_size=queue_size,
+            extracted_dir=extracted_dir,
+            verbose=verbose,
+            extract_text=supervisor.extract if supervisor else extract_text_from_file,
+            iter_text=supervisor.iter_extract if supervisor else iter_text_from_file,
+            convert_legacy=supervisor.convert_legacy_office if supervisor else None,
+        )
+    finally:
+        if supervisor is not None:
+            supervisor.close()
+
+    # Save report to file if there were skips or errors
+    report_file: Path | None = None
+    if error_tracker.total_skipped > 0 or error_tracker.total_errors > 0:
+        report_file = error_tracker.save_to_file(output, prefix="ingestion")
+
+    info = indexer.get_collection_info()
+
+    console.print(f"\n[green]✓ Successfully ingested {ingested_count} document(s)[/green]")
+    if skipped_count > 0:
+        console.print(f"[cyan]↻ Skipped {skipped_count} document(s)[/cyan]")
+    if failed_count > 0:
+        console.print(f"[yellow]✗ Failed to ingest {failed_count} document(s)[/yellow]")
+
+    console.print("\n[cyan]Index Statistics:[/cyan]")
+    console.print(f"  Total chunks: {info['total_chunks']}")
+    console.print(f"  Collection: {info['collection_name']}")
+    console.print(f"  Output directory: {info['output_dir']}")
+    if extracted_dir is not None:
+        console.print(f"  Extracted text: {extracted_dir}")
+
+    if error_tracker.total_skipped > 0:
+        error_tracker.print_skip_summary(console, show_file_path=report_file)
+
+    if failed_count > 0:
+        error_tracker.print_summary(console)
+
+    # Clean up temporary hydration files
+    cleaned = cleanup_hydration_temp_dir()
+    if cleaned > 0:
+        console.print(f"[dim]Cleaned up {cleaned} temporary hydration file(s)[/dim]")
@@ -3,6 +3,7 @@
 import click
 
 from bloginator import __version__
+from bloginator.cli.batch import batch
 from bloginator.cli.blocklist import blocklist
 from bloginator.cli.cloud_check import cloud_check
 from bloginator.cli.diff import diff
@@ -11,6 +12,7 @@ from bloginator.cli.export import export
 from bloginator.cli.extract import extract
 from bloginator.cli.history import history
 from bloginator.cli.index import index
+from bloginator.cli.ingest import ingest
 from bloginator.cli.init import init
 from bloginator.cli.metrics import metrics
 from bloginator.cli.optimize import optimize
@@ -37,9 +39,11 @@ def cli(ctx: click.Context) -> None:
     Workflow:
       1. bloginator extract <source> -o output/extracted
       2. bloginator index output/extracted -o output/index
+         (or steps 1-2 in one pass: bloginator ingest -c corpus.yaml -o output/index)
       3. bloginator search output/index "your query"
       4. bloginator outline --index output/index --keywords "topic,theme"
       5. bloginator draft --outline outline.json -o draft.md
+         (or steps 4-5 for many blogs: bloginator batch topics.yaml -o output/batch)
       6. bloginator refine -d draft.md -f "make more engaging"
       7. bloginator diff my-draft --list-versions
       8. bloginator revert my-draft 2 -o draft.md
@@ -72,6 +76,7 @@ def cli(ctx: click.Context) -> None:
 
 
 # Register commands
+cli.add_command(batch)
 cli.add_command(blocklist)
 cli.add_command(cloud_check)
 cli.add_command(diff)
@@ -80,6 +85,7 @@ cli.add_command(export)
 cli.add_command(extract)
 cli.add_command(history)
 cli.add_command(index)
+cli.add_command(ingest)
 cli.add_command(init)
 cli.add_command(metrics)
 cli.add_command(optimize)
@@ -7,6 +7,9 @@ import click
 from rich.console import Console
 from rich.table import Table
 
+from bloginator.config import config
+from bloginator.generation._llm_cache import cache_report
+from bloginator.generation._llm_coalesce import coalescing_report
 from bloginator.generation.llm_factory import create_llm_from_config
 from bloginator.optimization.prompt_tuner import PromptTuner
 from bloginator.search import CorpusSearcher
@@ -56,6 +59,20 @@ logger = logging.getLogger(__name__)
     default=2.0,
     help="Seconds to sleep between rounds (default: 2.0)",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Test cases to optimize in parallel (default: 1)",
+)
+@click.option(
+    "--resume/--no-resume",
+    default=True,
+    help=(
+        "Continue interrupted runs from checkpoints and reuse cached baselines made with "
+        "the same prompts, model and index (default: on)"
+    ),
+)
 def optimize(
     corpus_dir: Path | None,
     index_dir: Path | None,
@@ -64,6 +81,8 @@ def optimize(
     num_iterations: int,
     verbose: bool,
     sleep_between_rounds: float,
+    workers: int,
+    resume: bool,
 ) -> None:
     """Optimize LLM prompts through iterative testing and scoring.
 
@@ -103,7 +122,9 @@ def optimize(
 
     # Initialize LLM client
     console.print("🔧 Initializing LLM client...")
-    llm_client = create_llm_from_config(verbose=verbose)
+    llm_client = create_llm_from_config(
+        verbose=verbose, use_cache=config.LLM_CACHE, coalesce=config.LLM_COALESCE
+    )
 
     # Initialize searcher
     console.print(f"📚 Loading corpus index from {index_path}...")
@@ -116,6 +137,7 @@ def optimize(
         searcher=searcher,
         output_dir=output_dir,
         sleep_between_rounds=sleep_between_rounds,
+        max_workers=workers,
     )
 
     # Run optimization
@@ -125,6 +147,7 @@ def optimize(
     results = tuner.optimize(
         num_iterations=num_iterations,
         num_test_cases=num_test_cases,
+        resume=resume,
     )
 
     # Display results
@@ -162,3 +185,7 @@ def optimize(
     console.print(f"📈 Average improved score: {avg_improved:.2f}/5.0")
     console.print(f"🎯 Average improvement: {avg_improvement:+.2f}")
     console.print(f"\n📁 Results saved to: {output_dir}")
+
+    for report in (cache_report(llm_client), coalescing_report(llm_client)):
+        if report:
+            console.print(f"[dim]{report}[/dim]")
@@ -13,7 +13,11 @@ from bloginator.cli._outline_formatter import (
     display_outline_results,
     save_outline_files,
 )
+from bloginator.config import config
 from bloginator.generation import OutlineGenerator
+from bloginator.generation._llm_cache import cache_report
+from bloginator.generation._llm_coalesce import coalescing_report
+from bloginator.generation._ollama_session import ollama_report, start_ollama_session
 from bloginator.generation.llm_factory import create_llm_from_config
 from bloginator.search import CorpusSearcher
 from bloginator.services.template_manager import TemplateManager
@@ -226,8 +230,13 @@ def outline(
             logger.info(
                 f"Connecting to LLM from config (model param '{model}' is ignored, using .env)"
             )
-            llm_client = create_llm_from_config(verbose=verbose)
+            llm_client = create_llm_from_config(
+                verbose=verbose, use_cache=config.LLM_CACHE, coalesce=config.LLM_COALESCE
+            )
             logger.info("LLM client connected")
+            if config.OLLAMA_PRELOAD:
+                progress.update(task, description="Loading model...")
+                start_ollama_session(llm_client)
         except Exception as e:
             logger.error(f"Failed to connect to LLM: {e}")
             console.print(f"[red]✗[/red] Failed to connect to LLM: {e}")
@@ -308,3 +317,11 @@ def outline(
     else:
         # Display markdown preview
         display_markdown_preview(console, outline_obj)
+
+    for report in (
+        cache_report(llm_client),
+        coalescing_report(llm_client),
+        ollama_report(llm_client),
+    ):
+        if report:
+            console.print(f"[dim]{report}[/dim]")
@@ -178,6 +178,7 @@ def refine(
             feedback=feedback,
             validate_safety=validate_safety,
             score_voice=score_voice,
+            parsed=parsed,
         )
 
         # Add new version to history
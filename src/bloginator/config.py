@@ -33,6 +33,9 @@ class Config:
         LLM_TIMEOUT: Request timeout in seconds
         LLM_TEMPERATURE: Default temperature for generation
         LLM_MAX_TOKENS: Default max tokens for generation
+        LLM_CONTEXT_TOKENS: Context window for prompt budgeting (0 = per model)
+        OLLAMA_KEEP_ALIVE: How long Ollama keeps the model loaded between requests
+        OLLAMA_PRELOAD: Load and warm the Ollama model before a run's first request
     """
 
     # Base data directory - can be set to external location like /tmp/bloginator
@@ -44,6 +47,9 @@ class Config:
     _corpus_dir_env = os.getenv("BLOGINATOR_CORPUS_DIR", "corpus")
     _chroma_dir_env = os.getenv("BLOGINATOR_CHROMA_DIR", os.getenv("CHROMA_DB_PATH", "chroma"))
     _output_dir_env = os.getenv("BLOGINATOR_OUTPUT_DIR", "output")
+    _ocr_cache_dir_env = os.getenv("BLOGINATOR_OCR_CACHE_DIR", "ocr_cache")
+    _llm_cache_dir_env = os.getenv("BLOGINATOR_LLM_CACHE_DIR", "llm_cache")
+    _template_cache_dir_env = os.getenv("BLOGINATOR_TEMPLATE_CACHE_DIR", "template_cache")
 
     @classmethod
     def _resolve_path(cls, path_str: str, subdir: str) -> Path:
@@ -77,6 +83,21 @@ class Config:
         """Get output directory path."""
         return self._resolve_path(self._output_dir_env, "output")
 
+    @property
+    def ocr_cache_dir(self) -> Path:
+        """Get OCR result cache directory path."""
+        return self._resolve_path(self._ocr_cache_dir_env, "ocr_cache")
+
+    @property
+    def llm_cache_dir(self) -> Path:
+        """Get LLM response cache directory path."""
+        return self._resolve_path(self._llm_cache_dir_env, "llm_cache")
+
+    @property
+    def template_cache_dir(self) -> Path:
+        """Get compiled prompt template (Jinja bytecode) cache directory path."""
+        return self._resolve_path(self._template_cache_dir_env, "template_cache")
+
     # Class-level aliases for backward compatibility (static access)
     CORPUS_DIR: Path = Path(os.getenv("BLOGINATOR_CORPUS_DIR", "corpus"))
     CHROMA_DIR: Path = Path(
@@ -99,6 +120,26 @@ class Config:
     # Generation defaults
     LLM_TEMPERATURE: float = float(os.getenv("BLOGINATOR_LLM_TEMPERATURE", "0.7"))
     LLM_MAX_TOKENS: int = int(os.getenv("BLOGINATOR_LLM_MAX_TOKENS", "2000"))
+    # Prompt context window in tokens; 0 uses the model's known window
+    LLM_CONTEXT_TOKENS: int = int(os.getenv("BLOGINATOR_LLM_CONTEXT_TOKENS", "0"))
+    # Sections a retrieved chunk may be used as a source for in one draft
+    # (0 = unlimited: every section keeps its own top results); a section
+    # always keeps its best candidate even if other sections used it
+    DRAFT_SOURCE_MAX_USES: int = int(os.getenv("BLOGINATOR_DRAFT_SOURCE_MAX_USES", "1"))
+
+    # LLM response cache (opt-in) - deterministic (temperature 0) calls are
+    # reused across runs; sampled calls only when LLM_CACHE_SAMPLED is set
+    LLM_CACHE: bool = os.getenv("BLOGINATOR_LLM_CACHE", "false").lower() == "true"
+    LLM_CACHE_SAMPLED: bool = os.getenv("BLOGINATOR_LLM_CACHE_SAMPLED", "false").lower() == "true"
+    LLM_CACHE_TTL: int = int(os.getenv("BLOGINATOR_LLM_CACHE_TTL", str(7 * 24 * 3600)))
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("BLOGINATOR_LLM_CACHE_MAX_ENTRIES", "10000"))
+    # Identical requests made at the same time share one upstream call
+    LLM_COALESCE: bool = os.getenv("BLOGINATOR_LLM_COALESCE", "true").lower() == "true"
+
+    # Ollama model residency: sent as keep_alive with every request (Ollama
+    # duration string or seconds; empty leaves the server default)
+    OLLAMA_KEEP_ALIVE: str = os.getenv("BLOGINATOR_OLLAMA_KEEP_ALIVE", "30m")
+    OLLAMA_PRELOAD: bool = os.getenv("BLOGINATOR_OLLAMA_PRELOAD", "true").lower() == "true"
 
     # Custom LLM headers (for authentication, etc.)
     LLM_CUSTOM_HEADERS: str | None = os.getenv("BLOGINATOR_LLM_CUSTOM_HEADERS")
@@ -122,6 +163,11 @@ class Config:
     # Shadow copy root directory (uses system temp dir, exposed for testing)
     SHADOW_COPY_ROOT: Path = Path(tempfile.gettempdir()) / "bloginator" / "corpus_shadow"
 
+    # OCR images embedded in DOCX/PPTX files and append their text
+    OCR_EMBEDDED_IMAGES: bool = (
+        os.getenv("BLOGINATOR_OCR_EMBEDDED_IMAGES", "false").lower() == "true"
+    )
+
     # Company Branding (for blog personalization)
     # These are injected into prompts for company-specific content
     COMPANY_NAME: str = os.getenv("BLOGINATOR_COMPANY_NAME", "our company")
@@ -26,10 +26,39 @@ from bloginator.extraction._extended_extractors import (
     extract_text_from_xlsx,
     extract_text_from_xml,
 )
+from bloginator.extraction._legacy_office import (
+    LegacyOfficeBatch,
+    convert_legacy_office_to_text,
+)
+from bloginator.extraction._libreoffice import (
+    LibreOfficeConverter,
+    LibreOfficeError,
+)
+from bloginator.extraction._ocr import (
+    OCRCache,
+    OCREngine,
+    OCRMetrics,
+    get_ocr_engine,
+)
+from bloginator.extraction._ocr_embedded import extract_embedded_image_text
+from bloginator.extraction._pdf_extractors import (
+    PAGE_SEPARATOR,
+    iter_pdf_pages,
+    iter_pdf_text,
+    write_pdf_text,
+)
+from bloginator.extraction._supervisor import (
+    ExtractionLimits,
+    ExtractionSupervisor,
+    ExtractionTimeoutError,
+    ExtractionWorkerCrashError,
+    default_extraction_limits,
+)
 from bloginator.extraction.chunking import (
     chunk_text_by_paragraphs,
     chunk_text_by_sentences,
     chunk_text_fixed_size,
+    iter_chunks_by_paragraphs,
 )
 from bloginator.extraction.extractors import (
     extract_section_headings,
@@ -38,6 +67,7 @@ from bloginator.extraction.extractors import (
     extract_text_from_markdown,
     extract_text_from_pdf,
     extract_text_from_txt,
+    iter_text_from_file,
 )
 from bloginator.extraction.metadata import (
     count_words,
@@ -71,4 +101,24 @@ __all__ = [
     "chunk_text_fixed_size",
     "chunk_text_by_paragraphs",
     "chunk_text_by_sentences",
+    "iter_chunks_by_paragraphs",
+    "PAGE_SEPARATOR",
+    "iter_pdf_pages",
+    "iter_pdf_text",
+    "iter_text_from_file",
+    "write_pdf_text",
+    "ExtractionSupervisor",
+    "ExtractionLimits",
+    "ExtractionTimeoutError",
+    "ExtractionWorkerCrashError",
+    "default_extraction_limits",
+    "LegacyOfficeBatch",
+    "LibreOfficeConverter",
+    "LibreOfficeError",
+    "convert_legacy_office_to_text",
+    "OCREngine",
+    "OCRCache",
+    "OCRMetrics",
+    "extract_embedded_image_text",
+    "get_ocr_engine",
 ]
@@ -7,7 +7,6 @@ including MIME-encoded Confluence exports and real MS Word binary documents.
 import re
 import shutil
 import subprocess
-import tempfile
 from pathlib import Path
 
 
@@ -170,10 +169,13 @@ def extract_doc_with_antiword(doc_path: Path) -> str:
 
 
 def extract_doc_with_libreoffice(doc_path: Path) -> str:
-    """Convert .doc to text using LibreOffice headless mode.
+    """Convert a legacy Office file to text using the shared LibreOffice service.
+
+    The service keeps LibreOffice running between files, so only the first
+    conversion in a process pays its start-up cost.
 
     Args:
-        doc_path: Path to .doc file
+        doc_path: Path to .doc (or .ppt) file
 
     Returns:
         Extracted text content
@@ -181,31 +183,9 @@ def extract_doc_with_libreoffice(doc_path: Path) -> str:
     Raises:
         ValueError: If conversion fails
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Convert to text using LibreOffice
-        result = subprocess.run(
-            [
-                "soffice",
-                "--headless",
-                "--convert-to",
-                "txt:Text",
-                "--outdir",
-                tmpdir,
-                str(doc_path.absolute()),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        if result.returncode != 0:
-            raise ValueError(f"LibreOffice conversion failed: {result.stderr}")
-
-        # Find the output file
-        txt_files = list(Path(tmpdir).glob("*.txt"))
-        if not txt_files:
-            raise ValueError("LibreOffice produced no output file")
-
-        # Read the converted text
-        text = txt_files[0].read_text(encoding="utf-8", errors="replace")
-        return text
+    from bloginator.extraction._legacy_office import convert_legacy_office_to_text
+
+    result = convert_legacy_office_to_text([doc_path])[doc_path]
+    if isinstance(result, Exception):
+        raise result
+    return result
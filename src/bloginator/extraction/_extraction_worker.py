@@ -0,0 +1,340 @@
+"""Extraction worker processes and the supervisor's handle on them.
+
+Each worker runs in its own process group, receives one task at a time
+over a pipe and replies with text, streamed pieces or an error. Tasks run
+under an address-space limit; wall-clock limits are enforced by the
+supervisor side of ExtractionWorker.run.
+"""
+
+import atexit
+import contextlib
+import os
+import signal
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any
+
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no resource module
+    resource = None  # type: ignore[assignment]
+
+
+# Default address-space limit for a worker while it extracts one file
+DEFAULT_MEMORY_LIMIT_MB = 2048
+
+# Worker task modes: whole text, text in pieces, batch LibreOffice conversion
+EXTRACT = "extract"
+STREAM = "stream"
+CONVERT = "convert"
+
+
+class ExtractionTimeoutError(TimeoutError):
+    """Raised when extracting a file exceeds its wall-clock limit."""
+
+    def __init__(self, path: Path, timeout_seconds: float):
+        """Initialize timeout error.
+
+        Args:
+            path: File that was being extracted
+            timeout_seconds: Limit that was exceeded
+        """
+        super().__init__(f"Extraction timed out after {timeout_seconds:g}s: {path}")
+        self.path = path
+        self.timeout_seconds = timeout_seconds
+
+
+class ExtractionWorkerCrashError(RuntimeError):
+    """Raised when a worker process dies while extracting a file."""
+
+    def __init__(self, path: Path, exitcode: int | None):
+        """Initialize crash error.
+
+        Args:
+            path: File that was being extracted
+            exitcode: Worker exit code (negative for the terminating signal)
+        """
+        if exitcode is not None and exitcode < 0:
+            try:
+                reason = signal.Signals(-exitcode).name
+            except ValueError:
+                reason = f"signal {-exitcode}"
+        else:
+            reason = f"exit code {exitcode}"
+        super().__init__(f"Extraction worker crashed ({reason}): {path}")
+        self.path = path
+        self.exitcode = exitcode
+
+
+@dataclass(frozen=True)
+class ExtractionLimits:
+    """Resource limits applied while extracting one file.
+
+    Attributes:
+        timeout_seconds: Wall-clock limit before the worker is killed
+        memory_limit_mb: Address-space limit for the worker (None = unlimited)
+    """
+
+    timeout_seconds: float
+    memory_limit_mb: int | None = DEFAULT_MEMORY_LIMIT_MB
+
+
+def _set_memory_limit(limit_bytes: int | None) -> None:
+    """Set the soft address-space limit for the current process.
+
+    Args:
+        limit_bytes: New soft limit, or None to lift it back to the hard limit
+    """
+    if resource is None:
+        return
+    try:
+        _soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if limit_bytes is None:
+            soft = hard
+        else:
+            soft = limit_bytes if hard == resource.RLIM_INFINITY else min(limit_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+    except (ValueError, OSError):
+        # Not enforceable on this platform (e.g. macOS); timeouts still apply
+        pass
+
+
+def _iter_pieces(path: Path, extractor: Callable[[Path], str] | None) -> Iterator[str]:
+    """Yield a file's text in pieces (one piece unless streamed by format).
+
+    Args:
+        path: File to extract
+        extractor: Custom text extractor (default: iter_text_from_file)
+
+    Yields:
+        Text pieces joined by blank lines
+    """
+    if extractor is None:
+        from bloginator.extraction.extractors import iter_text_from_file
+
+        yield from iter_text_from_file(path)
+    else:
+        yield extractor(path)
+
+
+def _worker_main(conn: Connection, extractor: Callable[[Path], str] | None) -> None:
+    """Worker process loop: receive file paths, send back text or an error.
+
+    Args:
+        conn: Pipe to the supervisor
+        extractor: Text extractor (default: extract_text_from_file)
+    """
+    # Own process group so a kill also takes down LibreOffice/antiword children
+    # (the supervisor sets it too, to cover a kill before this line runs)
+    if hasattr(os, "setpgrp"):
+        with contextlib.suppress(OSError):
+            os.setpgrp()
+
+    try:
+        _serve(conn, extractor)
+    finally:
+        # Shut down a LibreOffice server or OCR pool this worker may have started
+        from bloginator.extraction._legacy_office import close_libreoffice_converter
+        from bloginator.extraction._ocr import close_ocr_engine
+
+        close_libreoffice_converter()
+        close_ocr_engine()
+
+
+def _serve(conn: Connection, extractor: Callable[[Path], str] | None) -> None:
+    """Handle extraction requests until the supervisor stops the worker.
+
+    A streamed request is answered with one ("piece", text) message per
+    piece followed by ("ok", None); a conversion with ("ok", {path: text or
+    exception}); any other with ("ok", text). Failures end each with
+    ("error", exception).
+
+    Args:
+        conn: Pipe to the supervisor
+        extractor: Custom text extractor (default: extract_text_from_file)
+    """
+    extract_text: Callable[[Path], str]
+    if extractor is None:
+        from bloginator.extraction.extractors import extract_text_from_file
+
+        extract_text = extract_text_from_file
+    else:
+        extract_text = extractor
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+
+        path_strs, limit_bytes, mode = task
+        paths = [Path(p) for p in path_strs]
+        _set_memory_limit(limit_bytes)
+        try:
+            if mode == STREAM:
+                for piece in _iter_pieces(paths[0], extractor):
+                    conn.send(("piece", piece))
+                result: tuple[str, Any] = ("ok", None)
+            elif mode == CONVERT:
+                from bloginator.extraction._legacy_office import convert_legacy_office_to_text
+
+                result = ("ok", convert_legacy_office_to_text(paths))
+            else:
+                result = ("ok", extract_text(paths[0]))
+        except Exception as e:
+            result = ("error", e)
+        finally:
+            _set_memory_limit(None)
+
+        try:
+            conn.send(result)
+        except Exception as e:
+            # Exception or result not picklable - send a plain description instead
+            conn.send(("error", ValueError(f"{type(result[1]).__name__}: {result[1]} ({e})")))
+
+
+# Workers not yet stopped, killed at interpreter exit: multiprocessing would
+# otherwise wait for these non-daemonic processes forever
+_live_workers: "weakref.WeakSet[ExtractionWorker]" = weakref.WeakSet()
+
+
+@atexit.register
+def _kill_live_workers() -> None:
+    for worker in list(_live_workers):
+        worker.kill()
+
+
+class ExtractionWorker:
+    """Handle for one extraction worker process."""
+
+    def __init__(self, context: Any, extractor: Callable[[Path], str] | None):
+        """Start a worker process.
+
+        Args:
+            context: multiprocessing context used to create the process
+            extractor: Text extractor run by the worker
+        """
+        self.conn, child_conn = context.Pipe()
+        # Not daemonic, so extractors may start process pools of their own
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, extractor),
+            name="bloginator-extract-worker",
+            daemon=False,
+        )
+        self.process.start()
+        child_conn.close()
+        if hasattr(os, "setpgid"):
+            # Fails once the child has exec'd (spawn); it then sets the group itself
+            with contextlib.suppress(OSError):
+                os.setpgid(self.process.pid, self.process.pid)
+        _live_workers.add(self)
+        self.tasks_run = 0
+
+    def run(
+        self, paths: list[Path], limits: ExtractionLimits, mode: str = EXTRACT
+    ) -> Iterator[tuple[str, Any]]:
+        """Send one task to the worker and yield its replies.
+
+        The wall-clock limit covers the whole task, including time the
+        caller spends between streamed pieces.
+
+        Args:
+            paths: File to extract (conversions take several)
+            limits: Limits for this task
+            mode: EXTRACT, STREAM (text in pieces) or CONVERT
+
+        Yields:
+            ("piece", text) for each streamed piece, then ("ok", text) (text
+            is None when streamed) or ("error", exception)
+
+        Raises:
+            ExtractionTimeoutError: If the deadline passes first
+            ExtractionWorkerCrashError: If the worker dies first
+        """
+        path = paths[0]
+        limit_bytes = limits.memory_limit_mb * 1024 * 1024 if limits.memory_limit_mb else None
+        self.tasks_run += 1
+        try:
+            self.conn.send(([str(p) for p in paths], limit_bytes, mode))
+        except (BrokenPipeError, OSError):
+            raise ExtractionWorkerCrashError(path, self.process.exitcode) from None
+
+        deadline = time.monotonic() + limits.timeout_seconds
+        while True:
+            status, payload = self._receive(path, limits, deadline)
+            yield status, payload
+            if status != "piece":
+                return
+
+    def _receive(self, path: Path, limits: ExtractionLimits, deadline: float) -> tuple[str, Any]:
+        """Wait for the worker's next reply.
+
+        Raises:
+            ExtractionTimeoutError: If the deadline passes first
+            ExtractionWorkerCrashError: If the worker dies first
+        """
+        remaining = max(deadline - time.monotonic(), 0.0)
+        ready = wait([self.conn, self.process.sentinel], timeout=remaining)
+        if not ready:
+            raise ExtractionTimeoutError(path, limits.timeout_seconds)
+
+        # Check the pipe first: the worker may have exited right after replying
+        if self.conn.poll():
+            try:
+                status, payload = self.conn.recv()
+                return status, payload
+            except (EOFError, OSError):
+                pass
+
+        self.process.join(timeout=1)
+        raise ExtractionWorkerCrashError(path, self.process.exitcode)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is still running."""
+        return bool(self.process.is_alive())
+
+    def kill(self) -> None:
+        """Kill the worker and any processes it spawned."""
+        if self.process.is_alive() and not self._kill_group():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self._kill_group()
+        self.conn.close()
+        _live_workers.discard(self)
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        with contextlib.suppress(BrokenPipeError, OSError):
+            self.conn.send(None)
+        self.process.join(timeout=2)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            # Reap anything the worker left behind in its group
+            self._kill_group()
+            self.conn.close()
+            _live_workers.discard(self)
+
+    def _kill_group(self) -> bool:
+        """Send SIGKILL to the worker's process group.
+
+        Returns:
+            True if the group existed and was signalled
+        """
+        pid = self.process.pid
+        if pid is None or not hasattr(os, "killpg"):
+            return False
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            return False
+        return True
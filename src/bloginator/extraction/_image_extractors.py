@@ -2,15 +2,22 @@
 
 from pathlib import Path
 
+from bloginator.extraction._ocr import (
+    MIN_IMAGE_SIZE_FOR_OCR,
+    OCRUnavailableError,
+    get_ocr_engine,
+)
 
-# Minimum file size for image OCR (20KB) - smaller images are likely icons/decorations
-MIN_IMAGE_SIZE_FOR_OCR = 20 * 1024
+
+__all__ = ["MIN_IMAGE_SIZE_FOR_OCR", "extract_text_from_image"]
 
 
 def extract_text_from_image(image_path: Path) -> str:
     """Extract text from image using OCR.
 
-    Uses pytesseract for OCR when available.
+    Uses the shared OCR engine (pytesseract, when available), which
+    preprocesses the image and caches results by image content, so an
+    unchanged image is only OCR'd once.
     Supports: .png, .jpg, .jpeg, .webp
 
     Skips images smaller than 20KB as they're likely icons or decorative
@@ -35,17 +42,11 @@ def extract_text_from_image(image_path: Path) -> str:
         return ""  # Return empty - will be skipped as empty_content
 
     try:
-        import pytesseract
-        from PIL import Image
-    except ImportError:
-        # OCR not available - return empty with warning
-        return f"[OCR not available for {image_path.name}]"
-
-    try:
-        image = Image.open(image_path)
-        text: str = pytesseract.image_to_string(image)
-        return text.strip()
-    except pytesseract.TesseractNotFoundError:
+        return get_ocr_engine().ocr_file(image_path)
+    except OCRUnavailableError as e:
+        if isinstance(e.__cause__, ImportError):
+            # OCR not available - return empty with warning
+            return f"[OCR not available for {image_path.name}]"
         # Tesseract not installed
         return f"[Tesseract OCR not installed - cannot extract text from {image_path.name}]"
     except Exception as e:
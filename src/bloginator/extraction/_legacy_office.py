@@ -0,0 +1,243 @@
+"""Text extraction from legacy .doc/.ppt files through LibreOffice.
+
+Each process shares one LibreOfficeConverter. LegacyOfficeBatch lets the
+extract and ingest engines convert a run's legacy files a few at a time,
+in one LibreOffice batch each, instead of one conversion per file.
+"""
+
+import atexit
+import logging
+import shutil
+import tempfile
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from bloginator.extraction._libreoffice import (
+    CONVERSION_TARGETS,
+    OLE_SIGNATURE,
+    LibreOfficeConverter,
+    find_soffice,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Legacy Office files converted together by LegacyOfficeBatch; bounds both
+# the converted text held ahead of extraction and the work lost to a hang
+LEGACY_OFFICE_WINDOW = 8
+
+
+_converter: LibreOfficeConverter | None = None
+_converter_lock = threading.Lock()
+
+
+def get_libreoffice_converter() -> LibreOfficeConverter:
+    """Return this process's shared converter, creating it on first use.
+
+    Returns:
+        Shared LibreOfficeConverter
+    """
+    global _converter
+    with _converter_lock:
+        if _converter is None:
+            _converter = LibreOfficeConverter()
+            atexit.register(close_libreoffice_converter)
+        return _converter
+
+
+def close_libreoffice_converter() -> None:
+    """Shut down the shared converter, if one was started."""
+    global _converter
+    with _converter_lock:
+        if _converter is not None:
+            _converter.close()
+            _converter = None
+
+
+def read_converted_text(converted: Path) -> str:
+    """Read text from a file produced by LibreOfficeConverter.
+
+    Args:
+        converted: Converted .txt or .pptx file
+
+    Returns:
+        Extracted text content
+    """
+    if converted.suffix.lower() == ".pptx":
+        from bloginator.extraction._office_extractors import extract_text_from_pptx
+
+        return extract_text_from_pptx(converted)
+    return converted.read_text(encoding="utf-8", errors="replace")
+
+
+def convert_legacy_office_to_text(paths: Iterable[Path]) -> dict[Path, str | Exception]:
+    """Extract text from many .doc/.ppt files with the shared converter.
+
+    Args:
+        paths: Legacy Office files
+
+    Returns:
+        Mapping of each input path to its text or the error that prevented it
+    """
+    results: dict[Path, str | Exception] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        converted = get_libreoffice_converter().convert_batch(paths, Path(tmpdir))
+        for path, output in converted.items():
+            if isinstance(output, Exception):
+                results[path] = output
+                continue
+            try:
+                results[path] = read_converted_text(output)
+            except Exception as e:
+                results[path] = e
+    return results
+
+
+def needs_libreoffice(path: Path) -> bool:
+    """Whether extracting a file converts it with LibreOffice.
+
+    True for every non-empty .ppt, and for .doc files that are real Word
+    binaries when antiword (which is tried first) is not installed; Confluence
+    and plain-text .doc exports are read directly.
+
+    Args:
+        path: File to check
+
+    Returns:
+        True if the file's text comes from a LibreOffice conversion
+    """
+    suffix = path.suffix.lower()
+    if suffix not in CONVERSION_TARGETS:
+        return False
+    if suffix == ".doc" and shutil.which("antiword"):
+        return False
+    try:
+        with path.open("rb") as f:
+            header = f.read(len(OLE_SIGNATURE))
+    except OSError:
+        return False
+    return bool(header) and (suffix == ".ppt" or header == OLE_SIGNATURE)
+
+
+class LegacyOfficeBatch:
+    """Text extractor that converts legacy Office files in small batches.
+
+    prepare() queues the files that would go through LibreOffice. The first
+    time the batch is called with a queued path, that file and the next
+    queued ones (up to ``window`` files) are converted in one go; calling
+    with a converted path returns (and forgets) its text. Other files, and
+    files whose batch failed or timed out, go to the wrapped extractor, so
+    each is retried alone under its own limits and errors are still
+    reported per file. Only one window's text is held at a time per caller.
+
+    Attributes:
+        extract_text: Extractor for everything not converted in a batch
+        convert: Batch converter (e.g. ExtractionSupervisor.convert_legacy_office;
+            default: convert_legacy_office_to_text in this process)
+        window: Maximum files converted together
+    """
+
+    def __init__(
+        self,
+        extract_text: Callable[[Path], str],
+        convert: Callable[[list[Path]], dict[Path, str | Exception]] | None = None,
+        window: int = LEGACY_OFFICE_WINDOW,
+    ):
+        """Wrap an extractor.
+
+        Args:
+            extract_text: Extractor for everything not converted in a batch
+            convert: Batch converter (default: convert_legacy_office_to_text)
+            window: Maximum files converted together
+        """
+        self.extract_text = extract_text
+        self.convert = convert
+        self.window = max(window, 1)
+        self._pending: dict[Path, None] = {}
+        self._in_flight: dict[Path, threading.Event] = {}
+        self._converted: dict[Path, str] = {}
+        self._lock = threading.Lock()
+
+    def prepare(self, paths: Iterable[Path]) -> int:
+        """Queue the legacy Office files among paths for batch conversion.
+
+        Args:
+            paths: Files about to be extracted, in processing order
+
+        Returns:
+            Number of files queued
+        """
+        if find_soffice() is None:
+            return 0
+        queued = [p for p in paths if needs_libreoffice(p)]
+        with self._lock:
+            for path in queued:
+                if path not in self._converted and path not in self._in_flight:
+                    self._pending[path] = None
+        return len(queued)
+
+    def __call__(self, path: Path) -> str:
+        """Extract a file, converting its window first if it is queued.
+
+        Args:
+            path: File to extract
+
+        Returns:
+            Extracted text
+        """
+        with self._lock:
+            batch = self._take_window(path)
+            ready = None if batch else self._in_flight.get(path)
+
+        if batch:
+            self._convert_window(batch)
+        elif ready is not None:
+            # Another thread is converting this file's window
+            ready.wait()
+
+        with self._lock:
+            text = self._converted.pop(path, None)
+        return text if text is not None else self.extract_text(path)
+
+    def _take_window(self, path: Path) -> list[Path]:
+        """Claim path and the next queued files for conversion (lock held)."""
+        if path not in self._pending:
+            return []
+        del self._pending[path]
+        batch = [path]
+        for queued in self._pending:
+            if len(batch) >= self.window:
+                break
+            batch.append(queued)
+        for queued in batch[1:]:
+            del self._pending[queued]
+
+        ready = threading.Event()
+        for queued in batch:
+            self._in_flight[queued] = ready
+        return batch
+
+    def _convert_window(self, batch: list[Path]) -> None:
+        """Convert claimed files and release threads waiting on them."""
+        convert = self.convert or convert_legacy_office_to_text
+        converted = {}
+        try:
+            results = convert(batch)
+        except Exception as e:
+            results = dict.fromkeys(batch, e)
+        try:
+            for path, result in results.items():
+                if isinstance(result, Exception):
+                    logger.debug(
+                        f"Batch conversion failed for {path}, extracting it alone: {result}"
+                    )
+                else:
+                    converted[path] = result
+        finally:
+            with self._lock:
+                self._converted.update(converted)
+                ready = self._in_flight.pop(batch[0])
+                for path in batch[1:]:
+                    self._in_flight.pop(path, None)
+            ready.set()
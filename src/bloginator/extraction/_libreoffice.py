@@ -0,0 +1,324 @@
+"""Managed LibreOffice conversion service for legacy .doc/.ppt files.
+
+Launching ``soffice --convert-to`` once per file pays LibreOffice's
+multi-second cold start (and, with a fresh profile, first-run profile
+initialisation) on every document. LibreOfficeConverter keeps that cost to
+once per process:
+
+- When the Python UNO bridge is importable, conversions go through a
+  persistent LibreOfficeServer (see _libreoffice_server).
+- Otherwise conversions use the command line with a private, persistent
+  profile, and convert_batch() converts many files in a single invocation.
+
+Either way, any file a batch fails to convert is retried on its own, so one
+bad document only affects itself.
+"""
+
+import logging
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from bloginator.extraction._libreoffice_server import (
+    LibreOfficeError,
+    LibreOfficeServer,
+    _ServerStartError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Re-exported for callers that import them from here
+__all__ = [
+    "LibreOfficeConverter",
+    "LibreOfficeError",
+    "find_soffice",
+]
+
+# Per-file conversion limit (matches the previous one-shot soffice call)
+DEFAULT_CONVERSION_TIMEOUT = 60
+
+# Recycle the server periodically to bound LibreOffice's memory growth
+DEFAULT_MAX_CONVERSIONS = 500
+
+# Target per legacy format: (--convert-to argument, UNO export filter, output suffix).
+# Impress has no plain-text export, so presentations go through PPTX.
+CONVERSION_TARGETS: dict[str, tuple[str, str, str]] = {
+    ".doc": ("txt:Text", "Text", ".txt"),
+    ".ppt": ("pptx", "Impress MS PowerPoint 2007 XML", ".pptx"),
+}
+
+
+# MS Office binary (OLE compound file) signature of real .doc files
+OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+
+def find_soffice() -> str | None:
+    """Locate the LibreOffice executable.
+
+    Returns:
+        Path to soffice, or None if LibreOffice is not installed
+    """
+    return shutil.which("soffice") or shutil.which("libreoffice")
+
+
+class LibreOfficeConverter:
+    """Long-lived LibreOffice conversion service.
+
+    Thread-safe; conversions are serialised because a LibreOffice instance
+    loads one document at a time reliably.
+
+    Attributes:
+        soffice_path: LibreOffice executable
+        timeout: Per-file conversion limit in seconds
+        max_conversions: Conversions before the server is recycled
+        conversions: Files converted so far
+        restarts: Times the server was restarted after a failure
+    """
+
+    def __init__(
+        self,
+        soffice_path: str | None = None,
+        timeout: float = DEFAULT_CONVERSION_TIMEOUT,
+        max_conversions: int = DEFAULT_MAX_CONVERSIONS,
+        use_server: bool = True,
+    ):
+        """Initialize converter. Nothing is launched until the first conversion.
+
+        Args:
+            soffice_path: LibreOffice executable (default: found on PATH)
+            timeout: Per-file conversion limit in seconds
+            max_conversions: Conversions before the server is recycled
+            use_server: Use a persistent UNO server when the bridge is available
+        """
+        self.soffice_path = soffice_path or find_soffice()
+        self.timeout = timeout
+        self.max_conversions = max_conversions
+        self.use_server = use_server
+        self.conversions = 0
+
+        self._lock = threading.RLock()
+        self._profile_dir: Path | None = None
+        self._server: LibreOfficeServer | None = None
+        self._closed = False
+
+    @property
+    def available(self) -> bool:
+        """Whether LibreOffice is installed."""
+        return self.soffice_path is not None
+
+    @property
+    def server_running(self) -> bool:
+        """Whether a conversion server process is currently alive."""
+        return self._server is not None and self._server.running
+
+    @property
+    def restarts(self) -> int:
+        """Times the server was restarted after a failure."""
+        return self._server.restarts if self._server is not None else 0
+
+    def convert(self, path: Path, outdir: Path) -> Path:
+        """Convert one legacy Office file.
+
+        Args:
+            path: .doc or .ppt file
+            outdir: Directory to write the converted file into
+
+        Returns:
+            Path to the converted file (.txt for .doc, .pptx for .ppt)
+
+        Raises:
+            LibreOfficeError: If the file cannot be converted
+        """
+        result = self.convert_batch([path], outdir)[path]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def convert_batch(self, paths: Iterable[Path], outdir: Path) -> dict[Path, Path | Exception]:
+        """Convert many legacy Office files, isolating failures per file.
+
+        Args:
+            paths: .doc and/or .ppt files
+            outdir: Directory to write converted files into
+
+        Returns:
+            Mapping of each input path to its converted file or the error
+        """
+        paths = list(paths)
+        results: dict[Path, Path | Exception] = {}
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("LibreOfficeConverter is closed")
+            if not self.available:
+                error: Exception = LibreOfficeError("LibreOffice (soffice) is not installed")
+                return dict.fromkeys(paths, error)
+
+            by_format: dict[str, list[Path]] = {}
+            for path in paths:
+                suffix = path.suffix.lower()
+                if suffix not in CONVERSION_TARGETS:
+                    results[path] = LibreOfficeError(f"Unsupported legacy format: {path.name}")
+                else:
+                    by_format.setdefault(suffix, []).append(path)
+
+            for suffix, group in by_format.items():
+                # soffice names outputs after the input stem, so same-named
+                # inputs go to separate batches with separate directories
+                for index, batch in enumerate(_split_unique_stems(group)):
+                    batch_dir = outdir / f"batch-{index}" if index else outdir
+                    batch_dir.mkdir(parents=True, exist_ok=True)
+                    server = self._active_server()
+                    if server is not None:
+                        results.update(self._convert_with_server(server, batch, batch_dir, suffix))
+                    else:
+                        results.update(self._convert_with_cli(batch, batch_dir, suffix))
+
+        return results
+
+    def close(self) -> None:
+        """Stop the server and remove the private profile."""
+        with self._lock:
+            self._closed = True
+            if self._server is not None:
+                self._server.stop()
+            if self._profile_dir is not None:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
+                self._profile_dir = None
+
+    def __enter__(self) -> "LibreOfficeConverter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Shared helpers
+
+    def _profile_uri(self) -> str:
+        # A private profile avoids clashing with a desktop LibreOffice session
+        # (which would swallow headless conversions) and is initialised only once
+        if self._profile_dir is None:
+            self._profile_dir = Path(tempfile.mkdtemp(prefix="bloginator-soffice-"))
+        return self._profile_dir.as_uri()
+
+    def _base_command(self) -> list[str]:
+        assert self.soffice_path is not None
+        return [
+            self.soffice_path,
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--norestore",
+            "--nolockcheck",
+            f"-env:UserInstallation={self._profile_uri()}",
+        ]
+
+    # ------------------------------------------------------------------
+    # Command-line conversion
+
+    def _convert_with_cli(
+        self, paths: list[Path], outdir: Path, suffix: str
+    ) -> dict[Path, Path | Exception]:
+        """Convert in one soffice invocation, then retry any failures singly."""
+        convert_to, _, out_suffix = CONVERSION_TARGETS[suffix]
+        results: dict[Path, Path | Exception] = {}
+
+        try:
+            self._run_cli(paths, outdir, convert_to, self.timeout * len(paths))
+        except LibreOfficeError as e:
+            logger.debug("Batch conversion of %d file(s) failed: %s", len(paths), e)
+
+        for path in paths:
+            output = outdir / f"{path.stem}{out_suffix}"
+            if not output.exists() and len(paths) > 1:
+                # Fall back to converting this file on its own for a precise error
+                try:
+                    self._run_cli([path], outdir, convert_to, self.timeout)
+                except LibreOfficeError as e:
+                    results[path] = e
+                    continue
+
+            if output.exists():
+                results[path] = output
+                self.conversions += 1
+            else:
+                results[path] = LibreOfficeError(f"LibreOffice produced no output for {path.name}")
+
+        return results
+
+    def _run_cli(self, paths: list[Path], outdir: Path, convert_to: str, timeout: float) -> None:
+        command = self._base_command() + ["--convert-to", convert_to, "--outdir", str(outdir)]
+        command.extend(str(path.absolute()) for path in paths)
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            raise LibreOfficeError(f"LibreOffice conversion timed out after {timeout:g}s") from e
+        if result.returncode != 0:
+            raise LibreOfficeError(f"LibreOffice conversion failed: {result.stderr}")
+
+    # ------------------------------------------------------------------
+    # Server conversion
+
+    def _active_server(self) -> LibreOfficeServer | None:
+        """Return the conversion server, or None to use the command line."""
+        if not self.use_server:
+            return None
+        if self._server is None:
+            assert self.soffice_path is not None
+            self._server = LibreOfficeServer(
+                self.soffice_path, self._base_command, self.timeout, self.max_conversions
+            )
+        return self._server if self._server.enabled() else None
+
+    def _convert_with_server(
+        self, server: LibreOfficeServer, paths: list[Path], outdir: Path, suffix: str
+    ) -> dict[Path, Path | Exception]:
+        _, filter_name, out_suffix = CONVERSION_TARGETS[suffix]
+        results: dict[Path, Path | Exception] = {}
+
+        for path in paths:
+            output = outdir / f"{path.stem}{out_suffix}"
+            try:
+                server.convert(path, output, filter_name)
+            except _ServerStartError:
+                # No server to talk to; convert this file on the command line
+                results.update(self._convert_with_cli([path], outdir, suffix))
+                continue
+            except LibreOfficeError as e:
+                results[path] = e
+                continue
+            results[path] = output
+            self.conversions += 1
+
+        return results
+
+
+def _split_unique_stems(paths: list[Path]) -> list[list[Path]]:
+    """Split paths into batches whose outputs cannot collide.
+
+    soffice names each output after the input's stem, so two inputs with the
+    same stem must go to different invocations.
+
+    Args:
+        paths: Input files
+
+    Returns:
+        Batches with unique stems, in input order
+    """
+    batches: list[list[Path]] = []
+    stems: list[set[str]] = []
+    for path in paths:
+        for batch, batch_stems in zip(batches, stems, strict=True):
+            if path.stem not in batch_stems:
+                batch.append(path)
+                batch_stems.add(path.stem)
+                break
+        else:
+            batches.append([path])
+            stems.append({path.stem})
+    return batches
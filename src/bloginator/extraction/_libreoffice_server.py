@@ -0,0 +1,269 @@
+"""Persistent headless LibreOffice server driven over the UNO bridge.
+
+LibreOfficeConverter uses this when the Python UNO bridge is importable:
+the server is started on first use, reused for every conversion, recycled
+after a fixed number of conversions and restarted if it dies or hangs.
+"""
+
+import logging
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+# How long to wait for a freshly launched server to accept connections
+SERVER_STARTUP_TIMEOUT = 30
+
+# Give up on server mode after this many consecutive failed starts
+MAX_SERVER_START_FAILURES = 3
+
+
+class LibreOfficeError(ValueError):
+    """Raised when LibreOffice cannot convert a file."""
+
+
+class _ServerStartError(LibreOfficeError):
+    """Raised when the conversion server cannot be launched."""
+
+
+def _import_uno(soffice_path: str) -> Any | None:
+    """Import the UNO bridge, looking next to soffice if needed.
+
+    Args:
+        soffice_path: Path to the soffice executable
+
+    Returns:
+        The uno module, or None if it cannot be imported
+    """
+    try:
+        import uno
+
+        return uno
+    except ImportError:
+        pass
+
+    # LibreOffice bundles uno.py in its program directory
+    program_dir = str(Path(soffice_path).resolve().parent)
+    if program_dir not in sys.path:
+        sys.path.append(program_dir)
+    try:
+        import uno
+
+        return uno
+    except Exception:
+        sys.path.remove(program_dir)
+        return None
+
+
+class _UnoSession:
+    """Connection to a running LibreOffice server over UNO."""
+
+    def __init__(self, uno: Any, pipe_name: str):
+        """Connect to the server.
+
+        Args:
+            uno: The uno module
+            pipe_name: Name of the pipe the server accepts on
+
+        Raises:
+            Exception: If the server is not (yet) accepting connections
+        """
+        self._uno = uno
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        context = resolver.resolve(f"uno:pipe,name={pipe_name};urp;StarOffice.ComponentContext")
+        self._desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def _properties(self, **values: Any) -> tuple[Any, ...]:
+        props = []
+        for name, value in values.items():
+            prop = self._uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+            prop.Name = name
+            prop.Value = value
+            props.append(prop)
+        return tuple(props)
+
+    def convert(self, source: Path, target: Path, filter_name: str) -> None:
+        """Convert one file in the server.
+
+        Args:
+            source: File to convert
+            target: Output file
+            filter_name: LibreOffice export filter
+        """
+        document = self._desktop.loadComponentFromURL(
+            source.absolute().as_uri(),
+            "_blank",
+            0,
+            self._properties(Hidden=True, ReadOnly=True),
+        )
+        if document is None:
+            raise LibreOfficeError(f"LibreOffice could not open {source.name}")
+        try:
+            document.storeToURL(
+                target.absolute().as_uri(), self._properties(FilterName=filter_name)
+            )
+        finally:
+            document.close(True)
+
+
+class LibreOfficeServer:
+    """A headless LibreOffice process and its UNO session.
+
+    Not thread-safe; LibreOfficeConverter serialises calls.
+
+    Attributes:
+        soffice_path: LibreOffice executable
+        timeout: Per-file conversion limit in seconds
+        max_conversions: Conversions before the server is recycled
+        process: Running server process, if any
+        restarts: Times the server was restarted after a failure
+    """
+
+    def __init__(
+        self,
+        soffice_path: str,
+        base_command: Callable[[], list[str]],
+        timeout: float,
+        max_conversions: int,
+    ):
+        """Initialize server state. Nothing is launched until the first conversion.
+
+        Args:
+            soffice_path: LibreOffice executable
+            base_command: Returns the soffice command line shared with CLI mode
+            timeout: Per-file conversion limit in seconds
+            max_conversions: Conversions before the server is recycled
+        """
+        self.soffice_path = soffice_path
+        self.timeout = timeout
+        self.max_conversions = max_conversions
+        self.process: subprocess.Popen[bytes] | None = None
+        self.restarts = 0
+
+        self._base_command = base_command
+        self._uno: Any | None = None
+        self._uno_checked = False
+        self._session: _UnoSession | None = None
+        self._conversions = 0
+        self._start_failures = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the server process is currently alive."""
+        return self.process is not None and self.process.poll() is None
+
+    def enabled(self) -> bool:
+        """Whether conversions can go through the server.
+
+        Returns:
+            False if the UNO bridge is missing or the server keeps failing to start
+        """
+        if self._start_failures >= MAX_SERVER_START_FAILURES:
+            return False
+        if not self._uno_checked:
+            self._uno = _import_uno(self.soffice_path)
+            self._uno_checked = True
+            if self._uno is None:
+                logger.debug("UNO bridge not importable; using soffice command line")
+        return self._uno is not None
+
+    def convert(self, path: Path, output: Path, filter_name: str) -> None:
+        """Convert one file on the server, restarting it once if it dies.
+
+        Args:
+            path: File to convert
+            output: Output file
+            filter_name: LibreOffice export filter
+
+        Raises:
+            _ServerStartError: If the server cannot be launched
+            LibreOfficeError: If the file cannot be converted
+        """
+        for attempt in range(2):
+            if self._conversions >= self.max_conversions:
+                self.stop()
+            session = self._ensure_started()
+
+            # Kill a hung server; the blocked call then fails and we restart
+            assert self.process is not None
+            watchdog = threading.Timer(self.timeout, self.process.kill)
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                session.convert(path, output, filter_name)
+                self._conversions += 1
+                return
+            except Exception as e:
+                if self.running:
+                    # The document itself is bad; the server is fine
+                    if isinstance(e, LibreOfficeError):
+                        raise
+                    raise LibreOfficeError(f"LibreOffice conversion failed: {e}") from e
+                if attempt == 1:
+                    raise LibreOfficeError(
+                        f"LibreOffice server failed converting {path.name}: {e}"
+                    ) from e
+                logger.warning("LibreOffice server died converting %s; restarting", path.name)
+                self.restarts += 1
+                self.stop()
+            finally:
+                watchdog.cancel()
+
+    def stop(self) -> None:
+        """Terminate the server process, if one is running."""
+        self._session = None
+        process, self.process = self.process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def _ensure_started(self) -> _UnoSession:
+        if self._session is not None and self.running:
+            return self._session
+
+        self.stop()
+        pipe_name = f"bloginator-{uuid.uuid4().hex}"
+        command = self._base_command() + [
+            "--nodefault",
+            f"--accept=pipe,name={pipe_name};urp;StarOffice.ComponentContext",
+        ]
+        # Same process group as the caller, so a supervised worker that is
+        # killed takes its server down with it
+        self.process = subprocess.Popen(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT
+        last_error: Exception | None = None
+        while time.monotonic() < deadline and self.running:
+            try:
+                self._session = _UnoSession(self._uno, pipe_name)
+            except Exception as e:
+                last_error = e
+                time.sleep(0.25)
+                continue
+            self._start_failures = 0
+            self._conversions = 0
+            return self._session
+
+        self.stop()
+        self._start_failures += 1
+        raise _ServerStartError(f"LibreOffice server did not start: {last_error}")
@@ -0,0 +1,321 @@
+"""OCR engine with image preprocessing, a worker pool and a result cache.
+
+OCREngine wraps Tesseract (via pytesseract) for every OCR use in extraction:
+
+- Images are preprocessed before OCR (see _ocr_image).
+- Results are cached on disk keyed by a hash of the image bytes and the OCR
+  settings, so re-running extraction never re-OCRs an unchanged image.
+- ocr_many() fans cache misses out to a process pool; use it for the images
+  embedded in a DOCX/PPTX (see _ocr_embedded).
+- OCRMetrics records throughput and cache effectiveness.
+"""
+
+import atexit
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from bloginator.extraction._ocr_cache import OCRCache
+from bloginator.extraction._ocr_image import (
+    DEFAULT_MAX_DIMENSION,
+    PREPROCESS_VERSION,
+    OCRUnavailableError,
+    preprocess_image,
+    recognize_image_bytes,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Re-exported for callers that import them from here
+__all__ = [
+    "MIN_IMAGE_SIZE_FOR_OCR",
+    "OCRCache",
+    "OCREngine",
+    "OCRMetrics",
+    "OCRUnavailableError",
+    "close_ocr_engine",
+    "get_ocr_engine",
+    "preprocess_image",
+    "recognize_image_bytes",
+]
+
+# Minimum file size for image OCR (20KB) - smaller images are likely icons/decorations
+MIN_IMAGE_SIZE_FOR_OCR = 20 * 1024
+
+
+@dataclass
+class OCRMetrics:
+    """OCR throughput and cache statistics.
+
+    Attributes:
+        images: Images OCR'd (cache misses that ran Tesseract)
+        cache_hits: Images answered from the cache
+        skipped_small: Images skipped as too small to contain text
+        failures: Images whose OCR raised an error
+        bytes_processed: Encoded bytes of OCR'd images
+        ocr_seconds: Wall-clock time spent waiting on OCR
+    """
+
+    images: int = 0
+    cache_hits: int = 0
+    skipped_small: int = 0
+    failures: int = 0
+    bytes_processed: int = 0
+    ocr_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.images + self.cache_hits
+        return self.cache_hits / lookups if lookups else 0.0
+
+    @property
+    def images_per_second(self) -> float:
+        """OCR throughput over time spent waiting on OCR."""
+        return self.images / self.ocr_seconds if self.ocr_seconds else 0.0
+
+    def record(self, **deltas: float) -> None:
+        """Add to counters atomically."""
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def to_dict(self) -> dict[str, float]:
+        """Return metrics as a plain dictionary for reports and logging."""
+        return {
+            "images": self.images,
+            "cache_hits": self.cache_hits,
+            "skipped_small": self.skipped_small,
+            "failures": self.failures,
+            "bytes_processed": self.bytes_processed,
+            "ocr_seconds": round(self.ocr_seconds, 3),
+            "cache_hit_rate": round(self.cache_hit_rate, 3),
+            "images_per_second": round(self.images_per_second, 3),
+        }
+
+
+class OCREngine:
+    """Cached, preprocessed OCR with an optional process pool.
+
+    Attributes:
+        cache: Result cache (None disables caching)
+        workers: Pool size for ocr_many (1 = run in this process)
+        max_dimension: Long-side pixel limit for preprocessing
+        language: Tesseract language code(s)
+        min_bytes: Images smaller than this are skipped
+        metrics: Throughput and cache statistics
+    """
+
+    def __init__(
+        self,
+        cache: OCRCache | None = None,
+        workers: int | None = None,
+        max_dimension: int = DEFAULT_MAX_DIMENSION,
+        language: str = "eng",
+        min_bytes: int = MIN_IMAGE_SIZE_FOR_OCR,
+        start_method: str = "spawn",
+        recognizer: Callable[[bytes, int, str], str] = recognize_image_bytes,
+    ):
+        """Initialize engine. The process pool is started on first use.
+
+        Args:
+            cache: Result cache (None disables caching)
+            workers: Pool size for ocr_many (default: CPU count, max 4)
+            max_dimension: Long-side pixel limit for preprocessing
+            language: Tesseract language code(s)
+            min_bytes: Images smaller than this are skipped
+            start_method: multiprocessing start method for the pool
+            recognizer: Picklable OCR function (for testing)
+        """
+        self.cache = cache
+        self.workers = workers if workers is not None else min(4, os.cpu_count() or 1)
+        self.max_dimension = max_dimension
+        self.language = language
+        self.min_bytes = min_bytes
+        self.metrics = OCRMetrics()
+
+        self._start_method = start_method
+        self._recognizer = recognizer
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def cache_key(self, data: bytes) -> str:
+        """Hash image bytes together with the settings that affect OCR output.
+
+        Args:
+            data: Encoded image bytes
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.sha256(data)
+        digest.update(f"|{self.language}|{self.max_dimension}|v{PREPROCESS_VERSION}".encode())
+        return digest.hexdigest()
+
+    def ocr_bytes(self, data: bytes) -> str:
+        """OCR one encoded image in this process.
+
+        Args:
+            data: Encoded image bytes
+
+        Returns:
+            Recognized text ("" for images below min_bytes)
+
+        Raises:
+            OCRUnavailableError: If OCR is not installed
+            Exception: If the image cannot be decoded or recognized
+        """
+        return self.ocr_many([data], parallel=False, strict=True)[0]
+
+    def ocr_file(self, image_path: Path) -> str:
+        """OCR an image file in this process.
+
+        Args:
+            image_path: Path to image
+
+        Returns:
+            Recognized text ("" for images below min_bytes)
+        """
+        return self.ocr_bytes(image_path.read_bytes())
+
+    def ocr_many(
+        self, images: Iterable[bytes], parallel: bool = True, strict: bool = False
+    ) -> list[str]:
+        """OCR many encoded images, serving repeats from the cache.
+
+        Args:
+            images: Encoded image bytes
+            parallel: Use the process pool for cache misses when workers > 1
+            strict: Raise on an unreadable image instead of returning ""
+
+        Returns:
+            Recognized text per image, in input order
+
+        Raises:
+            OCRUnavailableError: If OCR is not installed
+        """
+        images = list(images)
+        results: list[str | None] = [None] * len(images)
+        misses: dict[str, list[int]] = {}
+
+        for index, data in enumerate(images):
+            if len(data) < self.min_bytes:
+                self.metrics.record(skipped_small=1)
+                results[index] = ""
+                continue
+            key = self.cache_key(data)
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                self.metrics.record(cache_hits=1)
+                results[index] = cached
+            else:
+                # Identical images in one call are OCR'd once
+                misses.setdefault(key, []).append(index)
+
+        if misses:
+            keys = list(misses)
+            payloads = [images[misses[key][0]] for key in keys]
+            start = time.monotonic()
+            texts = self._recognize_all(payloads, parallel and len(payloads) > 1)
+            self.metrics.record(ocr_seconds=time.monotonic() - start)
+
+            for key, data, text in zip(keys, payloads, texts, strict=True):
+                if isinstance(text, OCRUnavailableError):
+                    raise text
+                if isinstance(text, Exception):
+                    self.metrics.record(failures=1)
+                    if strict:
+                        raise text
+                    logger.debug("OCR failed: %s", text)
+                    text = ""
+                else:
+                    self.metrics.record(images=1, bytes_processed=len(data))
+                    if self.cache:
+                        self.cache.put(key, text)
+                for index in misses[key]:
+                    results[index] = text
+
+        return [text or "" for text in results]
+
+    def _recognize_all(self, payloads: list[bytes], parallel: bool) -> list[str | Exception]:
+        settings = (self.max_dimension, self.language)
+        executor = self._get_executor() if parallel else None
+        if executor is None:
+            outcomes: list[str | Exception] = []
+            for data in payloads:
+                try:
+                    outcomes.append(self._recognizer(data, *settings))
+                except Exception as e:
+                    outcomes.append(e)
+            return outcomes
+
+        futures = [executor.submit(self._recognizer, data, *settings) for data in payloads]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _get_executor(self) -> Executor | None:
+        if self.workers < 2 or multiprocessing.current_process().daemon:
+            return None
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context(self._start_method)
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the process pool and log a metrics summary."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if self.metrics.images or self.metrics.cache_hits:
+            logger.info("OCR metrics: %s", self.metrics.to_dict())
+
+    def __enter__(self) -> "OCREngine":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+_engine: OCREngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_ocr_engine() -> OCREngine:
+    """Return this process's shared OCR engine, creating it on first use.
+
+    Returns:
+        Shared OCREngine caching under the configured OCR cache directory
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            from bloginator.config import config
+
+            _engine = OCREngine(cache=OCRCache(config.ocr_cache_dir))
+            atexit.register(close_ocr_engine)
+        return _engine
+
+
+def close_ocr_engine() -> None:
+    """Shut down the shared OCR engine, if one was started."""
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.close()
+            _engine = None
@@ -0,0 +1,47 @@
+"""On-disk cache of OCR results."""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+class OCRCache:
+    """On-disk OCR results keyed by image content hash.
+
+    Entries are plain text files fanned out by hash prefix and written
+    atomically, so the cache can be shared by concurrent processes.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cached results (created on first write)
+        """
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> str | None:
+        """Return cached text, or None on a miss."""
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except (FileNotFoundError, OSError):
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        """Store text for a key."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            Path(tmp).replace(path)
+        except OSError as e:
+            logger.debug("Could not write OCR cache entry %s: %s", key, e)
@@ -0,0 +1,75 @@
+"""OCR of the images embedded in DOCX and PPTX packages."""
+
+import logging
+import threading
+import zipfile
+from pathlib import Path
+
+from bloginator.extraction._ocr import OCREngine, get_ocr_engine
+from bloginator.extraction._ocr_image import OCRUnavailableError
+
+
+logger = logging.getLogger(__name__)
+
+# Image members inside Office Open XML packages
+_EMBEDDED_IMAGE_DIRS = ("word/media/", "ppt/media/")
+_EMBEDDED_IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tif", ".tiff", ".gif")
+
+
+def iter_embedded_images(document_path: Path) -> list[tuple[str, bytes]]:
+    """Read the images embedded in a DOCX or PPTX package.
+
+    Args:
+        document_path: Path to .docx or .pptx file
+
+    Returns:
+        (member name, image bytes) pairs in package order
+    """
+    images = []
+    with zipfile.ZipFile(document_path) as package:
+        for info in package.infolist():
+            name = info.filename
+            if name.startswith(_EMBEDDED_IMAGE_DIRS) and name.lower().endswith(
+                _EMBEDDED_IMAGE_SUFFIXES
+            ):
+                images.append((name, package.read(info)))
+    return images
+
+
+# Set once a missing OCR install has been reported, so embedded images are
+# then skipped without another warning or attempt
+_embedded_ocr_unavailable = threading.Event()
+
+
+def extract_embedded_image_text(document_path: Path, engine: OCREngine | None = None) -> str:
+    """OCR the images embedded in a DOCX or PPTX.
+
+    Embedded-image OCR only adds to a document's text, so when pytesseract
+    or Tesseract is missing it is skipped (with one warning per process)
+    rather than failing the document.
+
+    Args:
+        document_path: Path to .docx or .pptx file
+        engine: OCR engine (default: the shared engine)
+
+    Returns:
+        Text from all embedded images, one block per image with text
+    """
+    if _embedded_ocr_unavailable.is_set():
+        return ""
+    images = iter_embedded_images(document_path)
+    if not images:
+        return ""
+    engine = engine or get_ocr_engine()
+    try:
+        texts = engine.ocr_many(data for _, data in images)
+    except OCRUnavailableError as e:
+        if not _embedded_ocr_unavailable.is_set():
+            _embedded_ocr_unavailable.set()
+            logger.warning("%s; skipping OCR of embedded images", e)
+        return ""
+    return "\n\n".join(
+        f"[Image {Path(name).name}: {text}]"
+        for (name, _), text in zip(images, texts, strict=True)
+        if text
+    )
@@ -0,0 +1,106 @@
+"""Image preprocessing and Tesseract recognition for OCR.
+
+Images are converted to grayscale, downscaled so the long side is at most
+``max_dimension`` pixels and binarized (Otsu threshold) before OCR, which
+cuts Tesseract time sharply on large screenshots and scans.
+"""
+
+import io
+from typing import Any
+
+
+# Long-side pixel limit before OCR; ~300 DPI for a letter-size page
+DEFAULT_MAX_DIMENSION = 3300
+
+# Bump when preprocessing changes so stale cache entries are ignored
+PREPROCESS_VERSION = 1
+
+
+class OCRUnavailableError(RuntimeError):
+    """Raised when pytesseract or the Tesseract binary is not installed."""
+
+
+def _otsu_threshold(histogram: list[int]) -> int:
+    """Compute Otsu's binarization threshold from a 256-bin histogram.
+
+    Args:
+        histogram: Grayscale histogram
+
+    Returns:
+        Threshold in 0-255
+    """
+    total = sum(histogram)
+    if total == 0:
+        return 128
+    weighted_sum = sum(i * count for i, count in enumerate(histogram))
+
+    best_threshold, best_variance = 0, -1.0
+    background_weight = 0
+    background_sum = 0
+    for threshold, count in enumerate(histogram):
+        background_weight += count
+        if background_weight == 0:
+            continue
+        foreground_weight = total - background_weight
+        if foreground_weight == 0:
+            break
+        background_sum += threshold * count
+        background_mean = background_sum / background_weight
+        foreground_mean = (weighted_sum - background_sum) / foreground_weight
+        variance = background_weight * foreground_weight * (background_mean - foreground_mean) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = threshold, variance
+    return best_threshold
+
+
+def preprocess_image(image: Any, max_dimension: int = DEFAULT_MAX_DIMENSION) -> Any:
+    """Prepare an image for OCR: grayscale, downscale and binarize.
+
+    Args:
+        image: PIL image
+        max_dimension: Maximum length of the longer side in pixels
+
+    Returns:
+        Binarized PIL image
+    """
+    from PIL import Image, ImageOps
+
+    gray = ImageOps.grayscale(ImageOps.exif_transpose(image) or image)
+
+    longest = max(gray.size)
+    if longest > max_dimension:
+        scale = max_dimension / longest
+        size = (max(1, round(gray.width * scale)), max(1, round(gray.height * scale)))
+        gray = gray.resize(size, Image.Resampling.LANCZOS)
+
+    threshold = _otsu_threshold(gray.histogram())
+    return gray.point(lambda value: 255 if value > threshold else 0, mode="1")
+
+
+def recognize_image_bytes(data: bytes, max_dimension: int, language: str) -> str:
+    """Preprocess and OCR one encoded image (runs in pool workers).
+
+    Args:
+        data: Encoded image bytes (PNG, JPEG, ...)
+        max_dimension: Long-side pixel limit for preprocessing
+        language: Tesseract language code(s)
+
+    Returns:
+        Recognized text, stripped
+
+    Raises:
+        OCRUnavailableError: If pytesseract or Tesseract is missing
+    """
+    try:
+        import pytesseract
+        from PIL import Image
+    except ImportError as e:
+        raise OCRUnavailableError("OCR not available (pytesseract/Pillow not installed)") from e
+
+    with Image.open(io.BytesIO(data)) as image:
+        prepared = preprocess_image(image, max_dimension)
+    try:
+        text: str = pytesseract.image_to_string(prepared, lang=language)
+    except pytesseract.TesseractNotFoundError as e:
+        raise OCRUnavailableError("Tesseract OCR not installed") from e
+    return text.strip()
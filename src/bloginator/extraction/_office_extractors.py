@@ -2,6 +2,9 @@
 
 from pathlib import Path
 
+from bloginator.config import config
+from bloginator.extraction._ocr_embedded import extract_embedded_image_text
+
 
 def extract_text_from_pptx(pptx_path: Path) -> str:
     """Extract text content from PowerPoint PPTX file.
@@ -49,11 +52,16 @@ def extract_text_from_pptx(pptx_path: Path) -> str:
 
             if len(slide_texts) > 1:  # More than just the slide header
                 text_parts.append("\n".join(slide_texts))
-
-        return "\n\n".join(text_parts)
     except Exception as e:
         raise ValueError(f"Failed to extract text from PPTX: {e}") from e
 
+    if config.OCR_EMBEDDED_IMAGES:
+        image_text = extract_embedded_image_text(pptx_path)
+        if image_text:
+            text_parts.append(image_text)
+
+    return "\n\n".join(text_parts)
+
 
 def extract_text_from_ppt(ppt_path: Path) -> str:
     """Extract text from legacy .ppt file via LibreOffice conversion.
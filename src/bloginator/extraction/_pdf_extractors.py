@@ -0,0 +1,181 @@
+"""Page-streaming PDF text extraction.
+
+Text is produced one page at a time rather than collected for the whole
+document, so callers can write it out or chunk it as it arrives. Very large
+PDFs are split into page ranges extracted in parallel worker processes, each
+with its own PyMuPDF handle (PyMuPDF is not thread-safe), and the ranges are
+yielded back in page order with only a few in flight at once.
+"""
+
+import multiprocessing
+import os
+import sys
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TextIO
+
+import fitz  # PyMuPDF
+
+
+# Separator between pages in extracted text
+PAGE_SEPARATOR = "\n\n"
+
+# Documents with at least this many pages are extracted in parallel
+PARALLEL_PAGE_THRESHOLD = 500
+
+# Pages handed to each parallel worker task
+PAGES_PER_RANGE = 100
+
+# Upper bound on worker processes for one document
+MAX_PDF_WORKERS = 4
+
+
+@contextmanager
+def suppress_stderr() -> Generator[None, None, None]:
+    """Context manager to suppress stderr output.
+
+    This is useful for suppressing C-level warnings from PyMuPDF
+    that clutter the output but are informational, not errors.
+    """
+    # Save original stderr
+    original_stderr = sys.stderr
+    original_stderr_fd = os.dup(2)
+
+    try:
+        # Redirect stderr to devnull
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 2)
+        sys.stderr = os.fdopen(devnull, "w")
+
+        yield
+
+    finally:
+        # Restore original stderr
+        os.dup2(original_stderr_fd, 2)
+        sys.stderr = original_stderr
+        os.close(original_stderr_fd)
+
+
+def count_pdf_pages(pdf_path: Path) -> int:
+    """Return the number of pages in a PDF.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        Page count
+    """
+    with suppress_stderr():
+        doc = fitz.open(str(pdf_path))
+        try:
+            return int(doc.page_count)
+        finally:
+            doc.close()
+
+
+def iter_pdf_pages(pdf_path: Path, start: int = 0, stop: int | None = None) -> Iterator[str]:
+    """Yield the text of each page in a range, one page at a time.
+
+    Args:
+        pdf_path: Path to PDF file
+        start: First page index (0-based)
+        stop: Page index to stop before (default: end of document)
+
+    Yields:
+        Text of each page, in order
+    """
+    # Suppress MuPDF stderr warnings (syntax errors in PDF content streams)
+    with suppress_stderr():
+        doc = fitz.open(str(pdf_path))
+    try:
+        end = doc.page_count if stop is None else min(stop, doc.page_count)
+        for index in range(start, end):
+            with suppress_stderr():
+                text = doc.load_page(index).get_text()
+            yield text
+    finally:
+        doc.close()
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> str:
+    """Extract a page range in a worker process with its own document handle."""
+    return PAGE_SEPARATOR.join(iter_pdf_pages(Path(pdf_path), start, stop))
+
+
+def _can_use_processes() -> bool:
+    # Daemonic processes may not start children
+    return not multiprocessing.current_process().daemon
+
+
+def iter_pdf_text(
+    pdf_path: Path,
+    workers: int | None = None,
+    parallel_threshold: int = PARALLEL_PAGE_THRESHOLD,
+    pages_per_range: int = PAGES_PER_RANGE,
+) -> Iterator[str]:
+    """Yield a PDF's text in page order, in pieces joined by PAGE_SEPARATOR.
+
+    Small documents are read page by page in this process. Documents with at
+    least ``parallel_threshold`` pages are split into ranges of
+    ``pages_per_range`` pages and extracted by a process pool; each yielded
+    piece is then a whole range. At most two ranges per worker are pending,
+    which bounds memory regardless of document size.
+
+    Args:
+        pdf_path: Path to PDF file
+        workers: Worker processes for large documents (default: CPU count, max 4)
+        parallel_threshold: Minimum page count for parallel extraction
+        pages_per_range: Pages per parallel task
+
+    Yields:
+        Text pieces in document order
+    """
+    page_count = count_pdf_pages(pdf_path)
+    if workers is None:
+        workers = min(MAX_PDF_WORKERS, os.cpu_count() or 1)
+
+    if page_count < parallel_threshold or workers < 2 or not _can_use_processes():
+        yield from iter_pdf_pages(pdf_path)
+        return
+
+    ranges = [
+        (start, min(start + pages_per_range, page_count))
+        for start in range(0, page_count, pages_per_range)
+    ]
+    # Spawn rather than fork: callers may be running extraction threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending: deque[Future[str]] = deque()
+        next_range = iter(ranges)
+        try:
+            for start, stop in next_range:
+                pending.append(executor.submit(_extract_page_range, str(pdf_path), start, stop))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def write_pdf_text(pdf_path: Path, output: TextIO, workers: int | None = None) -> int:
+    """Stream a PDF's text into a writer without holding the whole document.
+
+    Args:
+        pdf_path: Path to PDF file
+        output: Text stream to write to
+        workers: Worker processes for large documents (see iter_pdf_text)
+
+    Returns:
+        Number of characters written
+    """
+    written = 0
+    for index, piece in enumerate(iter_pdf_text(pdf_path, workers=workers)):
+        if index:
+            written += output.write(PAGE_SEPARATOR)
+        written += output.write(piece)
+    return written
@@ -0,0 +1,317 @@
+"""Supervised text extraction in isolated worker processes.
+
+Extractors for some formats call into native code (MuPDF, Tesseract) or
+shell out to LibreOffice, any of which can hang or crash the interpreter on
+a malformed file. ExtractionSupervisor runs extract_text_from_file in a pool
+of long-lived worker processes with per-format wall-clock and memory limits.
+A worker that exceeds its deadline or dies is killed together with any
+child processes it started and replaced, and the caller gets a typed
+exception, so one bad file never stalls the rest of the batch.
+
+The supervisor is thread-safe: each call checks out one worker, so running
+extract() from a thread pool gives parallel extraction with crash isolation.
+iter_extract() streams a file's text back in pieces (a PDF's pages) instead
+of one string, and convert_legacy_office() runs a small batch LibreOffice
+conversion under the same isolation.
+
+Workers are not daemonic, so they can start process pools of their own
+(parallel PDF page ranges). Each worker leads its own process group, which
+is killed as a whole when the worker is stopped, replaced or left running at
+interpreter exit.
+"""
+
+import contextlib
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from collections.abc import Callable, Generator, Iterator
+from pathlib import Path
+from typing import Any
+
+from bloginator.extraction._extraction_worker import (
+    CONVERT,
+    DEFAULT_MEMORY_LIMIT_MB,
+    EXTRACT,
+    STREAM,
+    ExtractionLimits,
+    ExtractionTimeoutError,
+    ExtractionWorker,
+    ExtractionWorkerCrashError,
+)
+from bloginator.timeout_config import timeout_config
+
+
+logger = logging.getLogger(__name__)
+
+# Re-exported for callers that import them from here
+__all__ = [
+    "DEFAULT_MEMORY_LIMIT_MB",
+    "ExtractionLimits",
+    "ExtractionSupervisor",
+    "ExtractionTimeoutError",
+    "ExtractionWorkerCrashError",
+    "default_extraction_limits",
+]
+
+# Native renderers (MuPDF, Tesseract) legitimately need more headroom
+LARGE_MEMORY_LIMIT_MB = 4096
+
+# Recycle workers periodically to bound slow leaks in native libraries
+DEFAULT_MAX_TASKS_PER_WORKER = 200
+
+
+def default_extraction_limits() -> dict[str, ExtractionLimits]:
+    """Build per-extension limits from timeout configuration.
+
+    Returns:
+        Dictionary mapping lowercase file extension to limits
+    """
+    pdf = ExtractionLimits(timeout_config.EXTRACTION_PDF_TIMEOUT, LARGE_MEMORY_LIMIT_MB)
+    # No address-space cap: it would be inherited by the long-lived LibreOffice
+    # server the worker starts, and the conversion timeout still applies
+    legacy_office = ExtractionLimits(
+        timeout_config.EXTRACTION_LEGACY_OFFICE_TIMEOUT, memory_limit_mb=None
+    )
+    ocr = ExtractionLimits(timeout_config.EXTRACTION_OCR_TIMEOUT, LARGE_MEMORY_LIMIT_MB)
+
+    return {
+        ".pdf": pdf,
+        ".doc": legacy_office,
+        ".ppt": legacy_office,
+        ".png": ocr,
+        ".jpg": ocr,
+        ".jpeg": ocr,
+        ".webp": ocr,
+    }
+
+
+class ExtractionSupervisor:
+    """Pool of isolated extraction workers with per-format limits.
+
+    Workers are started lazily and reused across files. Use as a context
+    manager, or call close() when done.
+
+    Attributes:
+        max_workers: Maximum number of concurrent worker processes
+        limits: Per-extension limits (see default_extraction_limits)
+        default_limits: Limits for extensions not in ``limits``
+        max_tasks_per_worker: Files a worker handles before being recycled
+        timeouts: Number of files killed for exceeding their deadline
+        crashes: Number of files whose worker died
+        restarts: Number of workers replaced
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        limits: dict[str, ExtractionLimits] | None = None,
+        default_limits: ExtractionLimits | None = None,
+        max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER,
+        start_method: str = "spawn",
+        extractor: Callable[[Path], str] | None = None,
+    ):
+        """Initialize extraction supervisor.
+
+        Args:
+            max_workers: Maximum concurrent workers (default: CPU count, max 8)
+            limits: Per-extension limits (default: default_extraction_limits())
+            default_limits: Limits for other extensions (default: EXTRACTION_TIMEOUT)
+            max_tasks_per_worker: Files a worker handles before being recycled
+            start_method: multiprocessing start method; "spawn" avoids
+                inheriting threads and loaded models from the parent
+            extractor: Picklable text extractor run in workers
+                (default: extract_text_from_file)
+        """
+        self.max_workers = max_workers or min(os.cpu_count() or 4, 8)
+        self.limits = limits if limits is not None else default_extraction_limits()
+        self.default_limits = default_limits or ExtractionLimits(timeout_config.EXTRACTION_TIMEOUT)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.extractor = extractor
+
+        self.timeouts = 0
+        self.crashes = 0
+        self.restarts = 0
+
+        self._context = multiprocessing.get_context(start_method)
+        self._idle: queue.SimpleQueue[ExtractionWorker] = queue.SimpleQueue()
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self._all_workers: set[ExtractionWorker] = set()
+        self._closed = False
+
+    def __enter__(self) -> "ExtractionSupervisor":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Exit context manager, stopping all workers."""
+        self.close()
+
+    def limits_for(self, path: Path) -> ExtractionLimits:
+        """Get limits that apply to a file.
+
+        Args:
+            path: File path
+
+        Returns:
+            Limits for the file's extension
+        """
+        return self.limits.get(path.suffix.lower(), self.default_limits)
+
+    def extract(self, path: Path) -> str:
+        """Extract text from a file in an isolated worker.
+
+        Args:
+            path: File to extract
+
+        Returns:
+            Extracted text content
+
+        Raises:
+            ExtractionTimeoutError: If extraction exceeded its wall-clock limit
+            ExtractionWorkerCrashError: If the worker died (e.g. segfault, OOM kill)
+            Exception: Whatever the extractor raised, re-raised with its type
+        """
+        with contextlib.closing(self._run([path], EXTRACT)) as replies:
+            status, payload = next(replies)
+
+        if status == "ok":
+            return str(payload)
+        raise payload
+
+    def iter_extract(self, path: Path) -> Iterator[str]:
+        """Extract text from a file in an isolated worker, piece by piece.
+
+        PDFs come back a page (or parallel page range) at a time, other
+        formats as one piece; the pieces joined by blank lines are what
+        extract() returns. The worker stays checked out until the iterator
+        is exhausted or closed, and the file's wall-clock limit covers the
+        whole iteration.
+
+        Args:
+            path: File to extract
+
+        Yields:
+            Text pieces in document order
+
+        Raises:
+            ExtractionTimeoutError: If extraction exceeded its wall-clock limit
+            ExtractionWorkerCrashError: If the worker died (e.g. segfault, OOM kill)
+            Exception: Whatever the extractor raised, re-raised with its type
+        """
+        with contextlib.closing(self._run([path], STREAM)) as replies:
+            for status, payload in replies:
+                if status == "piece":
+                    yield payload
+                elif status == "error":
+                    raise payload
+
+    def convert_legacy_office(self, paths: list[Path]) -> dict[Path, str | Exception]:
+        """Convert legacy Office files with LibreOffice in an isolated worker.
+
+        The batch shares the first file's wall-clock limit, so a hang costs
+        at most one file's budget; if the worker is killed or dies, every
+        file gets the error and can be retried alone under its own limit.
+
+        Args:
+            paths: .doc/.ppt files to convert together
+
+        Returns:
+            Dictionary mapping each path to its text or the exception it raised
+        """
+        if not paths:
+            return {}
+        try:
+            with contextlib.closing(self._run(paths, CONVERT)) as replies:
+                status, payload = next(replies)
+        except (ExtractionTimeoutError, ExtractionWorkerCrashError) as e:
+            return dict.fromkeys(paths, e)
+
+        if status != "ok":
+            return dict.fromkeys(paths, payload)
+        return {Path(path): result for path, result in payload.items()}
+
+    def _run(self, paths: list[Path], mode: str) -> Generator[tuple[str, Any], None, None]:
+        """Run one task on a checked-out worker, yielding its replies.
+
+        Args:
+            paths: File to extract (conversions take several)
+            mode: EXTRACT, STREAM or CONVERT
+
+        Yields:
+            Replies as produced by ExtractionWorker.run
+        """
+        if self._closed:
+            raise RuntimeError("ExtractionSupervisor is closed")
+
+        path = paths[0]
+        limits = self.limits_for(path)
+
+        with self._slots:
+            worker = self._checkout()
+            # A stream abandoned part-way leaves replies in the worker's pipe
+            replace = True
+            try:
+                for status, payload in worker.run(paths, limits, mode):
+                    if status != "piece":
+                        # A worker that hit its memory limit may be left in a bad state
+                        replace = status == "error" and isinstance(payload, MemoryError)
+                    yield status, payload
+            except ExtractionTimeoutError:
+                logger.warning("Killing extraction worker: timed out on %s", path)
+                with self._lock:
+                    self.timeouts += 1
+                replace = True
+                raise
+            except ExtractionWorkerCrashError as e:
+                logger.warning("%s", e)
+                with self._lock:
+                    self.crashes += 1
+                replace = True
+                raise
+            finally:
+                self._checkin(worker, replace)
+
+    def close(self) -> None:
+        """Stop all workers."""
+        self._closed = True
+        with self._lock:
+            workers = list(self._all_workers)
+            self._all_workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def _checkout(self) -> ExtractionWorker:
+        """Take an idle worker or start a new one (caller holds a slot)."""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                worker = ExtractionWorker(self._context, self.extractor)
+                with self._lock:
+                    self._all_workers.add(worker)
+                return worker
+            if worker.alive:
+                return worker
+            self._discard(worker)
+
+    def _checkin(self, worker: ExtractionWorker, replace: bool) -> None:
+        """Return a worker to the idle pool, or retire it."""
+        if replace or not worker.alive or worker.tasks_run >= self.max_tasks_per_worker:
+            if replace:
+                with self._lock:
+                    self.restarts += 1
+            self._discard(worker, kill=replace)
+            return
+        self._idle.put(worker)
+
+    def _discard(self, worker: ExtractionWorker, kill: bool = False) -> None:
+        """Remove a worker from the pool."""
+        with self._lock:
+            self._all_workers.discard(worker)
+        if kill and worker.alive:
+            worker.kill()
+        else:
+            worker.stop()
@@ -2,6 +2,7 @@
 
 import re
 import uuid
+from collections.abc import Iterable, Iterator
 
 from bloginator.models import Chunk
 
@@ -84,90 +85,34 @@ def chunk_text_by_paragraphs(
     Returns:
         List of Chunk objects
     """
-    # Split into paragraphs (double newline or more)
-    paragraphs = re.split(r"\n\s*\n", text)
-    paragraphs = [p.strip() for p in paragraphs if p.strip()]
+    return list(iter_chunks_by_paragraphs([text], document_id, max_chunk_size))
 
-    chunks: list[Chunk] = []
+
+def iter_chunks_by_paragraphs(
+    texts: Iterable[str], document_id: str, max_chunk_size: int = 1000
+) -> Iterator[Chunk]:
+    """Chunk streamed text by paragraphs, yielding chunks as they fill.
+
+    Equivalent to chunk_text_by_paragraphs on the pieces joined by blank
+    lines (e.g. the pages from iter_pdf_text), without holding the whole
+    text in memory.
+
+    Args:
+        texts: Text pieces in order; each boundary is a paragraph break
+        document_id: ID of parent document
+        max_chunk_size: Maximum size of each chunk in characters
+
+    Yields:
+        Chunk objects in order
+    """
     chunk_index = 0
     current_chunk_parts: list[str] = []
     current_size = 0
     char_start = 0
 
-    for para in paragraphs:
-        para_size = len(para)
-
-        # If single paragraph exceeds max size, split it
-        if para_size > max_chunk_size:
-            # Flush current chunk first
-            if current_chunk_parts:
-                content = "\n\n".join(current_chunk_parts)
-                chunk = Chunk(
-                    id=str(uuid.uuid4()),
-                    document_id=document_id,
-                    content=content,
-                    chunk_index=chunk_index,
-                    section_heading=None,
-                    char_start=char_start,
-                    char_end=char_start + len(content),
-                )
-                chunks.append(chunk)
-                chunk_index += 1
-                current_chunk_parts = []
-                current_size = 0
-                char_start += len(content)
-
-            # Split large paragraph by sentences
-            sentences = re.split(r"(?<=[.!?])\s+", para)
-            for sent in sentences:
-                sent = sent.strip()
-                if sent:
-                    if current_size + len(sent) > max_chunk_size and current_chunk_parts:
-                        # Flush current chunk
-                        content = " ".join(current_chunk_parts)
-                        chunk = Chunk(
-                            id=str(uuid.uuid4()),
-                            document_id=document_id,
-                            content=content,
-                            chunk_index=chunk_index,
-                            section_heading=None,
-                            char_start=char_start,
-                            char_end=char_start + len(content),
-                        )
-                        chunks.append(chunk)
-                        chunk_index += 1
-                        current_chunk_parts = []
-                        current_size = 0
-                        char_start += len(content)
-
-                    current_chunk_parts.append(sent)
-                    current_size += len(sent) + 1  # +1 for space
-        else:
-            # Normal paragraph
-            if current_size + para_size > max_chunk_size and current_chunk_parts:
-                # Flush current chunk
-                content = "\n\n".join(current_chunk_parts)
-                chunk = Chunk(
-                    id=str(uuid.uuid4()),
-                    document_id=document_id,
-                    content=content,
-                    chunk_index=chunk_index,
-                    section_heading=None,
-                    char_start=char_start,
-                    char_end=char_start + len(content),
-                )
-                chunks.append(chunk)
-                chunk_index += 1
-                current_chunk_parts = []
-                current_size = 0
-                char_start += len(content)
-
-            current_chunk_parts.append(para)
-            current_size += para_size + 2  # +2 for double newline
-
-    # Flush remaining chunk
-    if current_chunk_parts:
-        content = "\n\n".join(current_chunk_parts)
+    def flush(separator: str) -> Chunk:
+        nonlocal chunk_index, current_chunk_parts, current_size, char_start
+        content = separator.join(current_chunk_parts)
         chunk = Chunk(
             id=str(uuid.uuid4()),
             document_id=document_id,
@@ -177,9 +122,46 @@ def chunk_text_by_paragraphs(
             char_start=char_start,
             char_end=char_start + len(content),
         )
-        chunks.append(chunk)
+        chunk_index += 1
+        current_chunk_parts = []
+        current_size = 0
+        char_start += len(content)
+        return chunk
+
+    for text in texts:
+        # Split into paragraphs (double newline or more)
+        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+
+        for para in paragraphs:
+            para_size = len(para)
+
+            # If single paragraph exceeds max size, split it
+            if para_size > max_chunk_size:
+                # Flush current chunk first
+                if current_chunk_parts:
+                    yield flush("\n\n")
+
+                # Split large paragraph by sentences
+                sentences = re.split(r"(?<=[.!?])\s+", para)
+                for sent in sentences:
+                    sent = sent.strip()
+                    if sent:
+                        if current_size + len(sent) > max_chunk_size and current_chunk_parts:
+                            yield flush(" ")
+
+                        current_chunk_parts.append(sent)
+                        current_size += len(sent) + 1  # +1 for space
+            else:
+                # Normal paragraph
+                if current_size + para_size > max_chunk_size and current_chunk_parts:
+                    yield flush("\n\n")
+
+                current_chunk_parts.append(para)
+                current_size += para_size + 2  # +2 for double newline
 
-    return chunks
+    # Flush remaining chunk
+    if current_chunk_parts:
+        yield flush("\n\n")
 
 
 def chunk_text_by_sentences(
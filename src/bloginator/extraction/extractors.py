@@ -1,14 +1,10 @@
 """Document content extractors for various file formats."""
 
-import os
 import re
-import sys
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import Iterator
 from pathlib import Path
 
-import fitz  # PyMuPDF
-
+from bloginator.config import config
 from bloginator.extraction._doc_extractors import (
     extract_confluence_export,
     extract_real_doc_file,
@@ -26,6 +22,8 @@ from bloginator.extraction._extended_extractors import (
     extract_text_from_xlsx,
     extract_text_from_xml,
 )
+from bloginator.extraction._ocr_embedded import extract_embedded_image_text
+from bloginator.extraction._pdf_extractors import PAGE_SEPARATOR, iter_pdf_text
 
 
 # Re-export for backward compatibility with tests
@@ -33,36 +31,12 @@ _extract_confluence_export = extract_confluence_export
 _html_to_text = html_to_text
 
 
-@contextmanager
-def suppress_stderr() -> Generator[None, None, None]:
-    """Context manager to suppress stderr output.
-
-    This is useful for suppressing C-level warnings from PyMuPDF
-    that clutter the output but are informational, not errors.
-    """
-    # Save original stderr
-    original_stderr = sys.stderr
-    original_stderr_fd = os.dup(2)
-
-    try:
-        # Redirect stderr to devnull
-        devnull = os.open(os.devnull, os.O_WRONLY)
-        os.dup2(devnull, 2)
-        sys.stderr = os.fdopen(devnull, "w")
-
-        yield
-
-    finally:
-        # Restore original stderr
-        os.dup2(original_stderr_fd, 2)
-        sys.stderr = original_stderr
-        os.close(original_stderr_fd)
-
-
 def extract_text_from_pdf(pdf_path: Path) -> str:
     """Extract text content from PDF file.
 
-    Uses PyMuPDF (fitz) to extract text from all pages.
+    Uses PyMuPDF (fitz) to extract text from all pages and returns it as
+    one string. To process pages as they are produced instead, use
+    iter_pdf_text or write_pdf_text.
 
     Args:
         pdf_path: Path to PDF file
@@ -78,18 +52,8 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
     try:
-        # Suppress MuPDF stderr warnings (syntax errors in PDF content streams)
-        # These are informational C-level warnings, not extraction errors
-        with suppress_stderr():
-            doc = fitz.open(str(pdf_path))
-            text_parts = []
-
-            for page in doc:
-                text_parts.append(page.get_text())
-
-            doc.close()
-
-        return "\n\n".join(text_parts)
+        # Very large PDFs are read in parallel
+        return PAGE_SEPARATOR.join(iter_pdf_text(pdf_path))
     except Exception as e:
         raise ValueError(f"Failed to extract text from PDF: {e}") from e
 
@@ -132,11 +96,16 @@ def extract_text_from_docx(docx_path: Path) -> str:
                 row_text = " | ".join(cell.text.strip() for cell in row.cells)
                 if row_text.strip():
                     text_parts.append(row_text)
-
-        return "\n\n".join(text_parts)
     except Exception as e:
         raise ValueError(f"Failed to extract text from DOCX: {e}") from e
 
+    if config.OCR_EMBEDDED_IMAGES:
+        image_text = extract_embedded_image_text(docx_path)
+        if image_text:
+            text_parts.append(image_text)
+
+    return "\n\n".join(text_parts)
+
 
 def extract_text_from_doc(doc_path: Path) -> str:
     """Extract text content from legacy .doc file.
@@ -287,6 +256,35 @@ def extract_text_from_file(file_path: Path) -> str:
         raise ValueError(f"Unsupported file type: {suffix}")
 
 
+def iter_text_from_file(file_path: Path) -> Iterator[str]:
+    """Extract text from a file in pieces, as it is produced.
+
+    PDFs are yielded page by page (see iter_pdf_text); other formats are
+    extracted whole and yielded as one piece. The pieces joined by blank
+    lines equal extract_text_from_file's result.
+
+    Args:
+        file_path: Path to file
+
+    Yields:
+        Text pieces in document order
+
+    Raises:
+        FileNotFoundError: If file does not exist
+        ValueError: If file type is not supported or the PDF cannot be read
+    """
+    if file_path.suffix.lower() != ".pdf":
+        yield extract_text_from_file(file_path)
+        return
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"PDF file not found: {file_path}")
+    try:
+        yield from iter_pdf_text(file_path)
+    except Exception as e:
+        raise ValueError(f"Failed to extract text from PDF: {e}") from e
+
+
 def extract_section_headings(text: str) -> list[tuple[str, int]]:
     """Extract section headings from Markdown text.
 
@@ -9,6 +9,7 @@ This module handles:
 - Safety validation with blocklist integration
 """
 
+from bloginator.generation._generation_context import GenerationContext
 from bloginator.generation.draft_generator import DraftGenerator
 from bloginator.generation.llm_client import (
     LLMClient,
@@ -32,6 +33,7 @@ __all__ = [
     # Generators
     "OutlineGenerator",
     "DraftGenerator",
+    "GenerationContext",
     # Scoring and validation
     "VoiceScorer",
     "SafetyValidator",
@@ -0,0 +1,142 @@
+"""Adaptive concurrency window and the gate that admits requests to it."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+
+class AIMDWindow:
+    """Additive-increase, multiplicative-decrease concurrency limit.
+
+    Attributes:
+        max_limit: Largest window
+        min_limit: Smallest window
+        limit: Current window (fractional; floored when admitting)
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial: int | None = None,
+        min_limit: int = 1,
+        decrease_factor: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the window.
+
+        Args:
+            max_limit: Largest window
+            initial: Starting window (defaults to half of max_limit)
+            min_limit: Smallest window
+            decrease_factor: Multiplier applied on overload
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.max_limit = max(max_limit, min_limit)
+        self.min_limit = min_limit
+        self.limit = float(initial if initial is not None else max(min_limit, max_limit // 2))
+        self.decrease_factor = decrease_factor
+        self._clock = clock
+        self._last_decrease = -math.inf
+
+    @property
+    def size(self) -> int:
+        """Requests that may currently be in flight."""
+        return max(self.min_limit, math.floor(self.limit))
+
+    def on_success(self) -> None:
+        """Grow by one request per full window of successes."""
+        self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+    def on_overload(self, started: float) -> None:
+        """Shrink the window after throttling, errors or slow responses.
+
+        Only the first signal from requests already in flight counts, so a
+        burst of failures halves the window once, not once per request.
+
+        Args:
+            started: When the failing request was sent
+        """
+        if started < self._last_decrease:
+            return
+        self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+        self._last_decrease = self._clock()
+
+
+class ConcurrencyGate:
+    """FIFO admission to an AIMD window for both threads and coroutines."""
+
+    def __init__(self, window: AIMDWindow):
+        self.window = window
+        self.in_flight = 0
+        self._waiters: deque[Any] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def _has_room(self) -> bool:
+        return not self._waiters and self.in_flight < self.window.size
+
+    def _admit_waiters(self) -> None:
+        """Hand free slots to queued callers in order (lock held)."""
+        while self._waiters and self.in_flight < self.window.size:
+            waiter = self._waiters.popleft()
+            self.in_flight += 1
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+            else:
+                loop, future = waiter
+                loop.call_soon_threadsafe(_resolve, future)
+
+    def acquire(self) -> None:
+        """Block the calling thread until a slot is free."""
+        with self._lock:
+            if self._has_room():
+                self.in_flight += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    async def acquire_async(self) -> None:
+        """Wait on the running event loop until a slot is free."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._has_room():
+                self.in_flight += 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    admitted = False
+                except ValueError:
+                    admitted = True
+            if admitted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot and admit the next waiter."""
+        with self._lock:
+            self.in_flight -= 1
+            self._admit_waiters()
+
+    def resize(self) -> None:
+        """Admit waiters after the window has grown."""
+        with self._lock:
+            self._admit_waiters()
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
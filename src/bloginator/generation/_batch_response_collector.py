@@ -1,19 +1,36 @@
 """Batch response collection logic for assistant LLM client."""
 
-import json
 import logging
 import time
 from pathlib import Path
-from typing import Any
 
 from rich.console import Console
 
+from bloginator.generation._batch_response_files import (
+    request_filename,
+    response_filename,
+    validate_response,
+)
+from bloginator.generation._response_watcher import ResponseWatcher
 from bloginator.generation.llm_base import LLMResponse
 
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Re-exported for callers that import them from here
+__all__ = [
+    "STATUS_INTERVAL",
+    "collect_batch_responses",
+    "format_elapsed",
+    "request_filename",
+    "response_filename",
+    "validate_response",
+]
+
+# Seconds between progress messages while waiting
+STATUS_INTERVAL = 15
+
 
 def format_elapsed(seconds: float) -> str:
     """Format elapsed time as mm:ss or hh:mm:ss.
@@ -31,77 +48,6 @@ def format_elapsed(seconds: float) -> str:
     return f"{mins}:{secs:02d}"
 
 
-def validate_response(
-    response_file: Path, request_id: int, request_dir: Path | None = None
-) -> dict[str, Any]:
-    """Validate response JSON schema, required fields, and timestamp.
-
-    Schema:
-      REQUIRED: content (str) - the synthesized content
-      OPTIONAL: request_id (int), tokens_used (int), error (str),
-                prompt_tokens (int), completion_tokens (int), finish_reason (str)
-
-    Args:
-        response_file: Path to response JSON file
-        request_id: Expected request ID
-        request_dir: Optional path to request directory for timestamp validation
-
-    Returns:
-        Validated response data dict
-
-    Raises:
-        ValueError: If response is invalid (missing required fields, bad types, or stale)
-    """
-    try:
-        with response_file.open() as f:
-            response_data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in {response_file}: {e}") from e
-
-    # Check for error field first
-    if "error" in response_data:
-        error_msg = response_data.get("error", "Unknown error")
-        raise ValueError(f"Response contains error: {error_msg}")
-
-    # Validate required field: content
-    if "content" not in response_data:
-        raise ValueError(f"Missing required 'content' field in {response_file}")
-
-    content = response_data["content"]
-    if not isinstance(content, str):
-        raise ValueError(
-            f"'content' must be string in {response_file}, got {type(content).__name__}"
-        )
-
-    if len(content.strip()) == 0:
-        raise ValueError(f"Empty 'content' in {response_file}")
-
-    # Validate timestamp: response must be newer than request
-    if request_dir is not None:
-        request_file = request_dir / f"request_{request_id:04d}.json"
-        if request_file.exists():
-            request_mtime = request_file.stat().st_mtime
-            response_mtime = response_file.stat().st_mtime
-            if response_mtime < request_mtime:
-                raise ValueError(
-                    f"Stale response: {response_file.name} is older than {request_file.name}. "
-                    f"Delete stale responses and regenerate."
-                )
-
-    # Validate optional fields if present
-    if "request_id" in response_data:
-        rid = response_data["request_id"]
-        if not isinstance(rid, int):
-            logger.warning(f"Response {request_id}: request_id should be int, got {type(rid)}")
-
-    if "tokens_used" in response_data:
-        tokens = response_data["tokens_used"]
-        if not isinstance(tokens, int):
-            logger.warning(f"Response {request_id}: tokens_used should be int")
-
-    return dict(response_data)
-
-
 def collect_batch_responses(
     pending_requests: list[int],
     response_dir: Path,
@@ -115,6 +61,10 @@ def collect_batch_responses(
 
     Blocks until all response files are available, timeout, or minimum threshold met.
     Returns placeholder content for missing/failed responses if allow_partial=True.
+    Wakes as response files are written (inotify on Linux; elsewhere one
+    directory scan per second) rather than checking each file in turn. A
+    response file rewritten while others are still awaited is read again and
+    replaces the earlier response or error.
 
     Args:
         pending_requests: List of request IDs to wait for
@@ -137,7 +87,6 @@ def collect_batch_responses(
     total = len(pending_requests)
     timeout_mins = timeout // 60
     min_required = int(total * min_response_threshold)
-    response_mtimes: dict[int, float] = {}
 
     console.print(
         f"\n[bold yellow]⏳ Claude thinking... (5-10min typical for {total} sections)"
@@ -149,61 +98,80 @@ def collect_batch_responses(
     start_time = time.time()
     last_status_time = start_time
     responses: dict[int, LLMResponse] = {}
-    remaining_ids = set(pending_requests)
+    pending_ids = sorted(set(pending_requests))
+    remaining_ids = set(pending_ids)
     errors: dict[int, str] = {}
-
-    while remaining_ids:
-        elapsed = time.time() - start_time
-        time_remaining = timeout - elapsed
-
-        # Check for new/updated response files
-        for request_id in list(remaining_ids):
-            response_file = response_dir / f"response_{request_id:04d}.json"
-            if response_file.exists():
-                # Check for duplicate/updated responses
-                is_update = _check_duplicate_response(request_id, response_file, response_mtimes)
-                if is_update and request_id in responses:
-                    console.print(
-                        f"[bold cyan]↻ Response {request_id} updated (overwrite)[/bold cyan]"
-                    )
+    # Modification time of each response file as last read
+    read_mtimes: dict[int, int] = {}
+
+    with ResponseWatcher(response_dir) as watcher:
+        arrived = watcher.scan()
+        while remaining_ids:
+            elapsed = time.time() - start_time
+            time_remaining = timeout - elapsed
+
+            # Read responses written since the last wake-up, including
+            # rewrites of ones already read
+            for request_id in pending_ids:
+                response_file = response_dir / response_filename(request_id)
+                if response_file.name not in arrived:
+                    continue
+                try:
+                    mtime = response_file.stat().st_mtime_ns
+                except OSError:
+                    continue
+                if read_mtimes.get(request_id) == mtime:
+                    continue
+                updated = request_id in read_mtimes
+                read_mtimes[request_id] = mtime
+                remaining_ids.discard(request_id)
 
                 try:
                     response_data = validate_response(response_file, request_id, request_dir)
-                    content = response_data["content"]
-                    responses[request_id] = LLMResponse(
-                        content=content,
-                        model=model,
-                        prompt_tokens=response_data.get("prompt_tokens", 0),
-                        completion_tokens=response_data.get("completion_tokens", len(content) // 4),
-                        finish_reason=response_data.get("finish_reason", "stop"),
+                except ValueError as e:
+                    errors[request_id] = str(e)
+                    responses.pop(request_id, None)
+                    console.print(f"[bold red]✗ Response {request_id}: {e}[/bold red]")
+                    continue
+
+                content = response_data["content"]
+                responses[request_id] = LLMResponse(
+                    content=content,
+                    model=model,
+                    prompt_tokens=response_data.get("prompt_tokens", 0),
+                    completion_tokens=response_data.get("completion_tokens", len(content) // 4),
+                    finish_reason=response_data.get("finish_reason", "stop"),
+                )
+                errors.pop(request_id, None)
+                elapsed_str = format_elapsed(elapsed)
+                if updated:
+                    console.print(
+                        f"[bold cyan]↻ Response {request_id} updated (overwrite) "
+                        f"[{elapsed_str} elapsed][/bold cyan]"
                     )
-                    remaining_ids.remove(request_id)
-                    elapsed_str = format_elapsed(elapsed)
+                else:
                     console.print(
                         f"[bold green]✓ Response {request_id}/{total} received "
                         f"[{elapsed_str} elapsed][/bold green]"
                     )
-                except ValueError as e:
-                    errors[request_id] = str(e)
-                    remaining_ids.remove(request_id)
-                    console.print(f"[bold red]✗ Response {request_id}: {e}[/bold red]")
 
-        # Show progress every 15 seconds
-        if time.time() - last_status_time >= 15:
-            last_status_time = time.time()
-            elapsed_str = format_elapsed(elapsed)
-            remaining_str = format_elapsed(time_remaining)
-            console.print(
-                f"[dim]⏳ Waiting for {len(remaining_ids)}/{total} responses... "
-                f"[{elapsed_str} elapsed, {remaining_str} remaining][/dim]"
-            )
+            # Show progress every 15 seconds
+            if time.time() - last_status_time >= STATUS_INTERVAL:
+                last_status_time = time.time()
+                elapsed_str = format_elapsed(elapsed)
+                remaining_str = format_elapsed(time_remaining)
+                console.print(
+                    f"[dim]⏳ Waiting for {len(remaining_ids)}/{total} responses... "
+                    f"[{elapsed_str} elapsed, {remaining_str} remaining][/dim]"
+                )
 
-        # Check timeout
-        if elapsed > timeout:
-            break
+            # Check timeout
+            if elapsed > timeout:
+                break
 
-        if remaining_ids:
-            time.sleep(1)
+            if remaining_ids:
+                next_status = last_status_time + STATUS_INTERVAL - time.time()
+                arrived = watcher.wait(min(time_remaining, next_status) + 0.01)
 
     # Handle timeout/partial completion
     elapsed_str = format_elapsed(time.time() - start_time)
@@ -213,14 +181,21 @@ def collect_batch_responses(
     # Determine if we have enough responses
     if missing_ids or errors:
         if received_count >= min_required and allow_partial:
-            _add_placeholders_for_missing(responses, missing_ids, errors, model)
+            _add_placeholders_for_missing(responses, missing_ids, errors, model, request_dir)
             console.print(
                 f"\n[bold yellow]⚠️  Partial batch: {received_count}/{total} responses "
                 f"(≥{int(min_response_threshold * 100)}% threshold met)[/bold yellow]"
             )
         else:
             _raise_insufficient_responses_error(
-                elapsed_str, received_count, total, min_required, missing_ids, errors
+                elapsed_str,
+                received_count,
+                total,
+                min_required,
+                missing_ids,
+                errors,
+                request_dir,
+                response_dir,
             )
     else:
         console.print(
@@ -231,39 +206,12 @@ def collect_batch_responses(
     return responses
 
 
-def _check_duplicate_response(
-    request_id: int, response_file: Path, response_mtimes: dict[int, float]
-) -> bool:
-    """Check if response file was updated (overwritten).
-
-    Args:
-        request_id: Request ID to check
-        response_file: Path to response file
-        response_mtimes: Dictionary tracking modification times
-
-    Returns:
-        True if this is an update to existing response
-    """
-    try:
-        current_mtime = response_file.stat().st_mtime
-    except OSError:
-        return False
-
-    if request_id in response_mtimes:
-        previous_mtime = response_mtimes[request_id]
-        if current_mtime > previous_mtime:
-            response_mtimes[request_id] = current_mtime
-            return True  # File was overwritten
-
-    response_mtimes[request_id] = current_mtime
-    return False
-
-
 def _add_placeholders_for_missing(
     responses: dict[int, LLMResponse],
     missing_ids: list[int],
     errors: dict[int, str],
     model: str,
+    request_dir: Path | None = None,
 ) -> None:
     """Add placeholder responses for missing/errored requests.
 
@@ -272,11 +220,13 @@ def _add_placeholders_for_missing(
         missing_ids: Request IDs that never received responses
         errors: Dictionary of request_id -> error message
         model: Model name for LLMResponse
+        request_dir: Directory holding this run's request files
     """
+    request_dir = request_dir or Path(".bloginator/llm_requests")
     for request_id in missing_ids:
         placeholder = (
             f"⚠️ **[SECTION {request_id}]** Response missing - add content manually.\n\n"
-            f"_Check `.bloginator/llm_requests/request_{request_id:04d}.json` "
+            f"_Check `{request_dir / request_filename(request_id)}` "
             f"for the original prompt._"
         )
         responses[request_id] = LLMResponse(
@@ -309,6 +259,8 @@ def _raise_insufficient_responses_error(
     min_required: int,
     missing_ids: list[int],
     errors: dict[int, str],
+    request_dir: Path | None = None,
+    response_dir: Path | None = None,
 ) -> None:
     """Raise TimeoutError with detailed diagnostic message.
 
@@ -319,6 +271,8 @@ def _raise_insufficient_responses_error(
         min_required: Minimum required for success
         missing_ids: Request IDs that never received responses
         errors: Dictionary of request_id -> error message
+        request_dir: Directory holding this run's request files
+        response_dir: Directory the responses were expected in
 
     Raises:
         TimeoutError: Always raises with diagnostic message
@@ -332,8 +286,8 @@ def _raise_insufficient_responses_error(
         error_msg += f"Errors: {list(errors.keys())}\n"
     error_msg += (
         "\nTo resolve:\n"
-        "1. Check .bloginator/llm_requests/ for pending requests\n"
-        "2. Write responses to .bloginator/llm_responses/\n"
+        f"1. Check {request_dir or '.bloginator/llm_requests'}/ for pending requests\n"
+        f"2. Write responses to {response_dir or '.bloginator/llm_responses'}/\n"
         "3. Re-run with --batch-timeout or lower threshold"
     )
     console.print(f"\n[bold red]❌ FAILED: {error_msg}[/bold red]")
@@ -0,0 +1,90 @@
+"""Request and response files exchanged with the assistant in batch mode."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+def request_filename(request_id: int) -> str:
+    """Name of the request file for a request ID."""
+    return f"request_{request_id:04d}.json"
+
+
+def response_filename(request_id: int) -> str:
+    """Name of the response file for a request ID."""
+    return f"response_{request_id:04d}.json"
+
+
+def validate_response(
+    response_file: Path, request_id: int, request_dir: Path | None = None
+) -> dict[str, Any]:
+    """Validate response JSON schema, required fields, and timestamp.
+
+    Schema:
+      REQUIRED: content (str) - the synthesized content
+      OPTIONAL: request_id (int), tokens_used (int), error (str),
+                prompt_tokens (int), completion_tokens (int), finish_reason (str)
+
+    Args:
+        response_file: Path to response JSON file
+        request_id: Expected request ID
+        request_dir: Optional path to request directory for timestamp validation
+
+    Returns:
+        Validated response data dict
+
+    Raises:
+        ValueError: If response is invalid (missing required fields, bad types, or stale)
+    """
+    try:
+        with response_file.open() as f:
+            response_data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {response_file}: {e}") from e
+
+    # Check for error field first
+    if "error" in response_data:
+        error_msg = response_data.get("error", "Unknown error")
+        raise ValueError(f"Response contains error: {error_msg}")
+
+    # Validate required field: content
+    if "content" not in response_data:
+        raise ValueError(f"Missing required 'content' field in {response_file}")
+
+    content = response_data["content"]
+    if not isinstance(content, str):
+        raise ValueError(
+            f"'content' must be string in {response_file}, got {type(content).__name__}"
+        )
+
+    if len(content.strip()) == 0:
+        raise ValueError(f"Empty 'content' in {response_file}")
+
+    # Validate timestamp: response must be newer than request
+    if request_dir is not None:
+        request_file = request_dir / request_filename(request_id)
+        if request_file.exists():
+            request_mtime = request_file.stat().st_mtime
+            response_mtime = response_file.stat().st_mtime
+            if response_mtime < request_mtime:
+                raise ValueError(
+                    f"Stale response: {response_file.name} is older than {request_file.name}. "
+                    f"Delete stale responses and regenerate."
+                )
+
+    # Validate optional fields if present
+    if "request_id" in response_data:
+        rid = response_data["request_id"]
+        if not isinstance(rid, int):
+            logger.warning(f"Response {request_id}: request_id should be int, got {type(rid)}")
+
+    if "tokens_used" in response_data:
+        tokens = response_data["tokens_used"]
+        if not isinstance(tokens, int):
+            logger.warning(f"Response {request_id}: tokens_used should be int")
+
+    return dict(response_data)
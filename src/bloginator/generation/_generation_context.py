@@ -0,0 +1,231 @@
+"""Per-request memoization shared by repeated generation attempts.
+
+Retries of one request differ only in their prompt variant, so the corpus
+searches, topic validation and voice samples they need are the same every
+time. A GenerationContext remembers them for the life of one request; pass
+its searcher and the context itself to OutlineGenerator and DraftGenerator.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+from bloginator.search import CorpusSearcher, SearchResult
+
+
+T = TypeVar("T")
+
+
+class _Memo(Generic[T]):
+    """Thread-safe compute-once cache.
+
+    Concurrent callers asking for the same key wait for the first one
+    instead of computing the value again.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._values: dict[Hashable, T] = {}
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the value for a key, computing it on first use."""
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+            value = compute()
+            with self._lock:
+                self._values[key] = value
+                self.misses += 1
+        return value
+
+
+class MemoizingSearcher(CorpusSearcher):
+    """Corpus searcher wrapper that remembers search results.
+
+    search() and batch_search() results are kept per query (with its result
+    count and filters); a batch only sends the queries not seen before, as
+    one batch. Every other attribute is read from the wrapped searcher, so
+    it can stand in wherever a CorpusSearcher is expected.
+
+    Attributes:
+        searcher: Wrapped corpus searcher
+        hits: Queries answered from memory
+        misses: Queries sent to the wrapped searcher
+    """
+
+    def __init__(self, searcher: CorpusSearcher):
+        """Wrap a searcher.
+
+        Args:
+            searcher: Corpus searcher to wrap
+        """
+        # No super().__init__(): the index is the wrapped searcher's
+        self.searcher = searcher
+        self.hits = 0
+        self.misses = 0
+        self._results: dict[tuple[Any, ...], list[SearchResult]] = {}
+        # Held while searching, so concurrent attempts never repeat a query
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate unknown attributes to the wrapped searcher."""
+        if name == "searcher":
+            raise AttributeError(name)
+        return getattr(self.searcher, name)
+
+    def search(
+        self,
+        query: str,
+        n_results: int = 10,
+        quality_filter: str | None = None,
+        tags_filter: list[str] | None = None,
+        format_filter: str | None = None,
+    ) -> list[SearchResult]:
+        """Search the corpus, reusing an earlier identical search.
+
+        Args:
+            query: Natural language search query
+            n_results: Number of results to return
+            quality_filter: Filter by quality rating
+            tags_filter: Filter by tags (any match)
+            format_filter: Filter by document format
+
+        Returns:
+            List of SearchResult objects sorted by similarity
+        """
+        key = self._key(query, n_results, quality_filter, tags_filter, format_filter)
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+            else:
+                self._results[key] = self.searcher.search(
+                    query=query,
+                    n_results=n_results,
+                    quality_filter=quality_filter,
+                    tags_filter=tags_filter,
+                    format_filter=format_filter,
+                )
+                self.misses += 1
+            return list(self._results[key])
+
+    def batch_search(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        quality_filter: str | None = None,
+        tags_filter: list[str] | None = None,
+        format_filter: str | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search with several queries, sending only the new ones.
+
+        Args:
+            queries: Natural language search queries
+            n_results: Number of results to return per query
+            quality_filter: Filter by quality rating
+            tags_filter: Filter by tags (any match)
+            format_filter: Filter by document format
+
+        Returns:
+            List of search result lists, one per query in original order
+        """
+        keys = [
+            self._key(query, n_results, quality_filter, tags_filter, format_filter)
+            for query in queries
+        ]
+        with self._lock:
+            missing = list(dict.fromkeys(k for k in keys if k not in self._results))
+            if missing:
+                fetched = self.searcher.batch_search(
+                    queries=[key[0] for key in missing],
+                    n_results=n_results,
+                    quality_filter=quality_filter,
+                    tags_filter=tags_filter,
+                    format_filter=format_filter,
+                )
+                for key, results in zip(missing, fetched, strict=False):
+                    self._results[key] = results
+            self.misses += len(missing)
+            self.hits += len(keys) - len(missing)
+            return [list(self._results.get(key, [])) for key in keys]
+
+    @staticmethod
+    def _key(
+        query: str,
+        n_results: int,
+        quality_filter: str | None,
+        tags_filter: list[str] | None,
+        format_filter: str | None,
+    ) -> tuple[Any, ...]:
+        tags = tuple(tags_filter) if tags_filter is not None else None
+        return (query, n_results, quality_filter, tags, format_filter)
+
+
+class GenerationContext:
+    """Inputs shared by every generation attempt of one request.
+
+    Attributes:
+        searcher: Memoizing wrapper around the corpus searcher
+    """
+
+    def __init__(self, searcher: CorpusSearcher):
+        """Create an empty context for one request.
+
+        Args:
+            searcher: Corpus searcher (wrapped in a MemoizingSearcher if needed)
+        """
+        self.searcher = (
+            searcher if isinstance(searcher, MemoizingSearcher) else MemoizingSearcher(searcher)
+        )
+        self._topic_checks: _Memo[str] = _Memo()
+        self._voice_samples: _Memo[str] = _Memo()
+
+    def topic_check(self, key: tuple[str, ...], compute: Callable[[], str]) -> str:
+        """Return the topic validation verdict for these inputs, computed once.
+
+        Args:
+            key: Everything the verdict depends on (title, keywords, corpus context)
+            compute: Runs the validation
+
+        Returns:
+            The validation verdict
+        """
+        return self._topic_checks.get(key, compute)
+
+    def voice_samples(self, keywords: list[str], compute: Callable[[], str]) -> str:
+        """Return the voice-sample block for these keywords, computed once.
+
+        Args:
+            keywords: Document keywords
+            compute: Builds the voice-sample block
+
+        Returns:
+            The voice-sample block
+        """
+        return self._voice_samples.get(tuple(keywords), compute)
+
+    def stats(self) -> dict[str, int]:
+        """Return how much work was reused.
+
+        Returns:
+            Reused and performed counts for searches, topic checks and
+            voice samples
+        """
+        return {
+            "searches_reused": self.searcher.hits,
+            "searches": self.searcher.misses,
+            "topic_checks_reused": self._topic_checks.hits,
+            "topic_checks": self._topic_checks.misses,
+            "voice_samples_reused": self._voice_samples.hits,
+            "voice_samples": self._voice_samples.misses,
+        }
@@ -0,0 +1,106 @@
+"""Shared, keep-alive HTTP connection pools for LLM clients.
+
+Every HTTP-backed LLM client in a process draws its connections from here, so
+a run that makes hundreds of calls to the same server pays TCP/TLS setup once
+per pooled connection instead of once per request.
+
+Synchronous calls use one ``requests.Session`` per server. Async calls use an
+``httpx.AsyncClient``; those are bound to the event loop that created them,
+so one is kept per running loop.
+"""
+
+import asyncio
+import atexit
+import threading
+import weakref
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Connections kept open per server; sized above the usual draft concurrency
+POOL_MAXSIZE = 16
+
+_lock = threading.Lock()
+_sessions: dict[str, requests.Session] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _origin(base_url: str) -> str:
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_http_session(base_url: str) -> requests.Session:
+    """Return the shared session for a server, creating it on first use.
+
+    Sessions are keyed by scheme and host, so clients for different API paths
+    on the same server share connections. Headers are not stored on the
+    session; pass them per request.
+
+    Args:
+        base_url: Any URL on the server
+
+    Returns:
+        Pooled session with keep-alive connections
+    """
+    origin = _origin(base_url)
+    with _lock:
+        session = _sessions.get(origin)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[origin] = session
+        return session
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared async client for the running event loop.
+
+    Must be called from a coroutine. Timeouts are passed per request.
+
+    Returns:
+        Pooled async client with keep-alive connections
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=None,
+                    max_keepalive_connections=POOL_MAXSIZE,
+                ),
+            )
+            _async_clients[loop] = client
+        return client
+
+
+async def aclose_http_clients() -> None:
+    """Close the async client of the running event loop, if any.
+
+    Call this from an application's shutdown hook.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def close_http_sessions() -> None:
+    """Close all shared synchronous sessions."""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_http_sessions)
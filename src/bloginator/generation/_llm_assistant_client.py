@@ -2,19 +2,66 @@
 
 import json
 import logging
+import os
+import shutil
 import time
 from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
 
-from bloginator.generation._batch_response_collector import collect_batch_responses
+from bloginator.generation._batch_response_collector import (
+    STATUS_INTERVAL,
+    collect_batch_responses,
+    request_filename,
+    response_filename,
+)
+from bloginator.generation._response_watcher import ResponseWatcher
 from bloginator.generation.llm_base import LLMClient, LLMResponse
 
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Parents of the per-run request and response directories
+REQUESTS_ROOT = Path(".bloginator/llm_requests")
+RESPONSES_ROOT = Path(".bloginator/llm_responses")
+
+# Run directories left untouched this long (e.g. by a crashed or timed-out
+# run) are removed when a client starts
+RUN_DIR_TTL_SECONDS = 24 * 3600
+
+
+def prune_stale_runs(
+    roots: tuple[Path, ...] = (REQUESTS_ROOT, RESPONSES_ROOT),
+    ttl_seconds: float = RUN_DIR_TTL_SECONDS,
+) -> int:
+    """Remove run directories that have not been modified within the TTL.
+
+    Args:
+        roots: Directories holding one subdirectory per run
+        ttl_seconds: Age after which a run directory is removed
+
+    Returns:
+        Number of run directories removed
+    """
+    cutoff = time.time() - ttl_seconds
+    removed = 0
+    for root in roots:
+        if not root.is_dir():
+            continue
+        for run_dir in root.iterdir():
+            try:
+                if not run_dir.is_dir() or run_dir.stat().st_mtime >= cutoff:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(run_dir, ignore_errors=True)
+            removed += 1
+    if removed:
+        logger.info(f"Removed {removed} stale assistant run directories")
+    return removed
+
 
 class AssistantLLMClient(LLMClient):
     """LLM client that uses the AI assistant (Claude) via file-based communication.
@@ -23,9 +70,18 @@ class AssistantLLMClient(LLMClient):
     responses. This enables the AI assistant to act as the LLM for optimization
     experiments without requiring API keys or external services.
 
+    Each client instance is one run with its own subdirectory, so concurrent
+    runs never see or clear each other's files:
+    .bloginator/llm_requests/<run_id>/ and .bloginator/llm_responses/<run_id>/
+
+    Serial requests remove their files once answered, a batch removes the
+    run's directories once every response has arrived, and close() removes
+    them outright. Directories of runs that never finished are pruned by the
+    next client after run_ttl seconds.
+
     Workflow (serial mode - default):
-    1. Write prompt to .bloginator/llm_requests/request_N.json
-    2. Wait for response file .bloginator/llm_responses/response_N.json
+    1. Write prompt to llm_requests/<run_id>/request_N.json
+    2. Wait for response file llm_responses/<run_id>/response_N.json
     3. Read and return the response
 
     Workflow (batch mode - with batch_mode=True):
@@ -36,8 +92,9 @@ class AssistantLLMClient(LLMClient):
     Attributes:
         model: Model name (for display purposes)
         verbose: Whether to print detailed request/response info
-        request_dir: Directory for request files
-        response_dir: Directory for response files
+        run_id: Name of this run's request/response subdirectories
+        request_dir: Directory for this run's request files
+        response_dir: Directory for this run's response files
         request_counter: Counter for request IDs
         timeout: Maximum seconds to wait for response
         batch_mode: If True, generate requests without waiting for responses
@@ -54,6 +111,8 @@ class AssistantLLMClient(LLMClient):
         timeout: int = 1800,  # 30 minutes default for batch mode
         batch_mode: bool = False,
         min_response_threshold: float = 0.80,
+        run_id: str | None = None,
+        run_ttl: float = RUN_DIR_TTL_SECONDS,
         **kwargs: object,
     ) -> None:
         """Initialize assistant LLM client.
@@ -64,6 +123,9 @@ class AssistantLLMClient(LLMClient):
             timeout: Maximum seconds to wait for response (default: 1800 = 30min)
             batch_mode: If True, write all requests upfront without waiting
             min_response_threshold: Min % of responses required (0.0-1.0, default: 0.80)
+            run_id: Subdirectory name for this run (default: timestamp and PID)
+            run_ttl: Age in seconds after which other runs' leftover
+                directories are removed
             **kwargs: Ignored (for compatibility)
         """
         self.model = model
@@ -72,31 +134,16 @@ class AssistantLLMClient(LLMClient):
         self.batch_mode = batch_mode
         self.min_response_threshold = min_response_threshold
 
-        # Setup directories
-        self.request_dir = Path(".bloginator/llm_requests")
-        self.response_dir = Path(".bloginator/llm_responses")
-        self.request_dir.mkdir(parents=True, exist_ok=True)
-        self.response_dir.mkdir(parents=True, exist_ok=True)
-
-        # In batch mode, clear stale files to prevent interference from previous runs
-        if batch_mode:
-            self._clear_stale_files()
+        # Per-run directories, created when the first request is written
+        self.run_id = run_id or f"run_{time.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}"
+        self.request_dir = REQUESTS_ROOT / self.run_id
+        self.response_dir = RESPONSES_ROOT / self.run_id
+        prune_stale_runs(ttl_seconds=run_ttl)
 
         # Request counter and pending requests for batch mode
         self.request_counter = 0
         self.pending_requests: list[int] = []
 
-    def _clear_stale_files(self) -> None:
-        """Clear request and response directories to prevent stale file interference.
-
-        This ensures each batch run starts fresh without leftover files from
-        previous runs that could cause request/response mismatches.
-        """
-        for directory in [self.request_dir, self.response_dir]:
-            for file in directory.glob("*.json"):
-                file.unlink()
-        console.print("[dim]Cleared stale request/response files for fresh batch run[/dim]")
-
     def generate(
         self,
         prompt: str,
@@ -122,7 +169,9 @@ class AssistantLLMClient(LLMClient):
         request_id = self.request_counter
 
         # Write request to file
-        request_file = self.request_dir / f"request_{request_id:04d}.json"
+        self.request_dir.mkdir(parents=True, exist_ok=True)
+        self.response_dir.mkdir(parents=True, exist_ok=True)
+        request_file = self.request_dir / request_filename(request_id)
         request_data = {
             "request_id": request_id,
             "model": self.model,
@@ -176,7 +225,7 @@ class AssistantLLMClient(LLMClient):
         Raises:
             TimeoutError: If response not received within timeout
         """
-        response_file = self.response_dir / f"response_{request_id:04d}.json"
+        response_file = self.response_dir / response_filename(request_id)
 
         console.print(
             f"\n[bold yellow]⏳ Waiting for AI assistant response {request_id}..." f"[/bold yellow]"
@@ -189,39 +238,49 @@ class AssistantLLMClient(LLMClient):
         last_status_time = start_time
         warning_shown = False
 
-        while not response_file.exists():
-            elapsed = time.time() - start_time
-            remaining = self.timeout - elapsed
-
-            # Show status every 30 seconds
-            if time.time() - last_status_time >= 30:
-                last_status_time = time.time()
-                console.print(
-                    f"[dim]Still waiting... {int(remaining)}s remaining "
-                    f"(request {request_id})[/dim]"
-                )
-
-            # Show warning when 60 seconds remain
-            if remaining <= 60 and not warning_shown:
-                warning_shown = True
-                console.print(
-                    f"\n[bold red]⚠️  WARNING: Only {int(remaining)}s remaining! "
-                    f"Response needed soon.[/bold red]"
-                )
-                console.print(f"[bold red]   Response file: {response_file}[/bold red]")
-                logger.warning(
-                    f"Timeout approaching for request {request_id}: " f"{int(remaining)}s remaining"
-                )
-
-            if elapsed > self.timeout:
-                self._raise_timeout_error(request_id, request_file, response_file)
-
-            time.sleep(1)
+        with ResponseWatcher(self.response_dir) as watcher:
+            arrived = watcher.scan()
+            while response_file.name not in arrived:
+                elapsed = time.time() - start_time
+                remaining = self.timeout - elapsed
+
+                # Show status every 30 seconds
+                if time.time() - last_status_time >= 2 * STATUS_INTERVAL:
+                    last_status_time = time.time()
+                    console.print(
+                        f"[dim]Still waiting... {int(remaining)}s remaining "
+                        f"(request {request_id})[/dim]"
+                    )
+
+                # Show warning when 60 seconds remain
+                if remaining <= 60 and not warning_shown:
+                    warning_shown = True
+                    console.print(
+                        f"\n[bold red]⚠️  WARNING: Only {int(remaining)}s remaining! "
+                        f"Response needed soon.[/bold red]"
+                    )
+                    console.print(f"[bold red]   Response file: {response_file}[/bold red]")
+                    logger.warning(
+                        f"Timeout approaching for request {request_id}: "
+                        f"{int(remaining)}s remaining"
+                    )
+
+                if elapsed > self.timeout:
+                    self._raise_timeout_error(request_id, request_file, response_file)
+
+                # Wake for the next status line, the 60s warning or the timeout
+                next_status = last_status_time + 2 * STATUS_INTERVAL - time.time()
+                until_warning = remaining - 60 if not warning_shown else remaining
+                arrived = watcher.wait(max(0.0, min(next_status, until_warning, remaining)) + 0.01)
 
         # Read response
         with response_file.open() as f:
             response_data = json.load(f)
 
+        # Answered; nothing else reads this request's files
+        request_file.unlink(missing_ok=True)
+        response_file.unlink(missing_ok=True)
+
         content = response_data["content"]
 
         if self.verbose:
@@ -301,9 +360,20 @@ class AssistantLLMClient(LLMClient):
             request_dir=self.request_dir,
         )
 
+        # Keep the files of an incomplete batch: placeholders point at them
+        if all(
+            response.finish_reason not in ("missing", "error") for response in responses.values()
+        ):
+            self.close()
+
         # Clear pending requests
         self.pending_requests = []
         return responses
 
+    def close(self) -> None:
+        """Remove this run's request and response directories."""
+        for directory in (self.request_dir, self.response_dir):
+            shutil.rmtree(directory, ignore_errors=True)
+
     # Backwards compatibility alias
     collect_batch_responses = get_batch_responses
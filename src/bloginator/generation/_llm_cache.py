@@ -0,0 +1,309 @@
+"""Content-addressed cache for LLM responses.
+
+CachingLLMClient answers repeated requests from an LLMResponseCache. Only
+deterministic calls (temperature 0) are cached unless sampled output is
+explicitly opted in, so re-running a deterministic pipeline - topic
+validation, coverage checks, unchanged sections during refinement - costs no
+API calls. Responses cut off at the token limit are never stored.
+"""
+
+from collections.abc import AsyncIterator, Iterator
+
+from bloginator.generation._llm_response_cache import (
+    LLMCacheStats,
+    LLMResponseCache,
+)
+from bloginator.generation.llm_base import LLMClient, LLMResponse, StreamUsage
+
+
+# Re-exported for callers that import them from here
+__all__ = [
+    "CachingLLMClient",
+    "LLMCacheStats",
+    "LLMResponseCache",
+    "cache_report",
+    "client_endpoint",
+]
+
+# Finish reasons of a response cut off at max_tokens (OpenAI/Ollama, Anthropic)
+TRUNCATED_FINISH_REASONS = frozenset({"length", "max_tokens"})
+
+
+def client_endpoint(client: object) -> str:
+    """Server a client sends its requests to, for cache keys.
+
+    Args:
+        client: LLM client, possibly wrapped
+
+    Returns:
+        The client's base URL, or "" for clients with a fixed endpoint
+    """
+    base_url = getattr(client, "base_url", None)
+    return base_url.rstrip("/") if isinstance(base_url, str) else ""
+
+
+class CachingLLMClient(LLMClient):
+    """LLM client wrapper that answers repeated requests from a cache.
+
+    Any other attribute (``model``, ``verbose``, ...) is read from the
+    wrapped client.
+
+    Attributes:
+        client: Wrapped LLM client
+        cache: Response store
+        provider: Provider name included in cache keys
+        cache_sampled: Also cache calls with temperature > 0
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        cache: LLMResponseCache,
+        provider: str | None = None,
+        cache_sampled: bool = False,
+    ):
+        """Wrap a client with a response cache.
+
+        Args:
+            client: LLM client to wrap
+            cache: Response store
+            provider: Provider name for cache keys (default: client class name)
+            cache_sampled: Also cache calls with temperature > 0, making
+                sampled output repeat across runs
+        """
+        self.client = client
+        self.cache = cache
+        self.provider = provider or type(client).__name__
+        self.cache_sampled = cache_sampled
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate unknown attributes to the wrapped client."""
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    @property
+    def stats(self) -> LLMCacheStats:
+        """Hit, miss and eviction counters of the cache."""
+        return self.cache.stats
+
+    def _key(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str | None,
+    ) -> str | None:
+        """Return the cache key, or None if this call must not be cached."""
+        if temperature > 0 and not self.cache_sampled:
+            self.cache.record_bypass()
+            return None
+        model = str(getattr(self.client, "model", ""))
+        num_ctx = getattr(self.client, "num_ctx", None)
+        return self.cache.make_key(
+            self.provider,
+            model,
+            system_prompt,
+            prompt,
+            temperature,
+            max_tokens,
+            endpoint=client_endpoint(self.client),
+            num_ctx=num_ctx if isinstance(num_ctx, int) else None,
+        )
+
+    def _store(self, key: str | None, response: LLMResponse) -> None:
+        """Cache a response unless the call is uncacheable or the output was truncated."""
+        if key is not None and response.finish_reason not in TRUNCATED_FINISH_REASONS:
+            self.cache.put(key, response)
+
+    def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate text, returning a cached response when one exists.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+
+        Returns:
+            LLMResponse from the cache or the wrapped client
+        """
+        key = self._key(prompt, temperature, max_tokens, system_prompt)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = self.client.generate(
+            prompt, temperature=temperature, max_tokens=max_tokens, system_prompt=system_prompt
+        )
+        self._store(key, response)
+        return response
+
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate text asynchronously, returning a cached response when one exists.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+
+        Returns:
+            LLMResponse from the cache or the wrapped client
+        """
+        key = self._key(prompt, temperature, max_tokens, system_prompt)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = await self.client.agenerate(
+            prompt, temperature=temperature, max_tokens=max_tokens, system_prompt=system_prompt
+        )
+        self._store(key, response)
+        return response
+
+    def _streamed_response(
+        self, prompt: str, received: list[str], usage: StreamUsage
+    ) -> LLMResponse:
+        """Build a cacheable response from streamed deltas.
+
+        Token counts are the provider's where it reported them, else estimated.
+        """
+        content = "".join(received)
+        return LLMResponse(
+            content=content,
+            model=str(getattr(self.client, "model", "")),
+            prompt_tokens=usage.prompt_tokens or len(prompt) // 4,
+            completion_tokens=usage.completion_tokens or len(content) // 4,
+            finish_reason=usage.finish_reason,
+        )
+
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> Iterator[str]:
+        """Stream text, replaying a cached response as a single delta.
+
+        A streamed response is stored only once it has been read to the end,
+        and not if it was cut off at max_tokens.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas
+        """
+        key = self._key(prompt, temperature, max_tokens, system_prompt)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if usage is not None:
+                    usage.record(cached.prompt_tokens, cached.completion_tokens)
+                    usage.record_finish_reason(cached.finish_reason)
+                yield cached.content
+                return
+
+        usage = usage if usage is not None else StreamUsage()
+        received = []
+        for delta in self.client.stream(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            usage=usage,
+        ):
+            received.append(delta)
+            yield delta
+        self._store(key, self._streamed_response(prompt, received, usage))
+
+    async def astream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream text asynchronously, replaying a cached response as a single delta.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas
+        """
+        key = self._key(prompt, temperature, max_tokens, system_prompt)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if usage is not None:
+                    usage.record(cached.prompt_tokens, cached.completion_tokens)
+                    usage.record_finish_reason(cached.finish_reason)
+                yield cached.content
+                return
+
+        usage = usage if usage is not None else StreamUsage()
+        received = []
+        async for delta in self.client.astream(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            usage=usage,
+        ):
+            received.append(delta)
+            yield delta
+        self._store(key, self._streamed_response(prompt, received, usage))
+
+    def is_available(self) -> bool:
+        """Check if the wrapped client's service is available.
+
+        Returns:
+            True if the wrapped client is available
+        """
+        return self.client.is_available()
+
+
+def cache_report(client: LLMClient) -> str | None:
+    """Summarize cache effectiveness for a client, if it is cached.
+
+    Args:
+        client: Any LLM client
+
+    Returns:
+        One-line hit rate summary, or None if the client is not cached or
+        made no cacheable calls
+    """
+    if not isinstance(client, CachingLLMClient) or not client.stats.lookups:
+        return None
+    stats = client.stats
+    return (
+        f"LLM cache: {stats.hits}/{stats.lookups} hits ({stats.hit_rate:.0%}), "
+        f"{stats.bypassed} uncached sampled calls"
+    )
@@ -0,0 +1,378 @@
+"""Single-flight coalescing of identical in-flight LLM requests.
+
+When the same request (provider, model, prompts, temperature, max tokens) is
+already on its way to the LLM, a second caller waits for that call and gets
+its response instead of sending its own. Only concurrent calls are merged;
+once a response is delivered, the next identical call goes upstream again
+(repeats across time are the response cache's job).
+
+Identical sampled calls made at the same moment share one sample, like any
+other identical call.
+"""
+
+import asyncio
+import copy
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from bloginator.generation._llm_cache import (
+    CachingLLMClient,
+    LLMResponseCache,
+    client_endpoint,
+)
+from bloginator.generation.llm_base import LLMClient, LLMResponse, StreamUsage
+
+
+@dataclass
+class CoalescingStats:
+    """Counters for request coalescing.
+
+    Attributes:
+        upstream: Calls sent to the LLM
+        coalesced: Calls answered by joining an identical call in flight
+    """
+
+    upstream: int = 0
+    coalesced: int = 0
+
+    @property
+    def calls(self) -> int:
+        """Number of calls made (sent plus coalesced)."""
+        return self.upstream + self.coalesced
+
+    def to_dict(self) -> dict[str, int]:
+        """Return counters for reporting."""
+        return {**asdict(self), "calls": self.calls}
+
+
+@dataclass
+class _Call:
+    """One upstream call and the callers waiting on it."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    result: LLMResponse | None = None
+    error: BaseException | None = None
+    waiters: list[tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = field(
+        default_factory=list
+    )
+
+    def outcome(self) -> LLMResponse | None:
+        """Return a copy of the shared response, or None if the leader was interrupted.
+
+        Raises:
+            Exception: The error the upstream call failed with
+        """
+        if isinstance(self.error, Exception):
+            raise self.error
+        if self.result is None:
+            # The leader was cancelled or interrupted; the caller should retry
+            return None
+        return copy.copy(self.result)
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class SingleFlight:
+    """Registry of in-flight calls, shared by threads and event loops.
+
+    Attributes:
+        stats: Upstream and coalesced call counters
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.stats = CoalescingStats()
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key: str) -> tuple[_Call, bool]:
+        """Find the in-flight call for a key, or register a new one.
+
+        Returns:
+            The call, and whether the caller must send it
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.stats.upstream += 1
+                return call, True
+            self.stats.coalesced += 1
+            return call, False
+
+    def _finish(
+        self, key: str, call: _Call, result: LLMResponse | None, error: BaseException | None
+    ) -> None:
+        """Publish a call's outcome and wake everyone waiting on it."""
+        with self._lock:
+            del self._calls[key]
+            call.result, call.error = result, error
+            call.done.set()
+            waiters, call.waiters = call.waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+
+    def do(self, key: str, send: Callable[[], LLMResponse]) -> LLMResponse:
+        """Run send, unless an identical call is in flight; then share its response.
+
+        Args:
+            key: Identity of the request
+            send: Performs the request
+
+        Returns:
+            The response (a copy, for callers that joined another call)
+
+        Raises:
+            Exception: Whatever the upstream call raised
+        """
+        while True:
+            call, leader = self._join(key)
+            if leader:
+                try:
+                    result = send()
+                except BaseException as e:
+                    self._finish(key, call, None, e)
+                    raise
+                self._finish(key, call, result, None)
+                return result
+
+            call.done.wait()
+            shared = call.outcome()
+            if shared is not None:
+                return shared
+
+    async def ado(self, key: str, send: Callable[[], Awaitable[LLMResponse]]) -> LLMResponse:
+        """Await send, unless an identical call is in flight; see do().
+
+        Args:
+            key: Identity of the request
+            send: Starts the request
+
+        Returns:
+            The response (a copy, for callers that joined another call)
+
+        Raises:
+            Exception: Whatever the upstream call raised
+        """
+        while True:
+            call, leader = self._join(key)
+            if leader:
+                try:
+                    result = await send()
+                except BaseException as e:
+                    self._finish(key, call, None, e)
+                    raise
+                self._finish(key, call, result, None)
+                return result
+
+            loop = asyncio.get_running_loop()
+            with self._lock:
+                future = None if call.done.is_set() else loop.create_future()
+                if future is not None:
+                    call.waiters.append((loop, future))
+            if future is not None:
+                await future
+            shared = call.outcome()
+            if shared is not None:
+                return shared
+
+
+# Process-wide registry, so separately created clients (e.g. one per web
+# request) still share in-flight calls
+_default_group = SingleFlight()
+
+
+class CoalescingLLMClient(LLMClient):
+    """LLM client wrapper that merges identical concurrent requests.
+
+    Any other attribute (``model``, ``verbose``, ...) is read from the
+    wrapped client. Streaming calls are passed through unmerged.
+
+    Attributes:
+        client: Wrapped LLM client
+        group: In-flight call registry (process-wide by default)
+        provider: Provider name included in request keys
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        group: SingleFlight | None = None,
+        provider: str | None = None,
+    ):
+        """Wrap a client with request coalescing.
+
+        Args:
+            client: LLM client to wrap
+            group: In-flight call registry (default: shared by the process)
+            provider: Provider name for request keys (default: client class name)
+        """
+        self.client = client
+        self.group = group or _default_group
+        self.provider = provider or type(client).__name__
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate unknown attributes to the wrapped client."""
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    @property
+    def stats(self) -> CoalescingStats:
+        """Upstream and coalesced call counters of the group."""
+        return self.group.stats
+
+    def _key(
+        self, prompt: str, temperature: float, max_tokens: int, system_prompt: str | None
+    ) -> str:
+        model = str(getattr(self.client, "model", ""))
+        return LLMResponseCache.make_key(
+            self.provider,
+            model,
+            system_prompt,
+            prompt,
+            temperature,
+            max_tokens,
+            endpoint=client_endpoint(self.client),
+        )
+
+    def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate text, sharing an identical call that is already in flight.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+
+        Returns:
+            LLMResponse from the wrapped client
+        """
+        return self.group.do(
+            self._key(prompt, temperature, max_tokens, system_prompt),
+            lambda: self.client.generate(
+                prompt, temperature=temperature, max_tokens=max_tokens, system_prompt=system_prompt
+            ),
+        )
+
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate text asynchronously, sharing an identical call in flight.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+
+        Returns:
+            LLMResponse from the wrapped client
+        """
+        return await self.group.ado(
+            self._key(prompt, temperature, max_tokens, system_prompt),
+            lambda: self.client.agenerate(
+                prompt, temperature=temperature, max_tokens=max_tokens, system_prompt=system_prompt
+            ),
+        )
+
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> Iterator[str]:
+        """Stream text from the wrapped client.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas
+        """
+        yield from self.client.stream(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            usage=usage,
+        )
+
+    async def astream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream text from the wrapped client asynchronously.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas
+        """
+        async for delta in self.client.astream(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            usage=usage,
+        ):
+            yield delta
+
+    def is_available(self) -> bool:
+        """Check if the wrapped client is available.
+
+        Returns:
+            True if the wrapped client is available
+        """
+        return self.client.is_available()
+
+
+def coalescing_report(client: Any) -> str | None:
+    """Summarize calls saved by coalescing, if any.
+
+    Args:
+        client: Any LLM client, possibly wrapped in a response cache
+
+    Returns:
+        One-line summary, or None if the client does not coalesce or no
+        calls were merged
+    """
+    if isinstance(client, CachingLLMClient):
+        client = client.client
+    if not isinstance(client, CoalescingLLMClient) or not client.stats.coalesced:
+        return None
+    stats = client.stats
+    return (
+        f"LLM coalescing: {stats.coalesced}/{stats.calls} calls shared an identical "
+        f"in-flight request"
+    )
@@ -1,5 +1,16 @@
 """Mock LLM client that returns canned responses."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import requests
+
+from bloginator.generation._llm_mock_latency import (
+    LatencyProfile,
+    LatencySimulator,
+    paced_chunks,
+    simulator_from_env,
+)
 from bloginator.generation._llm_mock_responses import (
     detect_draft_request,
     detect_outline_request,
@@ -11,7 +22,12 @@ from bloginator.generation._llm_mock_responses import (
     generate_mock_quality_review,
     generate_mock_topic_validation,
 )
-from bloginator.generation.llm_base import LLMClient, LLMResponse
+from bloginator.generation._llm_scheduler import (
+    LLMScheduler,
+    estimate_request_tokens,
+    get_scheduler,
+)
+from bloginator.generation.llm_base import LLMClient, LLMProvider, LLMResponse, StreamUsage
 
 
 class MockLLMClient(LLMClient):
@@ -20,15 +36,24 @@ class MockLLMClient(LLMClient):
     This client detects the type of request (outline or draft) based on
     the prompt content and returns appropriate realistic responses for testing.
 
+    With a latency profile (passed in, or from BLOGINATOR_LLM_MOCK_LATENCY)
+    it behaves like a real server: responses take time, stream at a token
+    rate, and can fail with 429s or timeouts. Calls then go through the
+    shared "mock" scheduler, so retries and adaptive concurrency work as they
+    do against real providers.
+
     Attributes:
         model: Mock model name
         verbose: Whether to print requests/responses
+        simulator: Simulated server behavior (None = instant responses)
+        scheduler: Rate limiter and retry policy (only with a simulator)
     """
 
     def __init__(
         self,
         model: str = "mock-model",
         verbose: bool = False,
+        latency: LatencyProfile | LatencySimulator | None = None,
         **kwargs: object,
     ) -> None:
         """Initialize mock LLM client.
@@ -36,10 +61,43 @@ class MockLLMClient(LLMClient):
         Args:
             model: Model name (always "mock-model")
             verbose: Print request/response details
+            latency: Simulated server behavior; a profile gets its own
+                simulator, a simulator can be shared between clients
+                (default: the process-wide one for BLOGINATOR_LLM_MOCK_LATENCY)
             **kwargs: Ignored (for compatibility with other clients)
         """
         self.model = model
         self.verbose = verbose
+        if isinstance(latency, LatencyProfile):
+            latency = LatencySimulator(latency)
+        self.simulator = latency if latency is not None else simulator_from_env()
+        self.scheduler: LLMScheduler | None = (
+            get_scheduler(LLMProvider.MOCK.value) if self.simulator else None
+        )
+
+    def _respond(self, prompt: str) -> str:
+        """Pick the canned response for a prompt."""
+        # Detect request type from prompt
+        # Topic validation must be checked before outline (both contain "section" keyword)
+        if detect_topic_validation_request(prompt):
+            return generate_mock_topic_validation(prompt)
+        if detect_quality_review_request(prompt):
+            return generate_mock_quality_review(prompt)
+        if detect_outline_request(prompt):
+            return generate_mock_outline(prompt)
+        if detect_draft_request(prompt):
+            return generate_mock_draft(prompt)
+        return generate_generic_response()
+
+    @contextmanager
+    def _translate_errors(self) -> Iterator[None]:
+        """Map simulated HTTP failures to the documented exceptions."""
+        try:
+            yield
+        except requests.exceptions.Timeout as e:
+            raise ConnectionError(f"Request to mock LLM timed out: {e}") from e
+        except requests.exceptions.HTTPError as e:
+            raise ValueError(f"Mock generation failed: {e}") from e
 
     def generate(
         self,
@@ -58,19 +116,12 @@ class MockLLMClient(LLMClient):
 
         Returns:
             LLMResponse with mock content
+
+        Raises:
+            ConnectionError: If a simulated request timed out
+            ValueError: If a simulated request was throttled on every attempt
         """
-        # Detect request type from prompt
-        # Topic validation must be checked before outline (both contain "section" keyword)
-        if detect_topic_validation_request(prompt):
-            content = generate_mock_topic_validation(prompt)
-        elif detect_quality_review_request(prompt):
-            content = generate_mock_quality_review(prompt)
-        elif detect_outline_request(prompt):
-            content = generate_mock_outline(prompt)
-        elif detect_draft_request(prompt):
-            content = generate_mock_draft(prompt)
-        else:
-            content = generate_generic_response()
+        content = self._respond(prompt)
 
         # Calculate token counts (rough estimate: 1 token ≈ 4 chars)
         prompt_tokens = len(prompt) // 4
@@ -82,13 +133,75 @@ class MockLLMClient(LLMClient):
             print_llm_request(self.model, prompt)
             print_llm_response(content)
 
-        return LLMResponse(
+        response = LLMResponse(
             content=content,
             model=self.model,
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
             finish_reason="stop",
         )
+        simulator, scheduler = self.simulator, self.scheduler
+        if simulator is None or scheduler is None:
+            return response
+
+        def send() -> LLMResponse:
+            with simulator.request():
+                simulator.sleep(simulator.token_delay(completion_tokens))
+            return response
+
+        with self._translate_errors():
+            return scheduler.call(send, estimate_request_tokens(prompt, system_prompt, max_tokens))
+
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> Iterator[str]:
+        """Stream the mock response, word by word at the simulated token rate.
+
+        Without a latency profile the whole response is yielded at once.
+
+        Args:
+            prompt: User prompt/instruction
+            temperature: Sampling temperature (ignored)
+            max_tokens: Maximum tokens (ignored)
+            system_prompt: System prompt (ignored)
+            usage: Filled in with the estimated token counts
+
+        Yields:
+            Text deltas
+
+        Raises:
+            ConnectionError: If the simulated request timed out
+            ValueError: If the simulated request was throttled
+        """
+        simulator, scheduler = self.simulator, self.scheduler
+        if simulator is None or scheduler is None:
+            yield from super().stream(
+                prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system_prompt=system_prompt,
+                usage=usage,
+            )
+            return
+
+        def open_stream() -> Iterator[str]:
+            content = self._respond(prompt)
+            with simulator.request():
+                for text, tokens in paced_chunks(content):
+                    simulator.sleep(simulator.token_delay(tokens))
+                    yield text
+            if usage is not None:
+                usage.record(len(prompt) // 4, len(content) // 4)
+
+        with self._translate_errors():
+            yield from scheduler.stream(
+                open_stream, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            )
 
     def is_available(self) -> bool:
         """Mock client is always available.
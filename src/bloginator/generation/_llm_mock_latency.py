@@ -0,0 +1,285 @@
+"""Simulated server behavior for the mock LLM client.
+
+MockLLMClient answers instantly, which hides whatever concurrency, retries
+and streaming are meant to save. A LatencyProfile makes it behave like a
+real server:
+
+- a time to first token drawn from a fixed, normal or long-tail (lognormal)
+  distribution;
+- output paced at a tokens-per-second rate, streamed as it is "generated";
+- a share of requests failing with HTTP 429 (with Retry-After) or timing out;
+- a capacity limit on requests in flight, beyond which requests queue or are
+  rejected with 429.
+
+Profiles are written as a spec string, e.g. for BLOGINATOR_LLM_MOCK_LATENCY:
+
+    longtail:mean=0.8,sigma=1.0,tokens_per_second=40,throttle_rate=0.05,capacity=2
+
+The distribution comes first; every other field is optional.
+"""
+
+import math
+import os
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+
+import requests
+
+
+DISTRIBUTIONS = ("fixed", "normal", "longtail")
+
+# Environment variable holding the default profile spec
+LATENCY_ENV_VAR = "BLOGINATOR_LLM_MOCK_LATENCY"
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """How a simulated LLM server responds.
+
+    Attributes:
+        distribution: Time-to-first-token distribution (fixed, normal, longtail)
+        mean: Mean seconds to first token (the median for longtail)
+        stddev: Standard deviation in seconds (normal)
+        sigma: Lognormal shape (longtail); larger means a heavier tail
+        tokens_per_second: Output rate (0 = whole response at once)
+        throttle_rate: Probability that a request fails with HTTP 429
+        timeout_rate: Probability that a request times out
+        timeout: Seconds a timing-out request hangs before failing
+        retry_after: Retry-After seconds sent with a 429
+        capacity: Requests served at once (0 = unlimited)
+        reject_over_capacity: Answer 429 beyond capacity instead of queueing
+        seed: Random seed, for repeatable runs
+    """
+
+    distribution: str = "fixed"
+    mean: float = 0.0
+    stddev: float = 0.0
+    sigma: float = 1.0
+    tokens_per_second: float = 0.0
+    throttle_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout: float = 1.0
+    retry_after: float = 1.0
+    capacity: int = 0
+    reject_over_capacity: bool = False
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution {self.distribution!r}; "
+                f"expected one of {', '.join(DISTRIBUTIONS)}"
+            )
+        if min(self.mean, self.stddev, self.sigma, self.tokens_per_second, self.timeout) < 0:
+            raise ValueError("Latency durations and rates must not be negative")
+        if not 0 <= self.throttle_rate + self.timeout_rate <= 1:
+            raise ValueError("throttle_rate plus timeout_rate must be between 0 and 1")
+        if self.capacity < 0:
+            raise ValueError("capacity must not be negative")
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "LatencyProfile":
+        """Parse a profile spec like ``normal:mean=1.5,stddev=0.3``.
+
+        Args:
+            spec: Distribution name, optionally followed by ``:`` and
+                comma-separated field=value pairs
+
+        Returns:
+            The profile
+
+        Raises:
+            ValueError: If the spec names an unknown field or has a bad value
+        """
+        distribution, _, options = spec.strip().partition(":")
+        types = {f.name: f.type for f in fields(cls)}
+        values: dict[str, object] = {"distribution": distribution.strip() or "fixed"}
+        for option in filter(None, (o.strip() for o in options.split(","))):
+            name, sep, raw = (part.strip() for part in option.partition("="))
+            if not sep or name not in types or name == "distribution":
+                raise ValueError(f"Invalid latency option {option!r}")
+            try:
+                if types[name] is bool:
+                    values[name] = raw.lower() in ("1", "true", "yes")
+                elif types[name] is int or name == "seed":
+                    values[name] = int(raw)
+                else:
+                    values[name] = float(raw)
+            except ValueError as e:
+                raise ValueError(f"Invalid latency option {option!r}: {e}") from e
+        return cls(**values)  # type: ignore[arg-type]
+
+    @classmethod
+    def from_env(cls) -> "LatencyProfile | None":
+        """Read the profile from BLOGINATOR_LLM_MOCK_LATENCY, if set.
+
+        Returns:
+            The profile, or None if the variable is unset or empty
+        """
+        spec = os.getenv(LATENCY_ENV_VAR, "").strip()
+        return cls.from_spec(spec) if spec else None
+
+
+@dataclass
+class SimulationStats:
+    """What the simulated server did.
+
+    Attributes:
+        requests: Requests received
+        throttled: Requests answered with 429 (injected or over capacity)
+        timeouts: Requests that timed out
+        peak_in_flight: Most requests served at once
+        busy_seconds: Total simulated service time
+    """
+
+    requests: int = 0
+    throttled: int = 0
+    timeouts: int = 0
+    peak_in_flight: int = 0
+    busy_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        """Return counters for reporting."""
+        return {**asdict(self), "busy_seconds": round(self.busy_seconds, 3)}
+
+
+def _throttled_error(retry_after: float, reason: str) -> requests.HTTPError:
+    """Build the 429 error a real HTTP client would raise."""
+    response = requests.Response()
+    response.status_code = 429
+    response.reason = "Too Many Requests"
+    response.headers["Retry-After"] = f"{retry_after:g}"
+    return requests.HTTPError(f"429 Too Many Requests ({reason})", response=response)
+
+
+class LatencySimulator:
+    """Applies a LatencyProfile to requests; shared by the clients of one server.
+
+    Attributes:
+        profile: The simulated server's behavior
+        stats: Counters of what the simulator did
+        sleep: Function used to wait (replaceable in tests)
+    """
+
+    def __init__(self, profile: LatencyProfile, sleep: Callable[[float], None] = time.sleep):
+        """Create a simulator.
+
+        Args:
+            profile: The simulated server's behavior
+            sleep: Function used to wait
+        """
+        self.profile = profile
+        self.sleep = sleep
+        self.stats = SimulationStats()
+        self._rng = random.Random(profile.seed)  # nosec B311 - simulation, not security
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._slots = threading.Semaphore(profile.capacity) if profile.capacity else None
+
+    def first_token_delay(self) -> float:
+        """Draw a time to first token from the profile's distribution.
+
+        Returns:
+            Seconds (never negative)
+        """
+        profile = self.profile
+        with self._lock:
+            if profile.distribution == "normal":
+                delay = self._rng.gauss(profile.mean, profile.stddev)
+            elif profile.distribution == "longtail" and profile.mean > 0:
+                delay = self._rng.lognormvariate(math.log(profile.mean), profile.sigma)
+            else:
+                delay = profile.mean
+        return max(0.0, delay)
+
+    def token_delay(self, tokens: int) -> float:
+        """Seconds needed to produce some tokens at the profile's rate."""
+        rate = self.profile.tokens_per_second
+        return tokens / rate if rate else 0.0
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """Serve one request: admit it, maybe fail it, then wait to first token.
+
+        The caller produces the output inside the block (pacing it with
+        token_delay); the request holds a capacity slot until the block exits.
+
+        Raises:
+            requests.HTTPError: 429, injected or because the server is full
+            requests.exceptions.Timeout: Injected timeout
+        """
+        profile = self.profile
+        with self._lock:
+            self.stats.requests += 1
+            roll = self._rng.random()
+
+        if self._slots is not None and not self._slots.acquire(
+            blocking=not profile.reject_over_capacity
+        ):
+            with self._lock:
+                self.stats.throttled += 1
+            raise _throttled_error(profile.retry_after, "server at capacity")
+
+        started = time.monotonic()
+        with self._lock:
+            self._in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self._in_flight)
+        try:
+            if roll < profile.throttle_rate:
+                with self._lock:
+                    self.stats.throttled += 1
+                raise _throttled_error(profile.retry_after, "simulated rate limit")
+            if roll < profile.throttle_rate + profile.timeout_rate:
+                self.sleep(profile.timeout)
+                with self._lock:
+                    self.stats.timeouts += 1
+                raise requests.exceptions.Timeout(f"Simulated timeout after {profile.timeout:g}s")
+            self.sleep(self.first_token_delay())
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self.stats.busy_seconds += time.monotonic() - started
+            if self._slots is not None:
+                self._slots.release()
+
+
+# Simulators for profiles read from the environment, shared by every mock
+# client of the process so the capacity limit applies to all of them
+_env_simulators: dict[LatencyProfile, LatencySimulator] = {}
+_env_lock = threading.Lock()
+
+
+def simulator_from_env() -> LatencySimulator | None:
+    """Return the process-wide simulator for BLOGINATOR_LLM_MOCK_LATENCY.
+
+    Returns:
+        Shared simulator, or None if no latency profile is configured
+    """
+    profile = LatencyProfile.from_env()
+    if profile is None:
+        return None
+    with _env_lock:
+        return _env_simulators.setdefault(profile, LatencySimulator(profile))
+
+
+def paced_chunks(content: str) -> Iterator[tuple[str, int]]:
+    """Split text into words, each with its approximate token count.
+
+    Args:
+        content: Full response text
+
+    Yields:
+        (text, tokens) pairs whose texts join back into the content
+    """
+    start = 0
+    for index in range(1, len(content) + 1):
+        if index == len(content) or (content[index].isspace() and not content[index - 1].isspace()):
+            text = content[start:index]
+            # Rough estimate used throughout the mock: 1 token ≈ 4 chars
+            yield text, max(1, len(text) // 4)
+            start = index
@@ -0,0 +1,267 @@
+"""SQLite store for cached LLM responses.
+
+Responses are stored under a hash of everything that determines them:
+provider, endpoint, model, system prompt, prompt, temperature and max
+tokens. Entries expire after a TTL and the least recently used are evicted
+beyond a maximum count.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from bloginator.generation.llm_base import LLMResponse
+
+
+# Cached responses older than this are treated as misses
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+# Least recently used entries beyond this count are evicted
+DEFAULT_MAX_ENTRIES = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_tokens INTEGER NOT NULL,
+    completion_tokens INTEGER NOT NULL,
+    finish_reason TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+@dataclass
+class LLMCacheStats:
+    """Counters for cache effectiveness.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that went to the LLM
+        bypassed: Calls not eligible for caching (sampled output)
+        evictions: Entries removed for age or size
+    """
+
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Number of cache lookups (hits plus misses)."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        """Return counters and hit rate for reporting."""
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class LLMResponseCache:
+    """SQLite store of LLM responses with TTL and size-based eviction.
+
+    Safe to share between threads; one connection is guarded by a lock.
+
+    Attributes:
+        path: SQLite database file
+        ttl_seconds: Maximum age of a usable entry (None: never expire)
+        max_entries: Entry limit enforced by LRU eviction
+        stats: Hit, miss and eviction counters
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Open (or create) a response cache.
+
+        Args:
+            path: SQLite database file; parent directories are created
+            ttl_seconds: Maximum age of a usable entry (None: never expire)
+            max_entries: Entry limit enforced by LRU eviction
+
+        Raises:
+            ValueError: If max_entries is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = LLMCacheStats()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        system_prompt: str | None,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        endpoint: str = "",
+        num_ctx: int | None = None,
+    ) -> str:
+        """Hash the inputs that determine a response.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            system_prompt: System prompt, if any
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            endpoint: Server the request goes to (see client_endpoint), since
+                the same model name can be a different model on another server
+            num_ctx: Context window the request is served with, if the client
+                sets one; a smaller window can truncate the prompt server-side
+
+        Returns:
+            Hex digest identifying the request
+        """
+        material = json.dumps(
+            [
+                provider,
+                endpoint,
+                model,
+                num_ctx,
+                system_prompt,
+                prompt,
+                float(temperature),
+                max_tokens,
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Look up a response, counting the hit or miss.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached response, or None if absent or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, model, prompt_tokens, completion_tokens, finish_reason,"
+                " created_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and self._expired(row[5], now):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.stats.evictions += 1
+                row = None
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.stats.hits += 1
+
+        return LLMResponse(
+            content=row[0],
+            model=row[1],
+            prompt_tokens=row[2],
+            completion_tokens=row[3],
+            finish_reason=row[4],
+        )
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting the least recently used entries if full.
+
+        Args:
+            key: Key from make_key
+            response: Response to store
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.content,
+                    response.model,
+                    response.prompt_tokens,
+                    response.completion_tokens,
+                    response.finish_reason,
+                    now,
+                    now,
+                ),
+            )
+            excess = self._count() - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN"
+                    " (SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                    (excess,),
+                )
+                self.stats.evictions += excess
+            self._conn.commit()
+
+    def record_bypass(self) -> None:
+        """Count a call that was not eligible for caching."""
+        with self._lock:
+            self.stats.bypassed += 1
+
+    def purge_expired(self) -> int:
+        """Delete all entries older than the TTL.
+
+        Returns:
+            Number of entries removed
+        """
+        if self.ttl_seconds is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self._conn.commit()
+            self.stats.evictions += cursor.rowcount
+            return int(cursor.rowcount)
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self._lock:
+            return self._count()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
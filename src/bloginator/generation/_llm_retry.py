@@ -0,0 +1,64 @@
+"""Classify failed LLM requests for the scheduler's retry and backoff.
+
+Reads the HTTP status and the server's Retry-After hint from the errors
+raised by requests, httpx and the provider SDKs.
+"""
+
+import time
+from email.utils import parsedate_to_datetime
+
+import httpx
+import requests
+
+
+# HTTP statuses worth retrying: throttling, overload and transient server errors
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504, 529})
+
+# Transport timeouts, which signal overload like a 503 but are not retried
+TIMEOUT_ERRORS = (TimeoutError, requests.exceptions.Timeout, httpx.TimeoutException)
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Read the server's requested delay from a failed request.
+
+    Understands Retry-After (seconds or HTTP date) and retry-after-ms on the
+    responses attached to requests, httpx and provider SDK errors.
+
+    Args:
+        error: Exception raised by the request
+
+    Returns:
+        Seconds to wait, or None if the server did not say
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    try:
+        milliseconds = headers.get("retry-after-ms")
+        if milliseconds is not None:
+            return max(0.0, float(milliseconds) / 1000)
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def status_code(error: BaseException) -> int | None:
+    """HTTP status of a failed request, if it got a response.
+
+    Args:
+        error: Exception raised by the request
+
+    Returns:
+        Status code, or None for transport errors
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
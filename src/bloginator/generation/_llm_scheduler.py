@@ -0,0 +1,319 @@
+"""Shared request scheduling for LLM providers.
+
+Every client for the same provider (and server) sends its requests through
+one scheduler, which:
+
+- admits requests through token buckets for requests and tokens per minute,
+- caps in-flight requests with an AIMD window that grows by one after each
+  window's worth of healthy responses and halves on throttling, server
+  errors, timeouts or responses slower than the target latency,
+- retries 429/5xx responses with exponential backoff and full jitter, never
+  sooner than the server's Retry-After asks; a Retry-After pauses every
+  request to that provider, not just the one that was throttled.
+
+Limits default per provider and are overridden through timeout_config.
+Streaming calls are admitted the same way and hold their slot until the
+stream ends; they are retried only when they fail before the first chunk,
+since text already yielded cannot be taken back.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
+
+from bloginator.generation._aimd_window import AIMDWindow
+from bloginator.generation._llm_retry import RETRYABLE_STATUSES, retry_after_seconds, status_code
+from bloginator.generation._llm_scheduler_base import (
+    PROVIDER_LIMITS,
+    ProviderLimits,
+    SchedulerBase,
+    SchedulerMetrics,
+    estimate_request_tokens,
+)
+from bloginator.generation._token_bucket import TokenBucket
+from bloginator.timeout_config import timeout_config
+
+
+# Helpers re-exported for callers that import them from here
+__all__ = [
+    "AIMDWindow",
+    "LLMScheduler",
+    "PROVIDER_LIMITS",
+    "ProviderLimits",
+    "RETRYABLE_STATUSES",
+    "SchedulerMetrics",
+    "TokenBucket",
+    "estimate_request_tokens",
+    "get_scheduler",
+    "retry_after_seconds",
+    "scheduler_metrics",
+    "status_code",
+]
+
+T = TypeVar("T")
+
+# Marks a stream that ended before its first chunk
+_EMPTY: Any = object()
+
+
+class LLMScheduler(SchedulerBase):
+    """Rate limits, adaptive concurrency and retries for one provider.
+
+    Blocking and async calls and streams share one SchedulerBase: the same
+    buckets, window and counters.
+    """
+
+    def call(self, send: Callable[[], T], estimated_tokens: int = 0) -> T:
+        """Send a request, waiting for capacity and retrying transient failures.
+
+        Args:
+            send: Performs the request and raises on HTTP errors
+            estimated_tokens: Tokens to count against the tokens-per-minute limit
+
+        Returns:
+            Whatever send returns
+
+        Raises:
+            Exception: The last error from send, once retries are exhausted
+                or the error is not retryable
+        """
+        attempt = 0
+        while True:
+            delay = self._admission_delay(estimated_tokens)
+            if delay > 0:
+                try:
+                    time.sleep(delay)
+                finally:
+                    self._admitted()
+            self._gate.acquire()
+            started = time.monotonic()
+            try:
+                result = send()
+            except Exception as e:
+                retry_delay = self._record_failure(e, attempt, started)
+                if retry_delay is None:
+                    raise
+            else:
+                self._record_success(started, result, estimated_tokens)
+                return result
+            finally:
+                self._gate.release()
+            time.sleep(retry_delay)
+            attempt += 1
+
+    async def acall(self, send: Callable[[], Awaitable[T]], estimated_tokens: int = 0) -> T:
+        """Send a request on the running event loop; see call().
+
+        Args:
+            send: Starts the request and raises on HTTP errors
+            estimated_tokens: Tokens to count against the tokens-per-minute limit
+
+        Returns:
+            Whatever send's awaitable returns
+
+        Raises:
+            Exception: The last error from send, once retries are exhausted
+                or the error is not retryable
+        """
+        attempt = 0
+        while True:
+            delay = self._admission_delay(estimated_tokens)
+            if delay > 0:
+                try:
+                    await asyncio.sleep(delay)
+                finally:
+                    self._admitted()
+            await self._gate.acquire_async()
+            started = time.monotonic()
+            try:
+                result = await send()
+            except Exception as e:
+                retry_delay = self._record_failure(e, attempt, started)
+                if retry_delay is None:
+                    raise
+            else:
+                self._record_success(started, result, estimated_tokens)
+                return result
+            finally:
+                self._gate.release()
+            await asyncio.sleep(retry_delay)
+            attempt += 1
+
+    def stream(
+        self, open_stream: Callable[[], Iterator[T]], estimated_tokens: int = 0
+    ) -> Iterator[T]:
+        """Stream a response, admitted and retried like call().
+
+        The request holds its concurrency slot until the stream is exhausted
+        or closed. Failures before the first chunk are retried; later ones
+        are raised, as the caller already has part of the response.
+
+        Args:
+            open_stream: Starts the request and returns its chunks; raises on
+                HTTP errors (possibly only once iterated)
+            estimated_tokens: Tokens to count against the tokens-per-minute limit
+
+        Yields:
+            The stream's chunks
+
+        Raises:
+            Exception: The last error from the stream, once retries are
+                exhausted or the error is not retryable
+        """
+        attempt = 0
+        while True:
+            delay = self._admission_delay(estimated_tokens)
+            if delay > 0:
+                try:
+                    time.sleep(delay)
+                finally:
+                    self._admitted()
+            self._gate.acquire()
+            started = time.monotonic()
+            try:
+                chunks = open_stream()
+                first = next(chunks, _EMPTY)
+            except Exception as e:
+                self._gate.release()
+                retry_delay = self._record_failure(e, attempt, started)
+                if retry_delay is None:
+                    raise
+                time.sleep(retry_delay)
+                attempt += 1
+                continue
+            except BaseException:
+                self._gate.release()
+                raise
+
+            try:
+                # Time to first chunk is the latency the window reacts to
+                self._record_success(started, None, estimated_tokens)
+                if first is not _EMPTY:
+                    yield first
+                    yield from chunks
+            except Exception as e:
+                self._record_failure(e, self.max_retries, started)
+                raise
+            finally:
+                close = getattr(chunks, "close", None)
+                if close is not None:
+                    close()
+                self._gate.release()
+            return
+
+    async def astream(
+        self, open_stream: Callable[[], AsyncIterator[T]], estimated_tokens: int = 0
+    ) -> AsyncIterator[T]:
+        """Stream a response on the running event loop; see stream().
+
+        Args:
+            open_stream: Starts the request and returns its chunks; raises on
+                HTTP errors (possibly only once iterated)
+            estimated_tokens: Tokens to count against the tokens-per-minute limit
+
+        Yields:
+            The stream's chunks
+
+        Raises:
+            Exception: The last error from the stream, once retries are
+                exhausted or the error is not retryable
+        """
+        attempt = 0
+        while True:
+            delay = self._admission_delay(estimated_tokens)
+            if delay > 0:
+                try:
+                    await asyncio.sleep(delay)
+                finally:
+                    self._admitted()
+            await self._gate.acquire_async()
+            started = time.monotonic()
+            try:
+                chunks = open_stream()
+                first = await anext(chunks, _EMPTY)
+            except Exception as e:
+                self._gate.release()
+                retry_delay = self._record_failure(e, attempt, started)
+                if retry_delay is None:
+                    raise
+                await asyncio.sleep(retry_delay)
+                attempt += 1
+                continue
+            except BaseException:
+                self._gate.release()
+                raise
+
+            try:
+                self._record_success(started, None, estimated_tokens)
+                if first is not _EMPTY:
+                    yield first
+                    async for chunk in chunks:
+                        yield chunk
+            except Exception as e:
+                self._record_failure(e, self.max_retries, started)
+                raise
+            finally:
+                aclose = getattr(chunks, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                self._gate.release()
+            return
+
+
+_registry_lock = threading.Lock()
+_schedulers: dict[str, LLMScheduler] = {}
+
+
+def _configured_limits(provider: str) -> ProviderLimits:
+    """Provider defaults with any timeout_config overrides applied."""
+    defaults = PROVIDER_LIMITS.get(provider, ProviderLimits())
+    return ProviderLimits(
+        requests_per_minute=timeout_config.LLM_REQUESTS_PER_MINUTE or defaults.requests_per_minute,
+        tokens_per_minute=timeout_config.LLM_TOKENS_PER_MINUTE or defaults.tokens_per_minute,
+        max_concurrency=timeout_config.LLM_MAX_CONCURRENCY or defaults.max_concurrency,
+    )
+
+
+def get_scheduler(provider: str, base_url: str | None = None) -> LLMScheduler:
+    """Return the shared scheduler for a provider, creating it on first use.
+
+    Args:
+        provider: Provider name (see LLMProvider)
+        base_url: Server URL for self-hosted providers; each server gets its
+            own scheduler
+
+    Returns:
+        Scheduler shared by every client of this provider and server
+    """
+    name = provider
+    if base_url:
+        parts = urlsplit(base_url)
+        name = f"{provider}@{parts.netloc or base_url}"
+
+    with _registry_lock:
+        scheduler = _schedulers.get(name)
+        if scheduler is None:
+            scheduler = LLMScheduler(
+                name,
+                _configured_limits(provider),
+                max_retries=timeout_config.LLM_RETRY_ATTEMPTS,
+                base_delay=timeout_config.LLM_RETRY_BASE_DELAY,
+                max_delay=timeout_config.LLM_RETRY_MAX_DELAY,
+                target_latency=timeout_config.LLM_TARGET_LATENCY,
+            )
+            _schedulers[name] = scheduler
+        return scheduler
+
+
+def scheduler_metrics() -> list[SchedulerMetrics]:
+    """Snapshot every scheduler created in this process.
+
+    Returns:
+        Metrics per provider (and server)
+    """
+    with _registry_lock:
+        schedulers = list(_schedulers.values())
+    return [scheduler.metrics() for scheduler in schedulers]
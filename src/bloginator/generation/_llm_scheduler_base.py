@@ -0,0 +1,236 @@
+"""Limits, admission and accounting behind the LLM request scheduler.
+
+SchedulerBase holds one provider's token buckets, AIMD window, Retry-After
+pause and counters; LLMScheduler (see _llm_scheduler) builds its blocking,
+async and streaming call paths on top of it.
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from bloginator.generation._aimd_window import AIMDWindow, ConcurrencyGate
+from bloginator.generation._llm_retry import (
+    RETRYABLE_STATUSES,
+    TIMEOUT_ERRORS,
+    retry_after_seconds,
+    status_code,
+)
+from bloginator.generation._token_bucket import TokenBucket
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Rate and concurrency limits for one provider.
+
+    Attributes:
+        requests_per_minute: Request rate limit (0 = unlimited)
+        tokens_per_minute: Token rate limit, prompt plus max output (0 = unlimited)
+        max_concurrency: Ceiling of the adaptive concurrency window
+    """
+
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+    max_concurrency: int = 8
+
+
+# Defaults per provider. Local servers are limited by hardware, not quotas
+# (Ollama runs OLLAMA_NUM_PARALLEL requests at once, often 1-4); cloud limits
+# are the entry-tier published quotas and are raised through timeout_config.
+PROVIDER_LIMITS = {
+    "ollama": ProviderLimits(max_concurrency=2),
+    "custom": ProviderLimits(max_concurrency=4),
+    "openai": ProviderLimits(requests_per_minute=500, tokens_per_minute=30_000),
+    "anthropic": ProviderLimits(
+        requests_per_minute=50, tokens_per_minute=40_000, max_concurrency=4
+    ),
+}
+
+
+def estimate_request_tokens(prompt: str, system_prompt: str | None, max_tokens: int) -> int:
+    """Estimate the tokens a request counts against a tokens-per-minute limit.
+
+    Args:
+        prompt: User prompt
+        system_prompt: Optional system prompt
+        max_tokens: Maximum tokens to generate
+
+    Returns:
+        Estimated prompt tokens plus the output allowance
+    """
+    return (len(prompt) + len(system_prompt or "")) // 4 + max_tokens
+
+
+@dataclass
+class SchedulerMetrics:
+    """Snapshot of a scheduler's queue and outcomes.
+
+    Attributes:
+        name: Provider (and server) the scheduler serves
+        queue_depth: Requests waiting for a rate-limit or concurrency slot
+        in_flight: Requests currently being sent
+        concurrency_limit: Current AIMD window
+        requests: Requests completed successfully
+        retries: Retries after throttling or transient errors
+        throttled: Responses with status 429
+        failures: Requests that failed after all retries
+        mean_latency: Mean latency of successful requests, in seconds
+    """
+
+    name: str
+    queue_depth: int
+    in_flight: int
+    concurrency_limit: int
+    requests: int
+    retries: int
+    throttled: int
+    failures: int
+    mean_latency: float
+
+
+class SchedulerBase:
+    """Rate-limit admission, retry backoff and outcome accounting for one provider.
+
+    Attributes:
+        name: Provider (and server) this scheduler serves
+        limits: Rate and concurrency limits
+        max_retries: Retries after a retryable failure
+        base_delay: First backoff delay in seconds
+        max_delay: Longest backoff delay in seconds
+        target_latency: Slower responses shrink the window (0 = ignore)
+        window: Adaptive concurrency window
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limits: ProviderLimits,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        target_latency: float = 0.0,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            name: Provider (and server) this scheduler serves
+            limits: Rate and concurrency limits
+            max_retries: Retries after a retryable failure
+            base_delay: First backoff delay in seconds
+            max_delay: Longest backoff delay in seconds
+            target_latency: Slower responses shrink the window (0 = ignore)
+        """
+        self.name = name
+        self.limits = limits
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.target_latency = target_latency
+
+        self.window = AIMDWindow(limits.max_concurrency)
+        self._gate = ConcurrencyGate(self.window)
+        self._request_bucket = TokenBucket(limits.requests_per_minute)
+        self._token_bucket = TokenBucket(limits.tokens_per_minute)
+
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._rate_waiting = 0
+        self._requests = 0
+        self._retries = 0
+        self._throttled = 0
+        self._failures = 0
+        self._latency_total = 0.0
+
+    def _admission_delay(self, estimated_tokens: int) -> float:
+        """Reserve rate-limit capacity and return how long to wait for it."""
+        delay = max(
+            self._request_bucket.reserve(1),
+            self._token_bucket.reserve(estimated_tokens),
+            self._paused_until - time.monotonic(),
+        )
+        if delay > 0:
+            with self._lock:
+                self._rate_waiting += 1
+        return delay
+
+    def _admitted(self) -> None:
+        with self._lock:
+            self._rate_waiting -= 1
+
+    def _backoff(self, attempt: int, retry_after: float | None) -> float:
+        """Full-jitter exponential delay, never shorter than Retry-After."""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    def _record_success(self, started: float, result: Any, estimated_tokens: int) -> None:
+        latency = time.monotonic() - started
+        used = getattr(result, "total_tokens", 0)
+        if isinstance(used, int) and used > 0:
+            self._token_bucket.adjust(used - estimated_tokens)
+
+        with self._lock:
+            self._requests += 1
+            self._latency_total += latency
+            if self.target_latency and latency > self.target_latency:
+                logger.info(
+                    f"{self.name}: {latency:.1f}s response exceeds "
+                    f"{self.target_latency}s target; reducing concurrency"
+                )
+                self.window.on_overload(started)
+            else:
+                self.window.on_success()
+        self._gate.resize()
+
+    def _record_failure(self, error: Exception, attempt: int, started: float) -> float | None:
+        """Account for a failed attempt.
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        status = status_code(error)
+        retryable = status in RETRYABLE_STATUSES
+        retry_after = retry_after_seconds(error) if retryable else None
+
+        with self._lock:
+            if status == 429:
+                self._throttled += 1
+            if retryable or isinstance(error, TIMEOUT_ERRORS):
+                self.window.on_overload(started)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            if not retryable or attempt >= self.max_retries:
+                self._failures += 1
+                return None
+            self._retries += 1
+
+        delay = self._backoff(attempt, retry_after)
+        logger.warning(
+            f"{self.name}: request failed with status {status}; "
+            f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+        )
+        return delay
+
+    def metrics(self) -> SchedulerMetrics:
+        """Snapshot the queue depth and request outcomes.
+
+        Returns:
+            Current scheduler metrics
+        """
+        with self._lock:
+            return SchedulerMetrics(
+                name=self.name,
+                queue_depth=self._rate_waiting + self._gate.waiting,
+                in_flight=self._gate.in_flight,
+                concurrency_limit=self.window.size,
+                requests=self._requests,
+                retries=self._retries,
+                throttled=self._throttled,
+                failures=self._failures,
+                mean_latency=self._latency_total / self._requests if self._requests else 0.0,
+            )
@@ -0,0 +1,220 @@
+"""Ollama model session: preload, warm up and keep the model resident.
+
+Ollama unloads an idle model after its keep-alive (five minutes by
+default), and the first request after that pays the full load again. A run
+starts an OllamaSession to load and warm the model before its first real
+request; the client sends the session's keep-alive with every request, so
+the model stays resident for the whole run.
+
+Every response carries Ollama's timing fields; the client adds them up in
+OllamaTimings so a run can report model-load time separately from prompt
+evaluation and generation.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from bloginator.generation.llm_ollama import OllamaClient
+
+logger = logging.getLogger(__name__)
+
+# A load_duration above this means the model was (re)loaded for the request
+COLD_LOAD_SECONDS = 0.5
+
+_NS_PER_SECOND = 1e9
+
+
+@dataclass
+class OllamaTimings:
+    """Timing totals reported by Ollama, in seconds.
+
+    Attributes:
+        requests: Responses whose timings were recorded
+        cold_loads: Requests that had to load the model first
+        load_seconds: Time spent loading the model
+        prompt_eval_seconds: Time spent evaluating prompts
+        eval_seconds: Time spent generating tokens
+        prompt_tokens: Prompt tokens evaluated (tokens reused from the
+            cached prefix are not counted by Ollama)
+        eval_tokens: Tokens generated
+    """
+
+    requests: int = 0
+    cold_loads: int = 0
+    load_seconds: float = 0.0
+    prompt_eval_seconds: float = 0.0
+    eval_seconds: float = 0.0
+    prompt_tokens: int = 0
+    eval_tokens: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, data: dict[str, Any]) -> None:
+        """Add the timing fields of one final Ollama response.
+
+        Args:
+            data: Decoded response (or final stream chunk)
+        """
+        load = data.get("load_duration", 0) / _NS_PER_SECOND
+        with self._lock:
+            self.requests += 1
+            self.cold_loads += load > COLD_LOAD_SECONDS
+            self.load_seconds += load
+            self.prompt_eval_seconds += data.get("prompt_eval_duration", 0) / _NS_PER_SECOND
+            self.eval_seconds += data.get("eval_duration", 0) / _NS_PER_SECOND
+            self.prompt_tokens += data.get("prompt_eval_count", 0)
+            self.eval_tokens += data.get("eval_count", 0)
+
+    def record_load(self, seconds: float) -> None:
+        """Add a model load that was not part of a generation request.
+
+        Args:
+            seconds: Time the load took
+        """
+        with self._lock:
+            self.cold_loads += seconds > COLD_LOAD_SECONDS
+            self.load_seconds += seconds
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Generation speed over all recorded requests."""
+        return self.eval_tokens / self.eval_seconds if self.eval_seconds else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        """Return totals for reporting."""
+        return {
+            "requests": self.requests,
+            "cold_loads": self.cold_loads,
+            "load_seconds": round(self.load_seconds, 3),
+            "prompt_eval_seconds": round(self.prompt_eval_seconds, 3),
+            "eval_seconds": round(self.eval_seconds, 3),
+            "prompt_tokens": self.prompt_tokens,
+            "eval_tokens": self.eval_tokens,
+            "tokens_per_second": round(self.tokens_per_second, 1),
+        }
+
+    def summary(self) -> str:
+        """Return a one-line summary of load versus evaluation time."""
+        return (
+            f"Ollama: {self.requests} requests, model load {self.load_seconds:.1f}s "
+            f"({self.cold_loads} cold), prompt eval {self.prompt_eval_seconds:.1f}s "
+            f"({self.prompt_tokens:,} tok), generation {self.eval_seconds:.1f}s "
+            f"({self.eval_tokens:,} tok, {self.tokens_per_second:.1f} tok/s)"
+        )
+
+
+class OllamaSession:
+    """Keeps an Ollama model loaded and warm for one run.
+
+    Attributes:
+        client: Ollama client of the run
+        warmup: Whether start() also runs a one-token generation
+        unload_on_close: Whether close() asks Ollama to unload the model
+        started: Whether the model was preloaded successfully
+    """
+
+    def __init__(self, client: "OllamaClient", warmup: bool = True, unload_on_close: bool = False):
+        """Create a session for a client.
+
+        Args:
+            client: Ollama client of the run
+            warmup: Also run a one-token generation after loading
+            unload_on_close: Unload the model when the session closes,
+                instead of leaving it for the keep-alive to expire
+        """
+        self.client = client
+        self.warmup = warmup
+        self.unload_on_close = unload_on_close
+        self.started = False
+
+    def start(self) -> bool:
+        """Load (and optionally warm) the model before the first request.
+
+        Failures are logged, not raised: the run's first real request
+        reports them with the usual errors.
+
+        Returns:
+            True if the model is loaded
+        """
+        try:
+            self.client.preload()
+            if self.warmup:
+                self.client.warm()
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"Could not preload Ollama model {self.client.model}: {e}")
+            return False
+        self.started = True
+        return True
+
+    def close(self) -> None:
+        """End the session, unloading the model if configured to."""
+        if self.started and self.unload_on_close:
+            try:
+                self.client.unload()
+            except (ConnectionError, ValueError) as e:
+                logger.warning(f"Could not unload Ollama model {self.client.model}: {e}")
+        self.started = False
+
+    def __enter__(self) -> "OllamaSession":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def find_ollama_client(client: Any) -> "OllamaClient | None":
+    """Return the Ollama client behind cache and coalescing wrappers.
+
+    Args:
+        client: Any LLM client
+
+    Returns:
+        The wrapped OllamaClient, or None for other providers
+    """
+    from bloginator.generation.llm_ollama import OllamaClient
+
+    while not isinstance(client, OllamaClient):
+        # Wrappers keep the wrapped client in .client (read from __dict__, so
+        # attribute delegation and mocks are not followed)
+        client = getattr(client, "__dict__", {}).get("client")
+        if client is None:
+            return None
+    return client
+
+
+def start_ollama_session(client: Any, warmup: bool = True) -> OllamaSession | None:
+    """Preload and warm the model if the client talks to Ollama.
+
+    Args:
+        client: Any LLM client, possibly wrapped
+        warmup: Also run a one-token generation after loading
+
+    Returns:
+        The started session, or None for other providers
+    """
+    ollama = find_ollama_client(client)
+    if ollama is None:
+        return None
+    session = OllamaSession(ollama, warmup=warmup)
+    session.start()
+    return session
+
+
+def ollama_report(client: Any) -> str | None:
+    """Summarize Ollama load versus evaluation time, if any.
+
+    Args:
+        client: Any LLM client, possibly wrapped
+
+    Returns:
+        One-line summary, or None if the client is not Ollama or made no
+        requests
+    """
+    ollama = find_ollama_client(client)
+    if ollama is None or not ollama.timings.requests:
+        return None
+    return ollama.timings.summary()
@@ -11,100 +11,147 @@ Coverage calculation uses generous thresholds to avoid discarding good content.
 """
 
 from bloginator.models.outline import OutlineSection
-from bloginator.search import CorpusSearcher
+from bloginator.search import CorpusSearcher, SearchResult
 
 
-def analyze_section_coverage(
+# Results fetched per section when measuring coverage
+COVERAGE_RESULTS_PER_SECTION = 10
+
+
+def _flatten_sections(sections: list[OutlineSection]) -> list[OutlineSection]:
+    """List sections depth-first, each followed by its subsections."""
+    flat: list[OutlineSection] = []
+    for section in sections:
+        flat.append(section)
+        flat.extend(_flatten_sections(section.subsections))
+    return flat
+
+
+def apply_section_coverage(
     section: OutlineSection,
+    results: list[SearchResult],
+    min_coverage_sources: int = 3,
+) -> None:
+    """Set a section's coverage statistics from its search results.
+
+    Updates section.coverage_pct, section.source_count and section.notes.
+    Subsections are not touched.
+
+    Args:
+        section: Section to update
+        results: Corpus search results for the section's query
+        min_coverage_sources: Minimum sources for good coverage
+    """
+    # Calculate coverage based on search results
+    if not results:
+        section.coverage_pct = 0.0
+        section.source_count = 0
+        section.notes = "No corpus coverage found for this topic"
+    else:
+        # Coverage calculation based on:
+        # - Best similarity score (top match matters most)
+        # - Average similarity across results
+        # - Number of results
+        #
+        # ChromaDB cosine similarity scores (after 1-distance conversion):
+        # - 0.5+ = strong match (excellent corpus coverage)
+        # - 0.3-0.5 = good match (adequate coverage)
+        # - 0.1-0.3 = weak match (limited coverage)
+        # - <0.1 = no real match
+        #
+        # Clamp negative similarities to 0 - they indicate no semantic match
+        # and shouldn't drag down the average
+        clamped_scores = [max(0.0, r.similarity_score) for r in results]
+        best_similarity = max(clamped_scores)
+
+        # Only average positive scores to avoid negative drag
+        positive_scores = [s for s in clamped_scores if s > 0]
+        avg_similarity = sum(positive_scores) / len(positive_scores) if positive_scores else 0.0
+
+        # Use best match as primary signal (90%) with average as secondary (10%)
+        # This ensures a strong single match counts heavily - one good source is enough
+        effective_similarity = 0.9 * best_similarity + 0.1 * avg_similarity
+
+        # Generous normalization: 0.25 similarity = 100% coverage
+        # Real-world embeddings for matching content typically score 0.2-0.4
+        normalized_similarity = min(effective_similarity / 0.25, 1.0)
+
+        # Result factor: having 2+ results with positive scores is full coverage
+        positive_count = len(positive_scores)
+        result_factor = min(positive_count / 2.0, 1.0)
+
+        section.coverage_pct = (result_factor * normalized_similarity) * 100.0
+
+        # Count unique source documents
+        unique_docs = set()
+        for result in results:
+            doc_id = result.metadata.get("document_id", "")
+            if doc_id:
+                unique_docs.add(doc_id)
+
+        section.source_count = len(unique_docs)
+
+        # Add warning for low coverage
+        if section.coverage_pct < 50.0:
+            section.notes = f"⚠️ Low corpus coverage ({section.coverage_pct:.0f}%)"
+        elif section.source_count < min_coverage_sources:
+            section.notes = f"Limited sources ({section.source_count} documents)"
+
+
+def analyze_outline_coverage(
+    sections: list[OutlineSection],
     keywords: list[str],
     searcher: CorpusSearcher,
     min_coverage_sources: int = 3,
 ) -> None:
-    """Analyze corpus coverage for a section.
+    """Analyze corpus coverage for sections and all their subsections.
 
-    Updates section.coverage_pct and section.source_count based on
-    how well the corpus covers this section's topic.
+    Every section's query runs in a single batch search (one embedding
+    pass and one index query), however many sections the outline has.
 
     Args:
-        section: Section to analyze
+        sections: Top-level sections to analyze
         keywords: Document keywords for context
         searcher: Corpus searcher instance
         min_coverage_sources: Minimum sources for good coverage
     """
-    # Build search query from section title + keywords
-    query = f"{section.title} {' '.join(keywords[:3])}"
+    all_sections = _flatten_sections(sections)
+    if not all_sections:
+        return
+
+    # Build search queries from section title + keywords
+    keyword_context = " ".join(keywords[:3])
+    queries = [f"{section.title} {keyword_context}" for section in all_sections]
 
     try:
-        # Search corpus for relevant content
-        results = searcher.search(
-            query=query,
-            n_results=10,
-        )
-
-        # Calculate coverage based on search results
-        if not results:
-            section.coverage_pct = 0.0
-            section.source_count = 0
-            section.notes = "No corpus coverage found for this topic"
-        else:
-            # Coverage calculation based on:
-            # - Best similarity score (top match matters most)
-            # - Average similarity across results
-            # - Number of results
-            #
-            # ChromaDB cosine similarity scores (after 1-distance conversion):
-            # - 0.5+ = strong match (excellent corpus coverage)
-            # - 0.3-0.5 = good match (adequate coverage)
-            # - 0.1-0.3 = weak match (limited coverage)
-            # - <0.1 = no real match
-            #
-            # Clamp negative similarities to 0 - they indicate no semantic match
-            # and shouldn't drag down the average
-            clamped_scores = [max(0.0, r.similarity_score) for r in results]
-            best_similarity = max(clamped_scores)
-
-            # Only average positive scores to avoid negative drag
-            positive_scores = [s for s in clamped_scores if s > 0]
-            avg_similarity = sum(positive_scores) / len(positive_scores) if positive_scores else 0.0
-
-            # Use best match as primary signal (90%) with average as secondary (10%)
-            # This ensures a strong single match counts heavily - one good source is enough
-            effective_similarity = 0.9 * best_similarity + 0.1 * avg_similarity
-
-            # Generous normalization: 0.25 similarity = 100% coverage
-            # Real-world embeddings for matching content typically score 0.2-0.4
-            normalized_similarity = min(effective_similarity / 0.25, 1.0)
-
-            # Result factor: having 2+ results with positive scores is full coverage
-            positive_count = len(positive_scores)
-            result_factor = min(positive_count / 2.0, 1.0)
-
-            section.coverage_pct = (result_factor * normalized_similarity) * 100.0
-
-            # Count unique source documents
-            unique_docs = set()
-            for result in results:
-                doc_id = result.metadata.get("document_id", "")
-                if doc_id:
-                    unique_docs.add(doc_id)
-
-            section.source_count = len(unique_docs)
-
-            # Add warning for low coverage
-            if section.coverage_pct < 50.0:
-                section.notes = f"⚠️ Low corpus coverage ({section.coverage_pct:.0f}%)"
-            elif section.source_count < min_coverage_sources:
-                section.notes = f"Limited sources ({section.source_count} documents)"
+        results_per_section = searcher.batch_search(queries, n_results=COVERAGE_RESULTS_PER_SECTION)
+        for i, section in enumerate(all_sections):
+            results = results_per_section[i] if i < len(results_per_section) else []
+            apply_section_coverage(section, results, min_coverage_sources)
 
     except Exception as e:
         # Fallback on error
-        section.coverage_pct = 0.0
-        section.source_count = 0
-        section.notes = f"Coverage analysis failed: {str(e)}"
+        for section in all_sections:
+            section.coverage_pct = 0.0
+            section.source_count = 0
+            section.notes = f"Coverage analysis failed: {str(e)}"
 
-    # Recursively analyze subsections
-    for subsection in section.subsections:
-        analyze_section_coverage(subsection, keywords, searcher, min_coverage_sources)
+
+def analyze_section_coverage(
+    section: OutlineSection,
+    keywords: list[str],
+    searcher: CorpusSearcher,
+    min_coverage_sources: int = 3,
+) -> None:
+    """Analyze corpus coverage for a section and its subsections.
+
+    Args:
+        section: Section to analyze
+        keywords: Document keywords for context
+        searcher: Corpus searcher instance
+        min_coverage_sources: Minimum sources for good coverage
+    """
+    analyze_outline_coverage([section], keywords, searcher, min_coverage_sources)
 
 
 def filter_sections_by_coverage(
@@ -0,0 +1,157 @@
+"""Wait for assistant response files without polling each one.
+
+On Linux, an inotify watch on the response directory wakes the waiter as
+soon as a file is closed after writing or moved in, and reports its name.
+Elsewhere, or if inotify is unavailable, each tick lists the directory once
+with os.scandir instead of stat-ing every outstanding response file.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+
+# struct inotify_event: wd, mask, cookie, len, then len bytes of name
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+@lru_cache(maxsize=1)
+def _libc() -> Any | None:
+    """Load libc if it provides inotify."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1  # noqa: B018 - raises AttributeError if missing
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _inotify_watch(directory: Path) -> int | None:
+    """Open a non-blocking inotify descriptor watching a directory.
+
+    Returns:
+        File descriptor, or None if inotify is unavailable
+    """
+    libc = _libc()
+    if libc is None:
+        return None
+
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        logger.debug(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+        logger.debug(f"inotify_add_watch failed: {os.strerror(ctypes.get_errno())}")
+        os.close(fd)
+        return None
+    return int(fd)
+
+
+class ResponseWatcher:
+    """Wake on new files in a directory.
+
+    Use as a context manager so the inotify descriptor is closed.
+
+    Attributes:
+        directory: Directory being watched
+        poll_interval: Seconds between scans when inotify is unavailable
+    """
+
+    def __init__(self, directory: Path, poll_interval: float = 1.0):
+        """Start watching a directory, creating it if needed.
+
+        Args:
+            directory: Directory to watch
+            poll_interval: Seconds between scans when inotify is unavailable
+        """
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._fd = _inotify_watch(self.directory)
+
+    @property
+    def event_driven(self) -> bool:
+        """Whether changes are delivered by inotify rather than scanning."""
+        return self._fd is not None
+
+    def scan(self) -> set[str]:
+        """List the file names currently in the directory.
+
+        Returns:
+            File names (one os.scandir call)
+        """
+        try:
+            with os.scandir(self.directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return set()
+
+    def wait(self, timeout: float) -> set[str]:
+        """Block until files are written to the directory or the timeout passes.
+
+        Args:
+            timeout: Longest wait in seconds
+
+        Returns:
+            Names of files written or moved in; without inotify, every file
+            in the directory after one poll interval
+        """
+        if self._fd is None:
+            time.sleep(max(0.0, min(timeout, self.poll_interval)))
+            return self.scan()
+
+        readable, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        return self._read_events() if readable else set()
+
+    def _read_events(self) -> set[str]:
+        """Drain pending inotify events and return the file names they name."""
+        assert self._fd is not None
+        names: set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                start = offset + _EVENT_HEADER.size
+                name = data[start : start + length].rstrip(b"\0")
+                if name:
+                    names.add(os.fsdecode(name))
+                offset = start + length
+        return names
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "ResponseWatcher":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
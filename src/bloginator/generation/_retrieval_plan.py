@@ -0,0 +1,192 @@
+"""Shared retrieval plan: assign retrieved chunks to outline sections.
+
+Each section's search is independent, so the best chunks for a topic tend
+to come back for several sections and are sent to the LLM (and cited) once
+per section. The planner takes an over-fetched candidate list per section
+and hands out chunks across the whole outline at once, greedily by maximal
+marginal relevance:
+
+- the next assignment is always the best-scoring (section, chunk) pair left,
+  so a chunk lands in the section it fits best rather than the first one;
+- a chunk's score in a section is lowered by how much it overlaps the chunks
+  that section already has (word-set Jaccard, since results carry no
+  embeddings);
+- a chunk's text is assigned at most max_uses times across the outline,
+  except that a section whose candidates were all used up elsewhere still
+  gets its best-ranked one, so no section with candidates goes without.
+"""
+
+import logging
+import re
+from collections.abc import Callable, Sequence
+
+from bloginator.models.outline import Outline
+from bloginator.search import CorpusSearcher, SearchResult
+from bloginator.search.validators import validate_search_results
+
+
+logger = logging.getLogger(__name__)
+
+# Candidates fetched per section for every source the section will get
+SOURCE_OVERFETCH = 3
+
+# Weight of relevance against redundancy in the marginal score
+DEFAULT_RELEVANCE_WEIGHT = 0.7
+
+_WORD = re.compile(r"\w+")
+
+
+def _words(text: str) -> frozenset[str]:
+    return frozenset(_WORD.findall(text.lower()))
+
+
+def _overlap(a: frozenset[str], b: frozenset[str]) -> float:
+    """Jaccard similarity of two word sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def plan_sources(
+    candidates: Sequence[Sequence[SearchResult]],
+    per_section: int,
+    max_uses: int = 1,
+    relevance_weight: float = DEFAULT_RELEVANCE_WEIGHT,
+) -> list[list[SearchResult]]:
+    """Assign candidate chunks to sections across the whole outline.
+
+    Args:
+        candidates: Retrieved results per section, best first
+        per_section: Sources each section gets at most
+        max_uses: Sections a chunk's text may be assigned to (0 = unlimited);
+            exceeded only to give a section its single best candidate
+        relevance_weight: Weight of relevance (the rest penalizes overlap
+            with the section's other sources), between 0 and 1
+
+    Returns:
+        Sources per section, in the order of candidates, each ordered by
+        relevance to its section
+
+    Raises:
+        ValueError: If per_section or max_uses is negative, or
+            relevance_weight is outside [0, 1]
+    """
+    if per_section < 0 or max_uses < 0:
+        raise ValueError("per_section and max_uses must not be negative")
+    if not 0 <= relevance_weight <= 1:
+        raise ValueError("relevance_weight must be between 0 and 1")
+
+    # Chunks are identified by their text: the same passage indexed twice
+    # costs the same prompt tokens as one chunk sent twice
+    words: dict[str, frozenset[str]] = {}
+    pools: list[dict[str, SearchResult]] = []
+    for results in candidates:
+        pool: dict[str, SearchResult] = {}
+        for result in results:
+            key = result.content.strip()
+            if key and key not in pool:
+                pool[key] = result
+                words.setdefault(key, _words(key))
+        pools.append(pool)
+
+    uses: dict[str, int] = {}
+    assigned: list[list[SearchResult]] = [[] for _ in pools]
+    assigned_words: list[list[frozenset[str]]] = [[] for _ in pools]
+
+    while True:
+        best: tuple[float, int, str] | None = None
+        for index, pool in enumerate(pools):
+            if len(assigned[index]) >= per_section:
+                continue
+            for key, result in pool.items():
+                if max_uses and uses.get(key, 0) >= max_uses:
+                    continue
+                redundancy = max(
+                    (_overlap(words[key], other) for other in assigned_words[index]),
+                    default=0.0,
+                )
+                score = (
+                    relevance_weight * result.combined_score - (1 - relevance_weight) * redundancy
+                )
+                if best is None or score > best[0]:
+                    best = (score, index, key)
+        if best is None:
+            break
+
+        _, index, key = best
+        assigned[index].append(pools[index].pop(key))
+        assigned_words[index].append(words[key])
+        uses[key] = uses.get(key, 0) + 1
+
+    # Never leave a section without sources because others took them all
+    for index, pool in enumerate(pools):
+        if per_section and not assigned[index] and pool:
+            key = next(iter(pool))
+            assigned[index].append(pool.pop(key))
+            uses[key] = uses.get(key, 0) + 1
+
+    logger.debug(
+        f"Retrieval plan: {sum(map(len, assigned))} sources over {len(pools)} sections "
+        f"from {len(uses)} distinct chunks"
+    )
+    return [
+        sorted(sources, key=lambda result: result.combined_score, reverse=True)
+        for sources in assigned
+    ]
+
+
+def prefetch_sources(
+    searcher: CorpusSearcher,
+    outline: Outline,
+    per_section: int,
+    max_uses: int,
+    progress_callback: Callable[[str, int, int], None] | None = None,
+) -> dict[int, list[SearchResult]]:
+    """Search for every section of an outline in one batch.
+
+    With a repeat limit, extra candidates are fetched per section, validated,
+    and assigned across the whole outline by plan_sources.
+
+    Args:
+        searcher: Corpus searcher
+        outline: Outline whose sections are searched
+        per_section: Sources each section gets at most
+        max_uses: Sections a chunk's text may be assigned to (0 = unlimited:
+            each section keeps its own top results)
+        progress_callback: Optional callback(message, current, total)
+
+    Returns:
+        Sources per section, keyed by id() since OutlineSection is not hashable
+    """
+    all_sections = outline.get_all_sections()
+    queries = [
+        f"{section.title} {section.description} {' '.join(outline.keywords[:2])}"
+        for section in all_sections
+    ]
+
+    if progress_callback:
+        progress_callback(
+            f"Pre-fetching corpus results for {len(queries)} sections...",
+            0,
+            len(all_sections),
+        )
+
+    planned = max_uses > 0
+    batch_results = searcher.batch_search(
+        queries=queries,
+        n_results=per_section * (SOURCE_OVERFETCH if planned else 1),
+    )
+    if planned:
+        candidates = []
+        for results in batch_results:
+            filtered_results, validation_warnings = validate_search_results(
+                results, expected_keywords=outline.keywords
+            )
+            for warning in validation_warnings:
+                logger.warning(f"Draft generation validation warning: {warning}")
+            candidates.append(filtered_results)
+        batch_results = plan_sources(candidates, per_section, max_uses)
+
+    return {
+        id(section): results for section, results in zip(all_sections, batch_results, strict=False)
+    }
@@ -0,0 +1,304 @@
+"""Section request preparation, LLM calls and dispatch for draft generation."""
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from bloginator.config import Config
+from bloginator.generation._section_refiner import build_source_context, create_citations
+from bloginator.generation._token_budget import PromptUsage, TokenBudget, output_token_budget
+from bloginator.generation.llm_client import LLMClient, StreamUsage
+from bloginator.models.draft import Citation, DraftSection
+from bloginator.models.outline import Outline, OutlineSection
+from bloginator.prompts.loader import PromptLoader
+from bloginator.search import SearchResult
+from bloginator.search.validators import validate_search_results
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SectionRequest:
+    """Prepared LLM request for one outline section."""
+
+    outline_section: OutlineSection
+    position: int
+    max_words: int
+    system_prompt: str
+    user_prompt: str
+    citations: list[Citation]
+    max_tokens: int
+    budget: TokenBudget
+
+
+def prepare_section_request(
+    outline_section: OutlineSection,
+    search_results: list[SearchResult],
+    keywords: list[str],
+    classification: str,
+    audience: str,
+    max_words: int,
+    position: int,
+    prompt_loader: PromptLoader,
+    voice_samples: str,
+    token_budget: Callable[[int], TokenBudget],
+) -> SectionRequest:
+    """Build the prompts and citations for one section from its sources.
+
+    Args:
+        outline_section: Section to prepare
+        search_results: Retrieved sources for the section, best first
+        keywords: Document keywords for validation
+        classification: Content classification for tone
+        audience: Target audience
+        max_words: Target word count
+        position: Section number for progress (0-based)
+        prompt_loader: Loader for the draft prompt template
+        voice_samples: Voice-sample block for the system prompt
+        token_budget: Prompt budget for the model, given the output tokens to reserve
+
+    Returns:
+        Prepared request with prompts and citations
+    """
+    # Validate and filter search results
+    filtered_results, validation_warnings = validate_search_results(
+        search_results, expected_keywords=keywords
+    )
+    for warning in validation_warnings:
+        logger.warning(f"Draft generation validation warning: {warning}")
+
+    # Load prompt template from external YAML file
+    prompt_template = prompt_loader.load("draft/base.yaml")
+
+    # Get classification and audience context from template
+    classification_contexts = prompt_template.parameters.get("classification_contexts", {})
+    audience_contexts = prompt_template.parameters.get("audience_contexts", {})
+
+    classification_guidance = classification_contexts.get(
+        classification, "Provide helpful guidance"
+    )
+    audience_context = audience_contexts.get(audience, "general professional audience")
+
+    # Render system prompt with context, voice samples, and company branding
+    system_prompt = prompt_template.render_system_prompt(
+        classification_guidance=classification_guidance,
+        audience_context=audience_context,
+        voice_samples=voice_samples,
+        company_name=Config.COMPANY_NAME,
+        company_possessive=Config.COMPANY_POSSESSIVE,
+    )
+
+    # Pack the best sources into what the context window has left after
+    # the fixed prompt text and the reserved output
+    max_tokens = output_token_budget(max_words)
+    budget = token_budget(max_tokens)
+    prompt_args = {
+        "title": outline_section.title,
+        "description": outline_section.description,
+        "max_words": max_words,
+    }
+    fixed_prompt = prompt_template.render_user_prompt(**prompt_args, source_context="")
+    sources = budget.pack(filtered_results, budget.remaining(system_prompt, fixed_prompt))
+
+    # Render user prompt with the packed sources
+    user_prompt = prompt_template.render_user_prompt(
+        **prompt_args, source_context=build_source_context(sources)
+    )
+
+    return SectionRequest(
+        outline_section=outline_section,
+        position=position,
+        max_words=max_words,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        # Create citations from the sources the prompt includes
+        citations=create_citations(sources, max_citations=5),
+        max_tokens=max_tokens,
+        budget=budget,
+    )
+
+
+def complete_section(
+    llm_client: LLMClient,
+    request: SectionRequest,
+    temperature: float,
+    token_callback: Callable[[str, str], None] | None,
+    prompt_usage: list[PromptUsage],
+) -> str:
+    """Run the LLM call for a prepared section.
+
+    Args:
+        llm_client: LLM client for generation
+        request: Prepared section request
+        temperature: LLM temperature
+        token_callback: Optional callback(section_title, delta); streams the call
+        prompt_usage: Receives the call's prompt token accounting
+
+    Returns:
+        Generated section content
+    """
+    max_tokens = request.max_tokens
+    title = request.outline_section.title
+    usage = PromptUsage(
+        label=title,
+        estimated_prompt_tokens=request.budget.counter.count(request.system_prompt)
+        + request.budget.counter.count(request.user_prompt),
+        context_tokens=request.budget.context_tokens,
+    )
+    prompt_usage.append(usage)
+
+    # Actual counts as reported by the provider
+    reported = StreamUsage()
+    if token_callback is None:
+        response = llm_client.generate(
+            prompt=request.user_prompt,
+            system_prompt=request.system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        reported.record(response.prompt_tokens, response.completion_tokens)
+        content = str(response.content)
+    else:
+        received = []
+        for delta in llm_client.stream(
+            prompt=request.user_prompt,
+            system_prompt=request.system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            usage=reported,
+        ):
+            received.append(delta)
+            token_callback(title, delta)
+        content = "".join(received)
+
+    usage.prompt_tokens = reported.prompt_tokens
+    usage.completion_tokens = reported.completion_tokens
+    logger.debug(
+        f"Prompt tokens for '{title}': {usage.prompt_tokens} "
+        f"(estimated {usage.estimated_prompt_tokens} of {usage.context_tokens})"
+    )
+    return content.strip()
+
+
+def generate_sequentially(
+    sections: list[OutlineSection],
+    max_words: int,
+    position: int,
+    prepare: Callable[[OutlineSection, int, int], SectionRequest],
+    complete: Callable[[SectionRequest], str],
+) -> list[DraftSection]:
+    """Generate sections one at a time, each followed by its subsections.
+
+    Args:
+        sections: Sections to generate, in outline order
+        max_words: Target words for these sections (subsections get half)
+        position: Number of the first section for progress (0-based)
+        prepare: Builds a section's request from (section, max_words, position)
+        complete: Runs a prepared request and returns the section text
+
+    Returns:
+        Draft sections in outline order
+    """
+    drafts = []
+    for outline_section in sections:
+        request = prepare(outline_section, max_words, position)
+        content = complete(request)
+        subsections = generate_sequentially(
+            outline_section.subsections, max_words // 2, position + 1, prepare, complete
+        )
+        drafts.append(
+            DraftSection(
+                title=outline_section.title,
+                content=content,
+                citations=request.citations,
+                subsections=subsections,
+            )
+        )
+        # Skip past the section and all its subsections
+        position += len(outline_section.get_all_sections())
+    return drafts
+
+
+def generate_concurrently(
+    outline: Outline,
+    max_section_words: int,
+    prepare: Callable[[OutlineSection, int, int], SectionRequest],
+    complete: Callable[[SectionRequest], str],
+    max_concurrency: int,
+    progress_callback: Callable[[str, int, int], None] | None,
+    total_sections: int,
+) -> list[DraftSection]:
+    """Generate all sections with up to max_concurrency LLM calls in flight.
+
+    Every section is prepared first, in outline order and on the calling
+    thread; the LLM calls are then dispatched in that order and progress is
+    reported as each one starts.
+
+    Args:
+        outline: Outline to generate from
+        max_section_words: Target words for top-level sections
+        prepare: Builds a section's request from (section, max_words, position)
+        complete: Runs a prepared request and returns the section text
+        max_concurrency: Maximum LLM calls in flight at once
+        progress_callback: Optional callback for progress updates
+        total_sections: Total number of sections
+
+    Returns:
+        Top-level draft sections in outline order
+    """
+    requests: list[SectionRequest] = []
+
+    def prepare_all(sections: list[OutlineSection], max_words: int, position: int) -> int:
+        for outline_section in sections:
+            requests.append(prepare(outline_section, max_words, position))
+            # Subsections get less content
+            position = prepare_all(outline_section.subsections, max_words // 2, position + 1)
+        return position
+
+    prepare_all(outline.sections, max_section_words, 0)
+
+    # Dispatch in outline order; a slot frees when a call finishes
+    slots = threading.BoundedSemaphore(max_concurrency)
+    futures: list[Future[str]] = []
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="bloginator-draft"
+    ) as executor:
+        try:
+            for request in requests:
+                slots.acquire()
+                if any(f.done() and f.exception() for f in futures):
+                    slots.release()
+                    break
+                if progress_callback:
+                    progress_callback(
+                        f"Generating content for: {request.outline_section.title}",
+                        request.position,
+                        total_sections,
+                    )
+                future = executor.submit(complete, request)
+                future.add_done_callback(lambda _: slots.release())
+                futures.append(future)
+
+            contents = {
+                id(request.outline_section): future.result()
+                for request, future in zip(requests, futures, strict=False)
+            }
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    citations = {id(request.outline_section): request.citations for request in requests}
+
+    def build(outline_section: OutlineSection) -> DraftSection:
+        return DraftSection(
+            title=outline_section.title,
+            content=contents[id(outline_section)],
+            citations=citations[id(outline_section)],
+            subsections=[build(sub) for sub in outline_section.subsections],
+        )
+
+    return [build(outline_section) for outline_section in outline.sections]
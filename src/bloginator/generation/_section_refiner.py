@@ -2,6 +2,8 @@
 
 import logging
 
+from bloginator.generation._token_budget import TokenBudget, output_token_budget
+from bloginator.generation._voice_samples import get_voice_samples
 from bloginator.generation.llm_client import LLMClient
 from bloginator.models.draft import Citation, DraftSection
 from bloginator.search import CorpusSearcher, SearchResult
@@ -10,6 +12,14 @@ from bloginator.search.validators import validate_search_results
 
 logger = logging.getLogger(__name__)
 
+# Re-exported for callers that import it from here
+__all__ = [
+    "build_source_context",
+    "create_citations",
+    "get_voice_samples",
+    "refine_section",
+]
+
 
 def build_source_context(results: list[SearchResult]) -> str:
     """Build context string from search results.
@@ -54,118 +64,6 @@ def create_citations(results: list[SearchResult], max_citations: int = 5) -> lis
     ]
 
 
-def get_voice_samples(searcher: CorpusSearcher, keywords: list[str], num_samples: int = 3) -> str:
-    """Fetch author-written voice samples from corpus to help LLM emulate style.
-
-    Prioritizes documents that represent the author's authentic voice:
-    - Essays, guides, and analysis docs (not interview transcripts)
-    - Documents with clear narrative structure (not templates or specs)
-    - Content with distinct writing style (not third-party or academic text)
-
-    Args:
-        searcher: Corpus searcher to use
-        keywords: Keywords for topical context
-        num_samples: Number of diverse samples to fetch (default: 3)
-
-    Returns:
-        Formatted voice samples string for inclusion in prompt
-    """
-    try:
-        # Search for author-written content using voice-indicative queries
-        voice_queries = [
-            "my experience leading teams",  # Personal narrative
-            "lessons learned from",  # Reflective writing
-            "how we approach",  # Organizational voice
-            "why this matters",  # Opinion/analysis
-            "what I've observed",  # Direct observation
-        ]
-
-        # Also include one topically relevant query for context
-        if keywords:
-            voice_queries.insert(0, f"{keywords[0]} best practices")
-
-        samples = []
-        seen_ids = set()
-
-        for query in voice_queries:
-            results = searcher.search(query, n_results=2)
-            for result in results:
-                # Filter out templates, transcripts, and third-party content
-                filename = result.metadata.get("filename", "").lower()
-
-                # Skip these document types (not authentic voice)
-                skip_patterns = [
-                    "template",
-                    "transcript",
-                    "interview",
-                    "questions",
-                    "jd",  # Job descriptions
-                    "sample",
-                    "_po_",  # Product owner templates
-                    "_sre_",  # SRE templates
-                    "contractor",
-                    "must-reads",  # HBR compilations
-                    "recap -",  # Summary docs of third-party content
-                    "stages of",  # Third-party frameworks
-                ]
-
-                if any(pattern in filename for pattern in skip_patterns):
-                    continue
-
-                # Skip if chunk is too short (likely metadata/headers)
-                if len(result.content.split()) < 50:
-                    continue
-
-                # Skip if already seen
-                if result.chunk_id in seen_ids:
-                    continue
-
-                seen_ids.add(result.chunk_id)
-                samples.append(result)
-
-                if len(samples) >= num_samples:
-                    break
-
-            if len(samples) >= num_samples:
-                break
-
-        if not samples:
-            logger.warning("No high-quality voice samples found - falling back to keyword search")
-            # Fallback: use keyword search but still filter templates
-            if keywords:
-                results = searcher.search(keywords[0], n_results=num_samples * 2)
-                for result in results:
-                    filename = result.metadata.get("filename", "").lower()
-                    if not any(
-                        p in filename for p in ["template", "transcript", "interview", "questions"]
-                    ):
-                        samples.append(result)
-                        if len(samples) >= num_samples:
-                            break
-
-        if not samples:
-            return ""
-
-        # Format samples for the prompt
-        sample_parts = []
-        for i, sample in enumerate(samples[:num_samples], 1):
-            # Limit to 150 words for brevity
-            content = sample.content
-            words = content.split()
-            if len(words) > 150:
-                content = " ".join(words[:150]) + "..."
-
-            # Include filename for transparency
-            filename = sample.metadata.get("filename", "unknown")
-            sample_parts.append(f"[Sample {i} - from {filename}]\n{content}\n")
-
-        return "\n".join(sample_parts)
-
-    except Exception as e:
-        logger.warning(f"Failed to fetch voice samples: {e}")
-        return ""
-
-
 def refine_section(
     section: DraftSection,
     feedback: str,
@@ -204,14 +102,13 @@ def refine_section(
     for warning in validation_warnings:
         logger.warning(f"Draft refinement validation warning: {warning}")
 
-    source_context = build_source_context(filtered_results)
-
     # Refine with LLM
     system_prompt = """You are refining content based on feedback.
 Keep the core message but incorporate the requested changes.
 Use only information from the provided sources."""
 
-    user_prompt = f"""Original content:
+    def build_user_prompt(source_context: str) -> str:
+        return f"""Original content:
 {section.content}
 
 Feedback: {feedback}
@@ -221,11 +118,17 @@ Additional source material:
 
 Revise the content to address the feedback while maintaining coherence."""
 
+    # Pack sources into the context left after the fixed prompt and output
+    max_tokens = output_token_budget(len(section.content.split()))
+    budget = TokenBudget.for_client(llm_client, max_tokens)
+    sources = budget.pack(filtered_results, budget.remaining(system_prompt, build_user_prompt("")))
+    user_prompt = build_user_prompt(build_source_context(sources))
+
     response = llm_client.generate(
         prompt=user_prompt,
         system_prompt=system_prompt,
         temperature=temperature,
-        max_tokens=len(section.content.split()) * 2,
+        max_tokens=max_tokens,
     )
 
     # Update citations
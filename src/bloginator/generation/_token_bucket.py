@@ -0,0 +1,65 @@
+"""Token bucket used to pace LLM requests and tokens per minute."""
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate.
+
+    Callers reserve capacity up front and are told how long to wait for it,
+    so no lock is held while a request waits its turn.
+
+    Attributes:
+        per_minute: Refill rate and capacity (0 = unlimited)
+    """
+
+    def __init__(self, per_minute: int, clock: Callable[[], float] = time.monotonic):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Refill rate and capacity (0 = unlimited)
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.per_minute = per_minute
+        self._clock = clock
+        self._level = float(per_minute)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(
+            float(self.per_minute), self._level + (now - self._updated) * self.per_minute / 60
+        )
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Take capacity, going into debt if the bucket is short.
+
+        Args:
+            amount: Capacity to take (capped at the bucket size, so an
+                oversized request waits for a full bucket rather than forever)
+
+        Returns:
+            Seconds to wait before the reserved capacity is available
+        """
+        if self.per_minute <= 0:
+            return 0.0
+        with self._lock:
+            self._refill()
+            self._level -= min(amount, self.per_minute)
+            return max(0.0, -self._level * 60 / self.per_minute)
+
+    def adjust(self, amount: float) -> None:
+        """Correct a reservation once the real cost is known.
+
+        Args:
+            amount: Extra capacity used (negative to give some back)
+        """
+        if self.per_minute <= 0:
+            return
+        with self._lock:
+            self._refill()
+            self._level = min(float(self.per_minute), self._level - amount)
@@ -0,0 +1,348 @@
+"""Token budgets for prompt assembly.
+
+Retrieved sources are packed into what is left of the model's context window
+after the fixed prompt text and the reserved output, highest-scoring first.
+A source that does not fit whole is cut at a sentence boundary.
+
+Token counts come from tiktoken. Its encodings are approximate for
+non-OpenAI models, and when an encoding is not available offline, counts
+fall back to a characters-per-token estimate.
+"""
+
+import copy
+import logging
+import math
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from bloginator.config import Config
+from bloginator.search import SearchResult
+
+
+logger = logging.getLogger(__name__)
+
+# Context window used for models not listed below
+DEFAULT_CONTEXT_TOKENS = 8192
+
+# Largest window requested from Ollama unless BLOGINATOR_LLM_CONTEXT_TOKENS
+# asks for more: Ollama allocates the KV cache for the whole num_ctx when it
+# loads the model, so a 128k table entry would cost far more memory than
+# bloginator's prompts need
+OLLAMA_MAX_CONTEXT_TOKENS = 16_384
+
+# Context windows by model-name prefix (longest matching prefix wins)
+_CONTEXT_WINDOWS = {
+    "gpt-4o": 128_000,
+    "gpt-4-turbo": 128_000,
+    "gpt-4.1": 1_000_000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16_385,
+    "o1": 128_000,
+    "o3": 200_000,
+    "claude": 200_000,
+    "llama3.1": 128_000,
+    "llama3.2": 128_000,
+    "llama3": 8192,
+    "llama2": 4096,
+    "mistral": 32_768,
+    "mixtral": 32_768,
+    "qwen2.5": 32_768,
+    "gemma2": 8192,
+    "phi3": 4096,
+}
+
+# Estimate used when no tokenizer is available
+_CHARS_PER_TOKEN = 4
+
+# Average tokens per English word, and headroom for output length targets
+TOKENS_PER_WORD = 4 / 3
+OUTPUT_HEADROOM = 1.5
+
+# Tokens for the "[Source n]" label and spacing around each packed source
+SOURCE_OVERHEAD_TOKENS = 8
+
+# A truncated source shorter than this is dropped instead
+MIN_TRUNCATED_TOKENS = 32
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+@lru_cache(maxsize=16)
+def _get_encoding(model: str | None) -> Any | None:
+    """Load the tiktoken encoding for a model, or None if unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        if model:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                pass
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use; offline, estimate instead
+        logger.info(f"Tokenizer unavailable, estimating token counts: {e}")
+        return None
+
+
+def output_token_budget(max_words: int) -> int:
+    """Max output tokens for a target word count, with headroom.
+
+    Args:
+        max_words: Target word count
+
+    Returns:
+        Token limit for the completion
+    """
+    return math.ceil(max_words * TOKENS_PER_WORD * OUTPUT_HEADROOM)
+
+
+def context_window(model: str | None, provider: str | None = None) -> int:
+    """Context window size for a model.
+
+    BLOGINATOR_LLM_CONTEXT_TOKENS overrides the built-in table. For Ollama,
+    which serves whatever num_ctx it is sent, the table value is capped at
+    OLLAMA_MAX_CONTEXT_TOKENS; the Ollama client sends the result as num_ctx.
+
+    Args:
+        model: Model name
+        provider: LLM provider name (e.g. "ollama")
+
+    Returns:
+        Context window in tokens
+    """
+    if Config.LLM_CONTEXT_TOKENS > 0:
+        return Config.LLM_CONTEXT_TOKENS
+    name = (model or "").lower().split("/")[-1]
+    matches = [prefix for prefix in _CONTEXT_WINDOWS if name.startswith(prefix)]
+    window = _CONTEXT_WINDOWS[max(matches, key=len)] if matches else DEFAULT_CONTEXT_TOKENS
+    if provider == "ollama":
+        window = min(window, OLLAMA_MAX_CONTEXT_TOKENS)
+    return window
+
+
+def client_context_window(client: object) -> int:
+    """Context window a client's requests are served with.
+
+    A client that sends num_ctx (Ollama) is budgeted against exactly that,
+    since it is what the server allocates; others use their model's window.
+
+    Args:
+        client: LLM client
+
+    Returns:
+        Context window in tokens
+    """
+    num_ctx = getattr(client, "num_ctx", None)
+    if isinstance(num_ctx, int) and num_ctx > 0:
+        return num_ctx
+    model = getattr(client, "model", None)
+    return context_window(model if isinstance(model, str) else None)
+
+
+class TokenCounter:
+    """Count tokens for a model.
+
+    Attributes:
+        model: Model name used to pick the encoding
+    """
+
+    def __init__(self, model: str | None = None):
+        """Initialize token counter.
+
+        Args:
+            model: Model name (cl100k_base encoding if unknown)
+        """
+        self.model = model
+        self._encoding = _get_encoding(model)
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from a tokenizer rather than an estimate."""
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """Count tokens in text.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Number of tokens
+        """
+        if not text:
+            return 0
+        if self._encoding is None:
+            return math.ceil(len(text) / _CHARS_PER_TOKEN)
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, counter: TokenCounter) -> str:
+    """Shorten text to fit a token limit, ending at a sentence boundary.
+
+    Falls back to a word boundary when even the first sentence is too long.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token limit
+        counter: Token counter for the target model
+
+    Returns:
+        Text within the limit (unchanged if it already fits)
+    """
+    if counter.count(text) <= max_tokens:
+        return text
+
+    kept = ""
+    for sentence in _SENTENCE_END.split(text):
+        candidate = f"{kept} {sentence}" if kept else sentence
+        if counter.count(candidate) > max_tokens:
+            break
+        kept = candidate
+    if kept:
+        return kept
+
+    words = text.split()
+    low, high = 0, len(words)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if counter.count(" ".join(words[:mid])) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return " ".join(words[:low])
+
+
+@dataclass
+class TokenBudget:
+    """Prompt token budget for one model call.
+
+    Attributes:
+        context_tokens: Model context window
+        reserved_output_tokens: Tokens kept free for the completion
+        counter: Token counter for the model
+    """
+
+    context_tokens: int
+    reserved_output_tokens: int = 0
+    counter: TokenCounter = field(default_factory=TokenCounter)
+
+    @classmethod
+    def for_model(cls, model: str | None, reserved_output_tokens: int = 0) -> "TokenBudget":
+        """Create a budget sized to a model's context window.
+
+        Args:
+            model: Model name
+            reserved_output_tokens: Tokens kept free for the completion
+
+        Returns:
+            Token budget
+        """
+        return cls(
+            context_tokens=context_window(model),
+            reserved_output_tokens=reserved_output_tokens,
+            counter=TokenCounter(model),
+        )
+
+    @classmethod
+    def for_client(cls, client: object, reserved_output_tokens: int = 0) -> "TokenBudget":
+        """Create a budget sized to the window a client's requests are served with.
+
+        Args:
+            client: LLM client (see client_context_window)
+            reserved_output_tokens: Tokens kept free for the completion
+
+        Returns:
+            Token budget
+        """
+        model = getattr(client, "model", None)
+        model = model if isinstance(model, str) else None
+        return cls(
+            context_tokens=client_context_window(client),
+            reserved_output_tokens=reserved_output_tokens,
+            counter=TokenCounter(model),
+        )
+
+    def remaining(self, *fixed_parts: str) -> int:
+        """Tokens left for variable content after the fixed prompt parts.
+
+        Args:
+            *fixed_parts: Prompt text that is always sent
+
+        Returns:
+            Available tokens (never negative)
+        """
+        used = sum(self.counter.count(part) for part in fixed_parts)
+        return max(0, self.context_tokens - self.reserved_output_tokens - used)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Shorten text to fit a token limit at a sentence boundary.
+
+        Args:
+            text: Text to shorten
+            max_tokens: Token limit
+
+        Returns:
+            Text within the limit (unchanged if it already fits)
+        """
+        return truncate_to_tokens(text, max_tokens, self.counter)
+
+    def pack(self, results: list[SearchResult], max_tokens: int) -> list[SearchResult]:
+        """Select the best-scoring sources that fit a token limit.
+
+        Sources are taken in descending similarity. The first one that does
+        not fit whole is truncated at a sentence boundary (or dropped if
+        too little room is left), and packing stops there.
+
+        Args:
+            results: Candidate sources
+            max_tokens: Tokens available for sources
+
+        Returns:
+            Packed sources in their original order; truncated ones are copies
+        """
+        chosen: dict[int, SearchResult] = {}
+        used = 0
+        by_score = sorted(range(len(results)), key=lambda i: -results[i].similarity_score)
+        for index in by_score:
+            result = results[index]
+            cost = self.counter.count(result.content) + SOURCE_OVERHEAD_TOKENS
+            if used + cost <= max_tokens:
+                chosen[index] = result
+                used += cost
+                continue
+
+            room = max_tokens - used - SOURCE_OVERHEAD_TOKENS
+            if room >= MIN_TRUNCATED_TOKENS:
+                truncated = copy.copy(result)
+                truncated.content = self.truncate(result.content, room)
+                chosen[index] = truncated
+            break
+
+        if len(chosen) < len(results):
+            logger.info(f"Packed {len(chosen)}/{len(results)} sources into {max_tokens} tokens")
+        return [chosen[index] for index in sorted(chosen)]
+
+
+@dataclass
+class PromptUsage:
+    """Token accounting for one LLM call.
+
+    Attributes:
+        label: What the call was for (e.g. the section title)
+        estimated_prompt_tokens: Prompt size counted before sending
+        prompt_tokens: Prompt size reported by the provider (0 if unknown)
+        completion_tokens: Completion size reported by the provider
+        context_tokens: Context window the prompt was budgeted against
+    """
+
+    label: str
+    estimated_prompt_tokens: int
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    context_tokens: int = 0
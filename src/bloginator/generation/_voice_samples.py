@@ -0,0 +1,226 @@
+"""Voice samples: passages of the author's own writing shown to the LLM.
+
+The samples come from a fixed set of voice-indicative queries plus one
+topical query. All queries run in a single batch search. Because the fixed
+queries never change, their results can be precomputed once per index and
+stored next to it, leaving only the topical query to run per draft.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from bloginator.generation._token_budget import TokenCounter, truncate_to_tokens
+from bloginator.indexing import index_fingerprint
+from bloginator.search import CorpusSearcher, SearchResult
+
+
+logger = logging.getLogger(__name__)
+
+# Queries that surface author-written narrative rather than reference material
+VOICE_QUERIES = (
+    "my experience leading teams",  # Personal narrative
+    "lessons learned from",  # Reflective writing
+    "how we approach",  # Organizational voice
+    "why this matters",  # Opinion/analysis
+    "what I've observed",  # Direct observation
+)
+
+# Results fetched per voice query
+RESULTS_PER_QUERY = 2
+
+# Token limit per sample shown in the prompt (about 150 words)
+VOICE_SAMPLE_TOKENS = 200
+
+# File in the index directory holding precomputed voice query results
+VOICE_SAMPLES_FILE = "voice_samples.json"
+
+# Filenames that indicate templates, transcripts or third-party content
+_SKIP_PATTERNS = (
+    "template",
+    "transcript",
+    "interview",
+    "questions",
+    "jd",  # Job descriptions
+    "sample",
+    "_po_",  # Product owner templates
+    "_sre_",  # SRE templates
+    "contractor",
+    "must-reads",  # HBR compilations
+    "recap -",  # Summary docs of third-party content
+    "stages of",  # Third-party frameworks
+)
+
+# Looser filter for the keyword fallback
+_FALLBACK_SKIP_PATTERNS = ("template", "transcript", "interview", "questions")
+
+
+def _result_to_dict(result: SearchResult) -> dict[str, Any]:
+    return {
+        "chunk_id": result.chunk_id,
+        "content": result.content,
+        "metadata": result.metadata,
+        "distance": result.distance,
+    }
+
+
+def precompute_voice_samples(searcher: CorpusSearcher) -> Path:
+    """Run the fixed voice queries and store their results with the index.
+
+    Re-run after re-indexing; stored results are ignored once the indexed
+    chunks change (see index_fingerprint).
+
+    Args:
+        searcher: Searcher for the index
+
+    Returns:
+        Path of the written file
+    """
+    results = searcher.batch_search(list(VOICE_QUERIES), n_results=RESULTS_PER_QUERY)
+    path = Path(searcher.index_dir) / VOICE_SAMPLES_FILE
+    path.write_text(
+        json.dumps(
+            {
+                "queries": list(VOICE_QUERIES),
+                "fingerprint": index_fingerprint(searcher.collection),
+                "results": [[_result_to_dict(r) for r in query] for query in results],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def load_precomputed_voice_results(searcher: CorpusSearcher) -> list[list[SearchResult]] | None:
+    """Load stored voice query results if they match the current index.
+
+    Args:
+        searcher: Searcher for the index
+
+    Returns:
+        Results per voice query, or None if absent, unreadable or stale
+    """
+    index_dir = getattr(searcher, "index_dir", None)
+    if not isinstance(index_dir, str | Path):
+        return None
+    path = Path(index_dir) / VOICE_SAMPLES_FILE
+    if not path.exists():
+        return None
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        current = index_fingerprint(searcher.collection)
+        if data["queries"] != list(VOICE_QUERIES) or data.get("fingerprint") != current:
+            logger.info(f"Ignoring stale precomputed voice samples in {path}")
+            return None
+        return [[SearchResult(**r) for r in query] for query in data["results"]]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable precomputed voice samples in {path}: {e}")
+        return None
+
+
+def _select_samples(
+    results_per_query: list[list[SearchResult]], num_samples: int
+) -> list[SearchResult]:
+    """Pick authentic, substantial, distinct passages in query order."""
+    samples: list[SearchResult] = []
+    seen_ids: set[str] = set()
+    for results in results_per_query:
+        for result in results:
+            filename = result.metadata.get("filename", "").lower()
+            if any(pattern in filename for pattern in _SKIP_PATTERNS):
+                continue
+            # Skip if chunk is too short (likely metadata/headers)
+            if len(result.content.split()) < 50:
+                continue
+            if result.chunk_id in seen_ids:
+                continue
+            seen_ids.add(result.chunk_id)
+            samples.append(result)
+            if len(samples) >= num_samples:
+                return samples
+    return samples
+
+
+def format_voice_samples(samples: list[SearchResult]) -> str:
+    """Format passages for inclusion in a prompt.
+
+    Args:
+        samples: Selected passages
+
+    Returns:
+        Numbered samples, each trimmed at a sentence boundary to about 150
+        words, with their source file
+    """
+    counter = TokenCounter()
+    sample_parts = []
+    for i, sample in enumerate(samples, 1):
+        # Limit length for brevity
+        content = truncate_to_tokens(sample.content, VOICE_SAMPLE_TOKENS, counter)
+        if content != sample.content:
+            content += "..."
+
+        # Include filename for transparency
+        filename = sample.metadata.get("filename", "unknown")
+        sample_parts.append(f"[Sample {i} - from {filename}]\n{content}\n")
+
+    return "\n".join(sample_parts)
+
+
+def get_voice_samples(searcher: CorpusSearcher, keywords: list[str], num_samples: int = 3) -> str:
+    """Fetch author-written voice samples from corpus to help LLM emulate style.
+
+    Prioritizes documents that represent the author's authentic voice:
+    - Essays, guides, and analysis docs (not interview transcripts)
+    - Documents with clear narrative structure (not templates or specs)
+    - Content with distinct writing style (not third-party or academic text)
+
+    The topical query and the fixed voice queries run as one batch search;
+    when precomputed results are stored with the index, only the topical
+    query is run.
+
+    Args:
+        searcher: Corpus searcher to use
+        keywords: Keywords for topical context
+        num_samples: Number of diverse samples to fetch (default: 3)
+
+    Returns:
+        Formatted voice samples string for inclusion in prompt
+    """
+    try:
+        # One topically relevant query comes first for context
+        topical = [f"{keywords[0]} best practices"] if keywords else []
+        precomputed = load_precomputed_voice_results(searcher)
+        if precomputed is None:
+            results_per_query = searcher.batch_search(
+                topical + list(VOICE_QUERIES), n_results=RESULTS_PER_QUERY
+            )
+        else:
+            topical_results = (
+                searcher.batch_search(topical, n_results=RESULTS_PER_QUERY) if topical else []
+            )
+            results_per_query = topical_results + precomputed
+
+        samples = _select_samples(results_per_query, num_samples)
+
+        if not samples:
+            logger.warning("No high-quality voice samples found - falling back to keyword search")
+            # Fallback: use keyword search but still filter templates
+            if keywords:
+                results = searcher.search(keywords[0], n_results=num_samples * 2)
+                for result in results:
+                    filename = result.metadata.get("filename", "").lower()
+                    if not any(p in filename for p in _FALLBACK_SKIP_PATTERNS):
+                        samples.append(result)
+                        if len(samples) >= num_samples:
+                            break
+
+        if not samples:
+            return ""
+
+        return format_voice_samples(samples[:num_samples])
+
+    except Exception as e:
+        logger.warning(f"Failed to fetch voice samples: {e}")
+        return ""
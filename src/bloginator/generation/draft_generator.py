@@ -5,18 +5,27 @@ import time
 from collections.abc import Callable
 
 from bloginator.config import Config
-from bloginator.generation._section_refiner import (
-    build_source_context,
-    create_citations,
-    get_voice_samples,
-    refine_section,
+from bloginator.generation._generation_context import GenerationContext
+from bloginator.generation._retrieval_plan import prefetch_sources
+from bloginator.generation._section_generation import (
+    SectionRequest,
+    complete_section,
+    generate_concurrently,
+    generate_sequentially,
+    prepare_section_request,
+)
+from bloginator.generation._section_refiner import get_voice_samples, refine_section
+from bloginator.generation._token_budget import (
+    PromptUsage,
+    TokenBudget,
+    TokenCounter,
+    client_context_window,
 )
 from bloginator.generation.llm_client import LLMClient
 from bloginator.models.draft import Draft, DraftSection
 from bloginator.models.outline import Outline, OutlineSection
 from bloginator.prompts.loader import PromptLoader
 from bloginator.search import CorpusSearcher, SearchResult
-from bloginator.search.validators import validate_search_results
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +41,11 @@ class DraftGenerator:
         llm_client: LLM client for text generation
         searcher: Corpus searcher for RAG
         sources_per_section: Number of sources to retrieve per section (reduced to 3 for brevity)
+        max_concurrency: Maximum LLM requests in flight at once (1 = sequential)
+        prompt_usage: Prompt token accounting for each LLM call of the last draft
+        context: Optional per-request context that remembers voice samples
+        max_source_uses: Sections a retrieved chunk may be a source for in one
+            draft (0 = unlimited)
     """
 
     def __init__(
@@ -40,6 +54,9 @@ class DraftGenerator:
         searcher: CorpusSearcher,
         sources_per_section: int = 3,
         prompt_loader: PromptLoader | None = None,
+        max_concurrency: int = 1,
+        context: GenerationContext | None = None,
+        max_source_uses: int | None = None,
     ):
         """Initialize draft generator.
 
@@ -48,11 +65,34 @@ class DraftGenerator:
             searcher: Corpus searcher for RAG
             sources_per_section: Sources to retrieve per section (default: 3, reduced from 5)
             prompt_loader: Prompt loader (creates default if None)
+            max_concurrency: Maximum LLM requests in flight at once. Values above 1
+                generate sections concurrently; the LLM client must be thread-safe.
+            context: Per-request context shared with other attempts; voice
+                samples then come from it (pass context.searcher as searcher
+                to share searches too)
+            max_source_uses: Sections a retrieved chunk may be a source for;
+                sources are then planned across the whole outline from an
+                over-fetched search (0 = unlimited, each section keeps its own
+                top results; default: Config.DRAFT_SOURCE_MAX_USES)
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_source_uses is None:
+            max_source_uses = Config.DRAFT_SOURCE_MAX_USES
+        if max_source_uses < 0:
+            raise ValueError("max_source_uses must not be negative")
+
         self.llm_client = llm_client
         self.searcher = searcher
         self.sources_per_section = sources_per_section
         self.prompt_loader = prompt_loader or PromptLoader()
+        self.max_concurrency = max_concurrency
+        self.context = context
+        self.max_source_uses = max_source_uses
+        # Voice samples depend only on the keywords; computed once per draft
+        self._voice_samples: dict[tuple[str, ...], str] = {}
+        self._token_counter: TokenCounter | None = None
+        self.prompt_usage: list[PromptUsage] = []
 
     def generate(
         self,
@@ -60,14 +100,25 @@ class DraftGenerator:
         temperature: float = 0.7,
         max_section_words: int = 70,
         progress_callback: Callable[[str, int, int], None] | None = None,
+        token_callback: Callable[[str, str], None] | None = None,
     ) -> Draft:
         """Generate draft from outline.
 
+        With max_concurrency > 1, section prompts are built up front and the
+        LLM calls run on a thread pool; sections are reassembled in outline
+        order and progress is still reported from the calling thread, in
+        outline order, as each section starts.
+
+        With a token_callback, section text is streamed from the LLM and each
+        delta is passed on as it arrives. Under concurrency the callback runs
+        on worker threads and deltas of different sections interleave.
+
         Args:
             outline: Outline to generate from
             temperature: LLM sampling temperature
             max_section_words: Target words per section
             progress_callback: Optional callback(message, current, total) for progress updates
+            token_callback: Optional callback(section_title, delta) for streamed text
 
         Returns:
             Draft with generated content and citations
@@ -80,58 +131,55 @@ class DraftGenerator:
             >>> print(f"Citations: {draft.total_citations}")
         """
         start_time = time.time()
+        self._voice_samples.clear()
+        self.prompt_usage = []
 
-        # Count total sections for progress tracking
         total_sections = len(outline.get_all_sections())
-        current_section = 0
 
         # Pre-fetch all search results using batch search for better performance
-        all_sections = outline.get_all_sections()
-        queries = [
-            f"{section.title} {section.description} {' '.join(outline.keywords[:2])}"
-            for section in all_sections
-        ]
-
-        if progress_callback:
-            progress_callback(
-                f"Pre-fetching corpus results for {len(queries)} sections...",
-                0,
-                total_sections,
-            )
-
-        batch_results = self.searcher.batch_search(
-            queries=queries,
-            n_results=self.sources_per_section,
+        search_cache = prefetch_sources(
+            self.searcher,
+            outline,
+            self.sources_per_section,
+            self.max_source_uses,
+            progress_callback,
         )
 
-        # Create a mapping from section ID to search results
-        # Use id() as key since OutlineSection is not hashable
-        search_cache = {
-            id(section): results
-            for section, results in zip(all_sections, batch_results, strict=False)
-        }
-
-        # Generate sections from outline
-        sections = []
-        for outline_section in outline.sections:
-            draft_section = self._generate_section(
-                outline_section=outline_section,
+        def prepare(section: OutlineSection, max_words: int, position: int) -> SectionRequest:
+            return self._prepare_section(
+                outline_section=section,
                 keywords=outline.keywords,
                 classification=outline.classification,
                 audience=outline.audience,
-                temperature=temperature,
-                max_words=max_section_words,
+                max_words=max_words,
                 progress_callback=progress_callback,
-                current_section=current_section,
+                current_section=position,
                 total_sections=total_sections,
                 search_cache=search_cache,
+                # Concurrent dispatch reports each section as its call starts
+                report_generation=self.max_concurrency == 1,
+            )
+
+        def complete(request: SectionRequest) -> str:
+            return self._complete_section(request, temperature, token_callback)
+
+        if self.max_concurrency > 1:
+            # Searches and prompts stay on this thread; LLM calls go to a pool
+            sections = generate_concurrently(
+                outline=outline,
+                max_section_words=max_section_words,
+                prepare=prepare,
+                complete=complete,
+                max_concurrency=self.max_concurrency,
+                progress_callback=progress_callback,
+                total_sections=total_sections,
+            )
+        else:
+            sections = generate_sequentially(
+                outline.sections, max_section_words, 0, prepare, complete
             )
-            # Update counter (section + all its subsections)
-            current_section += len(outline_section.get_all_sections())
-            sections.append(draft_section)
 
         # Create draft with timing
-        generation_time = time.time() - start_time
         draft = Draft(
             title=outline.title,
             thesis=outline.thesis,
@@ -139,7 +187,7 @@ class DraftGenerator:
             audience=outline.audience,
             keywords=outline.keywords,
             sections=sections,
-            generation_time_seconds=generation_time,
+            generation_time_seconds=time.time() - start_time,
         )
 
         # Calculate statistics
@@ -159,166 +207,129 @@ class DraftGenerator:
         current_section: int = 0,
         total_sections: int = 1,
         search_cache: dict[int, list[SearchResult]] | None = None,
+        token_callback: Callable[[str, str], None] | None = None,
     ) -> DraftSection:
-        """Generate content for a single section with RAG."""
+        """Generate content for a single section and its subsections with RAG."""
+        (section,) = generate_sequentially(
+            [outline_section],
+            max_words,
+            current_section,
+            prepare=lambda section, words, position: self._prepare_section(
+                outline_section=section,
+                keywords=keywords,
+                classification=classification,
+                audience=audience,
+                max_words=words,
+                progress_callback=progress_callback,
+                current_section=position,
+                total_sections=total_sections,
+                search_cache=search_cache,
+            ),
+            complete=lambda request: self._complete_section(request, temperature, token_callback),
+        )
+        return section
+
+    def _prepare_section(
+        self,
+        outline_section: OutlineSection,
+        keywords: list[str],
+        classification: str,
+        audience: str,
+        max_words: int,
+        progress_callback: Callable[[str, int, int], None] | None,
+        current_section: int,
+        total_sections: int,
+        search_cache: dict[int, list[SearchResult]] | None,
+        report_generation: bool = True,
+    ) -> SectionRequest:
+        """Retrieve sources and build the prompts for one section.
+
+        Args:
+            outline_section: Section to prepare
+            keywords: Document keywords for context
+            classification: Content classification for tone
+            audience: Target audience
+            max_words: Target word count
+            progress_callback: Optional callback for progress updates
+            current_section: Section number for progress (0-based)
+            total_sections: Total number of sections
+            search_cache: Optional pre-fetched search results cache
+            report_generation: Report "Generating content" progress here
+
+        Returns:
+            Prepared request with prompts and citations
+        """
         # Get search results from cache or perform search
         section_id = id(outline_section)
         if search_cache and section_id in search_cache:
             search_results = search_cache[section_id]
         else:
-            # Report progress
             if progress_callback:
                 progress_callback(
                     f"Searching corpus for: {outline_section.title}",
                     current_section,
                     total_sections,
                 )
-
-            # Search corpus for relevant content
             query = (
                 f"{outline_section.title} {outline_section.description} "
                 f"{' '.join(keywords[:2])}"
             )
+            search_results = self.searcher.search(query=query, n_results=self.sources_per_section)
 
-            search_results = self.searcher.search(
-                query=query,
-                n_results=self.sources_per_section,
-            )
-
-        # Validate and filter search results
-        filtered_results, validation_warnings = validate_search_results(
-            search_results, expected_keywords=keywords
-        )
-        for warning in validation_warnings:
-            logger.warning(f"Draft generation validation warning: {warning}")
-
-        # Report progress
-        if progress_callback:
+        if progress_callback and report_generation:
             progress_callback(
                 f"Generating content for: {outline_section.title}",
                 current_section,
                 total_sections,
             )
 
-        # Build context from filtered search results
-        source_context = build_source_context(filtered_results)
-
-        # Load prompt template from external YAML file
-        prompt_template = self.prompt_loader.load("draft/base.yaml")
-
-        # Get classification and audience context from template
-        classification_contexts = prompt_template.parameters.get("classification_contexts", {})
-        audience_contexts = prompt_template.parameters.get("audience_contexts", {})
-
-        classification_guidance = classification_contexts.get(
-            classification, "Provide helpful guidance"
-        )
-        audience_context = audience_contexts.get(audience, "general professional audience")
-
-        # Fetch voice samples from corpus to help LLM emulate author's style
-        voice_samples = get_voice_samples(self.searcher, keywords)
-
-        # Render system prompt with context, voice samples, and company branding
-        system_prompt = prompt_template.render_system_prompt(
-            classification_guidance=classification_guidance,
-            audience_context=audience_context,
-            voice_samples=voice_samples,
-            company_name=Config.COMPANY_NAME,
-            company_possessive=Config.COMPANY_POSSESSIVE,
-        )
-
-        # Render user prompt with variables
-        user_prompt = prompt_template.render_user_prompt(
-            title=outline_section.title,
-            description=outline_section.description,
-            max_words=max_words,
-            source_context=source_context,
-        )
-
-        response = self.llm_client.generate(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_tokens=max_words * 2,  # Rough token estimate
-        )
-
-        # Create citations from filtered search results
-        citations = create_citations(filtered_results, max_citations=5)
-
-        # Generate subsections recursively
-        subsections = self._generate_subsections(
+        return prepare_section_request(
             outline_section=outline_section,
+            search_results=search_results,
             keywords=keywords,
             classification=classification,
             audience=audience,
-            temperature=temperature,
             max_words=max_words,
-            progress_callback=progress_callback,
-            current_section=current_section,
-            total_sections=total_sections,
-            search_cache=search_cache,
+            position=current_section,
+            prompt_loader=self.prompt_loader,
+            # Voice samples from the corpus help the LLM emulate the author's style
+            voice_samples=self._get_voice_samples(keywords),
+            token_budget=self._token_budget,
         )
 
-        return DraftSection(
-            title=outline_section.title,
-            content=response.content.strip(),
-            citations=citations,
-            subsections=subsections,
+    def _token_budget(self, max_tokens: int) -> TokenBudget:
+        """Prompt budget for the client's model, reserving max_tokens for output."""
+        model = getattr(self.llm_client, "model", None)
+        model = model if isinstance(model, str) else None
+        if self._token_counter is None or self._token_counter.model != model:
+            self._token_counter = TokenCounter(model)
+        return TokenBudget(
+            context_tokens=client_context_window(self.llm_client),
+            reserved_output_tokens=max_tokens,
+            counter=self._token_counter,
         )
 
-    def _generate_subsections(
-        self,
-        outline_section: OutlineSection,
-        keywords: list[str],
-        classification: str,
-        audience: str,
-        temperature: float,
-        max_words: int,
-        progress_callback: Callable[[str, int, int], None] | None,
-        current_section: int,
-        total_sections: int,
-        search_cache: dict[int, list[SearchResult]] | None,
-    ) -> list[DraftSection]:
-        """Generate subsections recursively.
-
-        Args:
-            outline_section: Parent section from outline
-            keywords: Document keywords for context
-            classification: Content classification for tone
-            audience: Target audience
-            temperature: LLM temperature
-            max_words: Target word count for parent
-            progress_callback: Optional callback for progress updates
-            current_section: Current section number (0-based)
-            total_sections: Total number of sections
-            search_cache: Optional pre-fetched search results cache
-
-        Returns:
-            List of generated DraftSection objects for subsections
-        """
-        subsections = []
-        subsection_offset = current_section + 1
-
-        for i, outline_subsection in enumerate(outline_section.subsections):
-            # Calculate offset for this subsection
-            subsection_current = subsection_offset + sum(
-                len(outline_section.subsections[j].get_all_sections()) for j in range(i)
+    def _get_voice_samples(self, keywords: list[str]) -> str:
+        """Return the voice-sample block for these keywords, searching only once."""
+        if self.context is not None:
+            return self.context.voice_samples(
+                keywords, lambda: get_voice_samples(self.searcher, keywords)
             )
-            draft_subsection = self._generate_section(
-                outline_subsection,
-                keywords,
-                classification,
-                audience,
-                temperature,
-                max_words // 2,  # Subsections get less content
-                progress_callback=progress_callback,
-                current_section=subsection_current,
-                total_sections=total_sections,
-                search_cache=search_cache,
-            )
-            subsections.append(draft_subsection)
+        key = tuple(keywords)
+        if key not in self._voice_samples:
+            self._voice_samples[key] = get_voice_samples(self.searcher, keywords)
+        return self._voice_samples[key]
 
-        return subsections
+    def _complete_section(
+        self,
+        request: SectionRequest,
+        temperature: float,
+        token_callback: Callable[[str, str], None] | None = None,
+    ) -> str:
+        """Run the LLM call for a prepared section, recording its prompt usage."""
+        return complete_section(
+            self.llm_client, request, temperature, token_callback, self.prompt_usage
+        )
 
     def refine_section(
         self,
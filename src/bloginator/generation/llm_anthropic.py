@@ -1,10 +1,15 @@
 """Anthropic Claude LLM client implementation."""
 
 import os
+from collections.abc import Iterator
+from typing import Any
 
+from bloginator.generation._llm_scheduler import estimate_request_tokens, get_scheduler
 from bloginator.generation.llm_base import (
     LLMClient,
+    LLMProvider,
     LLMResponse,
+    StreamUsage,
     print_llm_request,
     print_llm_response,
 )
@@ -21,6 +26,7 @@ class AnthropicClient(LLMClient):
         api_key: Anthropic API key
         timeout: Request timeout in seconds
         verbose: Whether to print requests/responses
+        scheduler: Rate limiter and retry policy shared by all Anthropic clients
     """
 
     def __init__(
@@ -59,8 +65,9 @@ class AnthropicClient(LLMClient):
                 "variable or pass api_key parameter."
             )
 
-        # Initialize Anthropic client
-        self.client = anthropic.Anthropic(api_key=self.api_key, timeout=timeout)
+        # Initialize Anthropic client; retries are left to the shared scheduler
+        self.client = anthropic.Anthropic(api_key=self.api_key, timeout=timeout, max_retries=0)
+        self.scheduler = get_scheduler(LLMProvider.ANTHROPIC.value)
 
     def generate(
         self,
@@ -89,21 +96,13 @@ class AnthropicClient(LLMClient):
             print_llm_request(f"Anthropic - {self.model}", full_prompt)
 
         try:
-            # Build message
-            from typing import Any
-
-            kwargs: dict[str, Any] = {
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "messages": [{"role": "user", "content": prompt}],
-            }
-
-            if system_prompt:
-                kwargs["system"] = system_prompt
+            kwargs = self._request_kwargs(prompt, temperature, max_tokens, system_prompt)
 
             # Call API
-            response = self.client.messages.create(**kwargs)
+            response = self.scheduler.call(
+                lambda: self.client.messages.create(**kwargs),
+                estimate_request_tokens(prompt, system_prompt, max_tokens),
+            )
 
             # Extract content
             content = response.content[0].text
@@ -127,6 +126,74 @@ class AnthropicClient(LLMClient):
         except Exception as e:
             raise ValueError(f"Anthropic generation failed: {e}") from e
 
+    def _request_kwargs(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str | None,
+    ) -> dict[str, Any]:
+        """Build Messages API arguments."""
+        kwargs: dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system_prompt:
+            kwargs["system"] = system_prompt
+        return kwargs
+
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> Iterator[str]:
+        """Generate text using Claude, yielding tokens as they arrive.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas
+
+        Raises:
+            ValueError: If generation fails
+        """
+        if self.verbose:
+            full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+            print_llm_request(f"Anthropic - {self.model}", full_prompt)
+
+        kwargs = self._request_kwargs(prompt, temperature, max_tokens, system_prompt)
+
+        def open_stream() -> Iterator[str]:
+            with self.client.messages.stream(**kwargs) as response:
+                yield from response.text_stream
+                if usage is not None:
+                    final = response.get_final_message()
+                    usage.record(final.usage.input_tokens, final.usage.output_tokens)
+                    usage.record_finish_reason(final.stop_reason)
+
+        received = []
+        try:
+            for text in self.scheduler.stream(
+                open_stream, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            ):
+                received.append(text)
+                yield text
+        except Exception as e:
+            raise ValueError(f"Anthropic generation failed: {e}") from e
+
+        if self.verbose:
+            print_llm_response("".join(received))
+
     def is_available(self) -> bool:
         """Check if Anthropic API is available.
 
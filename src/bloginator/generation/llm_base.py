@@ -1,7 +1,10 @@
 """Base classes and types for LLM clients."""
 
+import asyncio
 import sys
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -63,8 +66,54 @@ class LLMResponse:
         self.finish_reason = finish_reason
 
 
+@dataclass
+class StreamUsage:
+    """Token counts for a streamed response.
+
+    Pass one as ``usage`` to stream()/astream(); the client fills it in once
+    the stream ends. Counts stay 0 if the provider does not report them.
+
+    Attributes:
+        prompt_tokens: Number of tokens in the prompt
+        completion_tokens: Number of tokens in the completion
+        finish_reason: Reason generation stopped, as reported ("stop" if not)
+    """
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    finish_reason: str = "stop"
+
+    def record(self, prompt_tokens: object, completion_tokens: object) -> None:
+        """Store counts as reported, ignoring any that are not integers.
+
+        Args:
+            prompt_tokens: Reported prompt token count
+            completion_tokens: Reported completion token count
+        """
+        if isinstance(prompt_tokens, int):
+            self.prompt_tokens = prompt_tokens
+        if isinstance(completion_tokens, int):
+            self.completion_tokens = completion_tokens
+
+    def record_finish_reason(self, finish_reason: object) -> None:
+        """Store the reason generation stopped, ignoring empty or non-string values.
+
+        Args:
+            finish_reason: Reported finish reason (e.g. "stop", "length")
+        """
+        if isinstance(finish_reason, str) and finish_reason:
+            self.finish_reason = finish_reason
+
+
 class LLMClient(ABC):
-    """Abstract base class for LLM clients."""
+    """Abstract base class for LLM clients.
+
+    Subclasses implement the synchronous ``generate``. Clients with a native
+    async transport also override ``agenerate``; for the rest it runs
+    ``generate`` in a worker thread so it never blocks the event loop.
+    Clients whose API can stream override ``stream``/``astream``; the
+    defaults deliver the whole response as a single delta.
+    """
 
     @abstractmethod
     def generate(
@@ -91,6 +140,100 @@ class LLMClient(ABC):
         """
         pass
 
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate text from prompt without blocking the event loop.
+
+        Args:
+            prompt: User prompt/instruction
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system/instruction prompt
+
+        Returns:
+            LLMResponse with generated content
+
+        Raises:
+            ConnectionError: If unable to connect to LLM service
+            ValueError: If generation fails
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+        )
+
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> Iterator[str]:
+        """Generate text from prompt, yielding it as it is produced.
+
+        Args:
+            prompt: User prompt/instruction
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system/instruction prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas; joined they form the full response
+
+        Raises:
+            ConnectionError: If unable to connect to LLM service
+            ValueError: If generation fails
+        """
+        response = self.generate(
+            prompt, temperature=temperature, max_tokens=max_tokens, system_prompt=system_prompt
+        )
+        if usage is not None:
+            usage.record(response.prompt_tokens, response.completion_tokens)
+            usage.record_finish_reason(response.finish_reason)
+        yield response.content
+
+    async def astream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> AsyncIterator[str]:
+        """Generate text from prompt, yielding it as it is produced, asynchronously.
+
+        Args:
+            prompt: User prompt/instruction
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system/instruction prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas; joined they form the full response
+
+        Raises:
+            ConnectionError: If unable to connect to LLM service
+            ValueError: If generation fails
+        """
+        response = await self.agenerate(
+            prompt, temperature=temperature, max_tokens=max_tokens, system_prompt=system_prompt
+        )
+        if usage is not None:
+            usage.record(response.prompt_tokens, response.completion_tokens)
+            usage.record_finish_reason(response.finish_reason)
+        yield response.content
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if LLM service is available.
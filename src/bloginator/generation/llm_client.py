@@ -11,6 +11,15 @@ import os
 from typing import Any
 
 # Re-export client implementations
+from bloginator.generation._llm_cache import CachingLLMClient, LLMCacheStats, LLMResponseCache
+from bloginator.generation._llm_coalesce import CoalescingLLMClient, CoalescingStats, SingleFlight
+from bloginator.generation._llm_scheduler import (
+    LLMScheduler,
+    ProviderLimits,
+    SchedulerMetrics,
+    get_scheduler,
+    scheduler_metrics,
+)
 from bloginator.generation.llm_anthropic import AnthropicClient
 
 # Re-export base classes and types
@@ -18,6 +27,7 @@ from bloginator.generation.llm_base import (
     LLMClient,
     LLMProvider,
     LLMResponse,
+    StreamUsage,
     print_llm_request,
     print_llm_response,
 )
@@ -89,11 +99,23 @@ __all__ = [
     "LLMClient",
     "LLMProvider",
     "LLMResponse",
+    "StreamUsage",
     "OllamaClient",
     "CustomLLMClient",
     "AnthropicClient",
     "MockLLMClient",
     "InteractiveLLMClient",
+    "CachingLLMClient",
+    "LLMCacheStats",
+    "LLMResponseCache",
+    "CoalescingLLMClient",
+    "CoalescingStats",
+    "SingleFlight",
+    "LLMScheduler",
+    "ProviderLimits",
+    "SchedulerMetrics",
+    "get_scheduler",
+    "scheduler_metrics",
     "create_llm_client",
     "print_llm_request",
     "print_llm_response",
@@ -1,12 +1,20 @@
 """Custom/OpenAI-compatible LLM client implementation."""
 
 import json
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from typing import Any
 
+import httpx
 import requests
 
+from bloginator.generation._http_pool import get_async_http_client, get_http_session
+from bloginator.generation._llm_scheduler import estimate_request_tokens, get_scheduler
 from bloginator.generation.llm_base import (
     LLMClient,
+    LLMProvider,
     LLMResponse,
+    StreamUsage,
     print_llm_request,
     print_llm_response,
 )
@@ -25,6 +33,7 @@ class CustomLLMClient(LLMClient):
         api_key: Optional API key for authentication
         headers: Custom headers for requests
         timeout: Request timeout in seconds
+        scheduler: Rate limiter and retry policy shared by clients of this server
     """
 
     def __init__(
@@ -51,6 +60,7 @@ class CustomLLMClient(LLMClient):
         self.api_key = api_key
         self.timeout = timeout if timeout is not None else timeout_config.LLM_REQUEST_TIMEOUT
         self.verbose = verbose
+        self.scheduler = get_scheduler(LLMProvider.CUSTOM.value, self.base_url)
 
         # Build headers
         self.headers = {"Content-Type": "application/json"}
@@ -59,6 +69,102 @@ class CustomLLMClient(LLMClient):
         if headers:
             self.headers.update(headers)
 
+    def _prepare(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str | None,
+    ) -> dict[str, Any]:
+        """Build the chat completion payload, echoing it if verbose."""
+        # Build messages
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        # Display request if verbose
+        if self.verbose:
+            full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+            print_llm_request(f"Custom - {self.model}", full_prompt)
+
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": False,
+        }
+
+    def _parse(self, data: dict[str, Any]) -> LLMResponse:
+        """Turn a decoded chat completion response into an LLMResponse."""
+        # Extract content from OpenAI-compatible response
+        content = data["choices"][0]["message"]["content"]
+
+        # Extract token usage if available
+        usage = data.get("usage", {})
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+
+        # Display response if verbose
+        if self.verbose:
+            print_llm_response(content)
+
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            finish_reason=data["choices"][0].get("finish_reason", "stop"),
+        )
+
+    @contextmanager
+    def _translate_errors(self) -> Iterator[None]:
+        """Map transport and decoding failures to the documented exceptions."""
+        try:
+            yield
+        except (requests.exceptions.ConnectionError, httpx.ConnectError) as e:
+            raise ConnectionError(
+                f"Unable to connect to custom LLM at {self.base_url}. Is the service running?"
+            ) from e
+        except (requests.exceptions.Timeout, httpx.TimeoutException) as e:
+            raise ConnectionError(f"Request to custom LLM timed out after {self.timeout}s") from e
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection to custom LLM at {self.base_url} failed: {e}") from e
+        except (requests.exceptions.HTTPError, httpx.HTTPStatusError) as e:
+            raise ValueError(f"Custom LLM generation failed: {e}") from e
+        except (KeyError, IndexError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid response from custom LLM: {e}") from e
+
+    @staticmethod
+    def _stream_delta(line: str | bytes, usage: StreamUsage | None = None) -> str | None:
+        """Decode one server-sent-events line of a streamed completion.
+
+        Args:
+            line: Response line
+            usage: Receives the finish reason, and token counts for servers
+                that report them (OpenAI-style "usage" on the last chunk)
+
+        Returns:
+            Text delta ("" for non-content lines), or None at end of stream
+        """
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.startswith("data:"):
+            return ""
+        data = line[len("data:") :].strip()
+        if data == "[DONE]":
+            return None
+        chunk = json.loads(data)
+        if usage is not None and isinstance(chunk.get("usage"), dict):
+            usage.record(
+                chunk["usage"].get("prompt_tokens"), chunk["usage"].get("completion_tokens")
+            )
+        choices = chunk.get("choices") or [{}]
+        if usage is not None:
+            usage.record_finish_reason(choices[0].get("finish_reason"))
+        return str(choices[0].get("delta", {}).get("content") or "")
+
     def generate(
         self,
         prompt: str,
@@ -68,7 +174,9 @@ class CustomLLMClient(LLMClient):
     ) -> LLMResponse:
         """Generate text using custom endpoint.
 
-        Uses OpenAI-compatible chat completion API format.
+        Uses OpenAI-compatible chat completion API format, over the shared
+        keep-alive session for this server. Throttled and transient server
+        errors are retried by the scheduler.
 
         Args:
             prompt: User prompt
@@ -84,66 +192,156 @@ class CustomLLMClient(LLMClient):
             ValueError: If generation fails
         """
         url = f"{self.base_url}/chat/completions"
+        payload = self._prepare(prompt, temperature, max_tokens, system_prompt)
 
-        # Build messages
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        def send() -> LLMResponse:
+            response = get_http_session(self.base_url).post(
+                url, json=payload, headers=self.headers, timeout=self.timeout
+            )
+            response.raise_for_status()
+            return self._parse(response.json())
 
-        # Build full prompt for display
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
+        with self._translate_errors():
+            return self.scheduler.call(
+                send, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            )
 
-        # Display request if verbose
-        if self.verbose:
-            print_llm_request(f"Custom - {self.model}", full_prompt)
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate text using custom endpoint on the running event loop.
 
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "stream": False,
-        }
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
 
-        try:
-            response = requests.post(url, json=payload, headers=self.headers, timeout=self.timeout)
+        Returns:
+            LLMResponse with generated content
+
+        Raises:
+            ConnectionError: If unable to connect to endpoint
+            ValueError: If generation fails
+        """
+        url = f"{self.base_url}/chat/completions"
+        payload = self._prepare(prompt, temperature, max_tokens, system_prompt)
+
+        async def send() -> LLMResponse:
+            response = await get_async_http_client().post(
+                url, json=payload, headers=self.headers, timeout=self.timeout
+            )
             response.raise_for_status()
+            return self._parse(response.json())
 
-            data = response.json()
+        with self._translate_errors():
+            return await self.scheduler.acall(
+                send, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            )
 
-            # Extract content from OpenAI-compatible response
-            content = data["choices"][0]["message"]["content"]
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> Iterator[str]:
+        """Generate text using custom endpoint, yielding tokens as they arrive.
 
-            # Extract token usage if available
-            usage = data.get("usage", {})
-            prompt_tokens = usage.get("prompt_tokens", 0)
-            completion_tokens = usage.get("completion_tokens", 0)
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
 
-            # Display response if verbose
-            if self.verbose:
-                print_llm_response(content)
+        Yields:
+            Text deltas
 
-            return LLMResponse(
-                content=content,
-                model=self.model,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                finish_reason=data["choices"][0].get("finish_reason", "stop"),
-            )
+        Raises:
+            ConnectionError: If unable to connect to endpoint
+            ValueError: If generation fails
+        """
+        url = f"{self.base_url}/chat/completions"
+        payload = {**self._prepare(prompt, temperature, max_tokens, system_prompt), "stream": True}
+        received = []
 
-        except requests.exceptions.ConnectionError as e:
-            raise ConnectionError(
-                f"Unable to connect to custom LLM at {self.base_url}. Is the service running?"
-            ) from e
-        except requests.exceptions.Timeout as e:
-            raise ConnectionError(f"Request to custom LLM timed out after {self.timeout}s") from e
-        except requests.exceptions.HTTPError as e:
-            raise ValueError(f"Custom LLM generation failed: {e}") from e
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
-            raise ValueError(f"Invalid response from custom LLM: {e}") from e
+        def open_stream() -> Iterator[str]:
+            with get_http_session(self.base_url).post(
+                url, json=payload, headers=self.headers, timeout=self.timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    delta = self._stream_delta(line, usage)
+                    if delta is None:
+                        break
+                    if delta:
+                        yield delta
+
+        with self._translate_errors():
+            for delta in self.scheduler.stream(
+                open_stream, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            ):
+                received.append(delta)
+                yield delta
+
+        if self.verbose:
+            print_llm_response("".join(received))
+
+    async def astream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> AsyncIterator[str]:
+        """Generate text using custom endpoint on the running event loop, yielding tokens.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas
+
+        Raises:
+            ConnectionError: If unable to connect to endpoint
+            ValueError: If generation fails
+        """
+        url = f"{self.base_url}/chat/completions"
+        payload = {**self._prepare(prompt, temperature, max_tokens, system_prompt), "stream": True}
+        received = []
+
+        async def open_stream() -> AsyncIterator[str]:
+            async with get_async_http_client().stream(
+                "POST", url, json=payload, headers=self.headers, timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    delta = self._stream_delta(line, usage)
+                    if delta is None:
+                        break
+                    if delta:
+                        yield delta
+
+        with self._translate_errors():
+            async for delta in self.scheduler.astream(
+                open_stream, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            ):
+                received.append(delta)
+                yield delta
+
+        if self.verbose:
+            print_llm_response("".join(received))
 
     def is_available(self) -> bool:
         """Check if custom endpoint is available.
@@ -154,7 +352,7 @@ class CustomLLMClient(LLMClient):
         try:
             # Try to hit the models endpoint
             url = f"{self.base_url}/models"
-            response = requests.get(
+            response = get_http_session(self.base_url).get(
                 url, headers=self.headers, timeout=timeout_config.MODEL_AVAILABILITY_TIMEOUT
             )
             return bool(response.status_code == 200)
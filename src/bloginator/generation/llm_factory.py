@@ -7,6 +7,8 @@ environment variables from the config module.
 from typing import Any
 
 from bloginator.config import config
+from bloginator.generation._llm_cache import CachingLLMClient, LLMResponseCache
+from bloginator.generation._llm_coalesce import CoalescingLLMClient
 from bloginator.generation.llm_client import (
     AnthropicClient,
     CustomLLMClient,
@@ -30,16 +32,43 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 
+def create_llm_cache() -> LLMResponseCache:
+    """Open the LLM response cache configured in the environment.
+
+    Returns:
+        Response cache under config.llm_cache_dir
+    """
+    return LLMResponseCache(
+        config.llm_cache_dir / "responses.sqlite",
+        ttl_seconds=config.LLM_CACHE_TTL,
+        max_entries=config.LLM_CACHE_MAX_ENTRIES,
+    )
+
+
 def create_llm_from_config(
-    verbose: bool = False, batch_mode: bool = False, batch_timeout: int = 1800
+    verbose: bool = False,
+    batch_mode: bool = False,
+    batch_timeout: int = 1800,
+    use_cache: bool = False,
+    coalesce: bool = False,
 ) -> LLMClient:
     """Create LLM client from environment configuration.
 
     Reads configuration from environment variables (via config module)
-    and creates the appropriate LLM client.
+    and creates the appropriate LLM client. HTTP-backed clients share one
+    keep-alive connection pool per server, so every client created during a
+    run reuses the same connections.
 
     Args:
         verbose: Show LLM request/response interactions
+        batch_mode: Enable batch mode for the assistant client
+        batch_timeout: Timeout in seconds for batch mode
+        use_cache: Answer repeated requests from the response cache (see
+            create_llm_cache); mock, interactive and assistant clients are
+            never cached
+        coalesce: Let identical concurrent requests share one upstream call
+            (see CoalescingLLMClient); not applied to mock, interactive and
+            assistant clients
 
     Returns:
         Configured LLM client instance
@@ -74,6 +103,23 @@ def create_llm_from_config(
             verbose=verbose,
         )
 
+    client = _create_provider_client(verbose)
+    if isinstance(client, MockLLMClient | InteractiveLLMClient):
+        return client
+    if coalesce:
+        client = CoalescingLLMClient(client, provider=config.LLM_PROVIDER.lower())
+    if not use_cache:
+        return client
+    return CachingLLMClient(
+        client,
+        create_llm_cache(),
+        provider=config.LLM_PROVIDER.lower(),
+        cache_sampled=config.LLM_CACHE_SAMPLED,
+    )
+
+
+def _create_provider_client(verbose: bool) -> LLMClient:
+    """Create the client for the configured provider."""
     provider_str = config.LLM_PROVIDER.lower()
 
     try:
@@ -94,6 +140,13 @@ def create_llm_from_config(
     # Provider-specific parameters
     if provider == LLMProvider.OLLAMA:
         kwargs["base_url"] = config.LLM_BASE_URL
+        # One keep-alive and context size for every request, so the model is
+        # neither unloaded nor reloaded mid-run
+        kwargs["keep_alive"] = _ollama_keep_alive(config.OLLAMA_KEEP_ALIVE)
+        # Always sent, so the server's window is the one prompts are budgeted for
+        from bloginator.generation._token_budget import context_window
+
+        kwargs["num_ctx"] = context_window(config.LLM_MODEL, provider=provider.value)
         return OllamaClient(**kwargs)
 
     elif provider == LLMProvider.CUSTOM:
@@ -139,6 +192,15 @@ def create_llm_from_config(
         return create_llm_client(provider, **kwargs)
 
 
+def _ollama_keep_alive(value: str | None) -> str | int | None:
+    """Convert the configured keep-alive to what Ollama accepts."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    # Bare numbers are seconds; Ollama reads them as such only when sent as numbers
+    return int(value) if value.lstrip("-").isdigit() else value
+
+
 def get_default_generation_params() -> dict[str, Any]:
     """Get default generation parameters from config.
 
@@ -4,16 +4,20 @@ This module provides multiple LLM implementations for different interaction
 patterns:
 - AssistantLLMClient: Returns responses from AI assistant via files
 - InteractiveLLMClient: Prompts user for responses
-- MockLLMClient: Generates deterministic mock responses
+- MockLLMClient: Generates deterministic mock responses, optionally with
+  simulated latency, streaming rate, errors and capacity (LatencyProfile)
 """
 
 from bloginator.generation._llm_assistant_client import AssistantLLMClient
 from bloginator.generation._llm_interactive_client import InteractiveLLMClient
 from bloginator.generation._llm_mock_client import MockLLMClient
+from bloginator.generation._llm_mock_latency import LatencyProfile, LatencySimulator
 
 
 __all__ = [
     "AssistantLLMClient",
     "InteractiveLLMClient",
+    "LatencyProfile",
+    "LatencySimulator",
     "MockLLMClient",
 ]
@@ -1,12 +1,22 @@
 """Ollama LLM client implementation."""
 
 import json
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from typing import Any
 
+import httpx
 import requests
 
+from bloginator.generation._http_pool import get_async_http_client, get_http_session
+from bloginator.generation._llm_scheduler import estimate_request_tokens, get_scheduler
+from bloginator.generation._ollama_session import OllamaTimings
 from bloginator.generation.llm_base import (
     LLMClient,
+    LLMProvider,
     LLMResponse,
+    StreamUsage,
     print_llm_request,
     print_llm_response,
 )
@@ -19,10 +29,21 @@ class OllamaClient(LLMClient):
     Ollama provides local LLM inference with models like llama3, mistral, etc.
     See: https://ollama.ai
 
+    Requests use the chat endpoint with the system prompt as its own message,
+    so consecutive requests sharing a system prompt share a prompt prefix and
+    Ollama can reuse its KV cache for it. Every request carries the same
+    keep-alive and context size, so the model is neither unloaded between
+    requests nor reloaded for a different num_ctx.
+
     Attributes:
         base_url: Ollama server URL (default: http://localhost:11434)
         model: Model name to use (e.g., "llama3", "mistral")
         timeout: Request timeout in seconds
+        keep_alive: How long Ollama keeps the model loaded after a request
+            (e.g. "30m", or seconds; None leaves the server default)
+        num_ctx: Context window requested from Ollama (None = model default)
+        scheduler: Rate limiter and retry policy shared by clients of this server
+        timings: Load and evaluation time reported by Ollama, summed
     """
 
     def __init__(
@@ -31,6 +52,8 @@ class OllamaClient(LLMClient):
         base_url: str = "http://localhost:11434",
         timeout: int | None = None,
         verbose: bool = False,
+        keep_alive: str | int | None = None,
+        num_ctx: int | None = None,
     ):
         """Initialize Ollama client.
 
@@ -39,11 +62,126 @@ class OllamaClient(LLMClient):
             base_url: Ollama server URL
             timeout: Request timeout in seconds (uses TimeoutConfig default if None)
             verbose: Show LLM request/response interactions
+            keep_alive: Keep-alive sent with every request (None = server default)
+            num_ctx: Context window sent with every request (None = model default)
         """
         self.model = model
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout if timeout is not None else timeout_config.LLM_REQUEST_TIMEOUT
         self.verbose = verbose
+        self.keep_alive = keep_alive
+        self.num_ctx = num_ctx
+        self.scheduler = get_scheduler(LLMProvider.OLLAMA.value, self.base_url)
+        self.timings = OllamaTimings()
+
+    def _chat_payload(
+        self, messages: list[dict[str, str]], options: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Build a /api/chat payload with the client's keep-alive and context size."""
+        payload: dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "stream": False,
+            "options": {**(options or {})},
+        }
+        if self.num_ctx:
+            payload["options"]["num_ctx"] = self.num_ctx
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        return payload
+
+    def _prepare(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str | None,
+    ) -> dict[str, Any]:
+        """Build the request payload, echoing it if verbose."""
+        # The system prompt goes first, in its own message, so it stays a
+        # stable prefix across requests
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        # Display request if verbose
+        if self.verbose:
+            full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+            print_llm_request(f"Ollama - {self.model}", full_prompt)
+
+        return self._chat_payload(messages, {"temperature": temperature, "num_predict": max_tokens})
+
+    @staticmethod
+    def _prompt_text(payload: dict[str, Any]) -> str:
+        """Return the text of all messages in a payload (for token estimates)."""
+        return "\n\n".join(m["content"] for m in payload["messages"])
+
+    def _parse(self, data: dict[str, Any], full_prompt: str) -> LLMResponse:
+        """Turn a decoded /api/chat response into an LLMResponse."""
+        # Extract content
+        content = data.get("message", {}).get("content", "")
+        self.timings.record(data)
+
+        # Extract token counts if available, otherwise estimate
+        prompt_tokens = data.get("prompt_eval_count", len(full_prompt) // 4)
+        completion_tokens = data.get("eval_count", len(content) // 4)
+
+        # Display response if verbose
+        if self.verbose:
+            print_llm_response(content)
+
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            # "length" when the output hit num_predict
+            finish_reason=data.get("done_reason") or "stop",
+        )
+
+    @contextmanager
+    def _translate_errors(self) -> Iterator[None]:
+        """Map transport and decoding failures to the documented exceptions."""
+        try:
+            yield
+        except (requests.exceptions.ConnectionError, httpx.ConnectError) as e:
+            raise ConnectionError(
+                f"Unable to connect to Ollama at {self.base_url}. "
+                f"Is Ollama running? Start with: ollama serve"
+            ) from e
+        except (requests.exceptions.Timeout, httpx.TimeoutException) as e:
+            raise ConnectionError(f"Request to Ollama timed out after {self.timeout}s") from e
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection to Ollama at {self.base_url} failed: {e}") from e
+        except (requests.exceptions.HTTPError, httpx.HTTPStatusError) as e:
+            raise ValueError(f"Ollama generation failed: {e}") from e
+        except (KeyError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid response from Ollama: {e}") from e
+
+    def _stream_delta(
+        self, line: str | bytes, usage: StreamUsage | None = None
+    ) -> tuple[str, bool]:
+        """Decode one NDJSON line of a streamed response.
+
+        Args:
+            line: Response line
+            usage: Receives the token counts and finish reason from the final chunk
+
+        Returns:
+            Text delta and whether this was the final chunk
+        """
+        chunk = json.loads(line)
+        if "error" in chunk:
+            raise ValueError(f"Ollama generation failed: {chunk['error']}")
+        done = bool(chunk.get("done"))
+        if done:
+            # The final chunk carries the request's timings and token counts
+            self.timings.record(chunk)
+            if usage is not None:
+                usage.record(chunk.get("prompt_eval_count"), chunk.get("eval_count"))
+                usage.record_finish_reason(chunk.get("done_reason"))
+        return chunk.get("message", {}).get("content", ""), done
 
     def generate(
         self,
@@ -54,6 +192,9 @@ class OllamaClient(LLMClient):
     ) -> LLMResponse:
         """Generate text using Ollama.
 
+        Requests go through the shared keep-alive session for this server;
+        throttled and transient server errors are retried by the scheduler.
+
         Args:
             prompt: User prompt
             temperature: Sampling temperature
@@ -67,63 +208,203 @@ class OllamaClient(LLMClient):
             ConnectionError: If unable to connect to Ollama
             ValueError: If generation fails
         """
-        url = f"{self.base_url}/api/generate"
+        url = f"{self.base_url}/api/chat"
+        payload = self._prepare(prompt, temperature, max_tokens, system_prompt)
 
-        # Build prompt with system instruction if provided
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
+        def send() -> LLMResponse:
+            response = get_http_session(self.base_url).post(url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            return self._parse(response.json(), self._prompt_text(payload))
+
+        with self._translate_errors():
+            return self.scheduler.call(
+                send, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            )
+
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate text using Ollama on the running event loop.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+
+        Returns:
+            LLMResponse with generated content
+
+        Raises:
+            ConnectionError: If unable to connect to Ollama
+            ValueError: If generation fails
+        """
+        url = f"{self.base_url}/api/chat"
+        payload = self._prepare(prompt, temperature, max_tokens, system_prompt)
+
+        async def send() -> LLMResponse:
+            response = await get_async_http_client().post(url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            return self._parse(response.json(), self._prompt_text(payload))
+
+        with self._translate_errors():
+            return await self.scheduler.acall(
+                send, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            )
+
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> Iterator[str]:
+        """Generate text using Ollama, yielding tokens as they arrive.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas
+
+        Raises:
+            ConnectionError: If unable to connect to Ollama
+            ValueError: If generation fails
+        """
+        url = f"{self.base_url}/api/chat"
+        payload = {**self._prepare(prompt, temperature, max_tokens, system_prompt), "stream": True}
+        received = []
+
+        def open_stream() -> Iterator[str]:
+            with get_http_session(self.base_url).post(
+                url, json=payload, timeout=self.timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    delta, done = self._stream_delta(line, usage)
+                    if delta:
+                        yield delta
+                    if done:
+                        break
+
+        with self._translate_errors():
+            for delta in self.scheduler.stream(
+                open_stream, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            ):
+                received.append(delta)
+                yield delta
 
-        # Display request if verbose
         if self.verbose:
-            print_llm_request(f"Ollama - {self.model}", full_prompt)
+            print_llm_response("".join(received))
 
-        payload = {
-            "model": self.model,
-            "prompt": full_prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens,
-            },
-        }
+    async def astream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> AsyncIterator[str]:
+        """Generate text using Ollama on the running event loop, yielding tokens.
 
-        try:
-            response = requests.post(url, json=payload, timeout=self.timeout)
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas
+
+        Raises:
+            ConnectionError: If unable to connect to Ollama
+            ValueError: If generation fails
+        """
+        url = f"{self.base_url}/api/chat"
+        payload = {**self._prepare(prompt, temperature, max_tokens, system_prompt), "stream": True}
+        received = []
+
+        async def open_stream() -> AsyncIterator[str]:
+            async with get_async_http_client().stream(
+                "POST", url, json=payload, timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    delta, done = self._stream_delta(line, usage)
+                    if delta:
+                        yield delta
+                    if done:
+                        break
+
+        with self._translate_errors():
+            async for delta in self.scheduler.astream(
+                open_stream, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            ):
+                received.append(delta)
+                yield delta
+
+        if self.verbose:
+            print_llm_response("".join(received))
+
+    def _session_call(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """POST a model-management request to /api/chat and return its reply."""
+        url = f"{self.base_url}/api/chat"
+        with self._translate_errors():
+            response = get_http_session(self.base_url).post(url, json=payload, timeout=self.timeout)
             response.raise_for_status()
+            data: dict[str, Any] = response.json()
+        return data
 
-            data = response.json()
+    def preload(self) -> None:
+        """Load the model into memory without generating anything.
 
-            # Extract content
-            content = data.get("response", "")
+        Uses the client's keep-alive and context size, so later requests
+        find the model loaded as they need it.
 
-            # Extract token counts if available, otherwise estimate
-            prompt_tokens = data.get("prompt_eval_count", len(full_prompt) // 4)
-            completion_tokens = data.get("eval_count", len(content) // 4)
+        Raises:
+            ConnectionError: If unable to connect to Ollama
+            ValueError: If the model cannot be loaded
+        """
+        started = time.perf_counter()
+        data = self._session_call(self._chat_payload([]))
+        # Load replies may not carry timing fields; the wall time is the load
+        seconds = data.get("load_duration", 0) / 1e9 or time.perf_counter() - started
+        self.timings.record_load(seconds)
 
-            # Display response if verbose
-            if self.verbose:
-                print_llm_response(content)
+    def warm(self) -> None:
+        """Run a one-token generation so the first real request starts hot.
 
-            return LLMResponse(
-                content=content,
-                model=self.model,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                finish_reason="stop",
-            )
+        Raises:
+            ConnectionError: If unable to connect to Ollama
+            ValueError: If generation fails
+        """
+        payload = self._chat_payload(
+            [{"role": "user", "content": "Hi"}], {"temperature": 0.0, "num_predict": 1}
+        )
+        self.timings.record(self._session_call(payload))
 
-        except requests.exceptions.ConnectionError as e:
-            raise ConnectionError(
-                f"Unable to connect to Ollama at {self.base_url}. "
-                f"Is Ollama running? Start with: ollama serve"
-            ) from e
-        except requests.exceptions.Timeout as e:
-            raise ConnectionError(f"Request to Ollama timed out after {self.timeout}s") from e
-        except requests.exceptions.HTTPError as e:
-            raise ValueError(f"Ollama generation failed: {e}") from e
-        except (KeyError, json.JSONDecodeError) as e:
-            raise ValueError(f"Invalid response from Ollama: {e}") from e
+    def unload(self) -> None:
+        """Ask Ollama to unload the model now.
+
+        Raises:
+            ConnectionError: If unable to connect to Ollama
+            ValueError: If the request fails
+        """
+        self._session_call({"model": self.model, "messages": [], "keep_alive": 0})
 
     def is_available(self) -> bool:
         """Check if Ollama is available.
@@ -134,7 +415,9 @@ class OllamaClient(LLMClient):
         try:
             # Check if server is running
             url = f"{self.base_url}/api/tags"
-            response = requests.get(url, timeout=timeout_config.OLLAMA_TAG_CHECK_TIMEOUT)
+            response = get_http_session(self.base_url).get(
+                url, timeout=timeout_config.OLLAMA_TAG_CHECK_TIMEOUT
+            )
             response.raise_for_status()
 
             # Check if our model is available
@@ -155,7 +438,9 @@ class OllamaClient(LLMClient):
         """
         try:
             url = f"{self.base_url}/api/tags"
-            response = requests.get(url, timeout=timeout_config.OLLAMA_TAG_CHECK_TIMEOUT)
+            response = get_http_session(self.base_url).get(
+                url, timeout=timeout_config.OLLAMA_TAG_CHECK_TIMEOUT
+            )
             response.raise_for_status()
 
             data = response.json()
@@ -1,11 +1,15 @@
 """OpenAI LLM client implementation."""
 
 import os
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
+from bloginator.generation._llm_scheduler import estimate_request_tokens, get_scheduler
 from bloginator.generation.llm_base import (
     LLMClient,
+    LLMProvider,
     LLMResponse,
+    StreamUsage,
     print_llm_request,
     print_llm_response,
 )
@@ -26,6 +30,7 @@ class OpenAIClient(LLMClient):
         api_key: OpenAI API key
         timeout: Request timeout in seconds
         verbose: Whether to print requests/responses
+        scheduler: Rate limiter and retry policy shared by all OpenAI clients
     """
 
     def __init__(
@@ -64,8 +69,9 @@ class OpenAIClient(LLMClient):
                 "variable or pass api_key parameter."
             )
 
-        # Initialize OpenAI client
-        self.client = openai.OpenAI(api_key=self.api_key, timeout=timeout)
+        # Initialize OpenAI client; retries are left to the shared scheduler
+        self.client = openai.OpenAI(api_key=self.api_key, timeout=timeout, max_retries=0)
+        self.scheduler = get_scheduler(LLMProvider.OPENAI.value)
 
     def generate(
         self,
@@ -101,11 +107,14 @@ class OpenAIClient(LLMClient):
             messages.append({"role": "user", "content": prompt})
 
             # Call API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
+            response = self.scheduler.call(
+                lambda: self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                ),
+                estimate_request_tokens(prompt, system_prompt, max_tokens),
             )
 
             # Extract content
@@ -130,6 +139,70 @@ class OpenAIClient(LLMClient):
         except Exception as e:
             raise ValueError(f"OpenAI generation failed: {e}") from e
 
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+        usage: StreamUsage | None = None,
+    ) -> Iterator[str]:
+        """Generate text using OpenAI, yielding tokens as they arrive.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            usage: Filled in with the provider's token counts when the stream ends
+
+        Yields:
+            Text deltas
+
+        Raises:
+            ValueError: If generation fails
+        """
+        if self.verbose:
+            full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+            print_llm_request(f"OpenAI - {self.model}", full_prompt)
+
+        messages: list[ChatCompletionMessageParam] = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        def open_stream() -> Iterator[str]:
+            chunks = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                # Adds a final chunk carrying the request's token counts
+                stream_options={"include_usage": True},
+            )
+            for chunk in chunks:
+                if usage is not None and chunk.usage is not None:
+                    usage.record(chunk.usage.prompt_tokens, chunk.usage.completion_tokens)
+                if usage is not None and chunk.choices:
+                    usage.record_finish_reason(chunk.choices[0].finish_reason)
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+
+        received = []
+        try:
+            for delta in self.scheduler.stream(
+                open_stream, estimate_request_tokens(prompt, system_prompt, max_tokens)
+            ):
+                received.append(delta)
+                yield delta
+        except Exception as e:
+            raise ValueError(f"OpenAI generation failed: {e}") from e
+
+        if self.verbose:
+            print_llm_response("".join(received))
+
     def is_available(self) -> bool:
         """Check if OpenAI API is available.
 
@@ -3,8 +3,9 @@
 import logging
 from pathlib import Path
 
+from bloginator.generation._generation_context import GenerationContext
 from bloginator.generation._outline_coverage import (
-    analyze_section_coverage,
+    analyze_outline_coverage,
     filter_by_keyword_match,
     filter_sections_by_coverage,
 )
@@ -16,6 +17,7 @@ from bloginator.generation._outline_prompt_builder import (
 )
 from bloginator.generation.llm_client import LLMClient
 from bloginator.models.outline import Outline
+from bloginator.prompts.loader import PromptLoader
 from bloginator.search import CorpusSearcher
 from bloginator.search.validators import validate_search_results
 
@@ -33,6 +35,7 @@ class OutlineGenerator:
         llm_client: LLM client for outline generation
         searcher: Corpus searcher for coverage analysis
         min_coverage_sources: Minimum sources for good coverage (default: 3)
+        context: Optional per-request context that remembers topic validation
     """
 
     def __init__(
@@ -40,6 +43,8 @@ class OutlineGenerator:
         llm_client: LLMClient,
         searcher: CorpusSearcher,
         min_coverage_sources: int = 3,
+        prompt_loader: PromptLoader | None = None,
+        context: GenerationContext | None = None,
     ):
         """Initialize outline generator.
 
@@ -47,11 +52,16 @@ class OutlineGenerator:
             llm_client: LLM client for generation
             searcher: Corpus searcher for coverage analysis
             min_coverage_sources: Minimum sources for good coverage
+            prompt_loader: Prompt loader (creates default if None)
+            context: Per-request context shared with other attempts; topic
+                validation then runs once per request (pass context.searcher
+                as searcher to share searches too)
         """
         self.llm_client = llm_client
         self.searcher = searcher
         self.min_coverage_sources = min_coverage_sources
-        self.prompt_builder = OutlinePromptBuilder()
+        self.context = context
+        self.prompt_builder = OutlinePromptBuilder(prompt_loader)
 
     def _validate_topic(
         self,
@@ -74,6 +84,21 @@ class OutlineGenerator:
         Returns:
             "VALID" if corpus matches topic, or "ERROR: <reason>" if not
         """
+        if self.context is not None:
+            key = (title, ", ".join(keywords), corpus_context, str(num_results))
+            return self.context.topic_check(
+                key, lambda: self._check_topic(title, keywords, corpus_context, num_results)
+            )
+        return self._check_topic(title, keywords, corpus_context, num_results)
+
+    def _check_topic(
+        self,
+        title: str,
+        keywords: list[str],
+        corpus_context: str,
+        num_results: int,
+    ) -> str:
+        """Ask the LLM whether the corpus context matches the topic (see _validate_topic)."""
         # Load topic validation prompt
         validation_template = self.prompt_builder.prompt_loader.load(
             "outline/topic-validation.yaml"
@@ -146,17 +171,18 @@ class OutlineGenerator:
         search_queries = build_search_queries(title, keywords, thesis)
         logger.info(f"Generated {len(search_queries)} search queries: {search_queries}")
 
-        # Collect all unique chunks to extract natural section boundaries
+        # Run all queries as one batch search, then collect all unique chunks
+        # to extract natural section boundaries
+        queries = [query for query in search_queries if query.strip()]
+        results_per_query = self.searcher.batch_search(queries, n_results=3) if queries else []
         all_results = []
         seen_chunk_ids = set()
-        for query in search_queries:
-            if query.strip():
-                results = self.searcher.search(query=query, n_results=3)
-                logger.info(f"Search query '{query}' returned {len(results)} results")
-                for result in results:
-                    if result.chunk_id not in seen_chunk_ids:
-                        all_results.append(result)
-                        seen_chunk_ids.add(result.chunk_id)
+        for query, results in zip(queries, results_per_query, strict=False):
+            logger.info(f"Search query '{query}' returned {len(results)} results")
+            for result in results:
+                if result.chunk_id not in seen_chunk_ids:
+                    all_results.append(result)
+                    seen_chunk_ids.add(result.chunk_id)
 
         # Validate and filter search results
         filtered_results, validation_warnings = validate_search_results(
@@ -241,9 +267,8 @@ class OutlineGenerator:
             if match_ratio < 0.3 and filtered_results:
                 sections = build_outline_from_corpus(filtered_results, keywords, num_sections)
 
-        # Analyze coverage for each section
-        for section in sections:
-            analyze_section_coverage(section, keywords, self.searcher, self.min_coverage_sources)
+        # Analyze coverage for all sections in one batch search
+        analyze_outline_coverage(sections, keywords, self.searcher, self.min_coverage_sources)
 
         # Create outline
         outline = Outline(
@@ -383,9 +408,8 @@ class OutlineGenerator:
         # Parse template into sections
         sections = parse_outline_response(template_content)
 
-        # Analyze coverage for each section
-        for section in sections:
-            analyze_section_coverage(section, keywords, self.searcher, self.min_coverage_sources)
+        # Analyze coverage for all sections in one batch search
+        analyze_outline_coverage(sections, keywords, self.searcher, self.min_coverage_sources)
 
         # Create outline
         outline = Outline(
@@ -1,15 +1,17 @@
 """Refinement engine for iterative draft improvement."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from typing import Any
 
 from bloginator.generation.draft_generator import DraftGenerator
 from bloginator.generation.llm_client import LLMClient
 from bloginator.generation.safety_validator import SafetyValidator
 from bloginator.generation.voice_scorer import VoiceScorer
-from bloginator.models.draft import Draft, DraftSection
+from bloginator.models.draft import Citation, Draft, DraftSection
 from bloginator.prompts.loader import PromptLoader
-from bloginator.search import Searcher
+from bloginator.search import Searcher, SearchResult
 
 
 logger = logging.getLogger(__name__)
@@ -21,8 +23,8 @@ class RefinementEngine:
     The refinement engine:
     1. Parses natural language feedback to understand what to change
     2. Identifies which sections need regeneration
-    3. Regenerates targeted sections while preserving overall structure
-    4. Optionally re-scores voice and validates safety
+    3. Regenerates targeted sections concurrently, preserving overall structure
+    4. Optionally re-scores voice and validates safety for changed sections
 
     Attributes:
         llm_client: LLM for parsing feedback and generating refinements
@@ -30,6 +32,7 @@ class RefinementEngine:
         searcher: For finding relevant corpus content
         voice_scorer: Optional voice similarity scorer
         safety_validator: Optional blocklist validator
+        max_concurrency: Maximum section rewrites in flight at once
     """
 
     def __init__(
@@ -39,6 +42,7 @@ class RefinementEngine:
         voice_scorer: VoiceScorer | None = None,
         safety_validator: SafetyValidator | None = None,
         prompt_loader: PromptLoader | None = None,
+        max_concurrency: int = 4,
     ):
         """Initialize refinement engine.
 
@@ -48,12 +52,21 @@ class RefinementEngine:
             voice_scorer: Optional voice similarity scorer
             safety_validator: Optional safety validator
             prompt_loader: Prompt loader (creates default if None)
+            max_concurrency: Maximum section rewrites in flight at once
+                (1 = sequential)
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         self.llm_client = llm_client
         self.searcher = searcher
         self.prompt_loader = prompt_loader or PromptLoader()
         self.voice_scorer = voice_scorer
         self.safety_validator = safety_validator
+        self.max_concurrency = max_concurrency
 
         # Create draft generator for section regeneration
         self.draft_generator = DraftGenerator(
@@ -147,14 +160,21 @@ Examples:
         feedback: str,
         validate_safety: bool = True,
         score_voice: bool = True,
+        parsed: dict[str, Any] | None = None,
     ) -> Draft:
         """Refine a draft based on natural language feedback.
 
+        Only the targeted sections are regenerated, up to max_concurrency at
+        a time. Unchanged sections keep the voice score and safety result
+        they had in the input draft; only regenerated ones are re-checked.
+
         Args:
             draft: Current draft to refine
             feedback: Natural language feedback
             validate_safety: Whether to validate against blocklist
             score_voice: Whether to score voice similarity
+            parsed: Result of parse_feedback for this feedback (parsed
+                again if None)
 
         Returns:
             Refined draft
@@ -163,7 +183,8 @@ Examples:
             ValueError: If safety validation fails
         """
         # Parse feedback to understand what to do
-        parsed = self.parse_feedback(draft, feedback)
+        if parsed is None:
+            parsed = self.parse_feedback(draft, feedback)
         action = parsed["action"]
         target_sections = parsed["target_sections"]
         instructions = parsed["instructions"]
@@ -185,30 +206,22 @@ Examples:
             logger.warning("No sections matched for refinement, returning original")
             return draft
 
-        # Create refined draft
+        # Regenerate targeted sections, keeping the others unchanged
+        refined = self._refine_sections(sections_to_refine, instructions, draft.keywords)
+        replacements = {
+            id(section): refined_section
+            for section, refined_section in zip(sections_to_refine, refined, strict=True)
+        }
         refined_draft = Draft(
             title=draft.title,
             thesis=draft.thesis,
             keywords=draft.keywords,
-            sections=[],
+            sections=[replacements.get(id(section), section) for section in draft.sections],
         )
 
-        # Regenerate targeted sections
-        for section in draft.sections:
-            if section in sections_to_refine:
-                # Regenerate this section with refinement instructions
-                refined_section = self._refine_section(
-                    section=section,
-                    instructions=instructions,
-                    keywords=draft.keywords,
-                )
-                refined_draft.sections.append(refined_section)
-            else:
-                # Keep original section unchanged
-                refined_draft.sections.append(section)
-
-        # Score voice if requested
+        # Score voice if requested; unchanged sections reuse their scores
         if score_voice and self.voice_scorer:
+            self.voice_scorer.remember_scores(draft)
             self.voice_scorer.score_draft(refined_draft)
         else:
             refined_draft.calculate_stats()
@@ -219,6 +232,37 @@ Examples:
 
         return refined_draft
 
+    def _refine_sections(
+        self,
+        sections: list[DraftSection],
+        instructions: str,
+        keywords: list[str],
+    ) -> list[DraftSection]:
+        """Refine several sections, rewriting up to max_concurrency at once.
+
+        Sources are retrieved for every section first, so only the LLM
+        calls run concurrently.
+
+        Args:
+            sections: Sections to refine
+            instructions: Refinement instructions
+            keywords: Context keywords
+
+        Returns:
+            Refined sections, in the order given
+        """
+        sources = [self._find_sources(section, keywords) for section in sections]
+
+        workers = min(self.max_concurrency, len(sections))
+        if workers <= 1:
+            return [
+                self._rewrite_section(section, instructions, results)
+                for section, results in zip(sections, sources, strict=True)
+            ]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bloginator-refine") as ex:
+            return list(ex.map(self._rewrite_section, sections, repeat(instructions), sources))
+
     def _refine_section(
         self,
         section: DraftSection,
@@ -235,13 +279,41 @@ Examples:
         Returns:
             Refined section
         """
-        # Search for relevant content
+        return self._rewrite_section(section, instructions, self._find_sources(section, keywords))
+
+    def _find_sources(self, section: DraftSection, keywords: list[str]) -> list[SearchResult]:
+        """Search the corpus for content relevant to a section.
+
+        Args:
+            section: Section being refined
+            keywords: Context keywords
+
+        Returns:
+            Search results
+        """
         search_query = f"{section.title} {' '.join(keywords[:3])}"
-        search_results = self.searcher.search(
+        return self.searcher.search(
             query=search_query,
             n_results=5,
         )
 
+    def _rewrite_section(
+        self,
+        section: DraftSection,
+        instructions: str,
+        search_results: list[SearchResult],
+    ) -> DraftSection:
+        """Rewrite a section from its sources and the refinement instructions.
+
+        Args:
+            section: Original section
+            instructions: Refinement instructions
+            search_results: Sources found for the section
+
+        Returns:
+            Refined section, or the original if there are no sources or
+            generation fails
+        """
         if not search_results:
             logger.warning(f"No search results for section '{section.title}'")
             return section
@@ -290,8 +362,6 @@ Examples:
                     "content_preview": result.content[:200],
                     "similarity_score": result.similarity_score,
                 }
-                from bloginator.models.draft import Citation
-
                 refined_section.citations.append(Citation(**citation))
 
             return refined_section
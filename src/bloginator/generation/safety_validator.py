@@ -1,5 +1,7 @@
 """Safety validation for generated content using blocklist."""
 
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 
@@ -31,12 +33,18 @@ class SafetyValidator:
         """
         self.blocklist_manager = BlocklistManager(blocklist_file)
         self.auto_reject = auto_reject
+        # Violations per section content hash, for sections checked before
+        # against the blocklist with this fingerprint
+        self._section_violations: dict[str, list[dict[str, Any]]] = {}
+        self._blocklist_fingerprint = ""
 
     def validate_draft(self, draft: Draft) -> None:
         """Validate entire draft against blocklist.
 
         Updates draft.has_blocklist_violations and
-        draft.blocklist_validation_result.
+        draft.blocklist_validation_result. Sections this validator checked
+        before with the same title and content reuse that result, as long as
+        the blocklist is unchanged.
 
         Args:
             draft: Draft to validate (modified in place)
@@ -52,13 +60,17 @@ class SafetyValidator:
         """
         all_violations = []
 
+        # Earlier results only hold for the blocklist they were checked against
+        fingerprint = self._fingerprint_blocklist()
+        if fingerprint != self._blocklist_fingerprint:
+            self._section_violations.clear()
+            self._blocklist_fingerprint = fingerprint
+
         # Validate each section
         for section in draft.get_all_sections():
-            section_result = self._validate_section(section)
-
-            if not section_result["is_valid"]:
-                all_violations.extend(section_result["violations"])
-                section.has_blocklist_violations = True
+            violations = self._check_section(section)
+            all_violations.extend(violations)
+            section.has_blocklist_violations = bool(violations)
 
         # Update draft
         draft.has_blocklist_violations = len(all_violations) > 0
@@ -77,6 +89,30 @@ class SafetyValidator:
                 f"Review and remove these terms before regenerating."
             )
 
+    def _fingerprint_blocklist(self) -> str:
+        """Hash the blocklist entries that section results depend on.
+
+        Returns:
+            Hex digest of the current entries
+        """
+        entries = [entry.model_dump(mode="json") for entry in self.blocklist_manager.entries]
+        return hashlib.sha256(json.dumps(entries, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _check_section(self, section: DraftSection) -> list[dict[str, Any]]:
+        """Get a section's violations, validating it only if not seen before.
+
+        Args:
+            section: Section to check
+
+        Returns:
+            Violations found (copies, safe to modify)
+        """
+        key = section.content_hash()
+        if key not in self._section_violations:
+            result = self._validate_section(section)
+            self._section_violations[key] = [] if result["is_valid"] else list(result["violations"])
+        return [dict(violation) for violation in self._section_violations[key]]
+
     def _validate_section(self, section: DraftSection) -> dict[str, Any]:
         """Validate a section's content.
 
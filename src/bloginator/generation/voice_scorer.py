@@ -1,23 +1,32 @@
 """Voice similarity scoring for authentic content validation."""
 
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from bloginator.indexing import VoiceProfile, index_fingerprint, load_voice_profile
 from bloginator.models.draft import Draft, DraftSection
 from bloginator.search import CorpusSearcher
+from bloginator.utils.checksum import calculate_content_checksum
 
 
 class VoiceScorer:
     """Score voice similarity between generated content and corpus.
 
     Uses embedding-based similarity to measure how well generated content
-    matches the author's historical writing style.
+    matches the author's historical writing style. When the index has a
+    voice profile (built by 'bloginator index --voice-profile'), texts are
+    scored against it directly; otherwise against corpus samples found by
+    search. Profile scores (similarity to the nearest author-style cluster)
+    run higher than sample-based ones (mean similarity to the samples).
 
     Attributes:
         embedding_model: Sentence transformer for embeddings
         searcher: Corpus searcher for finding style examples
         sample_size: Number of corpus samples to compare against
+        profile: Precomputed voice profile, if available
     """
 
     def __init__(
@@ -25,6 +34,7 @@ class VoiceScorer:
         searcher: CorpusSearcher,
         embedding_model: SentenceTransformer | None = None,
         sample_size: int = 20,
+        profile: VoiceProfile | None = None,
     ):
         """Initialize voice scorer.
 
@@ -32,15 +42,33 @@ class VoiceScorer:
             searcher: Corpus searcher for sampling author's writing
             embedding_model: Optional sentence transformer (uses searcher's if None)
             sample_size: Number of corpus samples for comparison
+            profile: Voice profile to score against (loaded from the
+                searcher's index directory if None and up to date)
         """
         self.searcher = searcher
         self.embedding_model = embedding_model or searcher.embedding_model
         self.sample_size = sample_size
+        self.profile = profile or self._load_profile()
+        self._section_scores: dict[str, float] = {}
+
+    def _load_profile(self) -> VoiceProfile | None:
+        """Load the voice profile stored with the searcher's index, if current."""
+        index_dir = getattr(self.searcher, "index_dir", None)
+        if not isinstance(index_dir, str | Path):
+            return None
+        try:
+            fingerprint = index_fingerprint(self.searcher.collection)
+        except Exception:
+            return None
+        return load_voice_profile(Path(index_dir), fingerprint=fingerprint)
 
     def score_draft(self, draft: Draft) -> None:
         """Score voice similarity for entire draft.
 
-        Updates draft.voice_score and each section's voice_score.
+        Updates draft.voice_score and each section's voice_score. Sections
+        scored before with the same title, content and keywords reuse that
+        score; the rest are scored together: one embedding call for every
+        section and its sampling query, then one corpus query.
 
         Args:
             draft: Draft to score (modified in place)
@@ -50,13 +78,51 @@ class VoiceScorer:
             >>> scorer.score_draft(draft)
             >>> print(f"Voice similarity: {draft.voice_score:.2f}")
         """
-        # Score each section
+        keyword_context = " ".join(draft.keywords[:2])
+        pending: dict[str, list[DraftSection]] = {}
         for section in draft.get_all_sections():
-            self._score_section(section, draft.keywords)
+            if not section.content:
+                section.voice_score = 0.0
+                continue
+            key = self._section_key(section, keyword_context)
+            if key in self._section_scores:
+                section.voice_score = self._section_scores[key]
+            else:
+                pending.setdefault(key, []).append(section)
+
+        keys = list(pending)
+        scores = self._score_texts(
+            [pending[key][0].content for key in keys],
+            [f"{pending[key][0].title} {keyword_context}" for key in keys],
+        )
+        for key, score in zip(keys, scores, strict=True):
+            self._section_scores[key] = score
+            for section in pending[key]:
+                section.voice_score = score
 
         # Recalculate overall stats
         draft.calculate_stats()
 
+    def remember_scores(self, draft: Draft) -> None:
+        """Record the section scores of an already scored draft.
+
+        Later score_draft calls then skip sections that are unchanged.
+
+        Args:
+            draft: Draft whose voice_score values were set by score_draft
+        """
+        keyword_context = " ".join(draft.keywords[:2])
+        for section in draft.get_all_sections():
+            if section.content and section.voice_score > 0:
+                self._section_scores.setdefault(
+                    self._section_key(section, keyword_context), section.voice_score
+                )
+
+    @staticmethod
+    def _section_key(section: DraftSection, keyword_context: str) -> str:
+        """Identify a section's score inputs: title, content and keywords."""
+        return calculate_content_checksum(f"{keyword_context}\n{section.content_hash()}")
+
     def _score_section(self, section: DraftSection, keywords: list[str]) -> None:
         """Score voice similarity for a section.
 
@@ -70,49 +136,58 @@ class VoiceScorer:
             section.voice_score = 0.0
             return
 
-        try:
-            # Get embedding for generated content
-            generated_embedding = self.embedding_model.encode([section.content])[0]
-
-            # Sample corpus content with similar topics
-            query = f"{section.title} {' '.join(keywords[:2])}"
-            corpus_samples = self.searcher.search(
-                query=query,
-                n_results=self.sample_size,
-            )
-
-            if not corpus_samples:
-                # No corpus samples to compare against
-                section.voice_score = 0.5  # Neutral score
-                return
+        query = f"{section.title} {' '.join(keywords[:2])}"
+        section.voice_score = self._score_texts([section.content], [query])[0]
 
-            # Get embeddings for corpus samples
-            corpus_texts = [sample.content for sample in corpus_samples]
-            corpus_embeddings = self.embedding_model.encode(corpus_texts)
+    def _score_texts(self, texts: list[str], queries: list[str]) -> list[float]:
+        """Score texts against corpus samples retrieved by their queries.
 
-            # Calculate similarities
-            from numpy import dot
-            from numpy.linalg import norm
+        With a voice profile, only the texts are encoded and each is scored
+        against the profile's clusters. Otherwise texts and queries are
+        encoded in one call and the samples' embeddings are read from the
+        index. Either way a custom embedding model must match the one the
+        index was built with.
 
-            def cosine_similarity(a: Any, b: Any) -> float:
-                """Calculate cosine similarity between two vectors."""
-                return float(dot(a, b) / (norm(a) * norm(b)))
-
-            similarities = [
-                cosine_similarity(generated_embedding, corpus_emb)
-                for corpus_emb in corpus_embeddings
-            ]
+        Args:
+            texts: Generated texts to score
+            queries: Corpus sampling query for each text
 
-            # Voice score is average similarity to corpus samples
-            # Higher score = more similar to author's voice
-            section.voice_score = float(sum(similarities) / len(similarities))
+        Returns:
+            Score per text: mean cosine similarity to its samples, clamped
+            to [0, 1]; 0.5 (neutral) without samples or on error
+        """
+        if not texts:
+            return []
 
-            # Ensure score is in [0, 1] range
-            section.voice_score = max(0.0, min(1.0, section.voice_score))
+        try:
+            if self.profile is not None:
+                return [float(s) for s in self.profile.score(self.embedding_model.encode(texts))]
+
+            embeddings = np.asarray(self.embedding_model.encode(texts + queries), dtype=np.float32)
+            generated, query_embeddings = embeddings[: len(texts)], embeddings[len(texts) :]
+            samples = self.searcher.nearest_embeddings(query_embeddings, n_results=self.sample_size)
+
+            # One text x sample similarity matrix over every retrieved sample
+            stacked = np.concatenate(samples)
+            similarities = _normalize(generated) @ _normalize(stacked).T
+
+            scores = []
+            offset = 0
+            for i, text_samples in enumerate(samples):
+                count = len(text_samples)
+                if count == 0:
+                    # No corpus samples to compare against
+                    scores.append(0.5)
+                    continue
+                # Voice score is average similarity to this text's own samples
+                score = float(similarities[i, offset : offset + count].mean())
+                scores.append(max(0.0, min(1.0, score)))
+                offset += count
+            return scores
 
         except Exception:
             # Fallback on error
-            section.voice_score = 0.5
+            return [0.5] * len(texts)
 
     def score_text(self, text: str, context_keywords: list[str]) -> float:
         """Score voice similarity for arbitrary text.
@@ -134,39 +209,7 @@ class VoiceScorer:
         if not text:
             return 0.0
 
-        try:
-            # Get embedding for text
-            text_embedding = self.embedding_model.encode([text])[0]
-
-            # Sample corpus content
-            query = " ".join(context_keywords[:3])
-            corpus_samples = self.searcher.search(
-                query=query,
-                n_results=self.sample_size,
-            )
-
-            if not corpus_samples:
-                return 0.5  # Neutral
-
-            # Calculate similarities
-            corpus_texts = [s.content for s in corpus_samples]
-            corpus_embeddings = self.embedding_model.encode(corpus_texts)
-
-            from numpy import dot
-            from numpy.linalg import norm
-
-            def cosine_similarity(a: Any, b: Any) -> float:
-                return float(dot(a, b) / (norm(a) * norm(b)))
-
-            similarities = [
-                cosine_similarity(text_embedding, corpus_emb) for corpus_emb in corpus_embeddings
-            ]
-
-            score = float(sum(similarities) / len(similarities))
-            return max(0.0, min(1.0, score))
-
-        except Exception:
-            return 0.5
+        return self._score_texts([text], [" ".join(context_keywords[:3])])[0]
 
     def get_voice_insights(self, draft: Draft, threshold: float = 0.7) -> dict[str, Any]:
         """Get insights about voice similarity across draft.
@@ -200,3 +243,9 @@ class VoiceScorer:
             "weak_section_details": weak_sections,
             "threshold": threshold,
         }
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
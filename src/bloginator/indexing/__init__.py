@@ -5,9 +5,18 @@ This module handles:
 - Embedding generation with sentence-transformers
 - Vector storage with ChromaDB
 - Metadata indexing and filtering
+- Precomputed author voice profiles
 """
 
+from bloginator.indexing._fingerprint import index_fingerprint
+from bloginator.indexing._voice_profile import VoiceProfile, build_voice_profile, load_voice_profile
 from bloginator.indexing.indexer import CorpusIndexer
 
 
-__all__ = ["CorpusIndexer"]
+__all__ = [
+    "CorpusIndexer",
+    "VoiceProfile",
+    "build_voice_profile",
+    "index_fingerprint",
+    "load_voice_profile",
+]
@@ -0,0 +1,52 @@
+"""Fingerprint of an index's contents, for files precomputed from it.
+
+Every chunk gets a fresh UUID when its document is indexed or re-indexed,
+so a hash of the sorted chunk IDs changes whenever any chunk is added,
+replaced or removed - including edits that leave the chunk count unchanged.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+
+# Chunk IDs read per collection query
+FINGERPRINT_PAGE_SIZE = 10_000
+
+
+def fingerprint_chunk_ids(chunk_ids: Iterable[str]) -> str:
+    """Hash a set of chunk IDs, independent of their order.
+
+    Args:
+        chunk_ids: IDs of the indexed chunks
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for chunk_id in sorted(chunk_ids):
+        digest.update(chunk_id.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def index_fingerprint(collection: Any, page_size: int = FINGERPRINT_PAGE_SIZE) -> str:
+    """Fingerprint the chunks currently in a collection.
+
+    Only IDs are read, a page at a time.
+
+    Args:
+        collection: ChromaDB collection
+        page_size: IDs read per collection query
+
+    Returns:
+        Hex digest (see fingerprint_chunk_ids)
+    """
+    chunk_ids: list[str] = []
+    while True:
+        results = collection.get(include=[], limit=page_size, offset=len(chunk_ids))
+        page = list(results["ids"]) if results else []
+        chunk_ids.extend(page)
+        if len(page) < page_size:
+            break
+    return fingerprint_chunk_ids(chunk_ids)
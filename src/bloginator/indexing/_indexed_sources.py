@@ -0,0 +1,69 @@
+"""Map indexed documents back to the source files they came from.
+
+Chunks record their document's ``source_path``. Indexes written before
+that was recorded only have the file name, so their documents are matched
+to the files being ingested by name where the name is unambiguous.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+
+def indexed_sources(
+    metadatas: Iterable[Mapping[str, Any]], paths: Iterable[Path] = ()
+) -> dict[str, tuple[str, datetime]]:
+    """Map source file paths to indexed documents.
+
+    Args:
+        metadatas: Metadata of the first chunk of every indexed document
+        paths: Files about to be ingested, matched by name to documents
+            indexed without a source path
+
+    Returns:
+        Dictionary mapping absolute source path to (document_id, modified_date)
+
+    Raises:
+        ValueError: If a document indexed without a source path shares its
+            file name with another such document or with several of the
+            given files, so it cannot be told which file it came from
+    """
+    sources: dict[str, tuple[str, datetime]] = {}
+    by_name: dict[str, list[tuple[str, datetime]]] = defaultdict(list)
+    for metadata in metadatas:
+        doc_id = metadata.get("document_id")
+        try:
+            modified = datetime.fromisoformat(str(metadata.get("modified_date")))
+        except ValueError:
+            continue
+        if not doc_id:
+            continue
+        source_path = metadata.get("source_path")
+        if source_path:
+            sources[str(source_path)] = (str(doc_id), modified)
+        elif metadata.get("filename"):
+            by_name[str(metadata["filename"])].append((str(doc_id), modified))
+
+    if not by_name:
+        return sources
+
+    candidates: dict[str, list[Path]] = defaultdict(list)
+    for path in paths:
+        if path.name in by_name and str(path.absolute()) not in sources:
+            candidates[path.name].append(path)
+
+    ambiguous = sorted(
+        name for name, files in candidates.items() if len(files) > 1 or len(by_name[name]) > 1
+    )
+    if ambiguous:
+        raise ValueError(
+            f"The index predates source path tracking and {len(ambiguous)} file name(s) "
+            f"match more than one document (e.g. {ambiguous[0]}); "
+            "rebuild it with --force to avoid duplicate chunks"
+        )
+
+    for name, (path,) in candidates.items():
+        sources[str(path.absolute())] = by_name[name][0]
+    return sources
@@ -0,0 +1,179 @@
+"""Author voice profile precomputed from the index.
+
+The profile condenses the corpus embeddings into a small k-means codebook
+of author-style clusters built from PREFERRED chunks. Scoring a text
+against it is a single dot product, with no corpus search.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from bloginator.models import QualityRating
+
+
+logger = logging.getLogger(__name__)
+
+# File in the index directory holding the voice profile
+VOICE_PROFILE_FILE = "voice_profile.npz"
+
+# Default number of author-style clusters
+DEFAULT_CLUSTERS = 8
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def _kmeans(vectors: np.ndarray, k: int, iterations: int = 25, seed: int = 0) -> np.ndarray:
+    """Spherical k-means: cluster unit vectors by cosine similarity.
+
+    Args:
+        vectors: Unit vectors to cluster
+        k: Number of clusters (capped at the number of vectors)
+        iterations: Maximum refinement passes
+        seed: Random seed for the initial centroids
+
+    Returns:
+        (k, dim) array of unit centroids
+    """
+    k = min(k, len(vectors))
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), size=k, replace=False)]
+    labels = np.full(len(vectors), -1)
+
+    for _ in range(iterations):
+        new_labels = np.argmax(vectors @ centroids.T, axis=1)
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for cluster in range(k):
+            members = vectors[labels == cluster]
+            # An emptied cluster keeps its previous centroid
+            if len(members):
+                centroids[cluster] = _normalize(members.mean(axis=0))
+
+    return centroids
+
+
+@dataclass
+class VoiceProfile:
+    """Compact embedding summary of the author's writing.
+
+    Attributes:
+        codebook: (k, dim) unit centroids of author-style clusters
+        fingerprint: Fingerprint of the index the profile was built from
+            (see index_fingerprint)
+    """
+
+    codebook: np.ndarray
+    fingerprint: str = ""
+
+    def score(self, embeddings: Any) -> np.ndarray:
+        """Score embeddings against the author-style clusters.
+
+        Each embedding's score is its cosine similarity to the nearest
+        cluster centroid, clamped to [0, 1].
+
+        Args:
+            embeddings: (n, dim) embeddings, from the index's model
+
+        Returns:
+            Score per embedding
+        """
+        vectors = _normalize(np.atleast_2d(np.asarray(embeddings, dtype=np.float32)))
+        similarities = vectors @ self.codebook.T
+        scores: np.ndarray = np.clip(similarities.max(axis=1), 0.0, 1.0)
+        return scores
+
+    def save(self, path: Path) -> None:
+        """Write the profile as a NumPy archive.
+
+        Args:
+            path: Destination file
+        """
+        np.savez(path, codebook=self.codebook, fingerprint=np.asarray(self.fingerprint))
+
+    @classmethod
+    def load(cls, path: Path) -> "VoiceProfile":
+        """Read a profile written by save().
+
+        Args:
+            path: Profile file
+
+        Returns:
+            Loaded profile
+        """
+        with np.load(path, allow_pickle=False) as data:
+            # Profiles from before fingerprints load as stale
+            fingerprint = str(data["fingerprint"]) if "fingerprint" in data else ""
+            return cls(codebook=data["codebook"], fingerprint=fingerprint)
+
+
+def build_voice_profile(
+    embeddings: Any,
+    metadatas: list[dict[str, Any]],
+    n_clusters: int = DEFAULT_CLUSTERS,
+    fingerprint: str = "",
+) -> VoiceProfile | None:
+    """Build a voice profile from chunk embeddings and their metadata.
+
+    The codebook is clustered from PREFERRED chunks. Without any, it falls
+    back to every chunk not marked DEPRECATED.
+
+    Args:
+        embeddings: (n, dim) chunk embeddings
+        metadatas: Chunk metadata, aligned with embeddings
+        n_clusters: Number of author-style clusters
+        fingerprint: Fingerprint of the index the chunks come from
+
+    Returns:
+        Voice profile, or None if there are no usable chunks
+    """
+    vectors = _normalize(np.asarray(embeddings, dtype=np.float32))
+    if len(vectors) == 0:
+        return None
+
+    tiers = [str(m.get("quality_rating", QualityRating.REFERENCE.value)) for m in metadatas]
+
+    tier_array = np.asarray(tiers)
+    voice_vectors = vectors[tier_array == QualityRating.PREFERRED.value]
+    if len(voice_vectors) == 0:
+        logger.info("No PREFERRED chunks; building voice profile from all non-deprecated chunks")
+        voice_vectors = vectors[tier_array != QualityRating.DEPRECATED.value]
+    if len(voice_vectors) == 0:
+        return None
+
+    return VoiceProfile(codebook=_kmeans(voice_vectors, n_clusters), fingerprint=fingerprint)
+
+
+def load_voice_profile(index_dir: Path, fingerprint: str | None = None) -> VoiceProfile | None:
+    """Load the voice profile stored with an index.
+
+    Args:
+        index_dir: Index directory
+        fingerprint: Current index fingerprint (see index_fingerprint); a
+            profile built from different chunks is treated as stale
+
+    Returns:
+        Voice profile, or None if absent, unreadable or stale
+    """
+    path = Path(index_dir) / VOICE_PROFILE_FILE
+    if not path.exists():
+        return None
+
+    try:
+        profile = VoiceProfile.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable voice profile {path}: {e}")
+        return None
+
+    if fingerprint is not None and profile.fingerprint != fingerprint:
+        logger.info(f"Ignoring stale voice profile {path}; re-run 'bloginator index'")
+        return None
+    return profile
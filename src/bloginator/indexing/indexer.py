@@ -1,16 +1,32 @@
 """ChromaDB indexer for document corpus."""
 
+from collections.abc import Iterable
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 import chromadb
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from bloginator.indexing._fingerprint import fingerprint_chunk_ids
+from bloginator.indexing._indexed_sources import indexed_sources
+from bloginator.indexing._voice_profile import (
+    DEFAULT_CLUSTERS,
+    VOICE_PROFILE_FILE,
+    build_voice_profile,
+)
 from bloginator.models import Chunk, Document
 
 
 if TYPE_CHECKING:
-    from chromadb.api.types import Metadatas
+    from chromadb.api.types import Metadatas, Where
+
+# Chunks read per query while building the voice profile
+VOICE_PROFILE_PAGE_SIZE = 5000
+
+# Chunk metadata the voice profile groups by
+_PROFILE_FIELDS = ("quality_rating",)
 
 
 class CorpusIndexer:
@@ -102,55 +118,174 @@ class CorpusIndexer:
             document: Document metadata
             chunks: List of text chunks to index
         """
-        if not chunks:
-            return
+        self.index_documents([(document, chunks)])
+
+    def index_documents(
+        self, batch: list[tuple[Document, list[Chunk]]], replace: bool = False
+    ) -> None:
+        """Add chunks for several documents with one embedding call and one write.
 
-        # Generate embeddings
-        contents = [chunk.content for chunk in chunks]
-        embeddings = self.embedding_model.encode(contents, show_progress_bar=False)
+        Batching amortizes model invocation and ChromaDB write overhead across
+        documents, which matters when many small documents are streamed in.
 
-        # Prepare metadata for each chunk
+        With replace, chunks already indexed for the batch's documents are
+        deleted only after the new chunks are written, so a document being
+        re-indexed stays searchable throughout and keeps its old chunks if the
+        write fails.
+
+        Args:
+            batch: List of (document, chunks) pairs to index
+            replace: Remove the documents' previously indexed chunks
+        """
+        stale_ids = self._chunk_ids([document.id for document, _ in batch]) if replace else []
+
+        ids: list[str] = []
+        contents: list[str] = []
         metadatas: list[dict[str, Any]] = []
-        for chunk in chunks:
-            metadata: dict[str, Any] = {
-                "document_id": chunk.document_id,
-                "chunk_index": chunk.chunk_index,
-                "section_heading": chunk.section_heading or "",
-                "char_start": chunk.char_start,
-                "char_end": chunk.char_end,
-                # Document-level metadata
-                "source": document.filename,  # Critical: used by outline/draft prompts
-                "filename": document.filename,
-                "format": document.format,
-                "quality_rating": str(
-                    document.quality_rating.value
-                    if hasattr(document.quality_rating, "value")
-                    else document.quality_rating
-                ),
-                "is_external_source": document.is_external_source,
-                "tags": ",".join(document.tags) if document.tags else "",
-            }
-
-            # Add dates if available
-            if document.created_date:
-                metadata["created_date"] = document.created_date.isoformat()
-            if document.modified_date:
-                metadata["modified_date"] = document.modified_date.isoformat()
-
-            # Add content checksum for incremental indexing
-            if document.content_checksum:
-                metadata["content_checksum"] = document.content_checksum
-
-            metadatas.append(metadata)
-
-        # Add to ChromaDB collection
-        self.collection.add(
-            ids=[chunk.id for chunk in chunks],
-            embeddings=embeddings.tolist(),
-            documents=contents,
-            metadatas=cast("Metadatas", metadatas),
+
+        for document, chunks in batch:
+            for chunk in chunks:
+                ids.append(chunk.id)
+                contents.append(chunk.content)
+                metadatas.append(self._build_chunk_metadata(document, chunk))
+
+        if contents:
+            # Generate embeddings
+            embeddings = self.embedding_model.encode(contents, show_progress_bar=False)
+
+            # Add to ChromaDB collection
+            self.collection.add(
+                ids=ids,
+                embeddings=embeddings.tolist(),
+                documents=contents,
+                metadatas=cast("Metadatas", metadatas),
+            )
+
+        if stale_ids:
+            self.collection.delete(ids=stale_ids)
+
+    def _chunk_ids(self, document_ids: list[str]) -> list[str]:
+        """IDs of the indexed chunks of some documents."""
+        if not document_ids:
+            return []
+        where = cast("Where", {"document_id": {"$in": document_ids}})
+        results = self.collection.get(where=where, include=[])
+        return list(results["ids"]) if results else []
+
+    def _build_chunk_metadata(self, document: Document, chunk: Chunk) -> dict[str, Any]:
+        """Build ChromaDB metadata for a chunk.
+
+        Args:
+            document: Parent document metadata
+            chunk: Chunk being indexed
+
+        Returns:
+            Flat metadata dictionary
+        """
+        metadata: dict[str, Any] = {
+            "document_id": chunk.document_id,
+            "chunk_index": chunk.chunk_index,
+            "section_heading": chunk.section_heading or "",
+            "char_start": chunk.char_start,
+            "char_end": chunk.char_end,
+            # Document-level metadata
+            "source": document.filename,  # Critical: used by outline/draft prompts
+            "filename": document.filename,
+            "source_path": str(document.source_path),
+            "format": document.format,
+            "quality_rating": str(
+                document.quality_rating.value
+                if hasattr(document.quality_rating, "value")
+                else document.quality_rating
+            ),
+            "is_external_source": document.is_external_source,
+            "tags": ",".join(document.tags) if document.tags else "",
+        }
+
+        # Add dates if available
+        if document.created_date:
+            metadata["created_date"] = document.created_date.isoformat()
+        if document.modified_date:
+            metadata["modified_date"] = document.modified_date.isoformat()
+
+        # Add content checksum for incremental indexing
+        if document.content_checksum:
+            metadata["content_checksum"] = document.content_checksum
+
+        return metadata
+
+    def get_indexed_sources(self, paths: Iterable[Path] = ()) -> dict[str, tuple[str, datetime]]:
+        """Map source file paths to indexed documents.
+
+        Returns the same shape as ``load_existing_extractions`` so indexed
+        documents can drive the extraction skip logic when no extracted
+        text is kept on disk.
+
+        Args:
+            paths: Files about to be ingested; documents in indexes built
+                before source paths were recorded are matched to these by name
+
+        Returns:
+            Dictionary mapping source_path to (document_id, modified_date)
+
+        Raises:
+            ValueError: If an older index's documents cannot be matched to
+                files unambiguously (see indexed_sources)
+        """
+        results = self.collection.get(where={"chunk_index": 0}, include=["metadatas"])
+        return indexed_sources(results.get("metadatas") or [], paths)
+
+    def build_voice_profile(
+        self, n_clusters: int = DEFAULT_CLUSTERS, page_size: int = VOICE_PROFILE_PAGE_SIZE
+    ) -> Path | None:
+        """Compute the author voice profile and store it with the index.
+
+        Reads the stored chunk embeddings, so nothing is re-encoded. They are
+        read a page at a time and kept as float32 arrays, so the corpus is
+        never held as one Chroma response of Python float lists.
+
+        Args:
+            n_clusters: Number of author-style clusters
+            page_size: Chunks read per collection query
+
+        Returns:
+            Path of the profile file, or None if the index has no usable chunks
+        """
+        pages: list[np.ndarray] = []
+        metadatas: list[dict[str, Any]] = []
+        chunk_ids: list[str] = []
+        while True:
+            results = self.collection.get(
+                include=["embeddings", "metadatas"], limit=page_size, offset=len(metadatas)
+            )
+            embeddings = results.get("embeddings")
+            if embeddings is None or len(embeddings) == 0:
+                break
+            pages.append(np.asarray(embeddings, dtype=np.float32))
+            chunk_ids.extend(results["ids"])
+            # Only the fields the profile groups by
+            page_metadatas = results.get("metadatas") or [{}] * len(embeddings)
+            metadatas.extend(
+                {key: metadata[key] for key in _PROFILE_FIELDS if key in metadata}
+                for metadata in (m or {} for m in page_metadatas)
+            )
+            if len(embeddings) < page_size:
+                break
+
+        profile = build_voice_profile(
+            np.concatenate(pages) if pages else [],
+            metadatas,
+            n_clusters=n_clusters,
+            fingerprint=fingerprint_chunk_ids(chunk_ids),
         )
 
+        path = self.output_dir / VOICE_PROFILE_FILE
+        if profile is None:
+            path.unlink(missing_ok=True)
+            return None
+        profile.save(path)
+        return path
+
     def get_total_chunks(self) -> int:
         """Get total number of chunks in index.
 
@@ -165,11 +300,9 @@ class CorpusIndexer:
         Args:
             document_id: ID of document to delete
         """
-        # Query for chunks with this document_id
-        results = self.collection.get(where={"document_id": document_id})
-
-        if results and results["ids"]:
-            self.collection.delete(ids=results["ids"])
+        chunk_ids = self._chunk_ids([document_id])
+        if chunk_ids:
+            self.collection.delete(ids=chunk_ids)
 
     def clear_index(self) -> None:
         """Clear all documents from the index."""
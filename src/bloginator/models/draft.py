@@ -5,6 +5,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from bloginator.utils.checksum import calculate_content_checksum
+
 
 class Citation(BaseModel):
     """Source citation for generated content.
@@ -66,6 +68,17 @@ class DraftSection(BaseModel):
         """
         return len(self.content.split())
 
+    def content_hash(self) -> str:
+        """Get a checksum of this section's title and content.
+
+        Subsections are not included. Used to recognize unchanged sections
+        whose scores can be reused.
+
+        Returns:
+            Hex-encoded SHA256 checksum
+        """
+        return calculate_content_checksum(f"{self.title}\n{self.content}")
+
 
 class Draft(BaseModel):
     """Complete draft document with citations and metadata.
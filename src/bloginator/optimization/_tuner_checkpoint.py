@@ -0,0 +1,192 @@
+"""Checkpoints and baseline cache for prompt tuning runs.
+
+Each test case's rounds are saved to a checkpoint after every round, so an
+interrupted run resumes from the last finished round instead of starting
+over; the checkpoint is deleted once the case finishes. The first
+(baseline) round of a test case is also cached. Both are keyed by the run
+key (a fingerprint of the prompt files, the model and the index): a rerun
+after editing a prompt or switching the LLM or corpus starts over instead
+of replaying rounds generated under the old setup.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from bloginator.optimization._tuner_models import RoundResult, TestCase
+from bloginator.optimization._tuner_serializer import (
+    round_result_from_dict,
+    round_result_to_dict,
+    test_case_to_dict,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Directory (under the output directory) holding per-case checkpoints
+CHECKPOINT_DIR = "checkpoints"
+
+# Directory (under the output directory) holding cached baseline rounds
+BASELINE_DIR = "baselines"
+
+
+def prompts_fingerprint(prompts_dir: Path) -> str:
+    """Hash every prompt file, so any edit changes the fingerprint.
+
+    Args:
+        prompts_dir: Prompt directory
+
+    Returns:
+        Hex-encoded SHA256 of the YAML files' paths and contents
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(prompts_dir).rglob("*.yaml")):
+        digest.update(str(path.relative_to(prompts_dir)).encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def tuning_run_key(prompts_dir: Path, model: str, index: str) -> dict[str, str]:
+    """Describe what a tuning run's rounds were generated with.
+
+    Args:
+        prompts_dir: Prompt directory (its files are fingerprinted)
+        model: LLM model name
+        index: Index the corpus searcher reads
+
+    Returns:
+        Key that checkpoints and cached baselines must match to be reused
+    """
+    return {"prompts": prompts_fingerprint(prompts_dir), "model": model, "index": index}
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON atomically, so a crash never leaves a torn file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    Path(tmp).replace(path)
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable tuning state {path}: {e}")
+        return None
+    return data if isinstance(data, dict) else None
+
+
+@dataclass
+class CaseCheckpoint:
+    """Finished rounds of one test case.
+
+    Attributes:
+        test_case: Test case the rounds belong to
+        run_key: tuning_run_key() the rounds were generated with
+        rounds: Finished rounds, in order
+    """
+
+    test_case: TestCase
+    run_key: dict[str, str] = field(default_factory=dict)
+    rounds: list[RoundResult] = field(default_factory=list)
+
+    @staticmethod
+    def path(output_dir: Path, test_case: TestCase) -> Path:
+        """Get the checkpoint file for a test case."""
+        return output_dir / CHECKPOINT_DIR / f"{test_case.id}.json"
+
+    @classmethod
+    def load(
+        cls, output_dir: Path, test_case: TestCase, run_key: dict[str, str]
+    ) -> "CaseCheckpoint":
+        """Load a test case's checkpoint.
+
+        Args:
+            output_dir: Tuning output directory
+            test_case: Test case to resume
+            run_key: tuning_run_key() of the current run
+
+        Returns:
+            The saved rounds, or an empty checkpoint if there is none or it
+            was written for a different version of the test case, prompts,
+            model or index
+        """
+        data = _read_json(cls.path(output_dir, test_case))
+        if (
+            data is None
+            or data.get("test_case") != test_case_to_dict(test_case)
+            or data.get("run_key") != run_key
+        ):
+            return cls(test_case, run_key)
+        rounds = [round_result_from_dict(r) for r in data.get("rounds", [])]
+        return cls(test_case, run_key, rounds)
+
+    def save(self, output_dir: Path) -> None:
+        """Write the checkpoint.
+
+        Args:
+            output_dir: Tuning output directory
+        """
+        _write_json(
+            self.path(output_dir, self.test_case),
+            {
+                "test_case": test_case_to_dict(self.test_case),
+                "run_key": self.run_key,
+                "rounds": [round_result_to_dict(r) for r in self.rounds],
+            },
+        )
+
+    def delete(self, output_dir: Path) -> None:
+        """Remove the checkpoint once the test case is finished.
+
+        Args:
+            output_dir: Tuning output directory
+        """
+        self.path(output_dir, self.test_case).unlink(missing_ok=True)
+
+
+def _baseline_path(output_dir: Path, test_case: TestCase, run_key: dict[str, str]) -> Path:
+    material = json.dumps([test_case_to_dict(test_case), run_key], sort_keys=True)
+    key = hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+    return output_dir / BASELINE_DIR / f"{test_case.id}-{key}.json"
+
+
+def load_baseline(
+    output_dir: Path, test_case: TestCase, run_key: dict[str, str]
+) -> RoundResult | None:
+    """Get the cached baseline round for a test case and run key.
+
+    Args:
+        output_dir: Tuning output directory
+        test_case: Test case
+        run_key: tuning_run_key() of the unmodified prompts
+
+    Returns:
+        The cached first round, or None
+    """
+    data = _read_json(_baseline_path(output_dir, test_case, run_key))
+    return round_result_from_dict(data) if data is not None else None
+
+
+def save_baseline(
+    output_dir: Path, test_case: TestCase, run_key: dict[str, str], result: RoundResult
+) -> None:
+    """Cache a test case's baseline round.
+
+    Args:
+        output_dir: Tuning output directory
+        test_case: Test case
+        run_key: tuning_run_key() of the unmodified prompts
+        result: First round of the test case
+    """
+    _write_json(_baseline_path(output_dir, test_case, run_key), round_result_to_dict(result))
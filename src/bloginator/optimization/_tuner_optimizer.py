@@ -3,6 +3,7 @@
 import json
 import logging
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,21 @@ from bloginator.optimization._tuner_serializer import round_result_to_dict
 logger = logging.getLogger(__name__)
 
 
+def strategy_to_apply(round_result: RoundResult) -> dict[str, Any] | None:
+    """Get a round's evolutionary strategy if it warrants mutating prompts.
+
+    Args:
+        round_result: Finished round
+
+    Returns:
+        The strategy, or None if the round calls for no prompt changes
+    """
+    strategy = round_result.evolutionary_strategy
+    if strategy.get("priority") in ["high", "critical"] and round_result.slop_violations > 0:
+        return strategy
+    return None
+
+
 def run_optimization_rounds(
     test_case: TestCase,
     num_iterations: int,
@@ -21,6 +37,8 @@ def run_optimization_rounds(
     get_evaluation_func: Any,
     apply_mutations_func: Any,
     sleep_between_rounds: float,
+    completed_rounds: list[RoundResult] | None = None,
+    on_round: Callable[[RoundResult], None] | None = None,
 ) -> tuple[list[RoundResult], float, int, float, int]:
     """Execute optimization rounds for a single test case.
 
@@ -32,6 +50,11 @@ def run_optimization_rounds(
         get_evaluation_func: Function to evaluate results
         apply_mutations_func: Function to apply prompt mutations
         sleep_between_rounds: Seconds to sleep between rounds
+        completed_rounds: Rounds already finished (e.g. from a checkpoint);
+            their mutations must already be applied, and the loop continues
+            after them
+        on_round: Called with each newly finished round, after its
+            mutations are applied
 
     Returns:
         Tuple of (round_results, baseline_score, baseline_violations,
@@ -39,10 +62,18 @@ def run_optimization_rounds(
     """
     logger.info(f"Optimizing test case: {test_case.name}")
 
-    round_results: list[RoundResult] = []
-    previous_result = None
+    round_results: list[RoundResult] = list(completed_rounds or [])[:num_iterations]
+    previous_result = round_results[-1] if round_results else None
+    start = len(round_results)
+    if start:
+        logger.info(f"  Resuming after round {start}/{num_iterations}")
+
+    for round_num in range(start, num_iterations):
+        if round_num > start:
+            # Sleep between rounds to avoid pummeling the LLM
+            logger.info(f"    Sleeping {sleep_between_rounds}s before next round...")
+            time.sleep(sleep_between_rounds)
 
-    for round_num in range(num_iterations):
         logger.info(f"  Round {round_num + 1}/{num_iterations}")
 
         # Generate outline and draft
@@ -100,14 +131,12 @@ def run_optimization_rounds(
         )
 
         # Apply evolutionary strategy (mutate prompts)
-        if strategy.get("priority") in ["high", "critical"] and total_violations > 0:
+        if strategy_to_apply(round_result) is not None:
             apply_mutations_func(strategy)
             logger.info(f"    Applied {len(strategy.get('specific_changes', []))} prompt mutations")
 
-        # Sleep between rounds to avoid pummeling the LLM
-        if round_num < num_iterations - 1:  # Don't sleep after last round
-            logger.info(f"    Sleeping {sleep_between_rounds}s before next round...")
-            time.sleep(sleep_between_rounds)
+        if on_round is not None:
+            on_round(round_result)
 
     # Calculate baseline vs final
     baseline_score = round_results[0].score
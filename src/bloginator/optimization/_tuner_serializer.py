@@ -52,3 +52,20 @@ def tuning_result_to_dict(result: TuningResult) -> dict[str, Any]:
         "rounds": [round_result_to_dict(r) for r in result.rounds],
         "timestamp": result.timestamp,
     }
+
+
+def round_result_from_dict(data: dict[str, Any]) -> RoundResult:
+    """Rebuild a round result from its JSON form."""
+    return RoundResult(
+        round_number=data["round_number"],
+        test_case_id=data["test_case_id"],
+        score=data["score"],
+        slop_violations=data["slop_violations"],
+        critical_violations=data["critical_violations"],
+        high_violations=data["high_violations"],
+        medium_violations=data["medium_violations"],
+        low_violations=data["low_violations"],
+        evolutionary_strategy=data.get("evolutionary_strategy", {}),
+        evaluation_details=data.get("evaluation_details", {}),
+        timestamp=data.get("timestamp", ""),
+    )
@@ -6,22 +6,33 @@ Based on the one-pager repo pattern:
 3. Score results using voice matching and slop detection
 4. Iteratively improve prompts using AI-driven evolutionary strategy
 5. Validate improvements
+
+Test cases are optimized independently, so they run on a worker pool; each
+gets its own PromptLoader, so one case's prompt mutations never affect
+another. Every finished round is checkpointed until the case completes, and
+baseline rounds are cached per test case, prompt version, model and index.
 """
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import yaml
-from jinja2 import Template
 
 from bloginator.generation.draft_generator import DraftGenerator
 from bloginator.generation.llm_client import LLMClient
 from bloginator.generation.outline_generator import OutlineGenerator
 from bloginator.models.draft import Draft
 from bloginator.models.outline import Outline
+from bloginator.optimization._tuner_checkpoint import (
+    CaseCheckpoint,
+    load_baseline,
+    save_baseline,
+    tuning_run_key,
+)
 from bloginator.optimization._tuner_evaluator import (
     get_ai_evaluation,
     get_automated_evaluation,
@@ -29,10 +40,10 @@ from bloginator.optimization._tuner_evaluator import (
 )
 from bloginator.optimization._tuner_models import RoundResult, TestCase, TuningResult
 from bloginator.optimization._tuner_mutator import apply_prompt_mutations
-from bloginator.optimization._tuner_optimizer import run_optimization_rounds
+from bloginator.optimization._tuner_optimizer import run_optimization_rounds, strategy_to_apply
 from bloginator.optimization._tuner_serializer import test_case_to_dict, tuning_result_to_dict
 from bloginator.optimization._tuner_test_generator import get_test_cases
-from bloginator.prompts.loader import PromptLoader
+from bloginator.prompts.loader import PromptLoader, compile_template
 from bloginator.quality.slop_detector import SlopDetector
 from bloginator.search import CorpusSearcher
 
@@ -56,24 +67,36 @@ class PromptTuner:
         output_dir: Path | None = None,
         sleep_between_rounds: float = 2.0,
         evaluator_llm_client: LLMClient | None = None,
+        max_workers: int = 1,
     ):
         """Initialize prompt tuner.
 
         Args:
             llm_client: LLM client for content generation
             searcher: Corpus searcher for RAG
-            prompt_loader: Prompt loader (creates default if None)
+            prompt_loader: Prompt loader shared by the generators (creates a
+                hot-reloading default if None, so edited prompt files apply
+                on the next round)
             output_dir: Directory for results (default: ./prompt_tuning_results)
             sleep_between_rounds: Seconds to sleep between rounds (default: 2.0)
             evaluator_llm_client: Separate LLM client for AI evaluation (uses llm_client if None)
+            max_workers: Test cases optimized at once; the LLM clients must
+                be thread-safe when above 1
+
+        Raises:
+            ValueError: If max_workers is less than 1
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
         self.llm_client = llm_client
         self.evaluator_llm_client = evaluator_llm_client or llm_client
         self.searcher = searcher
-        self.prompt_loader = prompt_loader or PromptLoader()
+        self.prompt_loader = prompt_loader or PromptLoader(auto_reload=True)
         self.output_dir = output_dir or Path("./prompt_tuning_results")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.sleep_between_rounds = sleep_between_rounds
+        self.max_workers = max_workers
 
         # Load meta-prompt for evaluation
         # __file__ is absolute, so: .../src/bloginator/optimization/prompt_tuner.py
@@ -86,16 +109,18 @@ class PromptTuner:
         )
         with meta_prompt_file.open() as f:
             meta_data = yaml.safe_load(f)
-            self.meta_prompt_template = Template(meta_data["evaluation_prompt"])
+            self.meta_prompt_template = compile_template(meta_data["evaluation_prompt"])
 
         # Initialize components
         self.outline_generator = OutlineGenerator(
             llm_client=llm_client,
             searcher=searcher,
+            prompt_loader=self.prompt_loader,
         )
         self.draft_generator = DraftGenerator(
             llm_client=llm_client,
             searcher=searcher,
+            prompt_loader=self.prompt_loader,
         )
         self.slop_detector = SlopDetector()
 
@@ -224,12 +249,18 @@ class PromptTuner:
         self,
         num_iterations: int = 3,
         num_test_cases: int = 2,
+        resume: bool = True,
     ) -> list[TuningResult]:
         """Run prompt optimization across multiple rounds.
 
+        Test cases run concurrently, up to max_workers at a time.
+
         Args:
             num_iterations: Number of optimization rounds to run
             num_test_cases: Number of test cases to use
+            resume: Continue from checkpoints and reuse cached baseline
+                rounds generated with the same prompts, model and index
+                (False starts every test case over)
 
         Returns:
             List of tuning results with round-by-round data
@@ -250,44 +281,19 @@ class PromptTuner:
                 indent=2,
             )
 
-        results: list[TuningResult] = []
-
-        # Run optimization for each test case
-        for test_case in test_cases:
-            (
-                round_results,
-                baseline_score,
-                baseline_violations,
-                final_score,
-                final_violations,
-            ) = run_optimization_rounds(
-                test_case=test_case,
-                num_iterations=num_iterations,
-                output_dir=self.output_dir,
-                run_baseline_func=self.run_baseline,
-                get_evaluation_func=self._get_ai_evaluation,
-                apply_mutations_func=self._apply_prompt_mutations,
-                sleep_between_rounds=self.sleep_between_rounds,
-            )
-
-            result = TuningResult(
-                test_case_id=test_case.id,
-                baseline_score=baseline_score,
-                improved_score=final_score,
-                improvement=final_score - baseline_score,
-                slop_violations_before=baseline_violations,
-                slop_violations_after=final_violations,
-                voice_score_before=baseline_score,
-                voice_score_after=final_score,
-                rounds=round_results,
-            )
+        run_key = self._run_key()
 
-            results.append(result)
+        def optimize_case(test_case: TestCase) -> TuningResult:
+            return self._optimize_case(test_case, num_iterations, run_key, resume)
 
-            # Save individual result
-            result_file = self.output_dir / f"result_{test_case.id}.json"
-            with result_file.open("w") as f:
-                json.dump(tuning_result_to_dict(result), f, indent=2)
+        workers = min(self.max_workers, len(test_cases))
+        if workers <= 1:
+            results = [optimize_case(test_case) for test_case in test_cases]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="bloginator-tuning"
+            ) as executor:
+                results = list(executor.map(optimize_case, test_cases))
 
         # Save summary
         summary_file = self.output_dir / "optimization_summary.json"
@@ -308,3 +314,124 @@ class PromptTuner:
         logger.info(f"Optimization complete. Results saved to {self.output_dir}")
 
         return results
+
+    def _run_key(self) -> dict[str, str]:
+        """Key of what this run generates with: prompts, model and index."""
+        model = getattr(self.llm_client, "model", "")
+        index = getattr(self.searcher, "index_dir", "")
+        return tuning_run_key(
+            self.prompt_loader.prompts_dir,
+            model=model if isinstance(model, str) else "",
+            index=str(index) if isinstance(index, str | Path) else "",
+        )
+
+    def _optimize_case(
+        self,
+        test_case: TestCase,
+        num_iterations: int,
+        run_key: dict[str, str],
+        resume: bool,
+    ) -> TuningResult:
+        """Run (or resume) the optimization rounds of one test case.
+
+        The case gets its own PromptLoader and generators. Mutations from
+        checkpointed rounds are replayed into that loader before continuing.
+
+        Args:
+            test_case: Test case to optimize
+            num_iterations: Number of rounds to run
+            run_key: tuning_run_key() of the unmodified prompts, model and index
+            resume: Use the checkpoint and cached baseline, if any
+
+        Returns:
+            Tuning result for the test case
+        """
+        prompt_loader = PromptLoader(prompts_dir=self.prompt_loader.prompts_dir, auto_reload=True)
+        outline_generator = OutlineGenerator(
+            llm_client=self.llm_client,
+            searcher=self.searcher,
+            prompt_loader=prompt_loader,
+        )
+        draft_generator = DraftGenerator(
+            llm_client=self.llm_client,
+            searcher=self.searcher,
+            prompt_loader=prompt_loader,
+        )
+
+        def run_round(test_case: TestCase) -> tuple[Outline, Draft, float]:
+            outline = outline_generator.generate(
+                title=test_case.title,
+                keywords=test_case.keywords,
+                thesis=test_case.thesis,
+                classification=test_case.classification,
+                audience=test_case.audience,
+            )
+            draft = draft_generator.generate(outline=outline)
+            return outline, draft, self._score_draft(draft)
+
+        def apply_mutations(strategy: dict[str, Any]) -> None:
+            apply_prompt_mutations(strategy, prompt_loader)
+
+        checkpoint = (
+            CaseCheckpoint.load(self.output_dir, test_case, run_key)
+            if resume
+            else CaseCheckpoint(test_case, run_key)
+        )
+        if resume and not checkpoint.rounds:
+            baseline = load_baseline(self.output_dir, test_case, run_key)
+            if baseline is not None:
+                logger.info(f"Reusing cached baseline round for test case {test_case.id}")
+                checkpoint.rounds.append(baseline)
+                checkpoint.save(self.output_dir)
+
+        # Bring this case's prompts to where the finished rounds left them
+        for finished in checkpoint.rounds[:num_iterations]:
+            strategy = strategy_to_apply(finished)
+            if strategy is not None:
+                apply_mutations(strategy)
+
+        def on_round(round_result: RoundResult) -> None:
+            checkpoint.rounds.append(round_result)
+            checkpoint.save(self.output_dir)
+            if round_result.round_number == 1:
+                save_baseline(self.output_dir, test_case, run_key, round_result)
+
+        (
+            round_results,
+            baseline_score,
+            baseline_violations,
+            final_score,
+            final_violations,
+        ) = run_optimization_rounds(
+            test_case=test_case,
+            num_iterations=num_iterations,
+            output_dir=self.output_dir,
+            run_baseline_func=run_round,
+            get_evaluation_func=self._get_ai_evaluation,
+            apply_mutations_func=apply_mutations,
+            sleep_between_rounds=self.sleep_between_rounds,
+            completed_rounds=checkpoint.rounds,
+            on_round=on_round,
+        )
+
+        result = TuningResult(
+            test_case_id=test_case.id,
+            baseline_score=baseline_score,
+            improved_score=final_score,
+            improvement=final_score - baseline_score,
+            slop_violations_before=baseline_violations,
+            slop_violations_after=final_violations,
+            voice_score_before=baseline_score,
+            voice_score_after=final_score,
+            rounds=round_results,
+        )
+
+        # Save individual result
+        result_file = self.output_dir / f"result_{test_case.id}.json"
+        with result_file.open("w") as f:
+            json.dump(tuning_result_to_dict(result), f, indent=2)
+
+        # The result file now holds the rounds; a rerun starts the case over
+        checkpoint.delete(self.output_dir)
+
+        return result
@@ -1,11 +1,78 @@
 """Prompt loading and rendering from YAML files."""
 
+import logging
+import threading
 from pathlib import Path
 from typing import Any
 
 import yaml
-from jinja2 import Template
-from pydantic import BaseModel, Field
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, Template
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+logger = logging.getLogger(__name__)
+
+
+class _SourceLoader(BaseLoader):
+    """Jinja loader whose template names are the template sources themselves.
+
+    Keying on the source lets the environment's template cache and bytecode
+    cache serve any prompt string, and an edited prompt simply gets a new key.
+    """
+
+    def get_source(self, environment: Environment, template: str) -> tuple[str, None, Any]:
+        return template, None, lambda: True
+
+
+# Shared environment: compiled templates are cached in memory (LRU) and their
+# bytecode on disk, so processes rendering the same prompts skip compilation.
+# The bytecode cache is attached on first use (see _attach_bytecode_cache).
+_ENVIRONMENT = Environment(loader=_SourceLoader(), cache_size=400)
+_bytecode_cache_lock = threading.Lock()
+_bytecode_cache_attached = False
+
+
+def _attach_bytecode_cache() -> None:
+    """Cache template bytecode under the data directory, once per process.
+
+    Without a usable directory, templates are compiled without a bytecode cache.
+    """
+    global _bytecode_cache_attached
+    with _bytecode_cache_lock:
+        if _bytecode_cache_attached:
+            return
+        _bytecode_cache_attached = True
+
+        from bloginator.config import config
+
+        cache_dir = config.template_cache_dir
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.debug(f"Template bytecode cache disabled ({cache_dir}): {e}")
+            return
+        _ENVIRONMENT.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+
+
+def compile_template(source: str) -> Template:
+    """Compile a Jinja template through the shared environment.
+
+    Args:
+        source: Template source
+
+    Returns:
+        Compiled template, reused for identical sources
+    """
+    _attach_bytecode_cache()
+    try:
+        return _ENVIRONMENT.get_template(source)
+    except OSError as e:
+        # The cache directory became unwritable or vanished; compile without it
+        if _ENVIRONMENT.bytecode_cache is None:
+            raise
+        logger.debug(f"Template bytecode cache disabled: {e}")
+        _ENVIRONMENT.bytecode_cache = None
+        return _ENVIRONMENT.get_template(source)
 
 
 class PromptTemplate(BaseModel):
@@ -21,26 +88,35 @@ class PromptTemplate(BaseModel):
     quality_criteria: list[str] = Field(default_factory=list)
     ai_slop_patterns: dict[str, Any] = Field(default_factory=dict)
 
+    _compiled: dict[str, Template] = PrivateAttr(default_factory=dict)
+
+    def _template(self, source: str) -> Template:
+        """Get the compiled template for a source, compiling it on first use."""
+        template = self._compiled.get(source)
+        if template is None:
+            template = self._compiled[source] = compile_template(source)
+        return template
+
     def render_system_prompt(self, **kwargs: Any) -> str:
         """Render system prompt with variables."""
-        template = Template(self.system_prompt)
-        return template.render(**kwargs)
+        return self._template(self.system_prompt).render(**kwargs)
 
     def render_user_prompt(self, **kwargs: Any) -> str:
         """Render user prompt with variables."""
-        template = Template(self.user_prompt_template)
-        return template.render(**kwargs)
+        return self._template(self.user_prompt_template).render(**kwargs)
 
 
 class PromptLoader:
     """Load and cache prompt templates from YAML files."""
 
-    def __init__(self, prompts_dir: Path | None = None):
+    def __init__(self, prompts_dir: Path | None = None, auto_reload: bool = False):
         """Initialize prompt loader.
 
         Args:
             prompts_dir: Directory containing prompt YAML files.
                         Defaults to project root/prompts directory.
+            auto_reload: Reload a cached prompt when its file's mtime changes,
+                so edits apply without restarting (used by prompt tuning)
         """
         if prompts_dir is None:
             # Find project root by looking for pyproject.toml
@@ -57,7 +133,9 @@ class PromptLoader:
         if not self.prompts_dir.exists():
             raise FileNotFoundError(f"Prompts directory not found: {self.prompts_dir}")
 
+        self.auto_reload = auto_reload
         self._cache: dict[str, PromptTemplate] = {}
+        self._mtimes: dict[str, float] = {}
 
     def load(self, prompt_path: str) -> PromptTemplate:
         """Load prompt template from YAML file.
@@ -72,14 +150,19 @@ class PromptLoader:
             FileNotFoundError: If prompt file doesn't exist
             ValueError: If prompt file is invalid
         """
-        # Check cache first
-        if prompt_path in self._cache:
-            return self._cache[prompt_path]
+        full_path = self.prompts_dir / prompt_path
+
+        # Check cache first (with auto_reload, only while the file is unchanged)
+        cached = self._cache.get(prompt_path)
+        if cached is not None and (
+            not self.auto_reload or self._mtime(full_path) == self._mtimes.get(prompt_path)
+        ):
+            return cached
 
         # Load from file
-        full_path = self.prompts_dir / prompt_path
         if not full_path.exists():
             raise FileNotFoundError(f"Prompt file not found: {full_path}")
+        mtime = self._mtime(full_path)
 
         with full_path.open() as f:
             data = yaml.safe_load(f)
@@ -90,10 +173,19 @@ class PromptLoader:
         except Exception as e:
             raise ValueError(f"Invalid prompt file {prompt_path}: {e}") from e
 
-        # Cache and return
+        # Cache and return; a new PromptTemplate compiles its sources afresh
         self._cache[prompt_path] = template
+        self._mtimes[prompt_path] = mtime
         return template
 
+    @staticmethod
+    def _mtime(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return -1.0
+
     def clear_cache(self) -> None:
         """Clear the prompt template cache."""
         self._cache.clear()
+        self._mtimes.clear()
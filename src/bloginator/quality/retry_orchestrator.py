@@ -2,12 +2,17 @@
 
 This module orchestrates the retry logic for blog generation, using quality
 assurance to detect poor results and retry with alternate prompts until
-satisfactory content is produced.
+satisfactory content is produced. Attempts share one GenerationContext, so
+corpus searches, topic validation and voice samples are done once per
+request rather than once per attempt.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Any
 
+from bloginator.generation._generation_context import GenerationContext
 from bloginator.generation.draft_generator import DraftGenerator
 from bloginator.generation.llm_client import LLMClient
 from bloginator.generation.outline_generator import OutlineGenerator
@@ -51,6 +56,7 @@ class RetryOrchestrator:
         searcher: CorpusSearcher,
         quality_assurance: QualityAssurance | None = None,
         max_retries: int = 3,
+        speculative: bool = False,
     ):
         """Initialize retry orchestrator.
 
@@ -59,11 +65,14 @@ class RetryOrchestrator:
             searcher: Corpus searcher for RAG
             quality_assurance: Quality assurance system (creates default if None)
             max_retries: Maximum number of retry attempts
+            speculative: Run prompt variants two at a time and keep the
+                better-scoring result; the LLM client must be thread-safe
         """
         self.llm_client = llm_client
         self.searcher = searcher
         self.qa = quality_assurance or QualityAssurance(max_retries=max_retries)
         self.max_retries = max_retries
+        self.speculative = speculative
 
     def generate_with_retry(
         self,
@@ -85,84 +94,141 @@ class RetryOrchestrator:
         Returns:
             GenerationResult with final content and quality assessment
         """
+        context = GenerationContext(self.searcher)
+        request = {
+            "title": title,
+            "keywords": keywords,
+            "thesis": thesis,
+            "classification": classification,
+            "audience": audience,
+        }
+        total = self.max_retries + 1
+        width = 2 if self.speculative else 1
+        lanes = [self._create_generators(context) for _ in range(min(width, total))]
+
         attempts: list[GenerationAttempt] = []
-        prompt_variants = self._get_prompt_variants()
-
-        for attempt_num in range(self.max_retries + 1):
-            # Select prompt variant
-            variant_name = prompt_variants[min(attempt_num, len(prompt_variants) - 1)]
-            logger.info(
-                f"Generation attempt {attempt_num + 1}/{self.max_retries + 1} using variant: {variant_name}"
-            )
-
-            # Get custom template for this variant (if available)
-            custom_template = self._get_prompt_template(variant_name)
-
-            # Generate content
-            outline_gen = OutlineGenerator(
-                llm_client=self.llm_client,
-                searcher=self.searcher,
-            )
-            draft_gen = DraftGenerator(
-                llm_client=self.llm_client,
-                searcher=self.searcher,
-            )
-
-            outline = outline_gen.generate(
-                title=title,
-                keywords=keywords,
-                thesis=thesis,
-                classification=classification,
-                audience=audience,
-                custom_prompt_template=custom_template,
-            )
-
-            draft = draft_gen.generate(outline=outline)
-
-            # Assess quality
-            assessment = self.qa.assess_quality(outline, draft)
-
-            # Record attempt
-            attempt = GenerationAttempt(
-                attempt_number=attempt_num + 1,
-                outline=outline,
-                draft=draft,
-                assessment=assessment,
-                prompt_variant=variant_name,
-            )
-            attempts.append(attempt)
-
-            logger.info(
-                f"Attempt {attempt_num + 1}: Quality={assessment.quality_level.value}, "
-                f"Score={assessment.score:.2f}, Violations={assessment.total_violations}"
-            )
-
-            # Check if quality is acceptable
-            if not assessment.retry_suggested:
-                logger.info(f"Acceptable quality achieved on attempt {attempt_num + 1}")
-                return GenerationResult(
-                    success=True,
-                    final_attempt=attempt,
-                    all_attempts=attempts,
-                    total_attempts=len(attempts),
-                    final_quality=assessment.quality_level,
-                )
-
-            # Log retry reason
-            if attempt_num < self.max_retries:
-                logger.warning(
-                    f"Quality below threshold. Issues: {', '.join(assessment.issues)}. "
-                    f"Retrying with variant: {prompt_variants[min(attempt_num + 1, len(prompt_variants) - 1)]}"
-                )
+        with ThreadPoolExecutor(
+            max_workers=len(lanes), thread_name_prefix="bloginator-speculative"
+        ) as executor:
+            while len(attempts) < total:
+                numbers = range(len(attempts), min(len(attempts) + width, total))
+                if len(numbers) == 1:
+                    round_attempts = [self._run_attempt(lanes[0], numbers[0], request)]
+                else:
+                    round_attempts = list(
+                        executor.map(
+                            lambda lane, number: self._run_attempt(lane, number, request),
+                            lanes,
+                            numbers,
+                        )
+                    )
+                attempts.extend(round_attempts)
+
+                # Keep the best acceptable attempt of this round, if any
+                acceptable = [a for a in round_attempts if not a.assessment.retry_suggested]
+                if acceptable:
+                    best = max(acceptable, key=lambda a: a.assessment.score)
+                    logger.info(f"Acceptable quality achieved on attempt {best.attempt_number}")
+                    self._log_reuse(context)
+                    return GenerationResult(
+                        success=True,
+                        final_attempt=best,
+                        all_attempts=attempts,
+                        total_attempts=len(attempts),
+                        final_quality=best.assessment.quality_level,
+                    )
+
+                # Log retry reason
+                if len(attempts) < total:
+                    last = round_attempts[-1].assessment
+                    logger.warning(
+                        f"Quality below threshold. Issues: {', '.join(last.issues)}. "
+                        f"Retrying with variant: {self._variant(len(attempts))}"
+                    )
 
         # Max retries exceeded
         logger.error(f"Failed to achieve acceptable quality after {len(attempts)} attempts")
+        self._log_reuse(context)
+        final = (
+            max(attempts, key=lambda a: a.assessment.score) if self.speculative else attempts[-1]
+        )
         return GenerationResult(
             success=False,
-            final_attempt=attempts[-1],
+            final_attempt=final,
             all_attempts=attempts,
             total_attempts=len(attempts),
-            final_quality=attempts[-1].assessment.quality_level,
+            final_quality=final.assessment.quality_level,
+        )
+
+    def _create_generators(
+        self, context: GenerationContext
+    ) -> tuple[OutlineGenerator, DraftGenerator]:
+        """Create an outline and draft generator sharing the request's context."""
+        return (
+            OutlineGenerator(
+                llm_client=self.llm_client, searcher=context.searcher, context=context
+            ),
+            DraftGenerator(llm_client=self.llm_client, searcher=context.searcher, context=context),
+        )
+
+    def _run_attempt(
+        self,
+        generators: tuple[OutlineGenerator, DraftGenerator],
+        attempt_index: int,
+        request: dict[str, Any],
+    ) -> GenerationAttempt:
+        """Generate and assess one attempt.
+
+        Args:
+            generators: Outline and draft generator for this attempt
+            attempt_index: Zero-based attempt number (selects the prompt variant)
+            request: Title, keywords, thesis, classification and audience
+
+        Returns:
+            The recorded attempt
+        """
+        outline_gen, draft_gen = generators
+        variant_name = self._variant(attempt_index)
+        logger.info(
+            f"Generation attempt {attempt_index + 1}/{self.max_retries + 1} using variant: {variant_name}"
+        )
+
+        # Get custom template for this variant (if available)
+        custom_template = self._get_prompt_template(variant_name)
+
+        # Generate content
+        outline = outline_gen.generate(**request, custom_prompt_template=custom_template)
+        draft = draft_gen.generate(outline=outline)
+
+        # Assess quality
+        assessment = self.qa.assess_quality(outline, draft)
+
+        logger.info(
+            f"Attempt {attempt_index + 1}: Quality={assessment.quality_level.value}, "
+            f"Score={assessment.score:.2f}, Violations={assessment.total_violations}"
+        )
+
+        return GenerationAttempt(
+            attempt_number=attempt_index + 1,
+            outline=outline,
+            draft=draft,
+            assessment=assessment,
+            prompt_variant=variant_name,
+        )
+
+    def _variant(self, attempt_index: int) -> str:
+        """Get the prompt variant for an attempt (the last one repeats)."""
+        variants = self._get_prompt_variants()
+        return variants[min(attempt_index, len(variants) - 1)]
+
+    @staticmethod
+    def _log_reuse(context: GenerationContext) -> None:
+        """Log how much retrieval work the attempts shared."""
+        stats = context.stats()
+        logger.info(
+            f"Reused across attempts: {stats['searches_reused']} searches, "
+            f"{stats['topic_checks_reused']} topic checks, "
+            f"{stats['voice_samples_reused']} voice sample lookups"
         )
 
     def _get_prompt_variants(self) -> list[str]:
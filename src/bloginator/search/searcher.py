@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any, cast
 
 import chromadb
+import numpy as np
 
 from bloginator.search._embedding import _get_embedding_model
 from bloginator.search._search_helpers import build_where_filter, convert_chromadb_results
@@ -161,6 +162,46 @@ class CorpusSearcher:
             for idx in range(len(queries))
         ]
 
+    def nearest_embeddings(
+        self,
+        query_embeddings: Any,
+        n_results: int = 10,
+    ) -> list[np.ndarray]:
+        """Fetch the stored embeddings of the chunks nearest to each query vector.
+
+        Reads the vectors Chroma already holds instead of re-encoding the
+        matched chunk texts.
+
+        Args:
+            query_embeddings: Query vectors (one row per query), encoded with
+                this searcher's embedding model
+            n_results: Number of nearest chunks per query
+
+        Returns:
+            One (n_matches, dim) array per query, in query order
+        """
+        vectors = np.asarray(query_embeddings, dtype=np.float32)
+        if len(vectors) == 0:
+            return []
+
+        raw_results = self.collection.query(
+            query_embeddings=vectors.tolist(),
+            n_results=n_results,
+            include=["embeddings"],
+        )
+        embeddings = cast("dict[str, Any]", raw_results).get("embeddings")
+        if embeddings is None:
+            embeddings = []
+        dim = vectors.shape[1]
+        return [
+            (
+                np.asarray(embeddings[i], dtype=np.float32).reshape(-1, dim)
+                if i < len(embeddings) and embeddings[i] is not None
+                else np.empty((0, dim), dtype=np.float32)
+            )
+            for i in range(len(vectors))
+        ]
+
     def search_with_recency(
         self,
         query: str,
@@ -77,6 +77,32 @@ def _get_timeout_from_env(env_var: str, default: int, name: str) -> int:
     return _validate_timeout(value, f"{env_var}")
 
 
+def _get_limit_from_env(env_var: str, default: int) -> int:
+    """Load a non-negative integer limit from environment or use default.
+
+    Args:
+        env_var: Environment variable name
+        default: Default value if env var not set
+
+    Returns:
+        Limit value (0 means "use the provider default" or "disabled")
+
+    Raises:
+        ValueError: If env var is set but not a non-negative integer
+    """
+    value_str = os.getenv(env_var)
+    if value_str is None:
+        return default
+
+    try:
+        value = int(value_str)
+    except ValueError:
+        raise ValueError(f"{env_var} must be an integer (got '{value_str}')") from None
+    if value < 0:
+        raise ValueError(f"{env_var} must be >= 0 (got {value})")
+    return value
+
+
 class TimeoutConfig:
     """Application timeout configuration from environment variables.
 
@@ -108,6 +134,26 @@ class TimeoutConfig:
         FILE_AVAILABILITY_TIMEOUT: Timeout for waiting for file to become available
             (default 10s)
         SMB_MOUNT_TIMEOUT: Timeout for SMB mount operations (default 15s)
+        EXTRACTION_TIMEOUT: Per-file extraction limit in supervised workers
+            (default 120s)
+        EXTRACTION_PDF_TIMEOUT: Per-file extraction limit for PDFs (default 300s)
+        EXTRACTION_LEGACY_OFFICE_TIMEOUT: Per-file extraction limit for .doc/.ppt
+            files converted via LibreOffice (default 180s)
+        EXTRACTION_OCR_TIMEOUT: Per-file extraction limit for OCR'd images
+            (default 180s)
+
+    LLM request scheduling (see generation/_llm_scheduler.py). Limits set to 0
+    fall back to the provider's defaults:
+        LLM_RETRY_ATTEMPTS: Retries after a throttled or failed (429/5xx) LLM
+            request (default 4; 0 disables retries)
+        LLM_RETRY_BASE_DELAY: First backoff delay, doubled per retry (default 1s)
+        LLM_RETRY_MAX_DELAY: Longest backoff delay, unless the server's
+            Retry-After asks for more (default 60s)
+        LLM_TARGET_LATENCY: Responses slower than this shrink the concurrency
+            window (default 90s; 0 ignores latency)
+        LLM_MAX_CONCURRENCY: Most in-flight requests per provider
+        LLM_REQUESTS_PER_MINUTE: Request rate limit per provider
+        LLM_TOKENS_PER_MINUTE: Token rate limit (prompt + max output) per provider
     """
 
     # LLM API request timeouts
@@ -195,6 +241,53 @@ class TimeoutConfig:
         "SMB_MOUNT_TIMEOUT",
     )
 
+    # Per-file extraction limits (supervised worker processes)
+    EXTRACTION_TIMEOUT: int = _get_timeout_from_env(
+        "BLOGINATOR_EXTRACTION_TIMEOUT",
+        120,
+        "EXTRACTION_TIMEOUT",
+    )
+
+    EXTRACTION_PDF_TIMEOUT: int = _get_timeout_from_env(
+        "BLOGINATOR_EXTRACTION_PDF_TIMEOUT",
+        300,
+        "EXTRACTION_PDF_TIMEOUT",
+    )
+
+    EXTRACTION_LEGACY_OFFICE_TIMEOUT: int = _get_timeout_from_env(
+        "BLOGINATOR_EXTRACTION_LEGACY_OFFICE_TIMEOUT",
+        180,
+        "EXTRACTION_LEGACY_OFFICE_TIMEOUT",
+    )
+
+    EXTRACTION_OCR_TIMEOUT: int = _get_timeout_from_env(
+        "BLOGINATOR_EXTRACTION_OCR_TIMEOUT",
+        180,
+        "EXTRACTION_OCR_TIMEOUT",
+    )
+
+    # LLM request scheduling: retries and backoff
+    LLM_RETRY_ATTEMPTS: int = _get_limit_from_env("BLOGINATOR_LLM_RETRY_ATTEMPTS", 4)
+
+    LLM_RETRY_BASE_DELAY: int = _get_timeout_from_env(
+        "BLOGINATOR_LLM_RETRY_BASE_DELAY",
+        1,
+        "LLM_RETRY_BASE_DELAY",
+    )
+
+    LLM_RETRY_MAX_DELAY: int = _get_timeout_from_env(
+        "BLOGINATOR_LLM_RETRY_MAX_DELAY",
+        60,
+        "LLM_RETRY_MAX_DELAY",
+    )
+
+    LLM_TARGET_LATENCY: int = _get_limit_from_env("BLOGINATOR_LLM_TARGET_LATENCY", 90)
+
+    # LLM request scheduling: per-provider limits (0 = provider default)
+    LLM_MAX_CONCURRENCY: int = _get_limit_from_env("BLOGINATOR_LLM_MAX_CONCURRENCY", 0)
+    LLM_REQUESTS_PER_MINUTE: int = _get_limit_from_env("BLOGINATOR_LLM_REQUESTS_PER_MINUTE", 0)
+    LLM_TOKENS_PER_MINUTE: int = _get_limit_from_env("BLOGINATOR_LLM_TOKENS_PER_MINUTE", 0)
+
     @classmethod
     def get_outline_schedule(cls) -> list[int]:
         """Get timeout schedule for outline generation retries.
@@ -1,6 +1,8 @@
 """FastAPI application for Bloginator web UI."""
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +21,15 @@ TEMPLATES_DIR = WEB_DIR / "templates"
 STATIC_DIR = WEB_DIR / "static"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Release pooled LLM connections opened on the server's event loop."""
+    from bloginator.generation._http_pool import aclose_http_clients
+
+    yield
+    await aclose_http_clients()
+
+
 def create_app(
     title: str = "Bloginator",
     description: str = "Content generation from your own corpus",
@@ -43,6 +54,7 @@ def create_app(
         debug=debug,
         docs_url="/api/docs",
         redoc_url="/api/redoc",
+        lifespan=lifespan,
     )
 
     # Configure templates
@@ -1,11 +1,20 @@
 """Document generation API routes."""
 
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from bloginator.generation._llm_coalesce import CoalescingLLMClient
 from bloginator.generation.draft_generator import DraftGenerator
 from bloginator.generation.llm_client import create_llm_client
 from bloginator.generation.outline_generator import OutlineGenerator
@@ -15,8 +24,31 @@ from bloginator.models.outline import Outline
 from bloginator.search import CorpusSearcher
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Events buffered between the generation thread and a streaming client
+STREAM_QUEUE_SIZE = 256
+
+# How often an idle stream checks for a disconnected client, and a generation
+# thread blocked on a full queue checks for cancellation
+STREAM_CANCEL_POLL_SECONDS = 0.5
+
+
+def _llm_client(model: str) -> CoalescingLLMClient:
+    """Create an LLM client whose identical concurrent requests are merged.
+
+    Users drafting on the same topic at once share in-flight calls.
+
+    Args:
+        model: Model name
+
+    Returns:
+        LLM client sharing the process-wide in-flight registry
+    """
+    return CoalescingLLMClient(create_llm_client(model=model))
+
 
 class SearchRequest(BaseModel):
     """Request model for corpus search."""
@@ -80,7 +112,8 @@ async def search_corpus(request: SearchRequest) -> dict[str, list[SearchResult]]
 
     try:
         searcher = CorpusSearcher(index_dir=index_path)
-        results = searcher.search(
+        results = await asyncio.to_thread(
+            searcher.search,
             query=request.query,
             n_results=request.n_results,
         )
@@ -116,7 +149,7 @@ async def generate_outline(request: OutlineRequest) -> dict[str, Any]:
 
     try:
         searcher = CorpusSearcher(index_dir=index_path)
-        llm_client = create_llm_client(model=request.llm_model)
+        llm_client = _llm_client(request.llm_model)
 
         generator = OutlineGenerator(
             llm_client=llm_client,
@@ -124,7 +157,9 @@ async def generate_outline(request: OutlineRequest) -> dict[str, Any]:
         )
 
         # OutlineGenerator.generate() is the correct method name
-        outline = generator.generate(
+        # Generation is blocking; keep it off the event loop
+        outline = await asyncio.to_thread(
+            generator.generate,
             title=request.title,
             keywords=request.keywords,
             thesis=request.thesis or "",
@@ -161,7 +196,7 @@ async def generate_draft(request: DraftRequest) -> dict[str, Any]:
         outline = Outline(**outline_data)
 
         searcher = CorpusSearcher(index_dir=index_path)
-        llm_client = create_llm_client(model=request.llm_model)
+        llm_client = _llm_client(request.llm_model)
 
         generator = DraftGenerator(
             llm_client=llm_client,
@@ -171,7 +206,8 @@ async def generate_draft(request: DraftRequest) -> dict[str, Any]:
         # DraftGenerator.generate() is the correct method name
         # Note: validate_safety and score_voice are handled separately in CLI
         # Web API currently doesn't support these features
-        draft = generator.generate(
+        draft = await asyncio.to_thread(
+            generator.generate,
             outline=outline,
         )
 
@@ -185,6 +221,111 @@ async def generate_draft(request: DraftRequest) -> dict[str, Any]:
         )
 
 
+class _StreamCancelledError(Exception):
+    """Raised on the generation thread once the stream's client has gone."""
+
+
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/draft/stream")
+async def stream_draft(request: DraftRequest, http_request: Request) -> StreamingResponse:
+    """Generate a draft, streaming section text as server-sent events.
+
+    Events are ``progress`` (message, current, total), ``token`` (section,
+    delta), then either ``done`` (the complete draft) or ``error`` (detail).
+
+    Generation stops at its next chunk once the client disconnects.
+
+    Args:
+        request: Draft generation parameters
+        http_request: Incoming HTTP request, polled for disconnection
+
+    Returns:
+        Event stream response
+    """
+    index_path = Path(request.index_path)
+    if not index_path.exists():
+        raise HTTPException(status_code=404, detail="Index not found")
+
+    try:
+        outline = Outline(**json.loads(request.outline_json))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid outline: {str(e)}")
+
+    loop = asyncio.get_running_loop()
+    # Bounded, so a slow client holds generation back instead of buffering it
+    queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    cancelled = threading.Event()
+
+    def emit(event: str, data: dict[str, Any]) -> None:
+        # Called between chunks; stops generation once the client has gone
+        if cancelled.is_set():
+            raise _StreamCancelledError
+        put = asyncio.run_coroutine_threadsafe(queue.put((event, data)), loop)
+        while True:
+            try:
+                put.result(timeout=STREAM_CANCEL_POLL_SECONDS)
+                return
+            except concurrent.futures.TimeoutError:
+                if cancelled.is_set():
+                    put.cancel()
+                    raise _StreamCancelledError from None
+
+    def run() -> None:
+        # Generation is blocking; it runs on a worker thread and feeds the queue
+        try:
+            generator = DraftGenerator(
+                llm_client=_llm_client(request.llm_model),
+                searcher=CorpusSearcher(index_dir=index_path),
+            )
+            draft = generator.generate(
+                outline=outline,
+                progress_callback=lambda message, current, total: emit(
+                    "progress", {"message": message, "current": current, "total": total}
+                ),
+                token_callback=lambda section, delta: emit(
+                    "token", {"section": section, "delta": delta}
+                ),
+            )
+            emit("done", {"draft": draft.model_dump(mode="json")})
+        except _StreamCancelledError:
+            logger.info("Draft stream client disconnected; generation stopped")
+        except Exception as e:
+            with contextlib.suppress(_StreamCancelledError):
+                emit("error", {"detail": f"Draft generation failed: {str(e)}"})
+
+    async def events() -> AsyncIterator[str]:
+        worker = loop.run_in_executor(None, run)
+        try:
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(
+                        queue.get(), timeout=STREAM_CANCEL_POLL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    # Nothing to send, e.g. while a section's first token is pending
+                    if await http_request.is_disconnected():
+                        return
+                    continue
+                yield _sse_event(event, data)
+                if event in ("done", "error"):
+                    break
+        finally:
+            # Reached on completion and on disconnect (polled above, or
+            # GeneratorExit/cancellation); the worker stops at its next chunk
+            cancelled.set()
+        await worker
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/draft/refine")
 async def refine_draft(request: RefineRequest) -> dict[str, Any]:
     """Refine a draft with feedback.
@@ -206,14 +347,15 @@ async def refine_draft(request: RefineRequest) -> dict[str, Any]:
         draft = Draft(**draft_data)
 
         searcher = CorpusSearcher(index_dir=index_path)
-        llm_client = create_llm_client(model=request.llm_model)
+        llm_client = _llm_client(request.llm_model)
 
         engine = RefinementEngine(
             llm_client=llm_client,
             searcher=searcher,
         )
 
-        refined = engine.refine_draft(
+        refined = await asyncio.to_thread(
+            engine.refine_draft,
             draft=draft,
             feedback=request.feedback,
             validate_safety=False,
@@ -3,10 +3,26 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _template_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keep compiled prompt templates out of the working directory during tests."""
+    from bloginator.config import Config
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        cache_dir = tmp_path_factory.mktemp("template_cache")
+        monkeypatch.setattr(Config, "_template_cache_dir_env", str(cache_dir))
+        yield
+
+
 @pytest.fixture
 def tmp_path(tmp_path: Path) -> Path:
     """Provide a temporary directory for tests.
@@ -71,6 +71,10 @@ def mock_corpus_searcher():
             distance=0.2,  # similarity_score = 0.8
         ),
     ]
+    # Batch search answers each query the way search would
+    searcher.batch_search.side_effect = lambda queries, n_results=10: [
+        searcher.search(query=query, n_results=n_results) for query in queries
+    ]
     return searcher
 
 
@@ -1,12 +1,29 @@
 """Tests for retry orchestrator."""
 
-from unittest.mock import MagicMock
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from bloginator.generation.llm_mock import MockLLMClient
-from bloginator.quality.quality_assurance import QualityAssurance
-from bloginator.quality.retry_orchestrator import RetryOrchestrator
+from bloginator.models.draft import Draft
+from bloginator.models.outline import Outline
+from bloginator.quality.quality_assurance import (
+    QualityAssessment,
+    QualityAssurance,
+    QualityLevel,
+)
+from bloginator.quality.retry_orchestrator import GenerationAttempt, RetryOrchestrator
+
+
+class AlwaysRetryQA(QualityAssurance):
+    """Quality assurance that rejects every attempt."""
+
+    def assess_quality(self, outline, draft):
+        assessment = super().assess_quality(outline, draft)
+        # Force retry suggestion
+        assessment.retry_suggested = True
+        return assessment
 
 
 @pytest.fixture
@@ -116,15 +133,6 @@ def test_quality_assessment_in_result(orchestrator):
 
 def test_max_retries_limit(mock_llm, mock_searcher):
     """Test that max retries limit is respected."""
-
-    # Create QA system that always suggests retry
-    class AlwaysRetryQA(QualityAssurance):
-        def assess_quality(self, outline, draft):
-            assessment = super().assess_quality(outline, draft)
-            # Force retry suggestion
-            assessment.retry_suggested = True
-            return assessment
-
     orchestrator = RetryOrchestrator(
         llm_client=mock_llm,
         searcher=mock_searcher,
@@ -143,3 +151,102 @@ def test_max_retries_limit(mock_llm, mock_searcher):
     # Should attempt: initial + 2 retries = 3 total
     assert result.total_attempts == 3
     assert not result.success  # Never achieved acceptable quality
+
+
+def test_attempts_share_searches(mock_llm, mock_searcher):
+    """Test that retries reuse the first attempt's corpus searches."""
+    mock_searcher.batch_search.side_effect = lambda queries, **kwargs: [[] for _ in queries]
+
+    def run(max_retries: int) -> int:
+        mock_searcher.batch_search.reset_mock()
+        RetryOrchestrator(
+            llm_client=mock_llm,
+            searcher=mock_searcher,
+            quality_assurance=AlwaysRetryQA(max_retries=max_retries),
+            max_retries=max_retries,
+        ).generate_with_retry(
+            title="Test",
+            keywords=["test"],
+            thesis="Test",
+            classification="best-practice",
+            audience="ic-engineers",
+        )
+        return mock_searcher.batch_search.call_count
+
+    single_attempt = run(max_retries=0)
+
+    assert single_attempt > 0
+    assert run(max_retries=2) == single_attempt
+
+
+def _attempt(number: int, score: float, retry: bool) -> GenerationAttempt:
+    assessment = QualityAssessment(
+        quality_level=QualityLevel.POOR if retry else QualityLevel.GOOD,
+        score=score,
+        critical_violations=0,
+        high_violations=0,
+        medium_violations=0,
+        low_violations=0,
+        total_violations=0,
+        issues=[],
+        recommendations=[],
+        retry_suggested=retry,
+    )
+    return GenerationAttempt(
+        attempt_number=number,
+        outline=Outline(title="T"),
+        draft=Draft(title="T"),
+        assessment=assessment,
+        prompt_variant="default",
+    )
+
+
+def test_speculative_runs_variants_concurrently(mock_llm, mock_searcher):
+    """Test that speculative mode runs two variants at once and keeps the better one."""
+    orchestrator = RetryOrchestrator(
+        llm_client=mock_llm, searcher=mock_searcher, max_retries=3, speculative=True
+    )
+    barrier = threading.Barrier(2, timeout=5)
+    scores = {0: (4.0, False), 1: (4.6, False)}
+
+    def run_attempt(generators, attempt_index, request):
+        barrier.wait()  # Breaks unless both variants are in flight together
+        return _attempt(attempt_index + 1, *scores[attempt_index])
+
+    with patch.object(orchestrator, "_run_attempt", side_effect=run_attempt):
+        result = orchestrator.generate_with_retry(
+            title="Test",
+            keywords=["test"],
+            thesis="Test",
+            classification="best-practice",
+            audience="ic-engineers",
+        )
+
+    assert result.success
+    assert result.total_attempts == 2
+    assert result.final_attempt.attempt_number == 2
+
+
+def test_speculative_failure_keeps_best_attempt(mock_llm, mock_searcher):
+    """Test that when every attempt fails QA the best-scoring one is returned."""
+    orchestrator = RetryOrchestrator(
+        llm_client=mock_llm, searcher=mock_searcher, max_retries=2, speculative=True
+    )
+    scores = [2.0, 3.0, 1.0]
+
+    with patch.object(
+        orchestrator,
+        "_run_attempt",
+        side_effect=lambda generators, index, request: _attempt(index + 1, scores[index], True),
+    ):
+        result = orchestrator.generate_with_retry(
+            title="Test",
+            keywords=["test"],
+            thesis="Test",
+            classification="best-practice",
+            audience="ic-engineers",
+        )
+
+    assert not result.success
+    assert result.total_attempts == 3
+    assert result.final_attempt.attempt_number == 2
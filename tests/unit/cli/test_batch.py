@@ -0,0 +1,245 @@
+"""Tests for the batch CLI command and engine."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from bloginator.cli._batch_engine import BatchRunner, load_manifest, slugify
+from bloginator.cli.batch import batch
+from bloginator.models.draft import Draft, DraftSection
+from bloginator.models.outline import Outline, OutlineSection
+
+
+def _outline(title: str = "Test Blog") -> Outline:
+    return Outline(
+        title=title,
+        keywords=["test"],
+        sections=[OutlineSection(title="Intro", description="Introduction")],
+    )
+
+
+def _draft(outline: Outline, **_kwargs) -> Draft:
+    draft = Draft(
+        title=outline.title,
+        keywords=outline.keywords,
+        sections=[DraftSection(title="Intro", content="Some generated words here.")],
+    )
+    draft.calculate_stats()
+    return draft
+
+
+@pytest.fixture
+def generators():
+    """Patch the generators used by the batch engine."""
+    with (
+        patch("bloginator.cli._batch_engine.OutlineGenerator") as outline_class,
+        patch("bloginator.cli._batch_engine.DraftGenerator") as draft_class,
+        patch("bloginator.cli._batch_engine.QualityReviewer") as reviewer_class,
+    ):
+        outline_class.return_value.generate.side_effect = lambda title, **_: _outline(title)
+        draft_class.return_value.generate.side_effect = _draft
+        reviewer_class.return_value.review_and_revise.return_value = (
+            "# Reviewed\n\n## Intro\n\nShorter words."
+        )
+        yield outline_class, draft_class, reviewer_class
+
+
+def _write_manifest(tmp_path, entries) -> object:
+    manifest = tmp_path / "topics.yaml"
+    manifest.write_text(json.dumps(entries))
+    return manifest
+
+
+class TestLoadManifest:
+    """Tests for load_manifest."""
+
+    def test_topics_layout(self, tmp_path):
+        """Test the corpus/blog-topics.yaml layout and field defaults."""
+        manifest = tmp_path / "topics.yaml"
+        manifest.write_text(
+            "topics:\n"
+            "  - title: 'Hiring: What Works'\n"
+            "    keywords: [hiring, interviews]\n"
+            "    summary: Hiring well is a process.\n"
+            "    sections: [One, Two, Three]\n"
+            "  - title: Hiring what works\n"
+            "    keywords: 'a, b'\n"
+        )
+
+        items = load_manifest(manifest)
+
+        assert [item.slug for item in items] == ["hiring-what-works", "hiring-what-works-2"]
+        assert items[0].thesis == "Hiring well is a process."
+        assert items[0].num_sections == 3
+        assert items[1].keywords == ["a", "b"]
+        assert items[1].num_sections == 5
+
+    def test_outline_entry_needs_no_keywords(self, tmp_path):
+        """Test that an entry can point at an existing outline."""
+        (tmp_path / "outline.json").write_text(_outline().model_dump_json())
+        manifest = _write_manifest(tmp_path, [{"title": "From Outline", "outline": "outline.json"}])
+
+        (item,) = load_manifest(manifest)
+
+        assert item.outline_file == tmp_path / "outline.json"
+
+    @pytest.mark.parametrize(
+        "entries",
+        [{"title": "Not a list"}, [{"keywords": ["x"]}], [{"title": "No keywords"}]],
+    )
+    def test_invalid(self, tmp_path, entries):
+        """Test that malformed manifests are rejected."""
+        with pytest.raises(ValueError):
+            load_manifest(_write_manifest(tmp_path, entries))
+
+
+def test_slugify():
+    """Test slug generation."""
+    assert slugify("Sprint Planning: Setting Teams Up!") == "sprint-planning-setting-teams-up"
+    assert slugify("???") == "blog"
+
+
+class TestBatchRunner:
+    """Tests for BatchRunner."""
+
+    def test_writes_outputs_and_times_stages(self, tmp_path, generators):
+        """Test per-blog outputs and stage timings."""
+        (tmp_path / "outline.json").write_text(_outline("Existing").model_dump_json())
+        manifest = _write_manifest(
+            tmp_path,
+            [
+                {"title": "First Blog", "keywords": ["a"]},
+                {"title": "Existing", "outline": "outline.json"},
+            ],
+        )
+        runner = BatchRunner(Mock(), Mock(), tmp_path / "out")
+
+        first, existing = runner.run(load_manifest(manifest))
+
+        assert first.status == "ok"
+        assert set(first.timings) == {"outline", "draft", "review", "save"}
+        assert set(first.outputs) == {"outline", "outline_markdown", "draft", "draft_json"}
+        assert (tmp_path / "out" / "first-blog.md").read_text().startswith("# Reviewed")
+        # The outline stage loads the given outline instead of generating one
+        assert set(existing.outputs) == {"draft", "draft_json"}
+        assert generators[0].return_value.generate.call_count == 1
+
+    def test_shares_searcher_and_prompts(self, tmp_path, generators):
+        """Test that every blog uses the same memoizing searcher and prompt loader."""
+        outline_class, draft_class, _ = generators
+        runner = BatchRunner(Mock(), Mock(), tmp_path, concurrency=2, quality_review=False)
+        manifest = _write_manifest(
+            tmp_path, [{"title": "One", "keywords": ["a"]}, {"title": "Two", "keywords": ["b"]}]
+        )
+
+        results = runner.run(load_manifest(manifest))
+
+        assert [r.status for r in results] == ["ok", "ok"]
+        for call in outline_class.call_args_list + draft_class.call_args_list:
+            assert call.kwargs["searcher"] is runner.searcher
+            assert call.kwargs["prompt_loader"] is runner.prompt_loader
+        assert "review" not in results[0].timings
+
+    def test_failure_does_not_stop_batch(self, tmp_path, generators):
+        """Test that one failing blog is reported and the rest still run."""
+        outline_class = generators[0]
+
+        def generate(title, **_):
+            if title == "Broken":
+                raise RuntimeError("LLM went away")
+            return _outline(title)
+
+        outline_class.return_value.generate.side_effect = generate
+        manifest = _write_manifest(
+            tmp_path,
+            [{"title": "Broken", "keywords": ["a"]}, {"title": "Fine", "keywords": ["b"]}],
+        )
+
+        broken, fine = BatchRunner(Mock(), Mock(), tmp_path).run(load_manifest(manifest))
+
+        assert broken.status == "failed"
+        assert broken.error == "RuntimeError: LLM went away"
+        assert "outline" in broken.timings
+        assert fine.status == "ok"
+
+    def test_rejects_zero_concurrency(self, tmp_path):
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError):
+            BatchRunner(Mock(), Mock(), tmp_path, concurrency=0)
+
+
+class TestBatchCommand:
+    """Tests for the batch CLI command."""
+
+    @patch("bloginator.cli.batch.create_llm_from_config")
+    @patch("bloginator.cli.batch.CorpusSearcher")
+    def test_runs_manifest_in_one_process(self, searcher_class, llm_factory, tmp_path, generators):
+        """Test that the index and LLM are set up once and a report is written."""
+        index = tmp_path / "index"
+        index.mkdir()
+        manifest = _write_manifest(
+            tmp_path, [{"title": "One", "keywords": ["a"]}, {"title": "Two", "keywords": ["b"]}]
+        )
+        out = tmp_path / "out"
+
+        result = CliRunner().invoke(
+            batch, [str(manifest), "--index", str(index), "-o", str(out), "--concurrency", "2"]
+        )
+
+        assert result.exit_code == 0, result.output
+        searcher_class.assert_called_once()
+        llm_factory.assert_called_once()
+        report = json.loads((out / "batch-report.json").read_text())
+        assert (report["blogs"], report["succeeded"], report["failed"]) == (2, 2, 0)
+        assert set(report["setup_timings"]) == {"index", "llm"}
+        assert set(report["stage_totals"]) == {"outline", "draft", "review", "save"}
+        assert (out / "one.md").exists() and (out / "two.outline.json").exists()
+
+    @patch("bloginator.cli.batch.create_llm_from_config")
+    @patch("bloginator.cli.batch.CorpusSearcher")
+    def test_exit_code_on_failure_and_filter(
+        self, searcher_class, llm_factory, tmp_path, generators
+    ):
+        """Test --only and a non-zero exit when a blog fails."""
+        generators[1].return_value.generate.side_effect = RuntimeError("boom")
+        index = tmp_path / "index"
+        index.mkdir()
+        manifest = _write_manifest(
+            tmp_path, [{"title": "Keep", "keywords": ["a"]}, {"title": "Skip", "keywords": ["b"]}]
+        )
+        report_file = tmp_path / "report.json"
+
+        result = CliRunner().invoke(
+            batch,
+            [
+                str(manifest),
+                "--index",
+                str(index),
+                "-o",
+                str(tmp_path / "out"),
+                "--only",
+                "keep",
+                "--report",
+                str(report_file),
+            ],
+        )
+
+        assert result.exit_code == 1
+        report = json.loads(report_file.read_text())
+        assert [r["title"] for r in report["results"]] == ["Keep"]
+        assert report["results"][0]["error"] == "RuntimeError: boom"
+
+    def test_invalid_manifest(self, tmp_path):
+        """Test that a bad manifest exits before loading the index."""
+        index = tmp_path / "index"
+        index.mkdir()
+        manifest = _write_manifest(tmp_path, [{"title": "No keywords"}])
+
+        result = CliRunner().invoke(
+            batch, [str(manifest), "--index", str(index), "-o", str(tmp_path / "out")]
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid manifest" in result.output
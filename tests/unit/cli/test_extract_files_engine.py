@@ -0,0 +1,77 @@
+"""Tests for concurrent file extraction progress and interruption."""
+
+import io
+import time
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from bloginator.cli._extract_files_engine import extract_source_files
+from bloginator.cli.error_reporting import ErrorTracker
+from bloginator.corpus_config import CorpusSource
+
+
+@pytest.fixture
+def source_cfg(tmp_path):
+    """Create a corpus source pointing at a temp directory."""
+    return CorpusSource(name="blog", path=str(tmp_path), quality="preferred")
+
+
+@pytest.fixture
+def corpus_files(tmp_path):
+    """Create a few text files."""
+    files = []
+    for i in range(5):
+        path = tmp_path / f"note{i}.txt"
+        path.write_text(f"Note {i}.")
+        files.append(path)
+    return files
+
+
+def _extract(files, source_cfg, tmp_path, console):
+    output = tmp_path / "out"
+    output.mkdir()
+    return extract_source_files(
+        files, source_cfg, output, {}, False, ErrorTracker(), console, verbose=True
+    )
+
+
+def test_extracting_line_printed_when_file_starts(source_cfg, corpus_files, tmp_path):
+    """Test that 'Extracting:' names a file before its extraction, not after."""
+    buffer = io.StringIO()
+    console = Console(file=buffer, width=400)
+    announced = []
+
+    def extract_text(path):
+        announced.append(f"Extracting: {path}" in buffer.getvalue())
+        return path.read_text()
+
+    with patch("bloginator.cli._extract_files_engine.extract_text_from_file", extract_text):
+        extracted, skipped, failed = _extract(corpus_files, source_cfg, tmp_path, console)
+
+    assert (extracted, skipped, failed) == (5, 0, 0)
+    assert announced == [True] * 5
+
+
+def test_interrupt_cancels_queued_files(source_cfg, corpus_files, tmp_path):
+    """Test that Ctrl-C stops extraction instead of draining the queue."""
+    calls = []
+
+    def extract_text(path):
+        calls.append(path)
+        if len(calls) == 1:
+            raise KeyboardInterrupt
+        # A file already picked up outlasts the main thread's cancellation,
+        # however slowly that thread is scheduled
+        time.sleep(0.5)
+        return path.read_text()
+
+    with (
+        patch("bloginator.cli._extract_files_engine.extract_text_from_file", extract_text),
+        pytest.raises(KeyboardInterrupt),
+    ):
+        _extract(corpus_files, source_cfg, tmp_path, Console(file=io.StringIO()))
+
+    # At most the file already picked up by the worker runs after the interrupt
+    assert len(calls) <= 2
@@ -92,6 +92,13 @@ class TestIndexCLI:
         # Just verify it ran without crashing
         assert result.exit_code == 0
         mock_indexer_class.assert_called_once()
+        # The voice profile is opt-in
+        mock_indexer.build_voice_profile.assert_not_called()
+
+        result = runner.invoke(index, [str(temp_source), "-o", str(temp_output), "--voice-profile"])
+
+        assert result.exit_code == 0
+        mock_indexer.build_voice_profile.assert_called_once()
 
     @patch("bloginator.cli.index.CorpusIndexer")
     def test_index_with_custom_chunk_size(
@@ -122,7 +129,7 @@ class TestIndexCLI:
         result = runner.invoke(index, [str(temp_source), "-o", str(temp_output)])
 
         assert result.exit_code == 0
-        mock_indexer.index_document.assert_not_called()
+        mock_indexer.index_documents.assert_not_called()
 
     @patch("bloginator.cli.index.CorpusIndexer")
     @patch("bloginator.cli.index.chunk_text_by_paragraphs")
@@ -0,0 +1,306 @@
+"""Tests for ingest CLI command and streaming ingestion engine."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from rich.console import Console
+
+from bloginator.cli._extract_files_engine import extract_file
+from bloginator.cli._ingest_engine import ChunkBatcher, ingest_files
+from bloginator.cli.error_reporting import ErrorTracker, SkipCategory
+from bloginator.cli.ingest import ingest
+from bloginator.corpus_config import CorpusSource
+from bloginator.extraction import chunk_text_by_paragraphs
+from bloginator.indexing.indexer import CorpusIndexer
+from bloginator.utils.checksum import calculate_content_checksum
+
+
+class FakeIndexer:
+    """In-memory stand-in for CorpusIndexer that records batches."""
+
+    def __init__(self, checksums=None):
+        self.batches = []
+        self.checksums = dict(checksums or {})
+        self.deleted = []
+        self.replaced = []
+
+    def index_documents(self, batch, replace=False):
+        self.batches.append(batch)
+        for document, _ in batch:
+            if replace and document.id in self.checksums:
+                self.replaced.append(document.id)
+            self.checksums[document.id] = document.content_checksum
+
+    def get_document_checksum(self, document_id):
+        return self.checksums.get(document_id)
+
+    def document_needs_reindexing(self, document):
+        return self.checksums.get(document.id) != document.content_checksum
+
+    def delete_document(self, document_id):
+        self.deleted.append(document_id)
+
+
+@pytest.fixture
+def source_cfg(tmp_path):
+    """Create a corpus source pointing at a temp directory."""
+    return CorpusSource(name="blog", path=str(tmp_path), quality="preferred", tags=["t"])
+
+
+@pytest.fixture
+def corpus_files(tmp_path):
+    """Create a few Markdown files."""
+    files = []
+    for i in range(5):
+        path = tmp_path / f"post{i}.md"
+        path.write_text(f"# Post {i}\n\nParagraph one of post {i}.\n\nParagraph two.")
+        files.append(path)
+    return files
+
+
+def _run(work, indexer, existing_docs=None, **kwargs):
+    tracker = ErrorTracker()
+    counts = ingest_files(
+        work=work,
+        indexer=indexer,
+        existing_docs=existing_docs or {},
+        force=False,
+        error_tracker=tracker,
+        console=Console(quiet=True),
+        **kwargs,
+    )
+    return counts, tracker
+
+
+class TestChunkBatcher:
+    """Tests for ChunkBatcher."""
+
+    def test_rejects_non_positive_batch_size(self):
+        """Test batch size validation."""
+        with pytest.raises(ValueError):
+            ChunkBatcher(FakeIndexer(), batch_size=0)
+
+    def test_flush_clears_buffer_on_failure(self):
+        """Test that a failed write does not leave chunks buffered."""
+        indexer = MagicMock()
+        indexer.index_documents.side_effect = RuntimeError("boom")
+        batcher = ChunkBatcher(indexer, batch_size=1)
+        batcher.add(MagicMock(), [MagicMock()])
+
+        with pytest.raises(RuntimeError):
+            batcher.flush()
+
+        assert batcher.pending == []
+        assert batcher.pending_chunks == 0
+
+
+class TestIngestFiles:
+    """Tests for ingest_files."""
+
+    def test_ingests_all_files_in_batches(self, source_cfg, corpus_files):
+        """Test that documents are embedded in batches rather than one at a time."""
+        indexer = FakeIndexer()
+        work = [(source_cfg, f) for f in corpus_files]
+
+        (ingested, skipped, failed), tracker = _run(work, indexer, batch_size=4)
+
+        assert (ingested, skipped, failed) == (5, 0, 0)
+        assert tracker.total_extracted == 5
+        assert len(indexer.batches) < len(corpus_files)
+        indexed_names = [doc.filename for batch in indexer.batches for doc, _ in batch]
+        assert indexed_names == [f.name for f in corpus_files]
+
+    def test_persists_extracted_text_when_requested(self, source_cfg, corpus_files, tmp_path):
+        """Test optional persistence of extracted text and metadata."""
+        extracted = tmp_path / "extracted"
+        extracted.mkdir()
+
+        _run([(source_cfg, corpus_files[0])], FakeIndexer(), extracted_dir=extracted)
+
+        assert len(list(extracted.glob("*.txt"))) == 1
+        assert len(list(extracted.glob("*.json"))) == 1
+
+    def test_skips_unchanged_indexed_files(self, source_cfg, corpus_files):
+        """Test that files already indexed and unmodified are skipped."""
+        future = datetime.now() + timedelta(days=1)
+        existing = {str(corpus_files[0].absolute()): ("doc-0", future)}
+
+        (ingested, skipped, _), tracker = _run(
+            [(source_cfg, f) for f in corpus_files[:2]], FakeIndexer(), existing_docs=existing
+        )
+
+        assert (ingested, skipped) == (1, 1)
+        assert tracker.skipped[SkipCategory.ALREADY_EXTRACTED] == [str(corpus_files[0])]
+
+    def test_reuses_document_id_and_replaces_changed_document(self, source_cfg, corpus_files):
+        """Test that modified files keep their document ID and replace their old chunks."""
+        existing = {str(corpus_files[0].absolute()): ("doc-0", datetime(2000, 1, 1))}
+        indexer = FakeIndexer(checksums={"doc-0": "stale"})
+
+        _run([(source_cfg, corpus_files[0])], indexer, existing_docs=existing)
+
+        assert indexer.replaced == ["doc-0"]
+        assert indexer.deleted == []
+        assert indexer.batches[0][0][0].id == "doc-0"
+
+    def test_failed_write_keeps_old_chunks(self, source_cfg, corpus_files):
+        """Test that a changed document is not removed before its new chunks are written."""
+        existing = {str(corpus_files[0].absolute()): ("doc-0", datetime(2000, 1, 1))}
+        indexer = FakeIndexer(checksums={"doc-0": "stale"})
+        indexer.index_documents = MagicMock(side_effect=RuntimeError("disk full"))
+
+        (_, _, failed), _ = _run([(source_cfg, corpus_files[0])], indexer, existing_docs=existing)
+
+        assert failed == 1
+        assert indexer.deleted == []
+        assert indexer.index_documents.call_args.kwargs == {"replace": True}
+
+    def test_records_extraction_errors_and_continues(self, source_cfg, corpus_files, tmp_path):
+        """Test that one failing file does not stop the stream."""
+        bad = tmp_path / "bad.xyz"
+        bad.write_text("content")
+        work = [(source_cfg, bad), (source_cfg, corpus_files[0])]
+
+        (ingested, _, failed), tracker = _run(work, FakeIndexer())
+
+        assert (ingested, failed) == (1, 1)
+        assert tracker.total_errors == 1
+
+    def test_legacy_office_files_converted_in_one_batch(self, source_cfg, tmp_path):
+        """Test that a run's .ppt files share one LibreOffice conversion."""
+        decks = []
+        for name in ("a.ppt", "b.ppt"):
+            path = tmp_path / name
+            path.write_bytes(b"\xd0\xcf\x11\xe0 legacy deck")
+            decks.append(path)
+        calls = []
+
+        def convert(paths):
+            calls.append(list(paths))
+            return {p: f"Slide text of {p.stem}." for p in calls[-1]}
+
+        with (
+            patch("bloginator.extraction._legacy_office.find_soffice", return_value="soffice"),
+            patch(
+                "bloginator.extraction._legacy_office.convert_legacy_office_to_text",
+                side_effect=convert,
+            ),
+        ):
+            (ingested, _, failed), _ = _run([(source_cfg, d) for d in decks], FakeIndexer())
+
+        assert (ingested, failed) == (2, 0)
+        assert calls == [decks]
+
+    def test_pdf_is_chunked_page_by_page(self, source_cfg, tmp_path):
+        """Test that PDF pages are chunked as they stream, never joined."""
+        pdf = tmp_path / "manual.pdf"
+        pdf.write_bytes(b"%PDF-1.4 stand-in")
+        pages = ["Page one text.", "Page two text.\n\nMore on two."]
+        extract_text = MagicMock(side_effect=AssertionError("PDF extracted whole"))
+        indexer = FakeIndexer()
+
+        (ingested, _, failed), _ = _run(
+            [(source_cfg, pdf)],
+            indexer,
+            chunk_size=20,
+            extract_text=extract_text,
+            iter_text=lambda path: iter(pages),
+        )
+
+        assert (ingested, failed) == (1, 0)
+        ((document, chunks),) = indexer.batches[0]
+        expected = chunk_text_by_paragraphs("\n\n".join(pages), document.id, 20)
+        assert [c.content for c in chunks] == [c.content for c in expected]
+        assert document.content_checksum == calculate_content_checksum("\n\n".join(pages))
+        assert document.word_count == 9
+
+    def test_batch_write_failure_counts_each_document(self, source_cfg, corpus_files):
+        """Test that a failed batch write is attributed to each document in it."""
+        indexer = FakeIndexer()
+        indexer.index_documents = MagicMock(side_effect=RuntimeError("disk full"))
+
+        (ingested, _, failed), tracker = _run(
+            [(source_cfg, f) for f in corpus_files], indexer, batch_size=1000
+        )
+
+        assert (ingested, failed) == (0, 5)
+        assert tracker.total_errors == 5
+
+
+class TestCorpusIndexerBatching:
+    """Tests for the batched indexer API used by ingest."""
+
+    @patch("bloginator.indexing.indexer.SentenceTransformer")
+    def test_index_documents_and_indexed_sources(self, mock_st, tmp_path, source_cfg):
+        """Test one encode call per batch and source lookup from the index."""
+        mock_st.return_value.encode.side_effect = lambda texts, **_: np.zeros((len(texts), 4))
+        indexer = CorpusIndexer(output_dir=tmp_path / "index")
+
+        docs = []
+        for i in range(3):
+            path = tmp_path / f"doc{i}.md"
+            path.write_text(f"Document number {i}.")
+            result = extract_file(path, source_cfg, {}, force=False)
+            docs.append((result.document, result.text))
+
+        indexer.index_documents(
+            [(doc, chunk_text_by_paragraphs(text, doc.id)) for doc, text in docs]
+        )
+
+        assert mock_st.return_value.encode.call_count == 1
+        sources = indexer.get_indexed_sources()
+        assert set(sources) == {str(doc.source_path) for doc, _ in docs}
+
+
+class TestIngestCLI:
+    """Tests for ingest CLI command."""
+
+    def test_ingest_requires_config(self, tmp_path):
+        """Test that ingest requires a corpus config."""
+        result = CliRunner().invoke(ingest, ["-o", str(tmp_path / "index")])
+        assert result.exit_code != 0
+
+    @patch("bloginator.cli.ingest.CorpusIndexer")
+    def test_ingest_from_config(self, mock_indexer_class, tmp_path, corpus_files):
+        """Test end-to-end ingest wiring with a mocked indexer."""
+        config = tmp_path / "corpus.yaml"
+        config.write_text(
+            f"sources:\n  - name: blog\n    path: {tmp_path}\n    quality: preferred\n"
+        )
+        indexer = FakeIndexer()
+        indexer.get_indexed_sources = lambda paths: {}
+        indexer.get_collection_info = lambda: {
+            "total_chunks": 10,
+            "collection_name": "bloginator_corpus",
+            "output_dir": str(tmp_path / "index"),
+        }
+        mock_indexer_class.return_value = indexer
+
+        result = CliRunner().invoke(ingest, ["-c", str(config), "-o", str(tmp_path / "index")])
+
+        assert result.exit_code == 0, result.output
+        assert "Successfully ingested 5 document(s)" in result.output
+
+    @patch("bloginator.cli.ingest.CorpusIndexer")
+    def test_ingest_refuses_unmatchable_index(self, mock_indexer_class, tmp_path, corpus_files):
+        """Test that an index that cannot be matched to files is not ingested into."""
+        config = tmp_path / "corpus.yaml"
+        config.write_text(
+            f"sources:\n  - name: blog\n    path: {tmp_path}\n    quality: preferred\n"
+        )
+        indexer = FakeIndexer()
+
+        def get_indexed_sources(paths):
+            raise ValueError("rebuild it with --force")
+
+        indexer.get_indexed_sources = get_indexed_sources
+        mock_indexer_class.return_value = indexer
+
+        result = CliRunner().invoke(ingest, ["-c", str(config), "-o", str(tmp_path / "index")])
+
+        assert result.exit_code != 0
+        assert "rebuild it with --force" in result.output
+        assert indexer.batches == []
@@ -6,6 +6,7 @@ from bloginator.extraction.chunking import (
     chunk_text_by_paragraphs,
     chunk_text_by_sentences,
     chunk_text_fixed_size,
+    iter_chunks_by_paragraphs,
 )
 
 
@@ -104,6 +105,26 @@ class TestChunkTextByParagraphs:
         assert indices == list(range(len(chunks)))
 
 
+class TestIterChunksByParagraphs:
+    """Test streaming paragraph chunking."""
+
+    def test_matches_chunking_of_joined_text(self) -> None:
+        """Test that streamed pieces chunk exactly like the joined text."""
+        pages = [
+            "Intro paragraph.\n\nSecond paragraph on page one.",
+            "",
+            "Page three. " * 40 + "\n\nShort tail.",
+            "Last page.\n",
+        ]
+
+        streamed = list(iter_chunks_by_paragraphs(pages, "doc_1", max_chunk_size=200))
+        joined = chunk_text_by_paragraphs("\n\n".join(pages), "doc_1", max_chunk_size=200)
+
+        assert [(c.content, c.chunk_index, c.char_start) for c in streamed] == [
+            (c.content, c.chunk_index, c.char_start) for c in joined
+        ]
+
+
 class TestChunkTextBySentences:
     """Test sentence-based chunking."""
 
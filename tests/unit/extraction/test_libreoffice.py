@@ -0,0 +1,318 @@
+"""Tests for the managed LibreOffice conversion service."""
+
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bloginator.extraction import _legacy_office, _libreoffice, _libreoffice_server
+from bloginator.extraction._legacy_office import LegacyOfficeBatch
+from bloginator.extraction._libreoffice import (
+    OLE_SIGNATURE,
+    LibreOfficeConverter,
+    LibreOfficeError,
+    _split_unique_stems,
+)
+
+
+@pytest.fixture
+def fake_soffice(tmp_path: Path) -> tuple[Path, Path]:
+    """Create a stand-in soffice that logs each invocation.
+
+    Files whose name contains "bad" produce no output, like a document
+    LibreOffice cannot open. With --accept it idles like a server.
+    """
+    log = tmp_path / "invocations.log"
+    script = tmp_path / "soffice"
+    script.write_text(
+        textwrap.dedent(
+            f"""\
+            #!{sys.executable}
+            import sys, time
+            from pathlib import Path
+
+            args = sys.argv[1:]
+            if any(a.startswith("--accept") for a in args):
+                time.sleep(600)
+            with open({str(log)!r}, "a") as log:
+                log.write(" ".join(args) + "\\n")
+            ext = args[args.index("--convert-to") + 1].split(":")[0]
+            outdir = Path(args[args.index("--outdir") + 1])
+            for name in args[args.index("--outdir") + 2 :]:
+                src = Path(name)
+                if "bad" not in src.name:
+                    (outdir / f"{{src.stem}}.{{ext}}").write_text(f"converted {{src.name}}")
+            """
+        )
+    )
+    script.chmod(0o755)
+    return script, log
+
+
+def _invocations(log: Path) -> list[str]:
+    return log.read_text().splitlines() if log.exists() else []
+
+
+def _make_docs(directory: Path, *names: str) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name in names:
+        path = directory / name
+        path.write_bytes(b"\xd0\xcf\x11\xe0 legacy office")
+        paths.append(path)
+    return paths
+
+
+class TestCommandLineConversion:
+    """Tests for conversion through the soffice command line."""
+
+    def test_batch_uses_single_invocation(self, tmp_path: Path, fake_soffice) -> None:
+        """Test that a batch pays LibreOffice start-up once."""
+        script, log = fake_soffice
+        docs = _make_docs(tmp_path / "in", "a.doc", "b.doc", "c.doc")
+        outdir = tmp_path / "out"
+
+        with LibreOfficeConverter(soffice_path=str(script), use_server=False) as converter:
+            results = converter.convert_batch(docs, outdir)
+
+        assert len(_invocations(log)) == 1
+        assert [results[doc].read_text() for doc in docs] == [
+            "converted a.doc",
+            "converted b.doc",
+            "converted c.doc",
+        ]
+
+    def test_failed_file_falls_back_to_single_conversion(
+        self, tmp_path: Path, fake_soffice
+    ) -> None:
+        """Test that only the failing file is retried and reported."""
+        script, log = fake_soffice
+        good, bad = _make_docs(tmp_path / "in", "good.doc", "bad.doc")
+
+        with LibreOfficeConverter(soffice_path=str(script), use_server=False) as converter:
+            results = converter.convert_batch([good, bad], tmp_path / "out")
+
+        assert isinstance(results[good], Path)
+        assert isinstance(results[bad], LibreOfficeError)
+        assert len(_invocations(log)) == 2
+        assert _invocations(log)[1].endswith("bad.doc")
+
+    def test_same_stem_inputs_do_not_collide(self, tmp_path: Path, fake_soffice) -> None:
+        """Test that same-named files from different folders keep separate outputs."""
+        script, _ = fake_soffice
+        first = _make_docs(tmp_path / "one", "notes.doc")[0]
+        second = _make_docs(tmp_path / "two", "notes.doc")[0]
+
+        with LibreOfficeConverter(soffice_path=str(script), use_server=False) as converter:
+            results = converter.convert_batch([first, second], tmp_path / "out")
+
+        assert results[first] != results[second]
+        assert results[first].exists() and results[second].exists()
+
+    def test_ppt_converts_through_pptx(self, tmp_path: Path, fake_soffice) -> None:
+        """Test that presentations are converted to PPTX rather than plain text."""
+        script, log = fake_soffice
+        deck = _make_docs(tmp_path / "in", "deck.ppt")[0]
+
+        with LibreOfficeConverter(soffice_path=str(script), use_server=False) as converter:
+            output = converter.convert(deck, tmp_path / "out")
+
+        assert output.suffix == ".pptx"
+        assert "--convert-to pptx" in _invocations(log)[0]
+
+    def test_missing_soffice(self, tmp_path: Path) -> None:
+        """Test that a missing LibreOffice is reported per file."""
+        doc = _make_docs(tmp_path, "a.doc")[0]
+
+        with patch.object(_libreoffice, "find_soffice", return_value=None):
+            converter = LibreOfficeConverter()
+
+        with pytest.raises(LibreOfficeError, match="not installed"):
+            converter.convert(doc, tmp_path / "out")
+
+
+class _FakeSession:
+    """Stand-in UNO session that writes the target file."""
+
+    # Server process to kill during the next conversion, simulating a crash
+    crash_server = None
+
+    def __init__(self, uno, pipe_name):
+        self.pipe_name = pipe_name
+
+    def convert(self, source: Path, target: Path, filter_name: str) -> None:
+        if _FakeSession.crash_server is not None:
+            process, _FakeSession.crash_server = _FakeSession.crash_server, None
+            process.kill()
+            process.wait()
+            raise RuntimeError("bridge disposed")
+        target.write_text(f"served {source.name} via {filter_name}")
+
+
+class TestServerConversion:
+    """Tests for conversion through a persistent LibreOffice server."""
+
+    @pytest.fixture(autouse=True)
+    def fake_uno(self):
+        """Pretend the UNO bridge is available."""
+        with (
+            patch.object(_libreoffice_server, "_import_uno", return_value=object()),
+            patch.object(_libreoffice_server, "_UnoSession", _FakeSession),
+        ):
+            yield
+
+    def test_server_is_reused_across_files(self, tmp_path: Path, fake_soffice) -> None:
+        """Test that one server handles many conversions."""
+        script, log = fake_soffice
+        docs = _make_docs(tmp_path / "in", "a.doc", "b.doc")
+
+        with LibreOfficeConverter(soffice_path=str(script)) as converter:
+            for doc in docs:
+                converter.convert(doc, tmp_path / "out")
+            assert converter.server_running
+            assert converter.conversions == 2
+
+        assert not converter.server_running
+        assert _invocations(log) == []
+
+    def test_dead_server_is_restarted(self, tmp_path: Path, fake_soffice) -> None:
+        """Test that a server that dies mid-conversion is replaced and the file retried."""
+        script, _ = fake_soffice
+        doc = _make_docs(tmp_path / "in", "a.doc")[0]
+
+        with LibreOfficeConverter(soffice_path=str(script)) as converter:
+            converter.convert(doc, tmp_path / "out")
+            _FakeSession.crash_server = converter._server.process
+
+            output = converter.convert(doc, tmp_path / "out")
+
+            assert output.read_text() == "served a.doc via Text"
+            assert converter.restarts == 1
+
+
+class TestLegacyOfficeBatch:
+    """Tests for converting a run's legacy Office files together."""
+
+    @pytest.fixture
+    def conversions(self, monkeypatch):
+        """Record batch conversions; files named "bad" fail."""
+        calls: list[list[Path]] = []
+
+        def convert(paths):
+            paths = list(paths)
+            calls.append(paths)
+            return {
+                p: LibreOfficeError("cannot open") if "bad" in p.name else f"text of {p.name}"
+                for p in paths
+            }
+
+        monkeypatch.setattr(_legacy_office, "convert_legacy_office_to_text", convert)
+        monkeypatch.setattr(_legacy_office, "find_soffice", lambda: "soffice")
+        monkeypatch.setattr(_legacy_office.shutil, "which", lambda name: None)
+        return calls
+
+    @staticmethod
+    def _files(directory: Path) -> dict[str, Path]:
+        files = {
+            "word.doc": OLE_SIGNATURE + b" body",
+            "deck.ppt": b"\xd0\xcf legacy deck",
+            "bad.ppt": b"\xd0\xcf broken deck",
+            "export.doc": b"<html>confluence export</html>",
+            "notes.txt": b"plain notes",
+        }
+        for name, content in files.items():
+            (directory / name).write_bytes(content)
+        return {name: directory / name for name in files}
+
+    def test_converts_legacy_files_when_first_needed(self, tmp_path: Path, conversions) -> None:
+        """Test that only LibreOffice-bound files are converted, on first use."""
+        files = self._files(tmp_path)
+        batch = LegacyOfficeBatch(lambda p: f"direct {p.name}")
+
+        queued = batch.prepare(files.values())
+
+        assert queued == 3
+        assert conversions == []
+        assert batch(files["notes.txt"]) == "direct notes.txt"
+        assert conversions == []
+        assert batch(files["word.doc"]) == "text of word.doc"
+        assert conversions == [[files["word.doc"], files["deck.ppt"], files["bad.ppt"]]]
+        assert batch(files["export.doc"]) == "direct export.doc"
+
+    def test_converts_in_bounded_windows(self, tmp_path: Path, conversions) -> None:
+        """Test that files are converted a window at a time, in order of use."""
+        decks = []
+        for i in range(5):
+            path = tmp_path / f"deck{i}.ppt"
+            path.write_bytes(b"\xd0\xcf legacy deck")
+            decks.append(path)
+        batch = LegacyOfficeBatch(lambda p: f"direct {p.name}", window=2)
+        batch.prepare(decks)
+
+        assert [batch(d) for d in decks] == [f"text of {d.name}" for d in decks]
+        assert conversions == [decks[0:2], decks[2:4], decks[4:5]]
+
+    def test_failed_and_reread_files_use_wrapped_extractor(
+        self, tmp_path: Path, conversions
+    ) -> None:
+        """Test that batch failures and repeat reads extract the file alone."""
+        files = self._files(tmp_path)
+        batch = LegacyOfficeBatch(lambda p: f"direct {p.name}")
+        batch.prepare(files.values())
+
+        assert batch(files["bad.ppt"]) == "direct bad.ppt"
+        assert batch(files["deck.ppt"]) == "text of deck.ppt"
+        assert batch(files["deck.ppt"]) == "direct deck.ppt"
+
+    def test_timed_out_window_falls_back_per_file(self, tmp_path: Path) -> None:
+        """Test that a window killed by the supervisor retries each file alone."""
+        files = self._files(tmp_path)
+        calls = []
+
+        def convert(paths):
+            calls.append(paths)
+            return dict.fromkeys(paths, TimeoutError("window timed out"))
+
+        batch = LegacyOfficeBatch(lambda p: f"direct {p.name}", convert=convert)
+        with patch.object(_legacy_office, "find_soffice", return_value="soffice"):
+            batch.prepare(files.values())
+
+        assert batch(files["deck.ppt"]) == "direct deck.ppt"
+        assert batch(files["bad.ppt"]) == "direct bad.ppt"
+        assert len(calls) == 1
+
+    def test_doc_files_left_to_antiword(self, tmp_path: Path, conversions, monkeypatch) -> None:
+        """Test that .doc files are not batched when antiword reads them."""
+        files = self._files(tmp_path)
+        monkeypatch.setattr(_legacy_office.shutil, "which", lambda name: f"/usr/bin/{name}")
+
+        batch = LegacyOfficeBatch(lambda p: "")
+        batch.prepare(files.values())
+        batch(files["deck.ppt"])
+
+        assert conversions == [[files["deck.ppt"], files["bad.ppt"]]]
+
+    def test_without_libreoffice_nothing_is_converted(
+        self, tmp_path: Path, conversions, monkeypatch
+    ) -> None:
+        """Test that a missing LibreOffice leaves errors to the per-file path."""
+        files = self._files(tmp_path)
+        monkeypatch.setattr(_legacy_office, "find_soffice", lambda: None)
+        batch = LegacyOfficeBatch(lambda p: "direct")
+
+        assert batch.prepare(files.values()) == 0
+        assert batch(files["deck.ppt"]) == "direct"
+        assert conversions == []
+
+
+def test_split_unique_stems() -> None:
+    """Test batching of inputs that share a file stem."""
+    paths = [Path("x/a.doc"), Path("y/a.doc"), Path("x/b.doc"), Path("z/a.doc")]
+
+    assert _split_unique_stems(paths) == [
+        [Path("x/a.doc"), Path("x/b.doc")],
+        [Path("y/a.doc")],
+        [Path("z/a.doc")],
+    ]
@@ -0,0 +1,189 @@
+"""Tests for the OCR engine: preprocessing, caching, pooling and metrics."""
+
+import io
+import logging
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from bloginator.config import config
+from bloginator.extraction import _ocr_embedded
+from bloginator.extraction._ocr import OCRCache, OCREngine, OCRUnavailableError
+from bloginator.extraction._ocr_embedded import extract_embedded_image_text
+from bloginator.extraction._ocr_image import _otsu_threshold, preprocess_image
+
+
+# Recognizers: module-level so a "fork" pool can run them
+
+
+def _size_recognizer(data: bytes, max_dimension: int, language: str) -> str:
+    with Image.open(io.BytesIO(data)) as image:
+        return f"{image.width}x{image.height} {language}"
+
+
+def _failing_recognizer(data: bytes, max_dimension: int, language: str) -> str:
+    raise ValueError("cannot identify image file")
+
+
+def _unavailable_recognizer(data: bytes, max_dimension: int, language: str) -> str:
+    raise OCRUnavailableError("Tesseract OCR not installed")
+
+
+def _png(width: int, height: int) -> bytes:
+    """Encode a noisy PNG (noise keeps it above the small-image threshold)."""
+    image = Image.frombytes("L", (width, height), os.urandom(width * height))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class CountingRecognizer:
+    """In-process recognizer that counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, data: bytes, max_dimension: int, language: str) -> str:
+        self.calls += 1
+        return _size_recognizer(data, max_dimension, language)
+
+
+class TestPreprocessing:
+    """Tests for image preprocessing."""
+
+    def test_downscales_and_binarizes(self) -> None:
+        """Test that large images are shrunk to the limit and made bilevel."""
+        image = Image.new("RGB", (5000, 1000), "white")
+
+        prepared = preprocess_image(image, max_dimension=2000)
+
+        assert prepared.size == (2000, 400)
+        assert prepared.mode == "1"
+
+    def test_small_images_keep_size(self) -> None:
+        """Test that images under the limit are not resized."""
+        assert preprocess_image(Image.new("L", (300, 200)), max_dimension=2000).size == (300, 200)
+
+    def test_otsu_threshold_separates_peaks(self) -> None:
+        """Test that the threshold falls between dark text and light background."""
+        histogram = [0] * 256
+        histogram[30] = 1000
+        histogram[220] = 5000
+
+        assert 30 <= _otsu_threshold(histogram) < 220
+
+
+class TestOCREngine:
+    """Tests for OCREngine."""
+
+    def test_cache_prevents_repeat_ocr(self, tmp_path: Path) -> None:
+        """Test that an unchanged image is OCR'd once across engines."""
+        recognizer = CountingRecognizer()
+        data = _png(200, 200)
+
+        first = OCREngine(cache=OCRCache(tmp_path), workers=1, recognizer=recognizer)
+        assert first.ocr_bytes(data) == "200x200 eng"
+
+        second = OCREngine(cache=OCRCache(tmp_path), workers=1, recognizer=recognizer)
+        assert second.ocr_bytes(data) == "200x200 eng"
+
+        assert recognizer.calls == 1
+        assert second.metrics.cache_hits == 1
+        assert second.metrics.cache_hit_rate == 1.0
+
+    def test_settings_are_part_of_cache_key(self, tmp_path: Path) -> None:
+        """Test that changing the language does not reuse cached text."""
+        data = _png(200, 200)
+
+        english = OCREngine(cache=OCRCache(tmp_path), language="eng")
+        german = OCREngine(cache=OCRCache(tmp_path), language="deu")
+
+        assert english.cache_key(data) != german.cache_key(data)
+
+    def test_skips_small_images(self) -> None:
+        """Test that icon-sized images are not OCR'd."""
+        recognizer = CountingRecognizer()
+        engine = OCREngine(workers=1, recognizer=recognizer)
+
+        assert engine.ocr_bytes(b"tiny") == ""
+        assert recognizer.calls == 0
+        assert engine.metrics.skipped_small == 1
+
+    def test_ocr_many_pool_preserves_order(self) -> None:
+        """Test that pooled OCR returns results in input order and dedupes repeats."""
+        images = [_png(150, 150), _png(160, 160), _png(170, 170)]
+        images.append(images[0])
+
+        with OCREngine(workers=2, start_method="fork", recognizer=_size_recognizer) as engine:
+            texts = engine.ocr_many(images)
+
+        assert texts == ["150x150 eng", "160x160 eng", "170x170 eng", "150x150 eng"]
+        assert engine.metrics.images == 3
+        assert engine.metrics.images_per_second > 0
+
+    def test_bad_image_in_batch_is_empty(self) -> None:
+        """Test that one unreadable image does not fail the batch, but strict mode raises."""
+        engine = OCREngine(workers=1, recognizer=_failing_recognizer)
+        data = _png(150, 150)
+
+        assert engine.ocr_many([data]) == [""]
+        assert engine.metrics.failures == 1
+        with pytest.raises(ValueError):
+            engine.ocr_bytes(data)
+
+    def test_unavailable_ocr_raises(self) -> None:
+        """Test that a missing Tesseract is reported rather than cached as empty text."""
+        engine = OCREngine(workers=1, recognizer=_unavailable_recognizer)
+
+        with pytest.raises(OCRUnavailableError):
+            engine.ocr_many([_png(150, 150)])
+
+
+def _docx_with_image(tmp_path: Path) -> Path:
+    """Write a DOCX with one paragraph and one embedded image."""
+    docx = pytest.importorskip("docx")
+    image_path = tmp_path / "diagram.png"
+    image_path.write_bytes(_png(180, 180))
+
+    document = docx.Document()
+    document.add_paragraph("Body text")
+    document.add_picture(str(image_path))
+    docx_path = tmp_path / "report.docx"
+    document.save(str(docx_path))
+    return docx_path
+
+
+def test_extract_embedded_image_text_from_docx(tmp_path: Path) -> None:
+    """Test OCR of images embedded in a DOCX package."""
+    docx_path = _docx_with_image(tmp_path)
+
+    engine = OCREngine(workers=1, recognizer=_size_recognizer)
+    text = extract_embedded_image_text(docx_path, engine=engine)
+
+    assert text.startswith("[Image ")
+    assert "180x180 eng" in text
+
+
+def test_missing_tesseract_skips_embedded_images(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that DOCX extraction survives a missing Tesseract, warning once."""
+    from bloginator.extraction.extractors import extract_text_from_docx
+
+    docx_path = _docx_with_image(tmp_path)
+    engine = OCREngine(workers=1, recognizer=_unavailable_recognizer)
+    monkeypatch.setattr(_ocr_embedded, "_embedded_ocr_unavailable", threading.Event())
+    monkeypatch.setattr(_ocr_embedded, "get_ocr_engine", lambda: engine)
+    monkeypatch.setattr(config, "OCR_EMBEDDED_IMAGES", True)
+
+    with caplog.at_level(logging.WARNING, logger=_ocr_embedded.__name__):
+        first = extract_text_from_docx(docx_path)
+        second = extract_text_from_docx(docx_path)
+
+    assert first == second == "Body text"
+    assert [r.getMessage() for r in caplog.records] == [
+        "Tesseract OCR not installed; skipping OCR of embedded images"
+    ]
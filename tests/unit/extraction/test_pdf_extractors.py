@@ -0,0 +1,74 @@
+"""Tests for page-streaming PDF extraction."""
+
+import io
+from pathlib import Path
+
+import fitz
+import pytest
+
+from bloginator.extraction import extract_text_from_pdf
+from bloginator.extraction._pdf_extractors import (
+    PAGE_SEPARATOR,
+    iter_pdf_pages,
+    iter_pdf_text,
+    write_pdf_text,
+)
+
+
+@pytest.fixture
+def pdf_path(tmp_path: Path) -> Path:
+    """Create a 10-page PDF whose pages say which page they are."""
+    path = tmp_path / "manual.pdf"
+    doc = fitz.open()
+    for number in range(1, 11):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"This is page {number}.")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestIterPdfPages:
+    """Tests for iter_pdf_pages."""
+
+    def test_yields_one_entry_per_page(self, pdf_path: Path) -> None:
+        """Test page-by-page iteration."""
+        pages = list(iter_pdf_pages(pdf_path))
+
+        assert len(pages) == 10
+        assert "page 1." in pages[0]
+        assert "page 10." in pages[9]
+
+    def test_page_range(self, pdf_path: Path) -> None:
+        """Test iterating a sub-range of pages."""
+        pages = list(iter_pdf_pages(pdf_path, start=3, stop=5))
+
+        assert len(pages) == 2
+        assert "page 4." in pages[0]
+
+
+class TestIterPdfText:
+    """Tests for iter_pdf_text."""
+
+    def test_parallel_ranges_preserve_order(self, pdf_path: Path) -> None:
+        """Test that page ranges extracted in parallel are reassembled in order."""
+        sequential = PAGE_SEPARATOR.join(iter_pdf_pages(pdf_path))
+
+        pieces = list(iter_pdf_text(pdf_path, workers=2, parallel_threshold=4, pages_per_range=3))
+
+        assert len(pieces) == 4  # Ranges of 3, 3, 3 and 1 pages
+        assert PAGE_SEPARATOR.join(pieces) == sequential
+
+    def test_small_document_is_sequential(self, pdf_path: Path) -> None:
+        """Test that documents below the threshold are yielded page by page."""
+        assert len(list(iter_pdf_text(pdf_path, workers=2))) == 10
+
+
+def test_write_pdf_text_matches_extract(pdf_path: Path) -> None:
+    """Test streaming into a writer produces the same text as extract_text_from_pdf."""
+    output = io.StringIO()
+
+    written = write_pdf_text(pdf_path, output)
+
+    assert output.getvalue() == extract_text_from_pdf(pdf_path)
+    assert written == len(output.getvalue())
@@ -0,0 +1,214 @@
+"""Tests for supervised extraction in isolated worker processes."""
+
+import faulthandler
+import multiprocessing
+import os
+import signal
+import time
+from pathlib import Path
+
+import fitz
+import pytest
+
+from bloginator.cli.error_reporting import ErrorCategory, ErrorTracker
+from bloginator.extraction import (
+    ExtractionLimits,
+    ExtractionSupervisor,
+    ExtractionTimeoutError,
+    ExtractionWorkerCrashError,
+    _legacy_office,
+)
+
+
+# Worker targets: with the "fork" start method these need not be importable by name
+
+
+def _slow_for_hang_files(path: Path) -> str:
+    if "hang" in path.name:
+        time.sleep(60)
+    return f"text of {path.name}"
+
+
+def _segfault_for_crash_files(path: Path) -> str:
+    if "crash" in path.name:
+        faulthandler.disable()  # Inherited from pytest; keep the simulated crash quiet
+        os.kill(os.getpid(), signal.SIGSEGV)
+    return f"text of {path.name}"
+
+
+def _raise_value_error(path: Path) -> str:
+    raise ValueError(f"Failed to extract text from PDF: {path.name}")
+
+
+def _start_child_process(path: Path) -> str:
+    child = multiprocessing.get_context("fork").Process(target=os.getpid)
+    child.start()
+    child.join()
+    return f"child exited {child.exitcode}"
+
+
+def _supervisor(extractor, timeout: float = 2.0, **kwargs) -> ExtractionSupervisor:
+    return ExtractionSupervisor(
+        max_workers=2,
+        limits={},
+        default_limits=ExtractionLimits(timeout_seconds=timeout, memory_limit_mb=None),
+        start_method="fork",
+        extractor=extractor,
+        **kwargs,
+    )
+
+
+class TestExtractionSupervisor:
+    """Tests for ExtractionSupervisor."""
+
+    def test_extracts_real_file_in_spawned_worker(self, tmp_path: Path) -> None:
+        """Test the default extractor in a spawned worker."""
+        txt = tmp_path / "note.txt"
+        txt.write_text("hello from a worker")
+
+        with ExtractionSupervisor(max_workers=1) as supervisor:
+            assert supervisor.extract(txt) == "hello from a worker"
+
+    def test_timeout_kills_and_replaces_worker(self, tmp_path: Path) -> None:
+        """Test that a hanging extraction is killed and the pool keeps working."""
+        with _supervisor(_slow_for_hang_files, timeout=0.5) as supervisor:
+            start = time.monotonic()
+            with pytest.raises(ExtractionTimeoutError):
+                supervisor.extract(tmp_path / "hang.pdf")
+            assert time.monotonic() - start < 10
+
+            assert supervisor.extract(tmp_path / "ok.pdf") == "text of ok.pdf"
+            assert supervisor.timeouts == 1
+            assert supervisor.restarts == 1
+
+    def test_crash_is_reported_and_worker_replaced(self, tmp_path: Path) -> None:
+        """Test that a segfaulting extractor does not take down the caller."""
+        with _supervisor(_segfault_for_crash_files) as supervisor:
+            with pytest.raises(ExtractionWorkerCrashError, match="SIGSEGV"):
+                supervisor.extract(tmp_path / "crash.pdf")
+
+            assert supervisor.extract(tmp_path / "fine.pdf") == "text of fine.pdf"
+            assert supervisor.crashes == 1
+
+    def test_extractor_errors_keep_their_type(self, tmp_path: Path) -> None:
+        """Test that ordinary extraction errors are re-raised unchanged."""
+        with _supervisor(_raise_value_error) as supervisor:
+            with pytest.raises(ValueError, match="Failed to extract text from PDF"):
+                supervisor.extract(tmp_path / "bad.pdf")
+            assert supervisor.restarts == 0
+
+    def test_limits_for_uses_extension(self) -> None:
+        """Test per-format limit lookup."""
+        pdf_limits = ExtractionLimits(timeout_seconds=300)
+        default = ExtractionLimits(timeout_seconds=5)
+        supervisor = ExtractionSupervisor(limits={".pdf": pdf_limits}, default_limits=default)
+
+        assert supervisor.limits_for(Path("Manual.PDF")) is pdf_limits
+        assert supervisor.limits_for(Path("notes.md")) is default
+        supervisor.close()
+
+    def test_closed_supervisor_rejects_work(self, tmp_path: Path) -> None:
+        """Test that extract() fails fast after close()."""
+        supervisor = _supervisor(_slow_for_hang_files)
+        supervisor.close()
+
+        with pytest.raises(RuntimeError):
+            supervisor.extract(tmp_path / "a.txt")
+
+
+class TestStreamingExtraction:
+    """Tests for iter_extract and worker process management."""
+
+    @pytest.fixture
+    def pdf_path(self, tmp_path: Path) -> Path:
+        """Create a 3-page PDF."""
+        path = tmp_path / "report.pdf"
+        doc = fitz.open()
+        for number in range(1, 4):
+            doc.new_page().insert_text((72, 72), f"This is page {number}.")
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    def test_pdf_streams_page_by_page(self, pdf_path: Path) -> None:
+        """Test that a PDF comes back a page at a time, joining to extract()."""
+        with ExtractionSupervisor(max_workers=1) as supervisor:
+            pages = list(supervisor.iter_extract(pdf_path))
+
+            assert len(pages) == 3
+            assert "page 2." in pages[1]
+            assert "\n\n".join(pages) == supervisor.extract(pdf_path)
+            assert supervisor.restarts == 0
+
+    def test_custom_extractor_streams_one_piece(self, tmp_path: Path) -> None:
+        """Test that other extractors are streamed as a single piece."""
+        with _supervisor(_slow_for_hang_files) as supervisor:
+            assert list(supervisor.iter_extract(tmp_path / "a.pdf")) == ["text of a.pdf"]
+
+            with pytest.raises(ExtractionTimeoutError):
+                list(supervisor.iter_extract(tmp_path / "hang.pdf"))
+
+    def test_abandoned_stream_replaces_worker(self, pdf_path: Path) -> None:
+        """Test that a worker with unread pieces is not reused."""
+        with ExtractionSupervisor(max_workers=1) as supervisor:
+            pieces = supervisor.iter_extract(pdf_path)
+            next(pieces)
+            pieces.close()
+
+            assert supervisor.restarts == 1
+            assert len(list(supervisor.iter_extract(pdf_path))) == 3
+
+    def test_workers_may_start_child_processes(self, tmp_path: Path) -> None:
+        """Test that workers are not daemonic, so extractors can use process pools."""
+        with _supervisor(_start_child_process) as supervisor:
+            assert supervisor.extract(tmp_path / "a.pdf") == "child exited 0"
+
+    def test_stop_kills_worker_process_group(self, tmp_path: Path) -> None:
+        """Test that stopping a worker leaves no process from its group behind."""
+        with _supervisor(_slow_for_hang_files) as supervisor:
+            supervisor.extract(tmp_path / "a.pdf")
+            (worker,) = supervisor._all_workers
+            pid = worker.process.pid
+
+        assert not worker.alive
+        with pytest.raises(ProcessLookupError):
+            os.killpg(pid, 0)
+
+    def test_legacy_office_batch_converted_in_worker(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a conversion runs in a worker and a hang costs one file's limit."""
+
+        def convert(paths):
+            if any("hang" in p.name for p in paths):
+                time.sleep(60)
+            return {p: f"text of {p.name}" for p in paths}
+
+        # Forked workers inherit the stand-in converter
+        monkeypatch.setattr(_legacy_office, "convert_legacy_office_to_text", convert)
+        ok = [tmp_path / "a.ppt", tmp_path / "b.doc"]
+        hung = [tmp_path / "c.ppt", tmp_path / "hang.ppt"]
+
+        with _supervisor(_slow_for_hang_files, timeout=0.5) as supervisor:
+            assert supervisor.convert_legacy_office(ok) == {
+                ok[0]: "text of a.ppt",
+                ok[1]: "text of b.doc",
+            }
+            start = time.monotonic()
+            results = supervisor.convert_legacy_office(hung)
+            assert time.monotonic() - start < 10
+
+        assert set(results) == set(hung)
+        assert all(isinstance(e, ExtractionTimeoutError) for e in results.values())
+
+
+class TestSupervisorErrorCategories:
+    """Tests for ErrorTracker categorization of supervisor failures."""
+
+    def test_timeout_has_own_category(self) -> None:
+        """Test that timeouts are reported under the timeout category."""
+        error = ExtractionTimeoutError(Path("big.pdf"), 300)
+        assert ErrorTracker().categorize_exception(error) == ErrorCategory.TIMEOUT
+
+    def test_crash_is_categorized_as_corrupted(self) -> None:
+        """Test that worker crashes are reported as corrupted files."""
+        error = ExtractionWorkerCrashError(Path("bad.pdf"), -11)
+        assert ErrorTracker().categorize_exception(error) == ErrorCategory.CORRUPTED_FILE
@@ -8,14 +8,24 @@ This module tests batch response collection including edge cases:
 - Missing files
 """
 
+import io
 import json
+import os
 import time
 from pathlib import Path
 from threading import Thread
+from unittest.mock import patch
 
 import pytest
+from rich.console import Console
 
-from bloginator.generation._batch_response_collector import format_elapsed, validate_response
+from bloginator.generation._batch_response_collector import (
+    collect_batch_responses,
+    format_elapsed,
+    validate_response,
+)
+from bloginator.generation._llm_assistant_client import AssistantLLMClient, prune_stale_runs
+from bloginator.generation._response_watcher import ResponseWatcher
 
 
 class TestFormatElapsed:
@@ -321,3 +331,227 @@ class TestValidateResponseLargeContent:
         assert result["content"] == "Test"
         # Extra fields should be preserved
         assert "metadata" in result
+
+
+def _write_later(path: Path, content: str, delay: float) -> Thread:
+    """Write a response file from another thread after a delay."""
+
+    def write() -> None:
+        time.sleep(delay)
+        path.write_text(json.dumps({"content": content}))
+
+    thread = Thread(target=write)
+    thread.start()
+    return thread
+
+
+class TestResponseWatcher:
+    """Test waiting for response files."""
+
+    def test_wait_reports_written_file(self, tmp_path: Path) -> None:
+        """Test that a write wakes the watcher with the file's name."""
+        with ResponseWatcher(tmp_path, poll_interval=0.05) as watcher:
+            thread = _write_later(tmp_path / "response_0001.json", "Done", 0.05)
+            arrived: set[str] = set()
+            deadline = time.monotonic() + 5
+            while "response_0001.json" not in arrived and time.monotonic() < deadline:
+                arrived = watcher.wait(1.0)
+            thread.join()
+
+        assert "response_0001.json" in arrived
+
+    def test_wait_times_out_quietly(self, tmp_path: Path) -> None:
+        """Test that an idle directory returns no new files."""
+        with ResponseWatcher(tmp_path) as watcher:
+            assert watcher.wait(0.05) == set()
+
+    def test_scan_fallback_without_inotify(self, tmp_path: Path) -> None:
+        """Test that without inotify each wait is one directory scan."""
+        (tmp_path / "response_0002.json").write_text("{}")
+
+        with patch(
+            "bloginator.generation._response_watcher._inotify_watch", return_value=None
+        ), ResponseWatcher(tmp_path, poll_interval=0.01) as watcher:
+            assert not watcher.event_driven
+            assert watcher.wait(1.0) == {"response_0002.json"}
+
+
+class TestCollectBatchResponses:
+    """Test collecting batch responses as they arrive."""
+
+    def test_collects_responses_written_while_waiting(self, tmp_path: Path) -> None:
+        """Test that responses are picked up as they are written."""
+        threads = [
+            _write_later(tmp_path / f"response_{i:04d}.json", f"Answer {i}", 0.05 * i)
+            for i in (1, 2, 3)
+        ]
+
+        started = time.monotonic()
+        responses = collect_batch_responses(
+            [1, 2, 3], tmp_path, model="assistant", timeout=10, min_response_threshold=1.0
+        )
+        for thread in threads:
+            thread.join()
+
+        assert {i: r.content for i, r in responses.items()} == {
+            1: "Answer 1",
+            2: "Answer 2",
+            3: "Answer 3",
+        }
+        if ResponseWatcher(tmp_path).event_driven:
+            # Woken by the writes, not by a once-a-second poll
+            assert time.monotonic() - started < 1.0
+
+    def test_rewritten_response_replaces_earlier_one(self, tmp_path: Path) -> None:
+        """Test that a response file overwritten while waiting is read again."""
+        (tmp_path / "response_0001.json").write_text('{"content": "trunc')
+        fixed = _write_later(tmp_path / "response_0001.json", "Fixed", 0.05)
+        # Keeps the collector waiting until the rewrite has been read
+        second = _write_later(tmp_path / "response_0002.json", "Answer 2", 0.3)
+        output = io.StringIO()
+
+        with patch(
+            "bloginator.generation._batch_response_collector.console",
+            Console(file=output, width=200),
+        ):
+            responses = collect_batch_responses(
+                [1, 2], tmp_path, model="assistant", timeout=10, min_response_threshold=1.0
+            )
+        fixed.join()
+        second.join()
+
+        assert responses[1].content == "Fixed"
+        assert responses[1].finish_reason == "stop"
+        assert "Response 1 updated" in output.getvalue()
+
+    def test_unchanged_files_read_once_without_inotify(self, tmp_path: Path) -> None:
+        """Test that directory scans do not re-read files that have not changed."""
+        (tmp_path / "response_0001.json").write_text(json.dumps({"content": "Answer 1"}))
+        second = _write_later(tmp_path / "response_0002.json", "Answer 2", 0.05)
+        output = io.StringIO()
+
+        with patch(
+            "bloginator.generation._response_watcher._inotify_watch", return_value=None
+        ), patch(
+            "bloginator.generation._batch_response_collector.console",
+            Console(file=output, width=200),
+        ):
+            responses = collect_batch_responses(
+                [1, 2], tmp_path, model="assistant", timeout=10, min_response_threshold=1.0
+            )
+        second.join()
+
+        assert [responses[i].content for i in (1, 2)] == ["Answer 1", "Answer 2"]
+        assert "updated" not in output.getvalue()
+
+    def test_partial_batch_uses_run_request_dir(self, tmp_path: Path) -> None:
+        """Test that placeholders point at this run's request files."""
+        request_dir = tmp_path / "requests" / "run_a"
+        (tmp_path / "response_0001.json").write_text(json.dumps({"content": "Answer"}))
+
+        responses = collect_batch_responses(
+            [1, 2],
+            tmp_path,
+            model="assistant",
+            timeout=0,
+            min_response_threshold=0.5,
+            request_dir=request_dir,
+        )
+
+        assert responses[2].finish_reason == "missing"
+        assert str(request_dir / "request_0002.json") in responses[2].content
+
+
+def test_assistant_runs_use_separate_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that concurrent runs write to their own request subdirectories."""
+    monkeypatch.chdir(tmp_path)
+    first = AssistantLLMClient(batch_mode=True, run_id="run_a")
+    second = AssistantLLMClient(batch_mode=True, run_id="run_b")
+
+    first.generate("First")
+    second.generate("Second")
+
+    assert first.request_dir != second.request_dir
+    assert (tmp_path / ".bloginator/llm_requests/run_a/request_0001.json").exists()
+    assert (tmp_path / ".bloginator/llm_requests/run_b/request_0001.json").exists()
+    assert first.response_dir == Path(".bloginator/llm_responses/run_a")
+
+
+class TestAssistantRunCleanup:
+    """Test that assistant runs do not leave request directories behind."""
+
+    def test_finished_batch_removes_run_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a fully answered batch deletes its run's directories."""
+        monkeypatch.chdir(tmp_path)
+        client = AssistantLLMClient(batch_mode=True, run_id="run_a", timeout=10)
+        client.generate("First")
+        client.generate("Second")
+        for i in (1, 2):
+            (client.response_dir / f"response_{i:04d}.json").write_text(
+                json.dumps({"content": f"Answer {i}"})
+            )
+
+        responses = client.get_batch_responses()
+
+        assert responses[2].content == "Answer 2"
+        assert not client.request_dir.exists()
+        assert not client.response_dir.exists()
+
+    def test_incomplete_batch_keeps_request_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that placeholders still point at existing request files."""
+        monkeypatch.chdir(tmp_path)
+        client = AssistantLLMClient(
+            batch_mode=True, run_id="run_a", timeout=0, min_response_threshold=0.5
+        )
+        client.generate("First")
+        client.generate("Second")
+        (client.response_dir / "response_0001.json").write_text(json.dumps({"content": "A"}))
+
+        responses = client.get_batch_responses()
+
+        assert responses[2].finish_reason == "missing"
+        assert (client.request_dir / "request_0002.json").exists()
+
+    def test_serial_request_removes_answered_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a serial request deletes its files once answered."""
+        monkeypatch.chdir(tmp_path)
+        client = AssistantLLMClient(run_id="run_a", timeout=10)
+        client.response_dir.mkdir(parents=True)
+        writer = _write_later(client.response_dir / "response_0001.json", "Answer", 0.05)
+
+        response = client.generate("Prompt")
+        writer.join()
+
+        assert response.content == "Answer"
+        assert list(client.request_dir.iterdir()) == []
+        assert list(client.response_dir.iterdir()) == []
+
+        client.close()
+        assert not client.request_dir.exists()
+
+    def test_stale_runs_pruned_on_start(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only run directories older than the TTL are removed."""
+        monkeypatch.chdir(tmp_path)
+        old = Path(".bloginator/llm_requests/run_old")
+        fresh = Path(".bloginator/llm_responses/run_fresh")
+        for directory in (old, fresh):
+            directory.mkdir(parents=True)
+            (directory / "request_0001.json").write_text("{}")
+        two_days_ago = time.time() - 2 * 24 * 3600
+        os.utime(old, (two_days_ago, two_days_ago))
+
+        AssistantLLMClient(run_id="run_new")
+
+        assert not old.exists()
+        assert fresh.exists()
+        assert prune_stale_runs(ttl_seconds=0) == 1
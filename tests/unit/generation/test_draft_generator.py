@@ -1,5 +1,6 @@
 """Tests for draft generator."""
 
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -448,3 +449,192 @@ class TestDraftGenerator:
         # Should be highest scores
         assert draft_section.citations[0].chunk_id == "chunk0"
         assert draft_section.citations[4].chunk_id == "chunk4"
+
+    def test_generate_plans_sources_across_sections(self, mock_llm_client, mock_searcher):
+        """Test that a chunk retrieved for every section is sent to only one."""
+        shared = SearchResult(
+            chunk_id="shared",
+            content="Test material that every section retrieves",
+            distance=0.1,
+            metadata={"document_id": "doc0", "filename": "shared.md"},
+        )
+        mock_searcher.batch_search.return_value = [
+            [
+                shared,
+                SearchResult(
+                    chunk_id=f"chunk{i}",
+                    content=f"Test material specific to section {i}",
+                    distance=0.3,
+                    metadata={"document_id": f"doc{i}", "filename": f"file{i}.md"},
+                ),
+            ]
+            for i in (1, 2)
+        ]
+        llm_response = Mock()
+        llm_response.content = "Content"
+        mock_llm_client.generate.return_value = llm_response
+        generator = DraftGenerator(
+            llm_client=mock_llm_client, searcher=mock_searcher, sources_per_section=2
+        )
+        outline = Outline(
+            title="Test",
+            keywords=["test"],
+            sections=[
+                OutlineSection(title="One", description="First"),
+                OutlineSection(title="Two", description="Second"),
+            ],
+        )
+
+        draft = generator.generate(outline)
+
+        # Candidates are over-fetched once for the whole outline
+        assert mock_searcher.batch_search.call_args_list[0].kwargs["n_results"] == 6
+        cited = [[c.chunk_id for c in section.citations] for section in draft.sections]
+        assert cited == [["shared", "chunk1"], ["chunk2"]]
+        prompts = [call.kwargs["prompt"] for call in mock_llm_client.generate.call_args_list]
+        assert sum(shared.content in prompt for prompt in prompts) == 1
+
+    def test_unlimited_source_uses_keeps_independent_results(self, mock_llm_client, mock_searcher):
+        """Test that max_source_uses=0 searches and assigns per section."""
+        generator = DraftGenerator(
+            llm_client=mock_llm_client,
+            searcher=mock_searcher,
+            sources_per_section=2,
+            max_source_uses=0,
+        )
+        mock_llm_client.generate.return_value = Mock(content="Content")
+
+        generator.generate(Outline(title="Test", keywords=["test"], sections=[]))
+
+        assert mock_searcher.batch_search.call_args_list[0].kwargs["n_results"] == 2
+
+        with pytest.raises(ValueError):
+            DraftGenerator(llm_client=mock_llm_client, searcher=mock_searcher, max_source_uses=-1)
+
+
+class TestConcurrentDraftGeneration:
+    """Tests for concurrent section generation."""
+
+    TITLES = ["Alpha", "Bravo", "Bravo One", "Bravo Two", "Charlie"]
+
+    @pytest.fixture
+    def outline(self):
+        """Create an outline with nested subsections."""
+        return Outline(
+            title="Concurrency",
+            keywords=["test"],
+            sections=[
+                OutlineSection(title="Alpha", description="First"),
+                OutlineSection(
+                    title="Bravo",
+                    description="Second",
+                    subsections=[
+                        OutlineSection(title="Bravo One", description="Second, part one"),
+                        OutlineSection(title="Bravo Two", description="Second, part two"),
+                    ],
+                ),
+                OutlineSection(title="Charlie", description="Third"),
+            ],
+        )
+
+    @pytest.fixture
+    def slow_llm(self):
+        """Create an LLM client whose calls take 0.2s and echo the section title."""
+
+        def generate(prompt, **kwargs):
+            time.sleep(0.2)
+            title = max((t for t in self.TITLES if t in prompt), key=len)
+            return Mock(content=f"Content for {title}")
+
+        client = Mock()
+        client.generate.side_effect = generate
+        return client
+
+    @pytest.fixture
+    def searcher(self):
+        """Create a searcher with no pre-fetched results."""
+        searcher = Mock()
+        searcher.batch_search.return_value = []
+        searcher.search.return_value = []
+        return searcher
+
+    def _generate(self, llm, searcher, outline, concurrency):
+        progress = []
+        generator = DraftGenerator(llm_client=llm, searcher=searcher, max_concurrency=concurrency)
+        start = time.monotonic()
+        draft = generator.generate(
+            outline, progress_callback=lambda msg, cur, total: progress.append((msg, cur, total))
+        )
+        return draft, progress, time.monotonic() - start
+
+    def test_sections_reassembled_in_outline_order(self, slow_llm, searcher, outline):
+        """Test that concurrent output matches the outline structure."""
+        draft, _, elapsed = self._generate(slow_llm, searcher, outline, concurrency=5)
+
+        assert [s.title for s in draft.sections] == ["Alpha", "Bravo", "Charlie"]
+        assert [s.content for s in draft.sections] == [
+            "Content for Alpha",
+            "Content for Bravo",
+            "Content for Charlie",
+        ]
+        assert [s.content for s in draft.sections[1].subsections] == [
+            "Content for Bravo One",
+            "Content for Bravo Two",
+        ]
+        # Five 0.2s calls in parallel take about as long as one
+        assert elapsed < 0.8
+
+    def test_progress_matches_sequential_generation(self, slow_llm, searcher, outline):
+        """Test that progress messages and positions are the same as sequential mode."""
+        _, sequential, _ = self._generate(slow_llm, searcher, outline, concurrency=1)
+        _, concurrent, _ = self._generate(slow_llm, searcher, outline, concurrency=3)
+
+        def generating(events):
+            return [e for e in events if e[0].startswith("Generating content")]
+
+        assert generating(concurrent) == generating(sequential)
+        assert [e[1] for e in generating(concurrent)] == [0, 1, 2, 3, 4]
+
+    def test_subsection_word_budget_is_halved(self, slow_llm, searcher, outline):
+        """Test that subsections get half the parent's token budget."""
+        generator = DraftGenerator(llm_client=slow_llm, searcher=searcher, max_concurrency=4)
+        generator.generate(outline, max_section_words=100)
+
+        max_tokens = sorted(c.kwargs["max_tokens"] for c in slow_llm.generate.call_args_list)
+        assert max_tokens == [100, 100, 200, 200, 200]
+
+    def test_llm_error_propagates(self, searcher, outline):
+        """Test that a failed section aborts generation with the original error."""
+        llm = Mock()
+        llm.generate.side_effect = RuntimeError("LLM failed")
+        generator = DraftGenerator(llm_client=llm, searcher=searcher, max_concurrency=2)
+
+        with pytest.raises(RuntimeError, match="LLM failed"):
+            generator.generate(outline)
+
+    def test_rejects_invalid_concurrency(self, searcher):
+        """Test max_concurrency validation."""
+        with pytest.raises(ValueError):
+            DraftGenerator(llm_client=Mock(), searcher=searcher, max_concurrency=0)
+
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_token_callback_streams_sections(self, searcher, outline, concurrency):
+        """Test that a token callback switches to streaming and sees every delta."""
+
+        def stream(prompt, **kwargs):
+            title = max((t for t in self.TITLES if t in prompt), key=len)
+            yield from ["Content ", "for ", title, "  "]
+
+        llm = Mock()
+        llm.stream.side_effect = stream
+        received = []
+        generator = DraftGenerator(llm_client=llm, searcher=searcher, max_concurrency=concurrency)
+
+        draft = generator.generate(
+            outline, token_callback=lambda title, delta: received.append((title, delta))
+        )
+
+        llm.generate.assert_not_called()
+        assert draft.sections[1].subsections[0].content == "Content for Bravo One"
+        assert ("Charlie", "Charlie") in received
+        assert len(received) == 4 * len(self.TITLES)
@@ -0,0 +1,94 @@
+"""Tests for per-request generation memoization."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from bloginator.generation._generation_context import GenerationContext, MemoizingSearcher
+from bloginator.search import SearchResult
+
+
+def _searcher() -> Mock:
+    searcher = Mock()
+    searcher.batch_search.side_effect = lambda queries, **kwargs: [
+        [SearchResult(chunk_id=q, content=q, metadata={}, distance=0.1)] for q in queries
+    ]
+    searcher.search.side_effect = lambda query, **kwargs: [
+        SearchResult(chunk_id=query, content=query, metadata={}, distance=0.1)
+    ]
+    return searcher
+
+
+class TestMemoizingSearcher:
+    """Tests for MemoizingSearcher."""
+
+    def test_batch_sends_only_new_queries(self) -> None:
+        """Test that a batch fetches just the queries not seen before."""
+        searcher = _searcher()
+        memo = MemoizingSearcher(searcher)
+
+        memo.batch_search(["a", "b"], n_results=3)
+        results = memo.batch_search(["b", "c", "c"], n_results=3)
+
+        assert searcher.batch_search.call_args.kwargs["queries"] == ["c"]
+        assert [r[0].chunk_id for r in results] == ["b", "c", "c"]
+        assert (memo.hits, memo.misses) == (2, 3)
+
+    def test_key_includes_result_count_and_filters(self) -> None:
+        """Test that different result counts or filters are separate searches."""
+        searcher = _searcher()
+        memo = MemoizingSearcher(searcher)
+
+        memo.search("a", n_results=3)
+        memo.search("a", n_results=3)
+        memo.search("a", n_results=5)
+        memo.search("a", n_results=3, tags_filter=["x"])
+
+        assert searcher.search.call_count == 3
+
+    def test_results_are_copies(self) -> None:
+        """Test that callers cannot change remembered results."""
+        memo = MemoizingSearcher(_searcher())
+
+        memo.search("a").clear()
+
+        assert len(memo.search("a")) == 1
+
+    def test_delegates_attributes(self) -> None:
+        """Test that other attributes come from the wrapped searcher."""
+        searcher = _searcher()
+        searcher.index_dir = "/index"
+
+        assert MemoizingSearcher(searcher).index_dir == "/index"
+
+
+def test_topic_check_computed_once_under_concurrency() -> None:
+    """Test that concurrent callers wait for the first validation."""
+    context = GenerationContext(_searcher())
+    calls = []
+
+    def compute() -> str:
+        calls.append(1)
+        time.sleep(0.05)
+        return "VALID"
+
+    results: list[str] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(context.topic_check(("t",), compute)))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == ["VALID"] * 3
+    assert len(calls) == 1
+    assert context.stats()["topic_checks_reused"] == 2
+
+
+def test_context_reuses_memoizing_searcher() -> None:
+    """Test that an already memoizing searcher is not wrapped again."""
+    memo = MemoizingSearcher(_searcher())
+
+    assert GenerationContext(memo).searcher is memo
@@ -0,0 +1,140 @@
+"""Tests for pooled HTTP connections and async LLM generation."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from bloginator.generation import llm_custom, llm_ollama
+from bloginator.generation._http_pool import (
+    aclose_http_clients,
+    get_async_http_client,
+    get_http_session,
+)
+from bloginator.generation.llm_custom import CustomLLMClient
+from bloginator.generation.llm_mock import MockLLMClient
+from bloginator.generation.llm_ollama import OllamaClient
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestPools:
+    """Tests for the shared connection pools."""
+
+    def test_session_shared_per_server(self) -> None:
+        """Test that clients for the same server reuse one session."""
+        first = get_http_session("http://localhost:11434")
+        second = get_http_session("http://localhost:11434/api/generate")
+        other = get_http_session("http://localhost:1234/v1")
+
+        assert first is second
+        assert first is not other
+
+    def test_async_client_shared_within_loop(self) -> None:
+        """Test that one async client serves a whole event loop."""
+
+        async def run() -> bool:
+            same = get_async_http_client() is get_async_http_client()
+            await aclose_http_clients()
+            return same
+
+        assert asyncio.run(run())
+
+
+class TestAsyncGeneration:
+    """Tests for agenerate on HTTP-backed clients."""
+
+    def test_ollama_agenerate(self) -> None:
+        """Test that Ollama's async path sends the same payload as the sync one."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(json.loads(request.content))
+            return httpx.Response(200, json={"message": {"content": "Hi"}, "eval_count": 3})
+
+        client = OllamaClient()
+
+        async def run():
+            async with _mock_client(handler) as http:
+                with patch.object(llm_ollama, "get_async_http_client", return_value=http):
+                    return await client.agenerate("Prompt", system_prompt="System")
+
+        response = asyncio.run(run())
+
+        assert response.content == "Hi"
+        assert response.completion_tokens == 3
+        assert seen[0]["messages"] == [
+            {"role": "system", "content": "System"},
+            {"role": "user", "content": "Prompt"},
+        ]
+        assert seen[0]["stream"] is False
+
+    def test_custom_agenerate_sends_headers(self) -> None:
+        """Test that the custom client's async path authenticates and parses replies."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "choices": [{"message": {"content": "Done"}, "finish_reason": "length"}],
+                    "usage": {"prompt_tokens": 4, "completion_tokens": 6},
+                },
+            )
+
+        client = CustomLLMClient(model="local", api_key="secret")
+
+        async def run():
+            async with _mock_client(handler) as http:
+                with patch.object(llm_custom, "get_async_http_client", return_value=http):
+                    return await client.agenerate("Prompt")
+
+        response = asyncio.run(run())
+
+        assert response.content == "Done"
+        assert response.total_tokens == 10
+        assert response.finish_reason == "length"
+        assert seen[0].headers["Authorization"] == "Bearer secret"
+
+    def test_connection_error_is_mapped(self) -> None:
+        """Test that transport failures surface as ConnectionError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        async def run():
+            async with _mock_client(handler) as http:
+                with patch.object(llm_ollama, "get_async_http_client", return_value=http):
+                    await OllamaClient().agenerate("Prompt")
+
+        with pytest.raises(ConnectionError, match="Unable to connect to Ollama"):
+            asyncio.run(run())
+
+    def test_ollama_astream(self) -> None:
+        """Test that Ollama's async stream yields tokens from NDJSON lines."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            lines = [
+                {"message": {"content": "One"}, "done": False},
+                {"message": {"content": " two"}, "done": False},
+                {"message": {"content": ""}, "done": True},
+            ]
+            return httpx.Response(200, text="\n".join(json.dumps(line) for line in lines))
+
+        async def run():
+            async with _mock_client(handler) as http:
+                with patch.object(llm_ollama, "get_async_http_client", return_value=http):
+                    return [delta async for delta in OllamaClient().astream("Prompt")]
+
+        assert asyncio.run(run()) == ["One", " two"]
+
+    def test_sync_only_client_uses_thread_adapter(self) -> None:
+        """Test that clients without an async transport still support agenerate."""
+        response = asyncio.run(MockLLMClient().agenerate("Write about Python"))
+
+        assert response.content
@@ -0,0 +1,208 @@
+"""Tests for the LLM response cache."""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from bloginator.generation._llm_cache import (
+    CachingLLMClient,
+    LLMResponseCache,
+    cache_report,
+)
+from bloginator.generation.llm_base import LLMClient, LLMResponse, StreamUsage
+
+
+class CountingClient(LLMClient):
+    """LLM client that numbers its responses."""
+
+    def __init__(self, model: str = "test-model", finish_reason: str = "stop"):
+        self.model = model
+        self.finish_reason = finish_reason
+        self.calls = 0
+
+    def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(
+            content=f"response {self.calls} to {prompt}",
+            model=self.model,
+            prompt_tokens=5,
+            completion_tokens=7,
+            finish_reason=self.finish_reason,
+        )
+
+    def is_available(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> LLMResponseCache:
+    """Create a response cache in a temporary directory."""
+    return LLMResponseCache(tmp_path / "llm" / "responses.sqlite")
+
+
+class TestCachingLLMClient:
+    """Tests for CachingLLMClient."""
+
+    def test_deterministic_calls_are_reused_across_clients(
+        self, cache: LLMResponseCache, tmp_path: Path
+    ) -> None:
+        """Test that a repeated temperature-0 call costs no second API call."""
+        inner = CountingClient()
+        first = CachingLLMClient(inner, cache, provider="ollama")
+        original = first.generate("Validate topic", temperature=0.0, system_prompt="Be strict")
+
+        reopened = LLMResponseCache(tmp_path / "llm" / "responses.sqlite")
+        second = CachingLLMClient(inner, reopened, provider="ollama")
+        repeat = second.generate("Validate topic", temperature=0.0, system_prompt="Be strict")
+
+        assert inner.calls == 1
+        assert repeat.content == original.content
+        assert repeat.total_tokens == 12
+        assert reopened.stats.hit_rate == 1.0
+
+    def test_sampled_calls_bypass_cache_unless_opted_in(self, cache: LLMResponseCache) -> None:
+        """Test that temperature > 0 is only cached when requested."""
+        inner = CountingClient()
+        client = CachingLLMClient(inner, cache)
+
+        client.generate("Write", temperature=0.7)
+        client.generate("Write", temperature=0.7)
+        assert inner.calls == 2
+        assert cache.stats.bypassed == 2
+
+        opted_in = CachingLLMClient(inner, cache, cache_sampled=True)
+        opted_in.generate("Write", temperature=0.7)
+        opted_in.generate("Write", temperature=0.7)
+        assert inner.calls == 3
+
+    def test_key_covers_all_inputs(self, cache: LLMResponseCache) -> None:
+        """Test that changing any request input misses the cache."""
+        inner = CountingClient()
+        client = CachingLLMClient(inner, cache, provider="ollama")
+
+        client.generate("Prompt", temperature=0.0)
+        client.generate("Prompt", temperature=0.0, max_tokens=100)
+        client.generate("Prompt", temperature=0.0, system_prompt="System")
+        CachingLLMClient(CountingClient("other-model"), cache, provider="ollama").generate(
+            "Prompt", temperature=0.0
+        )
+        CachingLLMClient(inner, cache, provider="custom").generate("Prompt", temperature=0.0)
+        remote = CountingClient()
+        remote.base_url = "http://gpu-box:11434"
+        CachingLLMClient(remote, cache, provider="ollama").generate("Prompt", temperature=0.0)
+        small_window = CountingClient()
+        small_window.num_ctx = 2048
+        CachingLLMClient(small_window, cache, provider="ollama").generate("Prompt", temperature=0.0)
+
+        assert cache.stats.hits == 0
+        assert len(cache) == 7
+
+    @pytest.mark.parametrize("finish_reason", ["length", "max_tokens"])
+    def test_truncated_responses_not_cached(
+        self, cache: LLMResponseCache, finish_reason: str
+    ) -> None:
+        """Test that output cut off at max_tokens is asked for again."""
+        inner = CountingClient(finish_reason=finish_reason)
+        client = CachingLLMClient(inner, cache)
+
+        client.generate("Prompt", temperature=0.0)
+        client.generate("Prompt", temperature=0.0)
+        list(client.stream("Prompt", temperature=0.0))
+
+        assert inner.calls == 3
+        assert len(cache) == 0
+
+    def test_agenerate_uses_cache(self, cache: LLMResponseCache) -> None:
+        """Test that async calls share the same cache."""
+        inner = CountingClient()
+        client = CachingLLMClient(inner, cache)
+
+        client.generate("Prompt", temperature=0.0)
+        response = asyncio.run(client.agenerate("Prompt", temperature=0.0))
+
+        assert inner.calls == 1
+        assert response.content == "response 1 to Prompt"
+
+    def test_stream_replays_cached_response(self, cache: LLMResponseCache) -> None:
+        """Test that a fully read stream is cached and replayed."""
+        inner = CountingClient()
+        client = CachingLLMClient(inner, cache)
+
+        first = "".join(client.stream("Prompt", temperature=0.0))
+        second = list(client.stream("Prompt", temperature=0.0))
+
+        assert inner.calls == 1
+        assert second == [first]
+
+    def test_stream_keeps_reported_token_counts(self, cache: LLMResponseCache) -> None:
+        """Test that streamed token counts are cached and replayed."""
+        client = CachingLLMClient(CountingClient(), cache)
+        streamed, replayed = StreamUsage(), StreamUsage()
+
+        list(client.stream("Prompt", temperature=0.0, usage=streamed))
+        list(client.stream("Prompt", temperature=0.0, usage=replayed))
+
+        assert (streamed.prompt_tokens, streamed.completion_tokens) == (5, 7)
+        assert replayed == streamed
+
+    def test_delegates_attributes(self, cache: LLMResponseCache) -> None:
+        """Test that wrapped client attributes remain reachable."""
+        client = CachingLLMClient(CountingClient(), cache)
+
+        assert client.model == "test-model"
+        assert client.is_available()
+
+    def test_cache_report(self, cache: LLMResponseCache) -> None:
+        """Test the hit rate summary."""
+        client = CachingLLMClient(CountingClient(), cache)
+        assert cache_report(client) is None
+
+        client.generate("Prompt", temperature=0.0)
+        client.generate("Prompt", temperature=0.0)
+
+        assert cache_report(client) == "LLM cache: 1/2 hits (50%), 0 uncached sampled calls"
+        assert cache_report(CountingClient()) is None
+
+
+class TestEviction:
+    """Tests for TTL and size eviction."""
+
+    def test_expired_entries_miss(self, tmp_path: Path) -> None:
+        """Test that entries past their TTL are discarded."""
+        cache = LLMResponseCache(tmp_path / "cache.sqlite", ttl_seconds=0.05)
+        cache.put("key", LLMResponse(content="old", model="m"))
+
+        time.sleep(0.1)
+
+        assert cache.get("key") is None
+        assert cache.stats.evictions == 1
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted_when_full(self, tmp_path: Path) -> None:
+        """Test that the size limit drops the least recently used entry."""
+        cache = LLMResponseCache(tmp_path / "cache.sqlite", max_entries=2)
+        cache.put("a", LLMResponse(content="a", model="m"))
+        time.sleep(0.01)
+        cache.put("b", LLMResponse(content="b", model="m"))
+        time.sleep(0.01)
+        assert cache.get("a") is not None  # refreshes "a"
+        time.sleep(0.01)
+
+        cache.put("c", LLMResponse(content="c", model="m"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 2
+
+    def test_invalid_size_limit(self, tmp_path: Path) -> None:
+        """Test that a zero size limit is rejected."""
+        with pytest.raises(ValueError, match="max_entries"):
+            LLMResponseCache(tmp_path / "cache.sqlite", max_entries=0)
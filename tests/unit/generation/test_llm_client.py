@@ -3,7 +3,7 @@
 import json
 import os
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
@@ -65,13 +65,13 @@ class TestOllamaClient:
         assert client.model == "llama3"
         assert client.base_url == "http://localhost:11434"
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_basic(self, mock_post):
         """Test basic generation."""
         # Mock successful response
         mock_response = Mock()
         mock_response.json.return_value = {
-            "response": "Generated content",
+            "message": {"role": "assistant", "content": "Generated content"},
             "prompt_eval_count": 10,
             "eval_count": 20,
         }
@@ -90,15 +90,15 @@ class TestOllamaClient:
         mock_post.assert_called_once()
         call_kwargs = mock_post.call_args.kwargs
         assert call_kwargs["json"]["model"] == "llama3"
-        assert call_kwargs["json"]["prompt"] == "Test prompt"
+        assert call_kwargs["json"]["messages"] == [{"role": "user", "content": "Test prompt"}]
         assert call_kwargs["json"]["stream"] is False
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_with_system_prompt(self, mock_post):
         """Test generation with system prompt."""
         mock_response = Mock()
         mock_response.json.return_value = {
-            "response": "Response",
+            "message": {"role": "assistant", "content": "Response"},
             "prompt_eval_count": 5,
             "eval_count": 10,
         }
@@ -112,15 +112,18 @@ class TestOllamaClient:
         )
 
         call_kwargs = mock_post.call_args.kwargs
-        # System prompt is concatenated with user prompt
-        assert call_kwargs["json"]["prompt"] == "System instructions\n\nUser prompt"
+        # System prompt is sent as its own leading message
+        assert call_kwargs["json"]["messages"] == [
+            {"role": "system", "content": "System instructions"},
+            {"role": "user", "content": "User prompt"},
+        ]
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_with_options(self, mock_post):
         """Test generation with temperature and max_tokens."""
         mock_response = Mock()
         mock_response.json.return_value = {
-            "response": "Response",
+            "message": {"role": "assistant", "content": "Response"},
             "prompt_eval_count": 5,
             "eval_count": 10,
         }
@@ -138,7 +141,7 @@ class TestOllamaClient:
         assert call_kwargs["json"]["options"]["temperature"] == 0.5
         assert call_kwargs["json"]["options"]["num_predict"] == 100
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_connection_error(self, mock_post):
         """Test handling of connection errors."""
         mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -148,7 +151,7 @@ class TestOllamaClient:
         with pytest.raises(ConnectionError, match="Unable to connect to Ollama"):
             client.generate(prompt="Test")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_http_error(self, mock_post):
         """Test handling of HTTP errors."""
         mock_response = Mock()
@@ -160,13 +163,13 @@ class TestOllamaClient:
         with pytest.raises(ValueError, match="Ollama generation failed"):
             client.generate(prompt="Test")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_missing_response_field(self, mock_post):
         """Test handling of malformed response."""
         mock_response = Mock()
         mock_response.json.return_value = {
             "prompt_eval_count": 10,
-            # Missing 'response' field - should return empty string
+            # Missing 'message' field - should return empty string
         }
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
@@ -179,12 +182,12 @@ class TestOllamaClient:
         assert response.prompt_tokens == 10  # From prompt_eval_count
         assert response.completion_tokens == 0  # len("") // 4 = 0
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_missing_token_counts(self, mock_post):
         """Test handling of missing token counts."""
         mock_response = Mock()
         mock_response.json.return_value = {
-            "response": "Content",
+            "message": {"role": "assistant", "content": "Content"},
             # Missing token counts
         }
         mock_response.raise_for_status.return_value = None
@@ -199,6 +202,46 @@ class TestOllamaClient:
         assert response.completion_tokens == 1  # len("Content") // 4 = 1
         assert response.total_tokens == 2
 
+    @patch("requests.Session.post")
+    def test_stream_yields_tokens(self, mock_post):
+        """Test that streaming requests NDJSON and yields each token."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_lines.return_value = [
+            b'{"message": {"content": "Hello"}, "done": false}',
+            b"",
+            b'{"message": {"content": " world"}, "done": false}',
+            b'{"message": {"content": ""}, "done": true, "eval_count": 2}',
+        ]
+        mock_post.return_value = mock_response
+
+        client = OllamaClient()
+        deltas = list(client.stream(prompt="Test"))
+
+        assert deltas == ["Hello", " world"]
+        assert mock_post.call_args.kwargs["json"]["stream"] is True
+        assert mock_post.call_args.kwargs["stream"] is True
+
+    @patch("requests.Session.post")
+    def test_stream_error_chunk(self, mock_post):
+        """Test that an error reported mid-stream raises ValueError."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_lines.return_value = [b'{"error": "model not found"}']
+        mock_post.return_value = mock_response
+
+        with pytest.raises(ValueError, match="model not found"):
+            list(OllamaClient().stream(prompt="Test"))
+
+    def test_default_stream_yields_full_response(self):
+        """Test that clients without native streaming yield one delta."""
+        client = MockLLMClient()
+
+        deltas = list(client.stream(prompt="Write about testing"))
+
+        assert len(deltas) == 1
+        assert deltas[0]
+
 
 class TestCreateLLMClient:
     """Tests for LLM client factory."""
@@ -0,0 +1,181 @@
+"""Tests for coalescing identical in-flight LLM requests."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+from bloginator.generation._llm_cache import CachingLLMClient, LLMResponseCache
+from bloginator.generation._llm_coalesce import (
+    CoalescingLLMClient,
+    SingleFlight,
+    coalescing_report,
+)
+from bloginator.generation.llm_base import LLMClient, LLMResponse
+from bloginator.generation.llm_factory import create_llm_from_config
+from bloginator.generation.llm_ollama import OllamaClient
+
+
+class GatedClient(LLMClient):
+    """LLM client whose calls block until released."""
+
+    def __init__(self, fail: bool = False):
+        self.model = "test-model"
+        self.fail = fail
+        self.calls = 0
+        self.release = threading.Event()
+
+    def _respond(self, prompt: str) -> LLMResponse:
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("upstream down")
+        return LLMResponse(content=f"{prompt} #{self.calls}", model=self.model)
+
+    def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        self.release.wait(timeout=5)
+        return self._respond(prompt)
+
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        await asyncio.sleep(0.02)
+        return self._respond(prompt)
+
+    def is_available(self) -> bool:
+        return True
+
+
+def _run_threads(client: CoalescingLLMClient, prompts: list[str]) -> list[object]:
+    """Call generate from one thread per prompt, releasing once all have joined."""
+    results: list[object] = [None] * len(prompts)
+
+    def call(i: int) -> None:
+        try:
+            results[i] = client.generate(prompts[i])
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(prompts))]
+    for thread in threads:
+        thread.start()
+    for _ in range(500):
+        if client.stats.calls == len(prompts):
+            break
+        threading.Event().wait(0.01)
+    client.client.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+class TestCoalescingLLMClient:
+    """Tests for CoalescingLLMClient."""
+
+    def test_concurrent_identical_calls_share_one_request(self) -> None:
+        """Test that threads asking the same thing wait for one upstream call."""
+        upstream = GatedClient()
+        client = CoalescingLLMClient(upstream, group=SingleFlight())
+
+        results = _run_threads(client, ["Same"] * 4)
+
+        assert upstream.calls == 1
+        assert {r.content for r in results} == {"Same #1"}
+        assert len({id(r) for r in results}) == 4
+        assert client.stats.to_dict() == {"upstream": 1, "coalesced": 3, "calls": 4}
+
+    def test_different_prompts_not_merged(self) -> None:
+        """Test that only identical requests are coalesced."""
+        upstream = GatedClient()
+        client = CoalescingLLMClient(upstream, group=SingleFlight())
+
+        _run_threads(client, ["A", "B"])
+
+        assert upstream.calls == 2
+        assert client.stats.coalesced == 0
+
+    def test_sequential_calls_go_upstream(self) -> None:
+        """Test that a finished call is not reused for the next one."""
+        upstream = GatedClient()
+        upstream.release.set()
+        client = CoalescingLLMClient(upstream, group=SingleFlight())
+
+        assert client.generate("Same").content == "Same #1"
+        assert client.generate("Same").content == "Same #2"
+
+    def test_error_shared_with_followers(self) -> None:
+        """Test that every waiter sees the upstream error."""
+        upstream = GatedClient(fail=True)
+        client = CoalescingLLMClient(upstream, group=SingleFlight())
+
+        results = _run_threads(client, ["Same"] * 3)
+
+        assert upstream.calls == 1
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    def test_async_calls_coalesced(self) -> None:
+        """Test that gathered coroutines share one upstream call."""
+        upstream = GatedClient()
+        client = CoalescingLLMClient(upstream, group=SingleFlight())
+
+        async def run() -> list[LLMResponse]:
+            return await asyncio.gather(*(client.agenerate("Same") for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        assert upstream.calls == 1
+        assert [r.content for r in results] == ["Same #1"] * 5
+
+    def test_delegates_attributes(self) -> None:
+        """Test that unknown attributes come from the wrapped client."""
+        client = CoalescingLLMClient(GatedClient(), group=SingleFlight())
+
+        assert client.model == "test-model"
+        assert client.is_available()
+
+
+def test_report_through_cache(tmp_path) -> None:
+    """Test the summary line for a coalescing client behind the response cache."""
+    upstream = GatedClient()
+    coalescing = CoalescingLLMClient(upstream, group=SingleFlight())
+    cached = CachingLLMClient(coalescing, LLMResponseCache(tmp_path / "c.sqlite"), "test")
+
+    assert coalescing_report(cached) is None
+    _run_threads(coalescing, ["Same"] * 2)
+
+    assert coalescing_report(cached) == (
+        "LLM coalescing: 1/2 calls shared an identical in-flight request"
+    )
+    assert coalescing_report(upstream) is None
+
+
+def test_factory_wraps_when_coalescing(monkeypatch) -> None:
+    """Test that create_llm_from_config(coalesce=True) adds the wrapper."""
+    monkeypatch.delenv("BLOGINATOR_LLM_MOCK", raising=False)
+    with patch("bloginator.generation.llm_factory.config") as mock_config:
+        mock_config.LLM_PROVIDER = "ollama"
+        mock_config.LLM_MODEL = "llama3"
+        mock_config.LLM_BASE_URL = "http://localhost:11434"
+
+        client = create_llm_from_config(coalesce=True)
+
+    assert isinstance(client, CoalescingLLMClient)
+    assert isinstance(client.client, OllamaClient)
+    assert client.provider == "ollama"
+
+
+def test_factory_leaves_mock_unwrapped(monkeypatch) -> None:
+    """Test that the mock client is never wrapped."""
+    monkeypatch.setenv("BLOGINATOR_LLM_MOCK", "true")
+
+    client = create_llm_from_config(coalesce=True)
+
+    assert not isinstance(client, CoalescingLLMClient)
@@ -1,10 +1,11 @@
 """Tests for CustomLLMClient."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
 
+from bloginator.generation.llm_base import StreamUsage
 from bloginator.generation.llm_custom import CustomLLMClient
 
 
@@ -50,7 +51,7 @@ class TestCustomLLMClient:
         assert client.headers["X-Custom"] == "value"
         assert "Content-Type" in client.headers
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_success(self, mock_post):
         """Test successful generation."""
         mock_response = Mock()
@@ -71,7 +72,7 @@ class TestCustomLLMClient:
         assert response.total_tokens == 30
         assert response.finish_reason == "stop"
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_with_system_prompt(self, mock_post):
         """Test generation with system prompt."""
         mock_response = Mock()
@@ -93,7 +94,7 @@ class TestCustomLLMClient:
         assert messages[1]["role"] == "user"
         assert messages[1]["content"] == "User prompt"
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_connection_error(self, mock_post):
         """Test handling of connection errors."""
         mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -103,7 +104,7 @@ class TestCustomLLMClient:
         with pytest.raises(ConnectionError, match="Unable to connect to custom LLM"):
             client.generate(prompt="Test")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_timeout(self, mock_post):
         """Test handling of timeout errors."""
         mock_post.side_effect = requests.exceptions.Timeout("Timeout")
@@ -113,7 +114,7 @@ class TestCustomLLMClient:
         with pytest.raises(ConnectionError, match="timed out after 30s"):
             client.generate(prompt="Test")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_http_error(self, mock_post):
         """Test handling of HTTP errors."""
         mock_response = Mock()
@@ -125,7 +126,7 @@ class TestCustomLLMClient:
         with pytest.raises(ValueError, match="Custom LLM generation failed"):
             client.generate(prompt="Test")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_invalid_response(self, mock_post):
         """Test handling of invalid JSON response."""
         mock_response = Mock()
@@ -138,7 +139,46 @@ class TestCustomLLMClient:
         with pytest.raises(ValueError, match="Invalid response from custom LLM"):
             client.generate(prompt="Test")
 
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    def test_stream_parses_server_sent_events(self, mock_post):
+        """Test that streamed chat completion deltas are yielded until [DONE]."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_lines.return_value = [
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b"",
+            b'data: {"choices": [{"delta": {"content": "Hi"}}]}',
+            b": keep-alive",
+            b'data: {"choices": [{"delta": {"content": " there"}}]}',
+            b"data: [DONE]",
+            b'data: {"choices": [{"delta": {"content": "ignored"}}]}',
+        ]
+        mock_post.return_value = mock_response
+
+        client = CustomLLMClient(model="gpt-4", api_key="key")
+        deltas = list(client.stream(prompt="Test"))
+
+        assert deltas == ["Hi", " there"]
+        assert mock_post.call_args.kwargs["json"]["stream"] is True
+        assert mock_post.call_args.kwargs["headers"]["Authorization"] == "Bearer key"
+
+    @patch("requests.Session.post")
+    def test_stream_records_usage_chunk(self, mock_post):
+        """Test that a final usage chunk fills in the stream's token counts."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_lines.return_value = [
+            b'data: {"choices": [{"delta": {"content": "Hi"}}]}',
+            b'data: {"choices": [], "usage": {"prompt_tokens": 9, "completion_tokens": 2}}',
+            b"data: [DONE]",
+        ]
+        mock_post.return_value = mock_response
+        usage = StreamUsage()
+
+        assert list(CustomLLMClient(model="gpt-4").stream("Test", usage=usage)) == ["Hi"]
+        assert (usage.prompt_tokens, usage.completion_tokens) == (9, 2)
+
+    @patch("requests.Session.get")
     def test_is_available_success(self, mock_get):
         """Test is_available when endpoint is reachable."""
         mock_response = Mock()
@@ -148,7 +188,7 @@ class TestCustomLLMClient:
         client = CustomLLMClient(model="gpt-4")
         assert client.is_available() is True
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_is_available_failure(self, mock_get):
         """Test is_available when endpoint is not reachable."""
         mock_get.side_effect = requests.exceptions.ConnectionError()
@@ -4,7 +4,12 @@ from unittest.mock import patch
 
 import pytest
 
-from bloginator.generation.llm_client import CustomLLMClient, MockLLMClient, OllamaClient
+from bloginator.generation.llm_client import (
+    CachingLLMClient,
+    CustomLLMClient,
+    MockLLMClient,
+    OllamaClient,
+)
 from bloginator.generation.llm_factory import create_llm_from_config, get_default_generation_params
 
 
@@ -32,6 +37,8 @@ class TestCreateLLMFromConfig:
             assert client.model == "llama3"
             assert client.base_url == "http://localhost:11434"
             assert client.verbose is False
+            # The budgeted window is always sent as num_ctx
+            assert client.num_ctx == 8192
 
     def test_create_ollama_client_with_verbose(self, monkeypatch):
         """Test creating Ollama client with verbose mode."""
@@ -155,6 +162,25 @@ class TestCreateLLMFromConfig:
             client = create_llm_from_config()
             assert isinstance(client, OllamaClient)
 
+    def test_use_cache_wraps_client(self, monkeypatch, tmp_path):
+        """Test that use_cache returns a caching wrapper around the provider client."""
+        monkeypatch.delenv("BLOGINATOR_LLM_MOCK", raising=False)
+        with patch("bloginator.generation.llm_factory.config") as mock_config:
+            mock_config.LLM_PROVIDER = "ollama"
+            mock_config.LLM_MODEL = "llama3"
+            mock_config.LLM_BASE_URL = "http://localhost:11434"
+            mock_config.LLM_CACHE_TTL = 60
+            mock_config.LLM_CACHE_MAX_ENTRIES = 100
+            mock_config.LLM_CACHE_SAMPLED = False
+            mock_config.llm_cache_dir = tmp_path / "llm_cache"
+
+            client = create_llm_from_config(use_cache=True)
+
+            assert isinstance(client, CachingLLMClient)
+            assert isinstance(client.client, OllamaClient)
+            assert client.provider == "ollama"
+            assert (tmp_path / "llm_cache" / "responses.sqlite").exists()
+
 
 class TestGetDefaultGenerationParams:
     """Tests for get_default_generation_params function."""
@@ -0,0 +1,263 @@
+"""Tests for the mock LLM's simulated latency, errors and capacity."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from bloginator.generation._llm_mock_latency import (
+    LATENCY_ENV_VAR,
+    LatencyProfile,
+    LatencySimulator,
+    paced_chunks,
+    simulator_from_env,
+)
+from bloginator.generation._llm_scheduler import LLMScheduler, ProviderLimits
+from bloginator.generation.llm_mock import MockLLMClient
+
+
+class SleepRecorder:
+    """Records requested sleeps instead of waiting."""
+
+    def __init__(self):
+        self.calls: list[float] = []
+
+    def __call__(self, seconds: float) -> None:
+        self.calls.append(seconds)
+
+
+def _client(profile: LatencyProfile, sleep=None) -> MockLLMClient:
+    """Mock client with a fast, private scheduler."""
+    client = MockLLMClient(latency=LatencySimulator(profile, sleep=sleep or SleepRecorder()))
+    client.scheduler = LLMScheduler("test", ProviderLimits(), base_delay=0.001, max_delay=0.01)
+    return client
+
+
+class TestLatencyProfile:
+    """Tests for parsing and validating profiles."""
+
+    def test_from_spec(self):
+        """Test that a spec sets the distribution and typed fields."""
+        profile = LatencyProfile.from_spec(
+            "longtail:mean=0.8, sigma=1.5,capacity=2,reject_over_capacity=true,seed=7"
+        )
+
+        assert profile.distribution == "longtail"
+        assert (profile.mean, profile.sigma) == (0.8, 1.5)
+        assert (profile.capacity, profile.seed) == (2, 7)
+        assert profile.reject_over_capacity is True
+
+    def test_from_spec_distribution_only(self):
+        """Test that every option is optional."""
+        assert LatencyProfile.from_spec("normal") == LatencyProfile(distribution="normal")
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            "uniform:mean=1",
+            "fixed:speed=3",
+            "fixed:mean",
+            "fixed:mean=fast",
+            "fixed:mean=-1",
+            "fixed:throttle_rate=0.7,timeout_rate=0.5",
+            "fixed:capacity=-1",
+        ],
+    )
+    def test_invalid_specs(self, spec):
+        """Test that bad specs are rejected with ValueError."""
+        with pytest.raises(ValueError):
+            LatencyProfile.from_spec(spec)
+
+    def test_from_env(self, monkeypatch):
+        """Test that the environment variable selects the profile."""
+        monkeypatch.delenv(LATENCY_ENV_VAR, raising=False)
+        assert LatencyProfile.from_env() is None
+
+        monkeypatch.setenv(LATENCY_ENV_VAR, "fixed:mean=0.25")
+
+        assert LatencyProfile.from_env() == LatencyProfile(mean=0.25)
+
+    def test_env_simulator_is_shared(self, monkeypatch):
+        """Test that clients configured from the environment share one simulator."""
+        monkeypatch.setenv(LATENCY_ENV_VAR, "fixed:mean=0.125,capacity=3")
+
+        first, second = MockLLMClient(), MockLLMClient()
+
+        assert first.simulator is second.simulator is simulator_from_env()
+        assert first.scheduler is not None
+
+
+class TestLatencySimulator:
+    """Tests for delays, injected failures and capacity."""
+
+    @pytest.mark.parametrize("distribution", ["normal", "longtail"])
+    def test_seeded_delays_repeat(self, distribution):
+        """Test that a seed makes the delays repeatable and non-negative."""
+        profile = LatencyProfile(distribution=distribution, mean=0.5, stddev=0.5, seed=3)
+
+        runs = [
+            [simulator.first_token_delay() for _ in range(20)]
+            for simulator in (LatencySimulator(profile), LatencySimulator(profile))
+        ]
+
+        assert runs[0] == runs[1]
+        assert min(runs[0]) >= 0
+        assert len(set(runs[0])) > 1
+
+    def test_fixed_delay_and_token_rate(self):
+        """Test the fixed distribution and token pacing."""
+        simulator = LatencySimulator(LatencyProfile(mean=0.3, tokens_per_second=50))
+
+        assert simulator.first_token_delay() == 0.3
+        assert simulator.token_delay(100) == 2.0
+        assert LatencySimulator(LatencyProfile()).token_delay(100) == 0.0
+
+    def test_request_waits_for_first_token(self):
+        """Test that a request sleeps the first-token delay and is counted."""
+        sleep = SleepRecorder()
+        simulator = LatencySimulator(LatencyProfile(mean=0.4), sleep=sleep)
+
+        with simulator.request():
+            pass
+
+        assert sleep.calls == [0.4]
+        assert simulator.stats.requests == 1
+
+    def test_injected_throttle(self):
+        """Test that throttled requests raise a 429 with Retry-After."""
+        simulator = LatencySimulator(LatencyProfile(throttle_rate=1.0, retry_after=2.5))
+
+        with pytest.raises(requests.HTTPError) as excinfo, simulator.request():
+            pass
+
+        response = excinfo.value.response
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2.5"
+        assert simulator.stats.throttled == 1
+
+    def test_injected_timeout(self):
+        """Test that timed-out requests hang for the timeout, then fail."""
+        sleep = SleepRecorder()
+        simulator = LatencySimulator(LatencyProfile(timeout_rate=1.0, timeout=5.0), sleep=sleep)
+
+        with pytest.raises(requests.exceptions.Timeout), simulator.request():
+            pass
+
+        assert sleep.calls == [5.0]
+        assert simulator.stats.timeouts == 1
+
+    def test_capacity_limits_in_flight(self):
+        """Test that requests beyond capacity queue until a slot frees."""
+        simulator = LatencySimulator(LatencyProfile(mean=0.02, capacity=2))
+
+        def serve(_: int) -> None:
+            with simulator.request():
+                time.sleep(0.01)
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(serve, range(12)))
+
+        assert simulator.stats.requests == 12
+        assert simulator.stats.peak_in_flight == 2
+        assert simulator.stats.throttled == 0
+
+    def test_reject_over_capacity(self):
+        """Test that a full server can answer 429 instead of queueing."""
+        simulator = LatencySimulator(LatencyProfile(capacity=1, reject_over_capacity=True))
+        inside, release = threading.Event(), threading.Event()
+
+        def hold() -> None:
+            with simulator.request():
+                inside.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        inside.wait(5)
+        try:
+            with pytest.raises(requests.HTTPError) as excinfo, simulator.request():
+                pass
+        finally:
+            release.set()
+            holder.join()
+
+        assert excinfo.value.response.status_code == 429
+        assert simulator.stats.throttled == 1
+
+    def test_paced_chunks_rejoin(self):
+        """Test that word chunks rebuild the text and count tokens."""
+        content = "# Title\n\nSome  words here."
+
+        chunks = list(paced_chunks(content))
+
+        assert "".join(text for text, _ in chunks) == content
+        assert [text for text, _ in chunks][:2] == ["#", " Title"]
+        assert all(tokens >= 1 for _, tokens in chunks)
+        assert list(paced_chunks("")) == []
+
+
+class TestMockClientSimulation:
+    """Tests for MockLLMClient with a latency profile."""
+
+    def test_instant_without_profile(self, monkeypatch):
+        """Test that the default client stays instant and unscheduled."""
+        monkeypatch.delenv(LATENCY_ENV_VAR, raising=False)
+        client = MockLLMClient()
+
+        assert client.simulator is None
+        assert client.scheduler is None
+        assert client.generate("Hello").content
+        assert len(list(client.stream("Hello"))) == 1
+
+    def test_generate_paces_completion(self):
+        """Test that generate waits for first token plus output time."""
+        sleep = SleepRecorder()
+        client = _client(LatencyProfile(mean=0.5, tokens_per_second=10), sleep=sleep)
+
+        response = client.generate("Hello")
+
+        assert sleep.calls == [0.5, response.completion_tokens / 10]
+
+    def test_throttle_is_retried_by_scheduler(self):
+        """Test that injected 429s are retried like real ones."""
+        client = _client(LatencyProfile(throttle_rate=0.5, retry_after=0.001, seed=1))
+
+        responses = [client.generate(f"Prompt {i}") for i in range(10)]
+
+        metrics = client.scheduler.metrics()
+        assert all(r.content for r in responses)
+        assert client.simulator.stats.throttled > 0
+        assert metrics.throttled == client.simulator.stats.throttled
+        assert metrics.failures == 0
+
+    def test_persistent_throttle_raises_value_error(self):
+        """Test that a request throttled on every attempt fails cleanly."""
+        client = _client(LatencyProfile(throttle_rate=1.0, retry_after=0.001))
+
+        with pytest.raises(ValueError, match="Mock generation failed"):
+            client.generate("Hello")
+
+        assert client.simulator.stats.requests == client.scheduler.max_retries + 1
+
+    def test_timeout_raises_connection_error(self):
+        """Test that simulated timeouts surface as ConnectionError."""
+        client = _client(LatencyProfile(timeout_rate=1.0))
+
+        with pytest.raises(ConnectionError, match="timed out"):
+            client.generate("Hello")
+        with pytest.raises(ConnectionError):
+            list(client.stream("Hello"))
+
+    def test_stream_paces_words(self):
+        """Test that streaming yields words at the token rate."""
+        sleep = SleepRecorder()
+        client = _client(LatencyProfile(mean=0.2, tokens_per_second=100), sleep=sleep)
+
+        chunks = list(client.stream("Hello"))
+
+        assert "".join(chunks) == client.generate("Hello").content
+        assert len(chunks) > 1
+        assert sleep.calls[0] == 0.2
+        assert all(delay > 0 for delay in sleep.calls[1 : len(chunks) + 1])
@@ -0,0 +1,333 @@
+"""Tests for LLM request scheduling: rate limits, AIMD concurrency and retries."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from bloginator.generation._llm_mock_latency import LatencyProfile, LatencySimulator
+from bloginator.generation._llm_scheduler import (
+    AIMDWindow,
+    LLMScheduler,
+    ProviderLimits,
+    TokenBucket,
+    get_scheduler,
+    retry_after_seconds,
+)
+from bloginator.generation.draft_generator import DraftGenerator
+from bloginator.generation.llm_custom import CustomLLMClient
+from bloginator.generation.llm_mock import MockLLMClient
+from bloginator.models.outline import Outline, OutlineSection
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _http_error(status: int, headers: dict[str, str] | None = None) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+def _scheduler(**kwargs) -> LLMScheduler:
+    limits = kwargs.pop("limits", ProviderLimits(max_concurrency=4))
+    return LLMScheduler("test", limits, base_delay=0.001, max_delay=0.01, **kwargs)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_waits_once_empty(self) -> None:
+        """Test that requests beyond capacity wait for the refill."""
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock=clock)  # one per second
+
+        assert bucket.reserve(60) == 0.0
+        assert bucket.reserve(1) == pytest.approx(1.0)
+        assert bucket.reserve(1) == pytest.approx(2.0)
+
+        clock.now = 10.0
+        assert bucket.reserve(1) == 0.0
+
+    def test_adjust_returns_unused_capacity(self) -> None:
+        """Test that over-estimated reservations are refunded."""
+        bucket = TokenBucket(100, clock=FakeClock())
+        bucket.reserve(100)
+
+        bucket.adjust(-50)
+
+        assert bucket.reserve(50) == 0.0
+
+    def test_unlimited(self) -> None:
+        """Test that a zero rate never waits."""
+        assert TokenBucket(0).reserve(1_000_000) == 0.0
+
+
+class TestAIMDWindow:
+    """Tests for AIMDWindow."""
+
+    def test_additive_increase(self) -> None:
+        """Test that about a window's worth of successes grows it by one."""
+        window = AIMDWindow(max_limit=3, initial=2)
+
+        for _ in range(3):
+            window.on_success()
+        assert window.size == 3
+
+        for _ in range(10):
+            window.on_success()
+        assert window.size == 3  # Capped
+
+    def test_multiplicative_decrease_once_per_burst(self) -> None:
+        """Test that failures from requests already in flight halve once."""
+        clock = FakeClock()
+        window = AIMDWindow(max_limit=8, initial=8, clock=clock)
+
+        clock.now = 1.0
+        window.on_overload(started=0.5)
+        window.on_overload(started=0.6)
+        assert window.size == 4
+
+        window.on_overload(started=2.0)
+        assert window.size == 2
+
+
+def test_retry_after_header_formats() -> None:
+    """Test Retry-After in seconds and milliseconds."""
+    assert retry_after_seconds(_http_error(429, {"Retry-After": "7"})) == 7.0
+    assert retry_after_seconds(_http_error(429, {"retry-after-ms": "250"})) == 0.25
+    assert retry_after_seconds(_http_error(429)) is None
+    assert retry_after_seconds(ValueError("no response")) is None
+
+
+class TestRetries:
+    """Tests for retrying failed requests."""
+
+    def test_retries_throttled_request_after_retry_after(self) -> None:
+        """Test that a 429 is retried no sooner than Retry-After."""
+        scheduler = _scheduler()
+        send = Mock(side_effect=[_http_error(429, {"Retry-After": "0.05"}), "ok"])
+
+        started = time.monotonic()
+        assert scheduler.call(send) == "ok"
+
+        assert time.monotonic() - started >= 0.05
+        metrics = scheduler.metrics()
+        assert (metrics.requests, metrics.retries, metrics.throttled) == (1, 1, 1)
+
+    def test_gives_up_after_max_retries(self) -> None:
+        """Test that persistent server errors are raised after the last retry."""
+        scheduler = _scheduler(max_retries=2)
+        send = Mock(side_effect=_http_error(503))
+
+        with pytest.raises(requests.HTTPError):
+            scheduler.call(send)
+
+        assert send.call_count == 3
+        assert scheduler.metrics().failures == 1
+
+    def test_client_errors_not_retried(self) -> None:
+        """Test that a 4xx other than 408/429 fails immediately."""
+        scheduler = _scheduler()
+        send = Mock(side_effect=_http_error(400))
+
+        with pytest.raises(requests.HTTPError):
+            scheduler.call(send)
+
+        assert send.call_count == 1
+
+    def test_throttling_shrinks_window(self) -> None:
+        """Test that a 429 halves the concurrency window."""
+        scheduler = _scheduler(limits=ProviderLimits(max_concurrency=8))
+        assert scheduler.window.size == 4
+
+        scheduler.call(Mock(side_effect=[_http_error(429), "ok"]))
+
+        assert scheduler.window.size == 2
+
+
+class TestConcurrency:
+    """Tests for the concurrency window."""
+
+    def test_threads_limited_to_window(self) -> None:
+        """Test that callers beyond the window queue until a slot frees."""
+        scheduler = _scheduler()
+        scheduler.window.limit = 2
+        scheduler.window.max_limit = 2
+        release = threading.Event()
+        active = []
+        peak = []
+
+        def send() -> str:
+            active.append(1)
+            peak.append(len(active))
+            release.wait(timeout=5)
+            active.pop()
+            return "ok"
+
+        threads = [threading.Thread(target=scheduler.call, args=(send,)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while scheduler.metrics().queue_depth < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        metrics = scheduler.metrics()
+        assert (metrics.in_flight, metrics.queue_depth) == (2, 3)
+
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert max(peak) == 2
+        assert scheduler.metrics().requests == 5
+
+    def test_async_calls_limited_to_window(self) -> None:
+        """Test that coroutines share the same window."""
+        scheduler = _scheduler()
+        scheduler.window.limit = 2
+        scheduler.window.max_limit = 2
+        active = 0
+        peak = 0
+
+        async def send() -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "ok"
+
+        async def run() -> list[str]:
+            return await asyncio.gather(*(scheduler.acall(send) for _ in range(6)))
+
+        assert asyncio.run(run()) == ["ok"] * 6
+        assert peak == 2
+
+
+class TestStreaming:
+    """Tests for scheduled streams."""
+
+    def test_retries_before_first_chunk(self) -> None:
+        """Test that a stream failing before any text is retried."""
+        scheduler = _scheduler()
+        attempts = []
+
+        def open_stream():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise _http_error(429, {"Retry-After": "0"})
+            yield from ["a", "b"]
+
+        assert list(scheduler.stream(open_stream)) == ["a", "b"]
+        metrics = scheduler.metrics()
+        assert (metrics.retries, metrics.throttled, metrics.in_flight) == (1, 1, 0)
+
+    def test_no_retry_after_first_chunk(self) -> None:
+        """Test that a stream failing mid-response is not replayed."""
+        scheduler = _scheduler()
+        attempts = []
+
+        def open_stream():
+            attempts.append(1)
+            yield "a"
+            raise _http_error(503)
+
+        received = []
+        with pytest.raises(requests.HTTPError):
+            for chunk in scheduler.stream(open_stream):
+                received.append(chunk)
+
+        assert received == ["a"]
+        assert len(attempts) == 1
+        assert scheduler.metrics().in_flight == 0
+
+    def test_slot_held_until_stream_closed(self) -> None:
+        """Test that an open stream occupies a concurrency slot."""
+        scheduler = _scheduler()
+
+        chunks = scheduler.stream(lambda: iter(["a", "b"]))
+        assert next(chunks) == "a"
+        assert scheduler.metrics().in_flight == 1
+
+        chunks.close()
+        assert scheduler.metrics().in_flight == 0
+
+    def test_async_stream_retries(self) -> None:
+        """Test that async streams are retried before their first chunk."""
+        scheduler = _scheduler()
+        attempts = []
+
+        async def open_stream():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise _http_error(502)
+            yield "a"
+
+        async def run() -> list[str]:
+            return [chunk async for chunk in scheduler.astream(open_stream)]
+
+        assert asyncio.run(run()) == ["a"]
+        assert len(attempts) == 2
+
+    def test_streamed_draft_honours_limiter(self) -> None:
+        """Test that a streaming, concurrent draft stays within the window."""
+        simulator = LatencySimulator(LatencyProfile(mean=0.02, tokens_per_second=2000))
+        client = MockLLMClient(latency=simulator)
+        client.scheduler = _scheduler()
+        client.scheduler.window.limit = 2
+        client.scheduler.window.max_limit = 2
+        searcher = Mock()
+        searcher.batch_search.return_value = []
+        searcher.search.return_value = []
+        outline = Outline(
+            title="Streaming",
+            keywords=["test"],
+            sections=[OutlineSection(title=f"Section {i}", description="Desc") for i in range(6)],
+        )
+        generator = DraftGenerator(llm_client=client, searcher=searcher, max_concurrency=4)
+
+        draft = generator.generate(outline, token_callback=lambda title, delta: None)
+
+        assert all(section.content for section in draft.sections)
+        assert client.scheduler.metrics().requests == 6
+        assert simulator.stats.peak_in_flight == 2
+
+
+def test_rate_limit_delays_requests() -> None:
+    """Test that a requests-per-minute limit spaces out calls."""
+    scheduler = _scheduler(limits=ProviderLimits(requests_per_minute=1200))  # one per 50ms
+    scheduler._request_bucket.reserve(1200)
+
+    started = time.monotonic()
+    scheduler.call(lambda: "ok")
+
+    assert time.monotonic() - started >= 0.04
+
+
+def test_client_retries_server_error() -> None:
+    """Test that an HTTP client retries a 503 through its shared scheduler."""
+    client = CustomLLMClient(model="m", base_url="http://scheduler-test:1234/v1")
+    assert client.scheduler is get_scheduler("custom", "http://scheduler-test:1234/v2")
+    ok = Mock()
+    ok.json.return_value = {"choices": [{"message": {"content": "Done"}}]}
+    failed = Mock()
+    failed.raise_for_status.side_effect = _http_error(503, {"Retry-After": "0"})
+
+    with patch("requests.Session.post", side_effect=[failed, ok]) as post, patch(
+        "bloginator.generation._llm_scheduler_base.random.uniform", return_value=0.0
+    ):
+        response = client.generate("Prompt")
+
+    assert response.content == "Done"
+    assert post.call_count == 2
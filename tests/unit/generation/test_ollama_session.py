@@ -0,0 +1,198 @@
+"""Tests for Ollama session management: keep-alive, preloading and timings."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import requests
+
+from bloginator.generation._llm_coalesce import CoalescingLLMClient
+from bloginator.generation._ollama_session import (
+    OllamaSession,
+    OllamaTimings,
+    find_ollama_client,
+    ollama_report,
+    start_ollama_session,
+)
+from bloginator.generation.llm_base import StreamUsage
+from bloginator.generation.llm_factory import _ollama_keep_alive
+from bloginator.generation.llm_mock import MockLLMClient
+from bloginator.generation.llm_ollama import OllamaClient
+
+
+# Timing fields of a warm request, in nanoseconds
+WARM_REPLY = {
+    "message": {"role": "assistant", "content": "Text"},
+    "done": True,
+    "load_duration": 20_000_000,
+    "prompt_eval_count": 100,
+    "prompt_eval_duration": 500_000_000,
+    "eval_count": 50,
+    "eval_duration": 2_000_000_000,
+}
+
+
+def _reply(data: dict) -> Mock:
+    response = Mock()
+    response.json.return_value = data
+    return response
+
+
+class TestRequests:
+    """Tests for keep-alive and context size on every request."""
+
+    @patch("requests.Session.post")
+    def test_keep_alive_and_num_ctx_sent(self, mock_post):
+        """Test that configured residency settings go out with each request."""
+        mock_post.return_value = _reply(WARM_REPLY)
+        client = OllamaClient(keep_alive="30m", num_ctx=8192)
+
+        client.generate("Prompt", system_prompt="System")
+
+        payload = mock_post.call_args.kwargs["json"]
+        assert mock_post.call_args.args[0].endswith("/api/chat")
+        assert payload["keep_alive"] == "30m"
+        assert payload["options"]["num_ctx"] == 8192
+        assert payload["messages"][0] == {"role": "system", "content": "System"}
+
+    @patch("requests.Session.post")
+    def test_server_defaults_without_settings(self, mock_post):
+        """Test that no keep-alive or num_ctx is sent unless configured."""
+        mock_post.return_value = _reply(WARM_REPLY)
+
+        OllamaClient().generate("Prompt")
+
+        payload = mock_post.call_args.kwargs["json"]
+        assert "keep_alive" not in payload
+        assert "num_ctx" not in payload["options"]
+
+    @patch("requests.Session.post")
+    def test_timings_recorded(self, mock_post):
+        """Test that load and evaluation durations are summed per client."""
+        cold = {**WARM_REPLY, "load_duration": 4_000_000_000}
+        mock_post.side_effect = [_reply(cold), _reply(WARM_REPLY)]
+        client = OllamaClient()
+
+        client.generate("One")
+        client.generate("Two")
+
+        timings = client.timings
+        assert (timings.requests, timings.cold_loads) == (2, 1)
+        assert timings.load_seconds == pytest.approx(4.02)
+        assert timings.eval_seconds == pytest.approx(4.0)
+        assert timings.prompt_tokens == 200
+        assert timings.tokens_per_second == pytest.approx(25.0)
+        assert "model load 4.0s (1 cold)" in timings.summary()
+
+    @patch("requests.Session.post")
+    def test_stream_records_final_chunk_timings(self, mock_post):
+        """Test that the final stream chunk's timings are recorded once."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = [
+            b'{"message": {"content": "Hi"}, "done": false}',
+            b'{"message": {"content": ""}, "done": true, "eval_count": 7}',
+        ]
+        mock_post.return_value = response
+        client = OllamaClient()
+
+        assert list(client.stream("Prompt")) == ["Hi"]
+        assert (client.timings.requests, client.timings.eval_tokens) == (1, 7)
+
+    @patch("requests.Session.post")
+    def test_stream_records_token_counts(self, mock_post):
+        """Test that the final stream chunk's token counts and reason fill the usage."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = [
+            b'{"message": {"content": "Hi"}, "done": false}',
+            b'{"message": {"content": ""}, "done": true, "done_reason": "length", '
+            b'"prompt_eval_count": 12, "eval_count": 7}',
+        ]
+        mock_post.return_value = response
+        usage = StreamUsage()
+
+        assert list(OllamaClient().stream("Prompt", usage=usage)) == ["Hi"]
+        assert (usage.prompt_tokens, usage.completion_tokens) == (12, 7)
+        assert usage.finish_reason == "length"
+
+
+class TestSession:
+    """Tests for preloading, warming and unloading."""
+
+    @patch("requests.Session.post")
+    def test_start_preloads_then_warms(self, mock_post):
+        """Test that start() loads the model with the run's settings, then warms it."""
+        mock_post.side_effect = [
+            _reply({"message": {"content": ""}, "done": True, "done_reason": "load"}),
+            _reply(WARM_REPLY),
+        ]
+        client = OllamaClient(keep_alive=-1, num_ctx=4096)
+
+        assert OllamaSession(client).start()
+
+        preload, warm = (call.kwargs["json"] for call in mock_post.call_args_list)
+        assert preload["messages"] == []
+        assert (preload["keep_alive"], preload["options"]["num_ctx"]) == (-1, 4096)
+        assert warm["options"]["num_predict"] == 1
+        # The warm-up is a generation; the preload only adds load time
+        assert client.timings.requests == 1
+
+    @patch("requests.Session.post")
+    def test_start_failure_is_not_fatal(self, mock_post):
+        """Test that an unreachable server only logs a warning."""
+        mock_post.side_effect = requests.exceptions.ConnectionError("refused")
+        session = OllamaSession(OllamaClient())
+
+        assert session.start() is False
+        assert session.started is False
+
+    @patch("requests.Session.post")
+    def test_unload_on_close(self, mock_post):
+        """Test that close() can release the model immediately."""
+        mock_post.return_value = _reply({"done": True})
+        client = OllamaClient()
+
+        with OllamaSession(client, warmup=False, unload_on_close=True):
+            pass
+
+        assert mock_post.call_args.kwargs["json"]["keep_alive"] == 0
+
+
+class TestHelpers:
+    """Tests for finding the Ollama client and reporting."""
+
+    def test_find_through_wrappers(self):
+        """Test that cache and coalescing wrappers are looked through."""
+        client = OllamaClient()
+
+        assert find_ollama_client(CoalescingLLMClient(client)) is client
+        assert find_ollama_client(MockLLMClient()) is None
+        assert find_ollama_client(Mock()) is None
+
+    def test_start_skips_other_providers(self):
+        """Test that non-Ollama clients get no session."""
+        assert start_ollama_session(MockLLMClient()) is None
+
+    def test_report_only_after_requests(self):
+        """Test that the report is empty until Ollama answered something."""
+        client = OllamaClient()
+        assert ollama_report(client) is None
+
+        client.timings.record(WARM_REPLY)
+
+        assert ollama_report(client).startswith("Ollama: 1 requests")
+
+    def test_timings_to_dict(self):
+        """Test report serialization."""
+        timings = OllamaTimings()
+        timings.record_load(3.0)
+
+        assert timings.to_dict()["cold_loads"] == 1
+        assert timings.to_dict()["requests"] == 0
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("30m", "30m"), ("300", 300), ("-1", -1), ("", None)]
+    )
+    def test_keep_alive_config(self, value, expected):
+        """Test that numeric keep-alive values are sent as seconds."""
+        assert _ollama_keep_alive(value) == expected
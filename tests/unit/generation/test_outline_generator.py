@@ -26,6 +26,10 @@ class TestOutlineGenerator:
         searcher = Mock()
         # Default: return empty search results
         searcher.search.return_value = []
+        # Batch search answers each query the way search would
+        searcher.batch_search.side_effect = lambda queries, n_results=10: [
+            searcher.search(query=query, n_results=n_results) for query in queries
+        ]
         return searcher
 
     @pytest.fixture
@@ -373,3 +377,32 @@ Understanding test coverage
         assert outline.avg_coverage > 0
         # Test Coverage section should have low coverage
         assert outline.low_coverage_sections > 0
+
+    @pytest.mark.parametrize("num_sections", [2, 6])
+    def test_generate_uses_two_batch_searches(
+        self, generator, mock_llm_client, mock_searcher, num_sections
+    ):
+        """Test that retrieval takes two batch searches regardless of section count."""
+        validation_response = Mock()
+        validation_response.content = "VALID"
+        generation_response = Mock()
+        generation_response.content = "\n".join(
+            f"## Test Part {i}\nAbout testing\n### Test Detail {i}\nMore testing"
+            for i in range(num_sections)
+        )
+        mock_llm_client.generate.side_effect = [validation_response, generation_response]
+        mock_searcher.search.return_value = [
+            SearchResult(
+                chunk_id="chunk1",
+                content="Content about testing",
+                distance=0.2,
+                metadata={"document_id": "doc1"},
+            )
+        ]
+
+        outline = generator.generate(title="Test", keywords=["test"])
+
+        assert mock_searcher.batch_search.call_count == 2
+        coverage_queries = mock_searcher.batch_search.call_args_list[1].args[0]
+        assert len(coverage_queries) == 2 * num_sections
+        assert all(section.coverage_pct > 0 for section in outline.get_all_sections())
@@ -1,10 +1,14 @@
 """Tests for refinement engine."""
 
+import threading
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 from bloginator.generation.refinement_engine import RefinementEngine
+from bloginator.generation.voice_scorer import VoiceScorer
+from bloginator.indexing import VoiceProfile
 from bloginator.models.draft import Draft, DraftSection
 from bloginator.search import SearchResult
 
@@ -203,16 +207,19 @@ INSTRUCTIONS: Make more engaging"""
             ],
         )
 
-        # Mock parsing for global change
-        mock_llm.generate.side_effect = [
-            Mock(
-                content="""ACTION: global
+        # Mock parsing for global change; sections are rewritten concurrently,
+        # so answer each rewrite by the section it names
+        def generate(prompt, **kwargs):
+            if "ACTION:" in prompt:
+                return Mock(
+                    content="""ACTION: global
 SECTIONS: all
 INSTRUCTIONS: Make more optimistic"""
-            ),
-            Mock(content="Refined S1 content"),
-            Mock(content="Refined S2 content"),
-        ]
+                )
+            title = "S1" if "Content 1" in prompt else "S2"
+            return Mock(content=f"Refined {title} content")
+
+        mock_llm.generate.side_effect = generate
 
         refined = engine.refine_draft(
             draft=draft,
@@ -449,3 +456,66 @@ INSTRUCTIONS: Do something"""
         # Should have citations from search results
         assert len(refined.sections[0].citations) > 0
         assert refined.sections[0].citations[0].filename == "source0.md"
+
+    def test_refine_draft_regenerates_sections_concurrently(self, mock_llm, mock_searcher):
+        """Test that targeted sections are rewritten in parallel."""
+        engine = RefinementEngine(llm_client=mock_llm, searcher=mock_searcher, max_concurrency=3)
+        draft = Draft(
+            title="Test",
+            keywords=["test"],
+            sections=[DraftSection(title=f"S{i}", content=f"Content {i}") for i in range(3)],
+        )
+        barrier = threading.Barrier(3, timeout=5)
+
+        def generate(prompt, **kwargs):
+            barrier.wait()  # Breaks unless all three rewrites are in flight
+            return Mock(content="Refined")
+
+        mock_llm.generate.side_effect = generate
+
+        refined = engine.refine_draft(
+            draft=draft,
+            feedback="Improve it",
+            validate_safety=False,
+            score_voice=False,
+            parsed={"action": "global", "target_sections": [], "instructions": "Improve"},
+        )
+
+        assert [s.title for s in refined.sections] == ["S0", "S1", "S2"]
+        assert all(s.content == "Refined" for s in refined.sections)
+        assert mock_llm.generate.call_count == 3  # Feedback not parsed again
+
+    def test_refine_draft_rescores_only_changed_sections(self, engine, mock_llm, mock_searcher):
+        """Test that unchanged sections keep their voice score without re-encoding."""
+        searcher = Mock()
+        searcher.embedding_model.encode.side_effect = lambda texts: np.tile(
+            [1.0, 0.0, 0.0], (len(texts), 1)
+        )
+        profile = VoiceProfile(codebook=np.array([[1.0, 0.0, 0.0]]))
+        engine.voice_scorer = VoiceScorer(searcher=searcher, profile=profile)
+        draft = Draft(
+            title="Test",
+            keywords=["test"],
+            sections=[
+                DraftSection(title="Intro", content="Original intro", voice_score=0.4),
+                DraftSection(title="Body", content="Original body", voice_score=0.6),
+            ],
+        )
+        mock_llm.generate.return_value = Mock(content="New intro")
+
+        refined = engine.refine_draft(
+            draft=draft,
+            feedback="Make intro more engaging",
+            validate_safety=False,
+            parsed={"action": "tone_change", "target_sections": ["Intro"], "instructions": "x"},
+        )
+
+        searcher.embedding_model.encode.assert_called_once_with(["New intro"])
+        assert refined.sections[0].voice_score == pytest.approx(1.0)
+        assert refined.sections[1].voice_score == pytest.approx(0.6)
+        assert refined.voice_score == pytest.approx(0.8)
+
+    def test_invalid_concurrency(self, mock_llm, mock_searcher):
+        """Test that max_concurrency must be positive."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            RefinementEngine(llm_client=mock_llm, searcher=mock_searcher, max_concurrency=0)
@@ -0,0 +1,105 @@
+"""Tests for the shared retrieval plan across outline sections."""
+
+import pytest
+
+from bloginator.generation._retrieval_plan import plan_sources
+from bloginator.search import SearchResult
+
+
+def _result(chunk_id: str, content: str, similarity: float) -> SearchResult:
+    return SearchResult(
+        chunk_id=chunk_id,
+        content=content,
+        metadata={"document_id": chunk_id, "filename": f"{chunk_id}.md"},
+        distance=1.0 - similarity,
+    )
+
+
+def _ids(plan: list[list[SearchResult]]) -> list[list[str]]:
+    return [[result.chunk_id for result in sources] for sources in plan]
+
+
+SHARED = _result("shared", "Deployment pipelines need fast rollback paths", 0.9)
+
+
+class TestPlanSources:
+    """Tests for plan_sources."""
+
+    def test_chunk_used_once_by_default(self):
+        """Test that a chunk retrieved for every section is sent only once."""
+        candidates = [
+            [SHARED, _result("a", "Alerting thresholds tuned to paging load", 0.6)],
+            [SHARED, _result("b", "Incident reviews without blame", 0.5)],
+        ]
+
+        plan = plan_sources(candidates, per_section=2)
+
+        assert _ids(plan) == [["shared", "a"], ["b"]]
+
+    def test_chunk_goes_to_best_fitting_section(self):
+        """Test that assignment is global, not first-section-wins."""
+        shared_for_first = _result("shared", SHARED.content, 0.4)
+        candidates = [
+            [shared_for_first, _result("a", "Alerting thresholds tuned to paging load", 0.35)],
+            [SHARED, _result("b", "Incident reviews without blame", 0.3)],
+        ]
+
+        plan = plan_sources(candidates, per_section=1)
+
+        assert _ids(plan) == [["a"], ["shared"]]
+
+    def test_max_uses_allows_repeats(self):
+        """Test the configurable repeat limit, and 0 for no limit."""
+        candidates = [
+            [SHARED, _result(name, f"Distinct passage {name}", 0.5)] for name in ("a", "b", "c")
+        ]
+
+        assert _ids(plan_sources(candidates, per_section=1, max_uses=2)) == [
+            ["shared"],
+            ["shared"],
+            ["c"],
+        ]
+        assert _ids(plan_sources(candidates, per_section=1, max_uses=0)) == [["shared"]] * 3
+
+    def test_identical_text_counts_as_one_chunk(self):
+        """Test that the same passage under two IDs is not sent twice."""
+        copy = _result("copy", SHARED.content, 0.85)
+        other = _result("b", "Incident reviews without blame", 0.5)
+
+        plan = plan_sources([[SHARED], [copy, other]], per_section=1)
+
+        assert _ids(plan) == [["shared"], ["b"]]
+
+    def test_section_keeps_best_candidate_when_all_used(self):
+        """Test that the repeat limit never leaves a section with no sources."""
+        copy = _result("copy", SHARED.content, 0.85)
+
+        plan = plan_sources([[SHARED], [copy], [SHARED], []], per_section=2)
+
+        assert _ids(plan) == [["shared"], ["copy"], ["shared"], []]
+
+    def test_redundant_chunks_are_penalized(self):
+        """Test that near-duplicates within a section give way to new material."""
+        near_duplicate = _result("near", SHARED.content + " today", 0.88)
+        different = _result("other", "Capacity planning from queue depth", 0.7)
+
+        plan = plan_sources([[SHARED, near_duplicate, different]], per_section=2)
+
+        assert _ids(plan) == [["shared", "other"]]
+
+    def test_sources_ordered_by_relevance(self):
+        """Test that each section's sources come back best first."""
+        candidates = [[_result(str(i), f"Distinct passage number {i}", 0.1 * i) for i in range(5)]]
+
+        plan = plan_sources(candidates, per_section=3, relevance_weight=1.0)
+
+        assert _ids(plan) == [["4", "3", "2"]]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"per_section": -1}, {"max_uses": -1}, {"relevance_weight": 1.5}],
+    )
+    def test_invalid_arguments(self, kwargs):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            plan_sources([[SHARED]], **{"per_section": 1, **kwargs})
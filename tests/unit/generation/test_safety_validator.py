@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -217,6 +218,77 @@ class TestSafetyValidator:
         # Overall draft should have violation
         assert draft.has_blocklist_violations is True
 
+    def test_validate_draft_reuses_unchanged_sections(self, blocklist_file):
+        """Test that only changed sections are checked against the blocklist again."""
+        validator = SafetyValidator(blocklist_file=blocklist_file, auto_reject=False)
+        validator.add_to_blocklist("BadTerm")
+        draft = Draft(
+            title="Document",
+            keywords=["test"],
+            sections=[
+                DraftSection(title="S1", content="This has BadTerm in it."),
+                DraftSection(title="S2", content="Clean text."),
+            ],
+        )
+        validator.validate_draft(draft)
+
+        checker = validator.blocklist_manager
+        with patch.object(checker, "validate_text", wraps=checker.validate_text) as validate_text:
+            draft.sections[1] = DraftSection(title="S2", content="Also BadTerm.")
+            validator.validate_draft(draft)
+
+        validate_text.assert_called_once_with("Also BadTerm.")
+        assert [v["section_title"] for v in draft.blocklist_validation_result["violations"]] == [
+            "S1",
+            "S2",
+        ]
+        assert all(s.has_blocklist_violations for s in draft.sections)
+
+    def test_result_stored_on_draft_is_not_trusted(self, blocklist_file):
+        """Test that a draft validated against an older blocklist is checked again."""
+        draft = Draft(
+            title="Document",
+            keywords=["test"],
+            sections=[DraftSection(title="S1", content="This has BadTerm in it.")],
+        )
+        SafetyValidator(blocklist_file=blocklist_file, auto_reject=False).validate_draft(draft)
+        assert not draft.has_blocklist_violations
+
+        validator = SafetyValidator(blocklist_file=blocklist_file, auto_reject=False)
+        validator.add_to_blocklist("BadTerm")
+        validator.validate_draft(draft)
+
+        assert draft.blocklist_validation_result["total_violations"] == 1
+        assert draft.sections[0].has_blocklist_violations
+
+    def test_blocklist_edited_directly_forgets_results(self, validator):
+        """Test that results are keyed on the blocklist contents, not just the API used."""
+        draft = Draft(
+            title="Document",
+            keywords=["test"],
+            sections=[DraftSection(title="S1", content="Mentions NewTerm.")],
+        )
+        validator.validate_draft(draft)
+
+        validator.blocklist_manager.add_entry(BlocklistEntry(id="new", pattern="NewTerm"))
+
+        with pytest.raises(ValueError, match="NewTerm"):
+            validator.validate_draft(draft)
+
+    def test_add_to_blocklist_forgets_results(self, validator):
+        """Test that a new blocklist entry makes sections be checked again."""
+        draft = Draft(
+            title="Document",
+            keywords=["test"],
+            sections=[DraftSection(title="S1", content="Mentions NewTerm.")],
+        )
+        validator.validate_draft(draft)
+
+        validator.add_to_blocklist("NewTerm")
+
+        with pytest.raises(ValueError, match="NewTerm"):
+            validator.validate_draft(draft)
+
     def test_validate_before_generation_clean(self, validator):
         """Test pre-validation with clean inputs."""
         result = validator.validate_before_generation(
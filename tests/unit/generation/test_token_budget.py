@@ -0,0 +1,195 @@
+"""Tests for prompt token budgeting."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from bloginator.config import Config
+from bloginator.generation._token_budget import (
+    DEFAULT_CONTEXT_TOKENS,
+    OLLAMA_MAX_CONTEXT_TOKENS,
+    TokenBudget,
+    TokenCounter,
+    client_context_window,
+    context_window,
+    output_token_budget,
+)
+from bloginator.generation.draft_generator import DraftGenerator
+from bloginator.generation.llm_base import LLMResponse
+from bloginator.models.outline import Outline, OutlineSection
+from bloginator.search import SearchResult
+
+
+@pytest.fixture
+def estimating():
+    """Count tokens with the 4-characters-per-token estimate."""
+    with patch("bloginator.generation._token_budget._get_encoding", return_value=None):
+        yield
+
+
+def _result(chunk_id: str, content: str, distance: float) -> SearchResult:
+    return SearchResult(chunk_id=chunk_id, content=content, metadata={}, distance=distance)
+
+
+class TestTokenCounter:
+    """Tests for TokenCounter."""
+
+    def test_estimate_without_tokenizer(self, estimating) -> None:
+        """Test the fallback estimate."""
+        counter = TokenCounter("llama3")
+
+        assert not counter.exact
+        assert counter.count("abcd" * 10) == 10
+        assert counter.count("") == 0
+
+    def test_tokenizer_counts(self) -> None:
+        """Test exact counts when the tiktoken encoding is available."""
+        counter = TokenCounter("gpt-4o")
+        if not counter.exact:
+            pytest.skip("tiktoken encoding not available offline")
+
+        assert 1 <= counter.count("Hello world") <= 3
+
+
+class TestContextWindow:
+    """Tests for context window lookup."""
+
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            ("gpt-4o-mini", 128_000),
+            ("gpt-4", 8192),
+            ("claude-sonnet-4", 200_000),
+            ("llama3.1:8b", 128_000),
+            ("llama3", 8192),
+            ("unknown-model", DEFAULT_CONTEXT_TOKENS),
+            (None, DEFAULT_CONTEXT_TOKENS),
+        ],
+    )
+    def test_known_models(self, model: str | None, expected: int) -> None:
+        """Test that the longest matching model prefix wins."""
+        assert context_window(model) == expected
+
+    def test_config_override(self) -> None:
+        """Test that the configured window overrides the table."""
+        with patch.object(Config, "LLM_CONTEXT_TOKENS", 2048):
+            assert context_window("gpt-4o") == 2048
+
+    def test_ollama_window_capped(self) -> None:
+        """Test that Ollama is not asked for a model's full 128k window."""
+        assert context_window("llama3.1:8b", provider="ollama") == OLLAMA_MAX_CONTEXT_TOKENS
+        assert context_window("llama3", provider="ollama") == 8192
+        with patch.object(Config, "LLM_CONTEXT_TOKENS", 65_536):
+            assert context_window("llama3.1:8b", provider="ollama") == 65_536
+
+    def test_client_window_prefers_num_ctx(self) -> None:
+        """Test that a client's num_ctx is what gets budgeted."""
+        assert client_context_window(Mock(model="llama3.1:8b", num_ctx=4096)) == 4096
+        assert client_context_window(Mock(model="gpt-4", num_ctx=None)) == 8192
+        assert client_context_window(object()) == DEFAULT_CONTEXT_TOKENS
+
+    def test_output_budget(self) -> None:
+        """Test the output token allowance for a word target."""
+        assert output_token_budget(300) == 600
+
+
+class TestTokenBudget:
+    """Tests for TokenBudget."""
+
+    def test_remaining_subtracts_fixed_parts_and_output(self, estimating) -> None:
+        """Test the space left for sources."""
+        budget = TokenBudget(1000, reserved_output_tokens=200, counter=TokenCounter())
+
+        assert budget.remaining("a" * 400) == 700
+        assert budget.remaining("a" * 8000) == 0
+
+    def test_truncate_at_sentence_boundary(self, estimating) -> None:
+        """Test that truncation keeps whole sentences."""
+        budget = TokenBudget(1000, counter=TokenCounter())
+        text = "First sentence here. Second sentence here. Third sentence here."
+
+        assert budget.truncate(text, 12) == "First sentence here. Second sentence here."
+        assert budget.truncate(text, 100) == text
+
+    def test_truncate_long_sentence_at_word_boundary(self, estimating) -> None:
+        """Test the word-boundary fallback."""
+        budget = TokenBudget(1000, counter=TokenCounter())
+
+        assert budget.truncate("alpha beta gamma delta epsilon", 4) == "alpha beta gamma"
+
+    def test_pack_by_score_then_truncate(self, estimating) -> None:
+        """Test that the best sources are packed and the overflow truncated."""
+        budget = TokenBudget(10_000, counter=TokenCounter())
+        weak = _result("weak", "w" * 400, distance=0.9)
+        strong = _result("strong", "s" * 400, distance=0.1)
+        long_text = " ".join(["A complete sentence of filler text."] * 40)
+        medium = _result("medium", long_text, distance=0.5)
+
+        packed = budget.pack([weak, strong, medium], max_tokens=200)
+
+        # strong (108) fits; medium is cut to fit the remaining 84; weak is dropped
+        assert [r.chunk_id for r in packed] == ["strong", "medium"]
+        assert packed[0] is strong
+        assert packed[1] is not medium
+        assert packed[1].content.endswith(".")
+        assert budget.counter.count(packed[1].content) <= 84
+        assert medium.content == long_text
+
+    def test_pack_keeps_everything_that_fits(self, estimating) -> None:
+        """Test that sources within budget are returned unchanged, in order."""
+        budget = TokenBudget(10_000, counter=TokenCounter())
+        results = [_result("a", "x" * 40, 0.5), _result("b", "y" * 40, 0.1)]
+
+        assert budget.pack(results, max_tokens=1000) == results
+
+
+def test_draft_sources_fit_context_and_usage_recorded(estimating) -> None:
+    """Test that section prompts respect the window and record token counts."""
+    searcher = Mock()
+    searcher.batch_search.return_value = [
+        [_result(f"c{i}", f"Source {i} sentence. " * 200, 0.2) for i in range(5)]
+    ]
+    llm = Mock()
+    llm.model = "llama3"
+    llm.generate.return_value = LLMResponse(
+        content="Text", model="llama3", prompt_tokens=1234, completion_tokens=56
+    )
+    outline = Outline(title="T", keywords=["k"], sections=[OutlineSection(title="S")])
+    generator = DraftGenerator(llm_client=llm, searcher=searcher, sources_per_section=5)
+
+    with patch.object(Config, "LLM_CONTEXT_TOKENS", 3000):
+        draft = generator.generate(outline, max_section_words=100)
+
+    call = llm.generate.call_args.kwargs
+    counter = TokenCounter()
+    assert call["max_tokens"] == 200
+    assert counter.count(call["system_prompt"]) + counter.count(call["prompt"]) <= 3000 - 200
+    assert len(draft.sections[0].citations) < 5
+
+    (usage,) = generator.prompt_usage
+    assert usage.label == "S"
+    assert usage.context_tokens == 3000
+    assert 0 < usage.estimated_prompt_tokens <= 2800
+    assert usage.prompt_tokens == 1234
+    assert usage.completion_tokens == 56
+
+
+def test_streamed_section_records_reported_tokens(estimating) -> None:
+    """Test that streamed sections record the provider's token counts too."""
+    searcher = Mock()
+    searcher.batch_search.return_value = [[_result("c0", "Source sentence.", 0.2)]]
+
+    def stream(prompt, usage=None, **kwargs):
+        yield "Text"
+        usage.record(321, 45)
+
+    llm = Mock()
+    llm.model = "llama3"
+    llm.stream.side_effect = stream
+    outline = Outline(title="T", keywords=["k"], sections=[OutlineSection(title="S")])
+    generator = DraftGenerator(llm_client=llm, searcher=searcher)
+
+    generator.generate(outline, token_callback=lambda title, delta: None)
+
+    (usage,) = generator.prompt_usage
+    assert (usage.prompt_tokens, usage.completion_tokens) == (321, 45)
@@ -0,0 +1,112 @@
+"""Tests for voice-sample retrieval."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from bloginator.generation._voice_samples import (
+    VOICE_QUERIES,
+    VOICE_SAMPLES_FILE,
+    get_voice_samples,
+    load_precomputed_voice_results,
+    precompute_voice_samples,
+)
+from bloginator.generation.draft_generator import DraftGenerator
+from bloginator.models.outline import Outline, OutlineSection
+from bloginator.search import SearchResult
+
+
+def _result(chunk_id: str, filename: str = "essay.md", words: int = 60) -> SearchResult:
+    return SearchResult(
+        chunk_id=chunk_id,
+        content=" ".join([chunk_id] * words),
+        metadata={"filename": filename},
+        distance=0.2,
+    )
+
+
+@pytest.fixture
+def searcher(tmp_path: Path) -> Mock:
+    """Create a searcher whose batch search returns one result per query."""
+    searcher = Mock()
+    searcher.index_dir = tmp_path
+    searcher.collection.get.return_value = {"ids": ["c1", "c2"]}
+    searcher.batch_search.side_effect = lambda queries, n_results: [
+        [_result(f"chunk{i}")] for i, _ in enumerate(queries)
+    ]
+    return searcher
+
+
+class TestGetVoiceSamples:
+    """Tests for get_voice_samples."""
+
+    def test_single_batch_search(self, searcher: Mock) -> None:
+        """Test that all voice queries run as one batch search."""
+        samples = get_voice_samples(searcher, ["leadership"])
+
+        searcher.batch_search.assert_called_once()
+        queries = searcher.batch_search.call_args.args[0]
+        assert queries == ["leadership best practices", *VOICE_QUERIES]
+        searcher.search.assert_not_called()
+        assert samples.count("[Sample ") == 3
+
+    def test_filters_templates_and_short_chunks(self, searcher: Mock) -> None:
+        """Test that templates, short chunks and duplicates are skipped."""
+        searcher.batch_search.side_effect = None
+        searcher.batch_search.return_value = [
+            [_result("a", filename="PO_Template.docx"), _result("b", words=10)],
+            [_result("c"), _result("c")],
+        ]
+
+        samples = get_voice_samples(searcher, [], num_samples=3)
+
+        assert "[Sample 1 - from essay.md]" in samples
+        assert "[Sample 2" not in samples
+
+    def test_precomputed_results_leave_only_topical_query(self, searcher: Mock) -> None:
+        """Test that stored voice results replace the fixed queries."""
+        path = precompute_voice_samples(searcher)
+        assert path == searcher.index_dir / VOICE_SAMPLES_FILE
+        searcher.batch_search.reset_mock()
+
+        samples = get_voice_samples(searcher, ["leadership"])
+
+        searcher.batch_search.assert_called_once_with(["leadership best practices"], n_results=2)
+        assert samples.count("[Sample ") == 3
+
+    def test_stale_precomputed_results_ignored(self, searcher: Mock) -> None:
+        """Test that re-indexed chunks invalidate stored voice results, even at the same count."""
+        precompute_voice_samples(searcher)
+        searcher.collection.get.return_value = {"ids": ["c1", "c3"]}
+
+        assert load_precomputed_voice_results(searcher) is None
+
+
+def test_draft_computes_voice_samples_once(searcher: Mock) -> None:
+    """Test that voice samples are fetched once per draft, not per section."""
+    outline = Outline(
+        title="Voice",
+        keywords=["leadership"],
+        sections=[
+            OutlineSection(
+                title=f"Section {i}",
+                description="Body",
+                subsections=[OutlineSection(title=f"Sub {i}", description="Detail")],
+            )
+            for i in range(4)
+        ],
+    )
+    llm = Mock()
+    llm.generate.return_value = Mock(content="Text")
+    generator = DraftGenerator(llm_client=llm, searcher=searcher)
+
+    generator.generate(outline)
+
+    voice_calls = [
+        call
+        for call in searcher.batch_search.call_args_list
+        if VOICE_QUERIES[0] in (call.args[0] if call.args else call.kwargs["queries"])
+    ]
+    assert len(voice_calls) == 1
+    assert all("[Sample 1" in call.kwargs["system_prompt"] for call in llm.generate.call_args_list)
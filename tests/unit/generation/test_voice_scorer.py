@@ -6,8 +6,10 @@ import numpy as np
 import pytest
 
 from bloginator.generation.voice_scorer import VoiceScorer
+from bloginator.indexing import VoiceProfile
+from bloginator.indexing._fingerprint import fingerprint_chunk_ids
+from bloginator.indexing._voice_profile import VOICE_PROFILE_FILE
 from bloginator.models.draft import Draft, DraftSection
-from bloginator.search import SearchResult
 
 
 class TestVoiceScorer:
@@ -18,15 +20,15 @@ class TestVoiceScorer:
         """Create mock searcher with embedding model."""
         searcher = Mock()
 
-        # Mock embedding model
+        # Mock embedding model: one row per encoded text
         embedding_model = Mock()
-        embedding_model.encode.return_value = np.array(
-            [
-                [0.1, 0.2, 0.3],  # Mock embedding
-            ]
-        )
+        embedding_model.encode.side_effect = lambda texts: np.tile([0.1, 0.2, 0.3], (len(texts), 1))
 
         searcher.embedding_model = embedding_model
+        # Default: no stored corpus embeddings near any query
+        searcher.nearest_embeddings.side_effect = lambda queries, n_results: [
+            np.empty((0, 3)) for _ in queries
+        ]
         return searcher
 
     @pytest.fixture
@@ -68,8 +70,6 @@ class TestVoiceScorer:
 
     def test_score_section_no_corpus_samples(self, scorer, mock_searcher):
         """Test scoring when corpus has no samples."""
-        mock_searcher.search.return_value = []
-
         section = DraftSection(title="Test", content="Some content")
         scorer._score_section(section, keywords=["test"])
 
@@ -78,21 +78,10 @@ class TestVoiceScorer:
 
     def test_score_section_with_samples(self, scorer, mock_searcher):
         """Test scoring with corpus samples."""
-        # Mock search results
-        mock_searcher.search.return_value = [
-            SearchResult(
-                chunk_id=f"chunk{i}",
-                content=f"Corpus content {i}",
-                distance=0.2,
-                metadata={},
-            )
-            for i in range(5)
-        ]
-
-        # Mock embeddings
-        # Generated content embedding
-        generated_emb = np.array([1.0, 0.0, 0.0])
-        # Corpus embeddings (similar to generated)
+        # Generated content embedding, then the sampling query embedding
+        scorer.embedding_model.encode.side_effect = None
+        scorer.embedding_model.encode.return_value = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        # Stored corpus embeddings (similar to generated)
         corpus_embs = np.array(
             [
                 [0.9, 0.1, 0.0],
@@ -102,14 +91,8 @@ class TestVoiceScorer:
                 [0.87, 0.13, 0.0],
             ]
         )
-
-        def encode_side_effect(texts):
-            if len(texts) == 1:
-                return np.array([generated_emb])
-            else:
-                return corpus_embs
-
-        scorer.embedding_model.encode.side_effect = encode_side_effect
+        mock_searcher.nearest_embeddings.side_effect = None
+        mock_searcher.nearest_embeddings.return_value = [corpus_embs]
 
         section = DraftSection(title="Test", content="Generated content")
         scorer._score_section(section, keywords=["test"])
@@ -120,23 +103,11 @@ class TestVoiceScorer:
 
     def test_score_section_bounds_check(self, scorer, mock_searcher):
         """Test that voice score is bounded to [0, 1]."""
-        mock_searcher.search.return_value = [
-            SearchResult(
-                chunk_id="chunk1",
-                content="Content",
-                distance=0.2,
-                metadata={},
-            )
-        ]
-
         # Mock extreme embeddings that might produce out-of-bounds scores
-        def encode_side_effect(texts):
-            if len(texts) == 1:
-                return np.array([[100.0, 0.0, 0.0]])
-            else:
-                return np.array([[0.01, 0.01, 0.01]])
-
-        scorer.embedding_model.encode.side_effect = encode_side_effect
+        scorer.embedding_model.encode.side_effect = None
+        scorer.embedding_model.encode.return_value = np.array([[100.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        mock_searcher.nearest_embeddings.side_effect = None
+        mock_searcher.nearest_embeddings.return_value = [np.array([[0.01, 0.01, 0.01]])]
 
         section = DraftSection(title="Test", content="Content")
         scorer._score_section(section, keywords=["test"])
@@ -146,7 +117,7 @@ class TestVoiceScorer:
 
     def test_score_section_error_handling(self, scorer, mock_searcher):
         """Test error handling during scoring."""
-        mock_searcher.search.side_effect = Exception("Search failed")
+        mock_searcher.nearest_embeddings.side_effect = Exception("Search failed")
 
         section = DraftSection(title="Test", content="Content")
         scorer._score_section(section, keywords=["test"])
@@ -163,8 +134,6 @@ class TestVoiceScorer:
 
     def test_score_draft_with_sections(self, scorer, mock_searcher):
         """Test scoring full draft."""
-        mock_searcher.search.return_value = []
-
         sections = [
             DraftSection(title="S1", content="Content 1"),
             DraftSection(title="S2", content="Content 2"),
@@ -187,21 +156,8 @@ class TestVoiceScorer:
 
     def test_score_text_basic(self, scorer, mock_searcher):
         """Test scoring arbitrary text."""
-        mock_searcher.search.return_value = [
-            SearchResult(
-                chunk_id="chunk1",
-                content="Corpus content",
-                distance=0.2,
-                metadata={},
-            )
-        ]
-
-        # Mock similar embeddings
-        scorer.embedding_model.encode.return_value = np.array(
-            [
-                [1.0, 0.0, 0.0],  # Text embedding
-            ]
-        )
+        mock_searcher.nearest_embeddings.side_effect = None
+        mock_searcher.nearest_embeddings.return_value = [np.array([[1.0, 0.0, 0.0]])]
 
         score = scorer.score_text(
             text="Test text",
@@ -221,8 +177,6 @@ class TestVoiceScorer:
 
     def test_score_text_no_samples(self, scorer, mock_searcher):
         """Test scoring text with no corpus samples."""
-        mock_searcher.search.return_value = []
-
         score = scorer.score_text(
             text="Test text",
             context_keywords=["test"],
@@ -230,6 +184,114 @@ class TestVoiceScorer:
 
         assert score == 0.5
 
+    def test_score_draft_batches_model_calls(self, scorer, mock_searcher):
+        """Test that a whole draft takes one encode call and one corpus query."""
+        scorer.embedding_model.encode.side_effect = None
+        # Two section embeddings, then two query embeddings
+        scorer.embedding_model.encode.return_value = np.array(
+            [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.5, 0.5, 0.0], [0.5, 0.5, 0.0]]
+        )
+        mock_searcher.nearest_embeddings.side_effect = None
+        mock_searcher.nearest_embeddings.return_value = [
+            np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),  # Samples for S1
+            np.empty((0, 3)),  # No samples for Sub
+        ]
+        draft = Draft(
+            title="Test",
+            keywords=["test"],
+            sections=[
+                DraftSection(
+                    title="S1",
+                    content="Content 1",
+                    subsections=[DraftSection(title="Sub", content="Content 2")],
+                ),
+                DraftSection(title="Empty", content=""),
+            ],
+        )
+
+        scorer.score_draft(draft)
+
+        scorer.embedding_model.encode.assert_called_once_with(
+            ["Content 1", "Content 2", "S1 test", "Sub test"]
+        )
+        mock_searcher.nearest_embeddings.assert_called_once()
+        mock_searcher.search.assert_not_called()
+        s1, empty = draft.sections
+        assert s1.voice_score == pytest.approx(0.5)  # mean of 1.0 and 0.0
+        assert s1.subsections[0].voice_score == 0.5  # neutral without samples
+        assert empty.voice_score == 0.0
+
+    def test_score_with_profile_skips_search(self, mock_searcher):
+        """Test that a voice profile replaces the corpus search."""
+        profile = VoiceProfile(codebook=np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]))
+        scorer = VoiceScorer(searcher=mock_searcher, profile=profile)
+        scorer.embedding_model.encode.side_effect = None
+        scorer.embedding_model.encode.return_value = np.array([[0.0, 2.0, 0.0], [0.0, 0.0, 1.0]])
+        draft = Draft(
+            title="Test",
+            keywords=["test"],
+            sections=[
+                DraftSection(title="S1", content="Content 1"),
+                DraftSection(title="S2", content="Content 2"),
+            ],
+        )
+
+        scorer.score_draft(draft)
+
+        scorer.embedding_model.encode.assert_called_once_with(["Content 1", "Content 2"])
+        mock_searcher.nearest_embeddings.assert_not_called()
+        assert [s.voice_score for s in draft.sections] == pytest.approx([1.0, 0.0])
+
+    def test_score_draft_reuses_unchanged_sections(self, mock_searcher):
+        """Test that only new or edited sections are encoded again."""
+        profile = VoiceProfile(codebook=np.array([[1.0, 0.0, 0.0]]))
+        scorer = VoiceScorer(searcher=mock_searcher, profile=profile)
+        draft = Draft(
+            title="Test",
+            keywords=["test"],
+            sections=[
+                DraftSection(title="S1", content="Content 1"),
+                DraftSection(title="S2", content="Content 2"),
+            ],
+        )
+        scorer.score_draft(draft)
+
+        draft.sections[1] = DraftSection(title="S2", content="Edited")
+        scorer.embedding_model.encode.reset_mock()
+        scorer.score_draft(draft)
+
+        scorer.embedding_model.encode.assert_called_once_with(["Edited"])
+        assert draft.sections[0].voice_score > 0
+
+    def test_remember_scores_from_scored_draft(self, mock_searcher):
+        """Test that scores already stored on a draft are reused."""
+        scorer = VoiceScorer(searcher=mock_searcher, profile=Mock())
+        draft = Draft(
+            title="Test",
+            keywords=["test"],
+            sections=[DraftSection(title="S1", content="Content 1", voice_score=0.8)],
+        )
+
+        scorer.remember_scores(draft)
+        scorer.score_draft(draft)
+
+        scorer.embedding_model.encode.assert_not_called()
+        assert draft.voice_score == pytest.approx(0.8)
+
+    def test_profile_loaded_from_index(self, mock_searcher, tmp_path):
+        """Test that an up-to-date profile stored with the index is used."""
+        VoiceProfile(
+            codebook=np.array([[1.0, 0.0, 0.0]]), fingerprint=fingerprint_chunk_ids(["a", "b"])
+        ).save(tmp_path / VOICE_PROFILE_FILE)
+        mock_searcher.index_dir = tmp_path
+        mock_searcher.collection.get.return_value = {"ids": ["b", "a"]}
+
+        assert VoiceScorer(searcher=mock_searcher).profile is not None
+
+        # Same chunk count, different chunks
+        mock_searcher.collection.get.return_value = {"ids": ["a", "c"]}
+        assert VoiceScorer(searcher=mock_searcher).profile is None
+
     def test_get_voice_insights_basic(self, scorer):
         """Test getting voice insights."""
         sections = [
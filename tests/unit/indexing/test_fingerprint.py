@@ -0,0 +1,33 @@
+"""Tests for index fingerprints."""
+
+from unittest.mock import Mock
+
+from bloginator.indexing import index_fingerprint
+from bloginator.indexing._fingerprint import fingerprint_chunk_ids
+
+
+def test_fingerprint_ignores_order() -> None:
+    """Test that the same chunks give the same fingerprint in any order."""
+    assert fingerprint_chunk_ids(["a", "b", "c"]) == fingerprint_chunk_ids(["c", "a", "b"])
+
+
+def test_fingerprint_changes_when_chunks_are_replaced() -> None:
+    """Test that re-indexed chunks change the fingerprint at the same count."""
+    assert fingerprint_chunk_ids(["a", "b"]) != fingerprint_chunk_ids(["a", "c"])
+    # IDs are not simply concatenated
+    assert fingerprint_chunk_ids(["ab", "c"]) != fingerprint_chunk_ids(["a", "bc"])
+
+
+def test_index_fingerprint_reads_ids_in_pages() -> None:
+    """Test that the collection is read a page of IDs at a time."""
+    ids = [f"chunk{i}" for i in range(5)]
+    collection = Mock()
+    collection.get.side_effect = lambda include, limit, offset: {
+        "ids": ids[offset : offset + limit]
+    }
+
+    fingerprint = index_fingerprint(collection, page_size=2)
+
+    assert fingerprint == fingerprint_chunk_ids(ids)
+    assert collection.get.call_count == 3
+    assert collection.get.call_args.kwargs == {"include": [], "limit": 2, "offset": 4}
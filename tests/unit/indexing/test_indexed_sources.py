@@ -0,0 +1,67 @@
+"""Tests for mapping indexed documents back to their source files."""
+
+from datetime import datetime
+
+import pytest
+
+from bloginator.indexing._indexed_sources import indexed_sources
+
+
+MODIFIED = "2024-03-01T12:00:00"
+
+
+def _metadata(doc_id, filename, source_path=None):
+    metadata = {"document_id": doc_id, "filename": filename, "modified_date": MODIFIED}
+    if source_path is not None:
+        metadata["source_path"] = source_path
+    return metadata
+
+
+def test_documents_keyed_on_source_path(tmp_path):
+    """Test that recorded source paths are used as they are."""
+    path = str(tmp_path / "a.md")
+
+    sources = indexed_sources([_metadata("doc-a", "a.md", path)])
+
+    assert sources == {path: ("doc-a", datetime.fromisoformat(MODIFIED))}
+
+
+def test_documents_without_source_path_matched_by_name(tmp_path):
+    """Test that an older index's documents are found for the files being ingested."""
+    path = tmp_path / "notes" / "a.md"
+
+    sources = indexed_sources([_metadata("doc-a", "a.md")], [path, tmp_path / "b.md"])
+
+    assert sources == {str(path.absolute()): ("doc-a", datetime.fromisoformat(MODIFIED))}
+
+
+def test_unmatched_documents_without_source_path_ignored(tmp_path):
+    """Test that documents whose files are no longer ingested are left out."""
+    assert indexed_sources([_metadata("doc-a", "a.md")], [tmp_path / "b.md"]) == {}
+
+
+@pytest.mark.parametrize(
+    ("metadatas", "names"),
+    [
+        ([_metadata("doc-a", "a.md")], ["one/a.md", "two/a.md"]),
+        ([_metadata("doc-a", "a.md"), _metadata("doc-b", "a.md")], ["one/a.md"]),
+    ],
+)
+def test_ambiguous_names_refused(tmp_path, metadatas, names):
+    """Test that a name shared by several files or documents asks for a rebuild."""
+    with pytest.raises(ValueError, match="--force"):
+        indexed_sources(metadatas, [tmp_path / name for name in names])
+
+
+def test_entries_without_id_or_date_skipped(tmp_path):
+    """Test that incomplete metadata is ignored."""
+    path = str(tmp_path / "a.md")
+
+    sources = indexed_sources(
+        [
+            {"filename": "a.md", "source_path": path, "modified_date": MODIFIED},
+            {"document_id": "doc-a", "filename": "a.md", "source_path": path},
+        ]
+    )
+
+    assert sources == {}
@@ -113,6 +113,17 @@ class TestCorpusIndexer:
         # Document chunks should be deleted
         assert indexer.get_total_chunks() == 0
 
+    def test_replace_swaps_chunks_after_write(
+        self, indexer: CorpusIndexer, test_document: Document, test_chunks: list[Chunk]
+    ) -> None:
+        """Test that replacing a document leaves only its new chunks."""
+        indexer.index_document(test_document, test_chunks)
+        new_chunk = test_chunks[0].model_copy(update={"id": "chunk_3", "content": "Rewritten."})
+
+        indexer.index_documents([(test_document, [new_chunk])], replace=True)
+
+        assert indexer.collection.get()["ids"] == ["chunk_3"]
+
     def test_clear_index(
         self, indexer: CorpusIndexer, test_document: Document, test_chunks: list[Chunk]
     ) -> None:
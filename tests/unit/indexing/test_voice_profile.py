@@ -0,0 +1,153 @@
+"""Tests for the precomputed author voice profile."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from bloginator.indexing import (
+    CorpusIndexer,
+    VoiceProfile,
+    build_voice_profile,
+    load_voice_profile,
+)
+from bloginator.indexing._fingerprint import fingerprint_chunk_ids
+from bloginator.indexing._voice_profile import VOICE_PROFILE_FILE, _kmeans
+
+
+def _chunks() -> tuple[np.ndarray, list[dict[str, str]]]:
+    """Two tight PREFERRED clusters, plus one DEPRECATED outlier."""
+    embeddings = np.array(
+        [
+            [1.0, 0.05, 0.0],
+            [0.95, 0.0, 0.05],
+            [0.0, 1.0, 0.05],
+            [0.05, 0.95, 0.0],
+            [0.0, 0.0, 1.0],
+        ]
+    )
+    metadatas = [
+        {"quality_rating": "preferred", "filename": "essay.md"},
+        {"quality_rating": "preferred", "filename": "essay.md"},
+        {"quality_rating": "preferred", "filename": "guide.md"},
+        {"quality_rating": "preferred", "filename": "guide.md"},
+        {"quality_rating": "deprecated", "filename": "old.md"},
+    ]
+    return embeddings, metadatas
+
+
+class TestBuildVoiceProfile:
+    """Tests for build_voice_profile."""
+
+    def test_codebook_clusters_preferred_chunks(self) -> None:
+        """Test that the codebook finds the author-style clusters."""
+        embeddings, metadatas = _chunks()
+
+        profile = build_voice_profile(embeddings, metadatas, n_clusters=2, fingerprint="abc")
+
+        assert profile is not None
+        assert profile.codebook.shape == (2, 3)
+        assert profile.fingerprint == "abc"
+        # Each cluster centroid points along one of the two preferred axes
+        assert sorted(np.argmax(profile.codebook, axis=1).tolist()) == [0, 1]
+
+    def test_score_is_one_dot_product_per_text(self) -> None:
+        """Test that texts near a cluster score high and others low."""
+        profile = build_voice_profile(*_chunks(), n_clusters=2)
+        assert profile is not None
+
+        scores = profile.score(np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [-1.0, 0.0, 0.0]]))
+
+        assert scores[0] > 0.95
+        assert scores[1] < 0.1
+        assert scores[2] == 0.0  # Clamped
+
+    def test_falls_back_without_preferred_chunks(self) -> None:
+        """Test that non-deprecated chunks are used when none are PREFERRED."""
+        embeddings, metadatas = _chunks()
+        for metadata in metadatas[:4]:
+            metadata["quality_rating"] = "reference"
+
+        profile = build_voice_profile(embeddings, metadatas, n_clusters=8)
+
+        assert profile is not None
+        assert len(profile.codebook) == 4  # Capped at the number of chunks
+
+    def test_empty_index(self) -> None:
+        """Test that an empty index yields no profile."""
+        assert build_voice_profile(np.empty((0, 3)), []) is None
+
+
+def test_kmeans_is_deterministic() -> None:
+    """Test that the same seed gives the same codebook."""
+    vectors = np.random.default_rng(1).normal(size=(40, 4))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    assert np.array_equal(_kmeans(vectors, 3), _kmeans(vectors, 3))
+
+
+class TestPersistence:
+    """Tests for saving and loading profiles."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that a saved profile loads back unchanged."""
+        profile = build_voice_profile(*_chunks(), n_clusters=2, fingerprint="abc")
+        assert profile is not None
+        profile.save(tmp_path / VOICE_PROFILE_FILE)
+
+        loaded = load_voice_profile(tmp_path, fingerprint="abc")
+
+        assert isinstance(loaded, VoiceProfile)
+        np.testing.assert_allclose(loaded.codebook, profile.codebook)
+        assert loaded.fingerprint == "abc"
+
+    def test_stale_profile_ignored(self, tmp_path: Path) -> None:
+        """Test that a profile built from different chunks is not used."""
+        profile = build_voice_profile(*_chunks(), n_clusters=2, fingerprint="abc")
+        assert profile is not None
+        profile.save(tmp_path / VOICE_PROFILE_FILE)
+
+        assert load_voice_profile(tmp_path, fingerprint="def") is None
+
+    def test_profile_without_fingerprint_is_stale(self, tmp_path: Path) -> None:
+        """Test that a profile saved before fingerprints is rebuilt, not trusted."""
+        np.savez(
+            tmp_path / VOICE_PROFILE_FILE,
+            codebook=np.eye(2),
+            chunk_count=np.asarray(5),
+        )
+
+        assert load_voice_profile(tmp_path, fingerprint="abc") is None
+        assert load_voice_profile(tmp_path) is not None
+
+    def test_missing_or_corrupt(self, tmp_path: Path) -> None:
+        """Test that missing and unreadable files yield no profile."""
+        assert load_voice_profile(tmp_path) is None
+
+        (tmp_path / VOICE_PROFILE_FILE).write_bytes(b"not a profile")
+
+        assert load_voice_profile(tmp_path) is None
+
+
+@patch("bloginator.indexing.indexer.SentenceTransformer")
+def test_indexer_reads_embeddings_in_pages(mock_st, tmp_path: Path) -> None:
+    """Test that the stored profile is the same however the corpus is paged."""
+    embeddings, metadatas = _chunks()
+    indexer = CorpusIndexer(output_dir=tmp_path / "index")
+    indexer.collection.add(
+        ids=[f"c{i}" for i in range(len(embeddings))],
+        embeddings=embeddings.tolist(),
+        metadatas=metadatas,
+        documents=["text"] * len(embeddings),
+    )
+    expected = build_voice_profile(embeddings, metadatas, n_clusters=2)
+    assert expected is not None
+
+    with patch.object(indexer.collection, "get", wraps=indexer.collection.get) as get:
+        path = indexer.build_voice_profile(n_clusters=2, page_size=2)
+
+    assert get.call_count == 3
+    assert path is not None
+    profile = VoiceProfile.load(path)
+    assert profile.fingerprint == fingerprint_chunk_ids(f"c{i}" for i in range(5))
+    np.testing.assert_allclose(profile.codebook, expected.codebook, atol=1e-6)
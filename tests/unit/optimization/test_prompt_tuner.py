@@ -0,0 +1,164 @@
+"""Tests for parallel, resumable prompt tuning."""
+
+import shutil
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bloginator.generation.llm_mock import MockLLMClient
+from bloginator.optimization import PromptTuner, TestCase
+from bloginator.optimization._tuner_checkpoint import CaseCheckpoint, prompts_fingerprint
+from bloginator.prompts.loader import PromptLoader
+
+
+def _cases(count: int) -> list[TestCase]:
+    return [
+        TestCase(
+            id=f"case{i}",
+            name=f"Case {i}",
+            title=f"Title {i}",
+            keywords=["testing"],
+            thesis="Thesis",
+            classification="guidance",
+            audience="all-disciplines",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def cases():
+    """Serve two fixed test cases instead of the YAML file."""
+    with patch(
+        "bloginator.optimization.prompt_tuner.get_test_cases",
+        side_effect=lambda num_cases: _cases(num_cases),
+    ):
+        yield
+
+
+def _tuner(tmp_path, **kwargs) -> PromptTuner:
+    return PromptTuner(
+        llm_client=MockLLMClient(),
+        searcher=MagicMock(),
+        output_dir=tmp_path,
+        sleep_between_rounds=0,
+        **kwargs,
+    )
+
+
+def test_cases_run_concurrently(tmp_path, cases) -> None:
+    """Test that test cases are spread over the worker pool."""
+    tuner = _tuner(tmp_path, max_workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+    score = tuner._score_draft
+
+    def score_together(draft):
+        barrier.wait()  # Breaks unless both cases are generating at once
+        return score(draft)
+
+    with patch.object(tuner, "_score_draft", side_effect=score_together):
+        results = tuner.optimize(num_iterations=1, num_test_cases=2)
+
+    assert [r.test_case_id for r in results] == ["case0", "case1"]
+    # Finished cases leave results, not checkpoints
+    for test_case in _cases(2):
+        assert not CaseCheckpoint.path(tmp_path, test_case).exists()
+        assert (tmp_path / f"result_{test_case.id}.json").exists()
+
+
+def test_interrupted_run_resumes_after_last_round(tmp_path, cases) -> None:
+    """Test that a rerun skips the rounds finished before the interruption."""
+    tuner = _tuner(tmp_path)
+    evaluate = tuner._get_ai_evaluation
+
+    def fail_in_round_two(**kwargs):
+        if kwargs["round_number"] == 2:
+            raise KeyboardInterrupt
+        return evaluate(**kwargs)
+
+    with (
+        patch.object(tuner, "_get_ai_evaluation", side_effect=fail_in_round_two),
+        pytest.raises(KeyboardInterrupt),
+    ):
+        tuner.optimize(num_iterations=3, num_test_cases=1)
+
+    with patch.object(tuner, "_score_draft", wraps=tuner._score_draft) as score:
+        (result,) = tuner.optimize(num_iterations=3, num_test_cases=1)
+
+    assert score.call_count == 2  # Rounds 2 and 3 only
+    assert [r.round_number for r in result.rounds] == [1, 2, 3]
+
+
+def test_baseline_round_cached(tmp_path, cases) -> None:
+    """Test that an unchanged test case reuses its baseline round."""
+    tuner = _tuner(tmp_path)
+    (first,) = tuner.optimize(num_iterations=1, num_test_cases=1)
+
+    with patch.object(tuner, "_score_draft") as score:
+        (again,) = tuner.optimize(num_iterations=1, num_test_cases=1)
+
+    score.assert_not_called()
+    assert again.baseline_score == first.baseline_score
+
+    with patch.object(tuner, "_score_draft", wraps=tuner._score_draft) as score:
+        tuner.optimize(num_iterations=1, num_test_cases=1, resume=False)
+
+    score.assert_called_once()
+
+
+def test_edited_prompts_generate_new_rounds(tmp_path, cases) -> None:
+    """Test that checkpoints and baselines from other prompts are not replayed."""
+    prompts_dir = tmp_path / "prompts"
+    shutil.copytree(PromptLoader().prompts_dir, prompts_dir)
+    tuner = _tuner(tmp_path / "out", prompt_loader=PromptLoader(prompts_dir=prompts_dir))
+    evaluate = tuner._get_ai_evaluation
+
+    def fail_in_round_two(**kwargs):
+        if kwargs["round_number"] == 2:
+            raise KeyboardInterrupt
+        return evaluate(**kwargs)
+
+    with (
+        patch.object(tuner, "_get_ai_evaluation", side_effect=fail_in_round_two),
+        pytest.raises(KeyboardInterrupt),
+    ):
+        tuner.optimize(num_iterations=2, num_test_cases=1)
+
+    prompt = prompts_dir / "draft" / "base.yaml"
+    prompt.write_text(prompt.read_text() + "\n# edited\n")
+
+    with patch.object(tuner, "_score_draft", wraps=tuner._score_draft) as score:
+        tuner.optimize(num_iterations=2, num_test_cases=1)
+
+    assert score.call_count == 2  # Both rounds generated again
+
+
+def test_other_model_generates_new_rounds(tmp_path, cases) -> None:
+    """Test that switching the LLM does not reuse the cached baseline."""
+    _tuner(tmp_path).optimize(num_iterations=1, num_test_cases=1)
+    tuner = _tuner(tmp_path)
+    tuner.llm_client.model = "other-model"
+
+    with patch.object(tuner, "_score_draft", wraps=tuner._score_draft) as score:
+        tuner.optimize(num_iterations=1, num_test_cases=1)
+
+    score.assert_called_once()
+
+
+def test_prompts_fingerprint_changes_with_prompts(tmp_path) -> None:
+    """Test that editing a prompt file changes the fingerprint."""
+    (tmp_path / "draft").mkdir()
+    prompt = tmp_path / "draft" / "base.yaml"
+    prompt.write_text("a: 1\n")
+    before = prompts_fingerprint(tmp_path)
+
+    prompt.write_text("a: 2\n")
+
+    assert prompts_fingerprint(tmp_path) != before
+
+
+def test_invalid_workers(tmp_path) -> None:
+    """Test that max_workers must be positive."""
+    with pytest.raises(ValueError, match="max_workers"):
+        _tuner(tmp_path, max_workers=0)
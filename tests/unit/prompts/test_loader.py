@@ -1,8 +1,12 @@
 """Tests for prompt loader."""
 
+import os
+from unittest.mock import patch
+
 import pytest
+import yaml
 
-from bloginator.prompts.loader import PromptLoader, PromptTemplate
+from bloginator.prompts.loader import PromptLoader, PromptTemplate, compile_template
 
 
 def test_prompt_loader_initialization():
@@ -136,3 +140,103 @@ def test_prompt_template_defaults():
     assert template.parameters == {}
     assert template.quality_criteria == []
     assert template.ai_slop_patterns == {}
+
+
+def test_render_compiles_template_once():
+    """Test that repeated renders reuse the compiled template."""
+    template = PromptTemplate(
+        name="test",
+        version="1.0.0",
+        description="Test prompt",
+        context="test",
+        system_prompt="Write as {{ role }}",
+        user_prompt_template="Topic: {{ topic }}",
+    )
+
+    with patch("bloginator.prompts.loader.compile_template", wraps=compile_template) as spy:
+        for _ in range(3):
+            assert template.render_system_prompt(role="an editor") == "Write as an editor"
+            assert template.render_user_prompt(topic="Jinja") == "Topic: Jinja"
+
+    assert spy.call_count == 2
+
+    template.system_prompt = "Edited {{ role }}"
+    assert template.render_system_prompt(role="text") == "Edited text"
+
+
+def test_auto_reload_on_mtime_change(tmp_path):
+    """Test that an auto-reloading loader picks up edited prompt files."""
+    prompt_file = tmp_path / "draft.yaml"
+
+    def write_prompt(system_prompt: str, mtime: float) -> None:
+        prompt_file.write_text(
+            yaml.safe_dump(
+                {
+                    "name": "draft",
+                    "version": "1.0.0",
+                    "description": "Draft",
+                    "context": "draft",
+                    "system_prompt": system_prompt,
+                    "user_prompt_template": "{{ title }}",
+                }
+            )
+        )
+        os.utime(prompt_file, (mtime, mtime))
+
+    write_prompt("Version one", 1_000_000)
+    static = PromptLoader(prompts_dir=tmp_path)
+    reloading = PromptLoader(prompts_dir=tmp_path, auto_reload=True)
+    assert static.load("draft.yaml").render_system_prompt() == "Version one"
+    first = reloading.load("draft.yaml")
+    assert reloading.load("draft.yaml") is first
+
+    write_prompt("Version two", 2_000_000)
+
+    assert static.load("draft.yaml").render_system_prompt() == "Version one"
+    assert reloading.load("draft.yaml").render_system_prompt() == "Version two"
+
+
+@pytest.fixture
+def fresh_bytecode_cache(monkeypatch, tmp_path):
+    """Reset the shared environment's bytecode cache to its unattached state."""
+    from bloginator.config import Config
+    from bloginator.prompts import loader
+
+    monkeypatch.setattr(loader, "_bytecode_cache_attached", False)
+    monkeypatch.setattr(loader._ENVIRONMENT, "bytecode_cache", None)
+    monkeypatch.setattr(Config, "_template_cache_dir_env", str(tmp_path / "template_cache"))
+    return loader
+
+
+def test_bytecode_cache_created_under_data_dir_on_first_compile(fresh_bytecode_cache, tmp_path):
+    """Test that template bytecode is cached in the configured directory, lazily."""
+    cache_dir = tmp_path / "template_cache"
+    assert not cache_dir.exists()
+
+    template = compile_template("Cached {{ value }} bytecode test")
+
+    assert template.render(value="template") == "Cached template bytecode test"
+    assert fresh_bytecode_cache._ENVIRONMENT.bytecode_cache.directory == str(cache_dir)
+    assert list(cache_dir.iterdir())
+
+
+def test_unusable_bytecode_cache_dir_falls_back_to_no_cache(fresh_bytecode_cache, tmp_path):
+    """Test that templates still compile when the cache directory cannot be created."""
+    blocker = tmp_path / "template_cache"
+    blocker.write_text("not a directory")
+
+    template = compile_template("Uncached {{ value }}")
+
+    assert template.render(value="render") == "Uncached render"
+    assert fresh_bytecode_cache._ENVIRONMENT.bytecode_cache is None
+
+
+def test_bytecode_cache_write_failure_falls_back_to_no_cache(fresh_bytecode_cache, tmp_path):
+    """Test that a cache directory removed after startup disables the cache."""
+    compile_template("Warm {{ value }}")
+    (tmp_path / "template_cache").rename(tmp_path / "moved")
+
+    template = compile_template("Cold {{ value }} after removal")
+
+    assert template.render(value="start") == "Cold start after removal"
+    assert fresh_bytecode_cache._ENVIRONMENT.bytecode_cache is None
@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from bloginator.indexing import CorpusIndexer
@@ -251,6 +252,23 @@ class TestCorpusSearcher:
 
         assert results == []
 
+    def test_nearest_embeddings(self, test_index: Path) -> None:
+        """Test fetching stored embeddings of the nearest chunks."""
+        searcher = CorpusSearcher(index_dir=test_index)
+        queries = searcher.embedding_model.encode(["agile", "hiring"])
+
+        embeddings = searcher.nearest_embeddings(queries, n_results=2)
+
+        assert len(embeddings) == 2
+        assert all(e.shape == (2, queries.shape[1]) for e in embeddings)
+        # The query for "agile" should retrieve a stored vector close to itself
+        best = (
+            embeddings[0]
+            @ queries[0]
+            / (np.linalg.norm(embeddings[0], axis=1) * np.linalg.norm(queries[0]))
+        )
+        assert best.max() > 0.3
+
 
 class TestSearchResult:
     """Test SearchResult class."""
@@ -0,0 +1,192 @@
+"""Tests for the server-sent event draft stream (requires the web-api extra)."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from bloginator.models.draft import Draft, DraftSection  # noqa: E402
+from bloginator.web.routes import documents  # noqa: E402
+
+
+OUTLINE_JSON = json.dumps({"title": "Rollbacks", "keywords": ["deploy"]})
+
+# Tokens in a long run: finite, so a broken cancellation fails instead of hanging
+LONG_RUN_TOKENS = 200
+
+
+class FakeGenerator:
+    """DraftGenerator stand-in driving the stream's callbacks.
+
+    Attributes:
+        tokens: Token deltas to emit (None = a long, paced run of tokens)
+        error: Exception raised after the tokens instead of returning a draft
+        emitted: Number of token callbacks that returned
+        stopped: Set once generate() has returned or raised
+    """
+
+    tokens: list[str] | None = ["Fast ", "rollback."]
+    error: Exception | None = None
+    emitted = 0
+    stopped = threading.Event()
+
+    def __init__(self, **kwargs):
+        """Accept DraftGenerator's arguments."""
+
+    def generate(self, outline, progress_callback, token_callback):
+        """Emit progress and tokens, then return a draft or raise."""
+        cls = type(self)
+        try:
+            progress_callback("Generating section: Intro", 1, 1)
+            paced = cls.tokens is None
+            for delta in cls.tokens if not paced else ["more "] * LONG_RUN_TOKENS:
+                if paced:
+                    time.sleep(0.01)
+                token_callback("Intro", delta)
+                cls.emitted += 1
+            if cls.error is not None:
+                raise cls.error
+            return Draft(
+                title=outline.title,
+                sections=[DraftSection(title="Intro", content="Fast rollback.")],
+            )
+        finally:
+            cls.stopped.set()
+
+
+@pytest.fixture
+def generator():
+    """Install a fresh FakeGenerator class for one test."""
+    fake = type(
+        "Generator",
+        (FakeGenerator,),
+        {"tokens": FakeGenerator.tokens, "error": None, "emitted": 0, "stopped": threading.Event()},
+    )
+    with (
+        patch.object(documents, "DraftGenerator", fake),
+        patch.object(documents, "CorpusSearcher"),
+        patch.object(documents, "_llm_client"),
+    ):
+        yield fake
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def _post(tmp_path) -> list[tuple[str, dict]]:
+    from bloginator.web.app import create_app
+
+    client = TestClient(create_app())
+    response = client.post(
+        "/api/documents/draft/stream",
+        json={"outline_json": OUTLINE_JSON, "index_path": str(tmp_path)},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    return _events(response.text)
+
+
+async def _open_stream(tmp_path, disconnected: bool = False):
+    """Call the endpoint directly and return its event iterator."""
+    http_request = MagicMock()
+
+    async def is_disconnected():
+        return disconnected
+
+    http_request.is_disconnected = is_disconnected
+    request = documents.DraftRequest(outline_json=OUTLINE_JSON, index_path=str(tmp_path))
+    response = await documents.stream_draft(request, http_request)
+    return response.body_iterator
+
+
+def test_events_arrive_in_order(tmp_path, generator):
+    """Test progress, then each token, then the finished draft."""
+    events = _post(tmp_path)
+
+    assert [name for name, _ in events] == ["progress", "token", "token", "done"]
+    assert events[0][1] == {"message": "Generating section: Intro", "current": 1, "total": 1}
+    assert [data["delta"] for name, data in events if name == "token"] == ["Fast ", "rollback."]
+    assert events[-1][1]["draft"]["title"] == "Rollbacks"
+
+
+def test_generation_failure_ends_with_error_event(tmp_path, generator):
+    """Test that an exception becomes the stream's last event."""
+    generator.error = RuntimeError("model unavailable")
+
+    events = _post(tmp_path)
+
+    assert [name for name, _ in events] == ["progress", "token", "token", "error"]
+    assert events[-1][1] == {"detail": "Draft generation failed: model unavailable"}
+
+
+def test_closing_stream_stops_generation(tmp_path, generator):
+    """Test that a client going away stops generation at its next chunk."""
+    generator.tokens = None
+
+    async def read_then_leave():
+        events = await _open_stream(tmp_path)
+        await events.__anext__()
+        await events.aclose()
+        return await asyncio.to_thread(generator.stopped.wait, 10)
+
+    assert asyncio.run(read_then_leave())
+    assert generator.emitted < LONG_RUN_TOKENS
+
+
+def test_idle_stream_notices_disconnect(tmp_path, generator, monkeypatch):
+    """Test that a disconnect is noticed while no event is pending."""
+    monkeypatch.setattr(documents, "STREAM_CANCEL_POLL_SECONDS", 0.05)
+    generator.tokens = []
+    release = threading.Event()
+    original = generator.generate
+
+    def slow_generate(self, outline, progress_callback, token_callback):
+        release.wait(5)
+        return original(self, outline, progress_callback, token_callback)
+
+    generator.generate = slow_generate
+
+    async def wait_for_end():
+        events = await _open_stream(tmp_path, disconnected=True)
+        received = [event async for event in events]
+        release.set()
+        return received
+
+    start = time.monotonic()
+    assert asyncio.run(wait_for_end()) == []
+    assert time.monotonic() - start < 5
+    # The released generation thread is stopped at its first emit
+    assert generator.stopped.wait(5)
+    assert generator.emitted == 0
+
+
+def test_queue_bounds_events_ahead_of_slow_client(tmp_path, generator, monkeypatch):
+    """Test that generation waits for the client once the queue is full."""
+    monkeypatch.setattr(documents, "STREAM_QUEUE_SIZE", 4)
+    monkeypatch.setattr(documents, "STREAM_CANCEL_POLL_SECONDS", 0.05)
+    generator.tokens = None
+
+    async def read_slowly():
+        events = await _open_stream(tmp_path)
+        await events.__anext__()
+        await asyncio.sleep(0.5)
+        ahead = generator.emitted
+        await events.aclose()
+        await asyncio.to_thread(generator.stopped.wait, 5)
+        return ahead
+
+    # One event read, a full queue, and one put waiting for space
+    assert asyncio.run(read_slowly()) <= 4 + 1